@@ -0,0 +1,497 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+"""
+Local stand-in of the CoinGecko API, for benchmarking the bot (e.g. retries, caching and rate limit) reproducibly.
+It serves coins/{id}, coins/markets and coins/{id}/market_chart from recorded fixtures or, if missing, from data
+generated deterministically from the request (chart timestamps are aligned to the current hour).
+Faults can be injected with configurable rates:
+- latency, with a constant, uniform, exponential or log-normal distribution
+- 429 (too many requests) with the Retry-After header, either randomly or when exceeding a rate limit
+- 5xx server errors
+- timeouts, i.e. requests that are never replied (the connection is kept open until the client gives up)
+Random values are drawn from a seeded generator, so the same sequence of requests gets the same latencies and faults.
+
+Fixtures are JSON files in the fixtures folder, named after the request path and the sorted query parameters
+(e.g. coins_bitcoin_market_chart_days=1_vs_currency=usd.json). With --record, missing fixtures are fetched from the
+real API and saved, so that they can be replayed later.
+
+The bot can be pointed to the stand-in by setting coingecko_api_base_url (e.g. http://127.0.0.1:8765/api/v3).
+
+Usage (from the repository root):
+    python -m benchmarks.coingecko_stand_in [-p PORT] [-s SEED] [-f FIXTURES_DIR] [--record]
+                                            [-l LATENCY_MS] [-d {const,uniform,exp,lognormal}]
+                                            [--rate-limit CALLS_PER_MIN] [--429-rate RATE] [--retry-after-sec SEC]
+                                            [-e ERROR_RATE] [-t TIMEOUT_RATE]
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import re
+import time
+import zlib
+from collections import Counter, deque
+from http import HTTPStatus
+from typing import Any, Deque, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+import httpx
+
+
+# Response: (status, body, headers)
+StandInResponse = Tuple[HTTPStatus, Any, Dict[str, str]]
+
+# Server errors injected
+SERVER_ERRORS: Tuple[HTTPStatus, ...] = (
+    HTTPStatus.INTERNAL_SERVER_ERROR,
+    HTTPStatus.BAD_GATEWAY,
+    HTTPStatus.SERVICE_UNAVAILABLE,
+    HTTPStatus.GATEWAY_TIMEOUT,
+)
+# Currencies of generated data, with their rate to USD
+VS_CURRENCIES: Dict[str, float] = {"usd": 1.0, "eur": 0.9, "btc": 1 / 60000}
+# Real API used for recording fixtures
+RECORD_URL_BASE: str = "https://api.coingecko.com/api/v3"
+
+
+def CoinPrice(coin_id: str,
+              coin_vs: str) -> float:
+    """
+    Get the price of a coin, generated from its ID.
+
+    Args:
+        coin_id: Coin ID.
+        coin_vs: Currency to compare against.
+
+    Returns:
+        Price.
+    """
+    return (0.01 + (zlib.crc32(coin_id.encode()) % 10000000) / 100) * VS_CURRENCIES.get(coin_vs, 1.0)
+
+
+def CoinRank(coin_id: str) -> int:
+    """
+    Get the market cap rank of a coin, generated from its ID.
+
+    Args:
+        coin_id: Coin ID.
+
+    Returns:
+        Market cap rank.
+    """
+    return zlib.crc32(coin_id.encode()) % 1000 + 1
+
+
+def CoinData(coin_id: str) -> Dict[str, Any]:
+    """
+    Generate the data of a coin (coins/{id} endpoint).
+
+    Args:
+        coin_id: Coin ID.
+
+    Returns:
+        Coin data.
+    """
+    prices = {vs: CoinPrice(coin_id, vs) for vs in VS_CURRENCIES}
+    return {
+        "id": coin_id,
+        "symbol": coin_id[:4],
+        "name": coin_id.capitalize(),
+        "market_data": {
+            "current_price": prices,
+            "market_cap": {vs: int(price * 1e7) for vs, price in prices.items()},
+            "market_cap_rank": CoinRank(coin_id),
+            "high_24h": {vs: price * 1.05 for vs, price in prices.items()},
+            "low_24h": {vs: price * 0.95 for vs, price in prices.items()},
+            "total_volume": {vs: int(price * 1e5) for vs, price in prices.items()},
+            "price_change_percentage_24h": 1.5,
+            "price_change_percentage_7d": -2.5,
+            "price_change_percentage_14d": 3.5,
+            "price_change_percentage_30d": -4.5,
+            "price_change_percentage_60d": 5.5,
+            "price_change_percentage_200d": -6.5,
+            "price_change_percentage_1y": 7.5,
+        },
+    }
+
+
+def MarketsData(query: Dict[str, str]) -> List[Dict[str, Any]]:
+    """
+    Generate the market data of coins (coins/markets endpoint).
+    Coins are the requested ones (ids parameter), otherwise a page of generated coins.
+
+    Args:
+        query: Query parameters.
+
+    Returns:
+        Market data.
+    """
+    coin_vs = query.get("vs_currency", "usd")
+    if "ids" in query:
+        coin_ids = [coin_id for coin_id in query["ids"].split(",") if coin_id]
+    else:
+        per_page = int(query.get("per_page", "100"))
+        page = int(query.get("page", "1"))
+        coin_ids = [f"coin{i}" for i in range((page - 1) * per_page, page * per_page)]
+
+    return [
+        {
+            "id": coin_id,
+            "symbol": coin_id[:4],
+            "name": coin_id.capitalize(),
+            "current_price": CoinPrice(coin_id, coin_vs),
+            "market_cap": int(CoinPrice(coin_id, coin_vs) * 1e7),
+            "market_cap_rank": CoinRank(coin_id),
+            "total_volume": int(CoinPrice(coin_id, coin_vs) * 1e5),
+            "high_24h": CoinPrice(coin_id, coin_vs) * 1.05,
+            "low_24h": CoinPrice(coin_id, coin_vs) * 0.95,
+            "price_change_percentage_24h": 1.5,
+        }
+        for coin_id in coin_ids
+    ]
+
+
+def ChartData(coin_id: str,
+              query: Dict[str, str]) -> Dict[str, Any]:
+    """
+    Generate the chart data of a coin (coins/{id}/market_chart endpoint), with hourly prices like CoinGecko.
+
+    Args:
+        coin_id: Coin ID.
+        query: Query parameters.
+
+    Returns:
+        Chart data.
+    """
+    price = CoinPrice(coin_id, query.get("vs_currency", "usd"))
+    last_days = int(query.get("days", "1"))
+    now_ms = int(time.time()) // 3600 * 3600 * 1000
+    points_num = last_days * 24 + 1
+    prices = [
+        [now_ms - (points_num - i) * 3600000, price * (1 + 0.05 * math.sin(i / 12) + 0.02 * math.cos(i / 5))]
+        for i in range(points_num)
+    ]
+    return {
+        "prices": prices,
+        "market_caps": [[ts, p * 1e7] for ts, p in prices],
+        "total_volumes": [[ts, p * 1e5] for ts, p in prices],
+    }
+
+
+class CoinGeckoStandIn:
+    """Local stand-in of the CoinGecko API."""
+
+    args: argparse.Namespace
+    rng: random.Random
+    request_times: Deque[float]
+    status_cnt: Counter
+
+    def __init__(self,
+                 args: argparse.Namespace) -> None:
+        """
+        Initialize the stand-in.
+
+        Args:
+            args: Command line arguments.
+        """
+        self.args = args
+        self.rng = random.Random(args.seed)
+        self.request_times = deque()
+        self.status_cnt = Counter()
+
+    async def Serve(self) -> None:
+        """Serve requests forever."""
+        server = await asyncio.start_server(self.__HandleConnection, self.args.host, self.args.port)
+        async with server:
+            await server.serve_forever()
+
+    def StatusCount(self) -> Counter:
+        """
+        Get the number of responses for each status (timeouts are counted as status 0).
+
+        Returns:
+            Number of responses for each status.
+        """
+        return self.status_cnt
+
+    async def __HandleConnection(self,
+                                 reader: asyncio.StreamReader,
+                                 writer: asyncio.StreamWriter) -> None:
+        """
+        Handle a client connection, serving requests until it is closed.
+
+        Args:
+            reader: Stream reader.
+            writer: Stream writer.
+        """
+        try:
+            while True:
+                request_line = (await reader.readuntil(b"\r\n")).decode("latin-1").split()
+                while (await reader.readuntil(b"\r\n")) != b"\r\n":
+                    pass
+                if len(request_line) != 3:
+                    break
+
+                # Random values are drawn when the request is received, so that they do not depend on latencies
+                latency_sec = self.__DrawLatency()
+                fault = self.__DrawFault()
+                await asyncio.sleep(latency_sec)
+
+                if fault == "timeout":
+                    self.status_cnt[0] += 1
+                    # Never reply, wait for the client to give up
+                    await reader.read()
+                    break
+
+                status, body, headers = await self.__GetResponse(request_line[1], fault)
+                self.status_cnt[status.value] += 1
+                self.__WriteResponse(writer, status, body, headers)
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+            pass
+        finally:
+            writer.close()
+
+    async def __GetResponse(self,
+                            path: str,
+                            fault: Optional[str]) -> StandInResponse:
+        """
+        Get the response to a request.
+
+        Args:
+            path: Request path, including the query string.
+            fault: Fault to be injected (None if no fault).
+
+        Returns:
+            HTTP status, body and headers.
+        """
+        fault_response = self.__GetFaultResponse(fault)
+        if fault_response is not None:
+            return fault_response
+
+        url = urlsplit(path)
+        parts = [part for part in url.path.split("/") if part]
+        # Paths may have the /api/v3 prefix, like in the real API
+        if parts[:2] == ["api", "v3"]:
+            parts = parts[2:]
+        query = dict(parse_qsl(url.query))
+
+        fixture = await self.__LoadFixture(parts, query)
+        if fixture is not None:
+            return HTTPStatus.OK, fixture, {}
+        try:
+            if parts == ["coins", "markets"]:
+                return HTTPStatus.OK, MarketsData(query), {}
+            if len(parts) == 2 and parts[0] == "coins":
+                return HTTPStatus.OK, CoinData(parts[1]), {}
+            if len(parts) == 3 and parts[0] == "coins" and parts[2] == "market_chart":
+                return HTTPStatus.OK, ChartData(parts[1], query), {}
+        except ValueError:
+            return HTTPStatus.BAD_REQUEST, {"error": "Invalid parameters"}, {}
+        return HTTPStatus.NOT_FOUND, {"error": "Not found"}, {}
+
+    def __GetFaultResponse(self,
+                           fault: Optional[str]) -> Optional[StandInResponse]:
+        """
+        Get the response of a request failing because of the rate limit or of an injected fault.
+
+        Args:
+            fault: Fault to be injected (None if no fault).
+
+        Returns:
+            HTTP status, body and headers (None if the request does not fail).
+        """
+        now = time.monotonic()
+        while len(self.request_times) > 0 and now - self.request_times[0] >= 60:
+            self.request_times.popleft()
+        if self.args.rate_limit > 0 and len(self.request_times) >= self.args.rate_limit:
+            retry_after = math.ceil(60 - (now - self.request_times[0]))
+            return HTTPStatus.TOO_MANY_REQUESTS, {"error": "Rate limit exceeded"}, {"Retry-After": str(retry_after)}
+        self.request_times.append(now)
+
+        if fault == "429":
+            return (
+                HTTPStatus.TOO_MANY_REQUESTS,
+                {"error": "Rate limit exceeded"},
+                {"Retry-After": str(self.args.retry_after_sec)}
+            )
+        if fault == "5xx":
+            status = self.rng.choice(SERVER_ERRORS)
+            return status, {"error": status.phrase}, {}
+        return None
+
+    async def __LoadFixture(self,
+                            parts: List[str],
+                            query: Dict[str, str]) -> Optional[Any]:
+        """
+        Load the fixture of a request, recording it from the real API if missing and recording is enabled.
+
+        Args:
+            parts: Path parts.
+            query: Query parameters.
+
+        Returns:
+            Fixture (None if not available).
+        """
+        if self.args.fixtures is None:
+            return None
+
+        file_name = re.sub(r"[^\w.=,-]", "_", "_".join(parts + [f"{k}={v}" for k, v in sorted(query.items())]))
+        file_path = os.path.join(self.args.fixtures, f"{file_name}.json")
+        if os.path.isfile(file_path):
+            with open(file_path, encoding="utf-8") as fin:
+                return json.load(fin)
+        if not self.args.record:
+            return None
+
+        async with httpx.AsyncClient(base_url=self.args.record_url, timeout=30.0) as client:
+            response = await client.get("/".join(parts), params=query)
+        if response.status_code != HTTPStatus.OK:
+            print(f"Unable to record {file_name} (status: {response.status_code})")
+            return None
+        os.makedirs(self.args.fixtures, exist_ok=True)
+        with open(file_path, "w", encoding="utf-8") as fout:
+            fout.write(response.text)
+        print(f"Recorded {file_name}")
+        return response.json()
+
+    def __DrawLatency(self) -> float:
+        """
+        Draw the latency of a request from the configured distribution.
+
+        Returns:
+            Latency in seconds.
+        """
+        mean_sec = self.args.latency_ms / 1000
+        if mean_sec <= 0:
+            return 0.0
+        if self.args.latency_dist == "uniform":
+            return self.rng.uniform(0, 2 * mean_sec)
+        if self.args.latency_dist == "exp":
+            return self.rng.expovariate(1 / mean_sec)
+        if self.args.latency_dist == "lognormal":
+            sigma = self.args.latency_sigma
+            return self.rng.lognormvariate(math.log(mean_sec) - sigma ** 2 / 2, sigma)
+        return mean_sec
+
+    def __DrawFault(self) -> Optional[str]:
+        """
+        Draw the fault to be injected in a request, if any.
+
+        Returns:
+            Fault ("timeout", "429" or "5xx"), None if no fault.
+        """
+        roll = self.rng.random()
+        for fault, rate in (("timeout", self.args.timeout_rate), ("429", self.args.rate_429), ("5xx", self.args.error_rate)):
+            if roll < rate:
+                return fault
+            roll -= rate
+        return None
+
+    @staticmethod
+    def __WriteResponse(writer: asyncio.StreamWriter,
+                        status: HTTPStatus,
+                        body: Any,
+                        headers: Dict[str, str]) -> None:
+        """
+        Write a response.
+
+        Args:
+            writer: Stream writer.
+            status: HTTP status.
+            body: Body, sent as JSON.
+            headers: Additional headers.
+        """
+        body_bytes = json.dumps(body).encode("utf-8")
+        header_lines = "".join(f"{name}: {value}\r\n" for name, value in headers.items())
+        writer.write(
+            (
+                f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+                "Content-Type: application/json\r\n"
+                f"Content-Length: {len(body_bytes)}\r\n"
+                f"{header_lines}"
+                "\r\n"
+            ).encode("latin-1") + body_bytes
+        )
+
+
+def ParseArgs(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """
+    Parse the command line arguments.
+
+    Args:
+        argv: Arguments (None for the ones of the command line).
+
+    Returns:
+        Parsed arguments.
+    """
+    parser = argparse.ArgumentParser(description="Local CoinGecko API stand-in")
+    parser.add_argument("--host", default="127.0.0.1", help="host address")
+    parser.add_argument("-p", "--port", type=int, default=8765, help="port")
+    parser.add_argument("-s", "--seed", type=int, default=0, help="seed of the random generator")
+    parser.add_argument("-f", "--fixtures", default=None, help="fixtures folder (data is generated if missing)")
+    parser.add_argument("--record", action="store_true", help="record missing fixtures from the real API")
+    parser.add_argument("--record-url", default=RECORD_URL_BASE, help="base URL of the API used for recording")
+    parser.add_argument("-l", "--latency-ms", type=float, default=0.0, help="mean latency in milliseconds")
+    parser.add_argument("-d", "--latency-dist", default="exp", choices=["const", "uniform", "exp", "lognormal"],
+                        help="latency distribution")
+    parser.add_argument("--latency-sigma", type=float, default=1.0, help="sigma of the log-normal latency distribution")
+    parser.add_argument("--rate-limit", type=int, default=0, help="calls per minute above which 429 is returned (0 for no limit)")
+    parser.add_argument("--429-rate", dest="rate_429", type=float, default=0.0, help="fraction of requests failing with 429")
+    parser.add_argument("--retry-after-sec", type=int, default=5, help="Retry-After of randomly injected 429")
+    parser.add_argument("-e", "--error-rate", type=float, default=0.0, help="fraction of requests failing with a server error")
+    parser.add_argument("-t", "--timeout-rate", type=float, default=0.0, help="fraction of requests never replied")
+    return parser.parse_args(argv)
+
+
+def RunServer(argv: Optional[List[str]] = None) -> None:
+    """
+    Run the server, e.g. in a separate process so that it does not load the process under test.
+    The number of responses for each status is printed when stopped.
+
+    Args:
+        argv: Arguments (None for the ones of the command line).
+    """
+    args = ParseArgs(argv)
+    stand_in = CoinGeckoStandIn(args)
+    print(f"CoinGecko stand-in serving on http://{args.host}:{args.port}/api/v3")
+    try:
+        asyncio.run(stand_in.Serve())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        status_cnt = stand_in.StatusCount()
+        print("CoinGecko stand-in responses: " + ", ".join(
+            f"{status if status > 0 else 'timeout'}: {cnt}" for status, cnt in sorted(status_cnt.items())
+        ))
+
+
+def main() -> None:
+    """Run the server."""
+    RunServer()
+
+
+if __name__ == "__main__":
+    main()
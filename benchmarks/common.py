@@ -0,0 +1,115 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+"""Helpers shared by the benchmarks."""
+
+import contextlib
+import io
+import logging
+import timeit
+from typing import Any, Callable
+
+import pyrogram
+from pyrogram.enums import ChatType
+
+from telegram_crypto_price_bot.bot.bot_config import BotConfig
+from telegram_crypto_price_bot.bot.bot_config_types import BotConfigTypes
+from telegram_crypto_price_bot.config.config_file_sections_loader import ConfigFileSectionsLoader
+from telegram_crypto_price_bot.config.config_object import ConfigObject
+
+
+def Benchmark(name: str,
+              fct: Callable[[], Any],
+              iter_num: int,
+              rep_num: int = 5,
+              indent: int = 2) -> float:
+    """
+    Benchmark a function, taking the best repetition, and print the result.
+
+    Args:
+        name: Benchmark name.
+        fct: Function to benchmark.
+        iter_num: Number of iterations of each repetition.
+        rep_num: Number of repetitions.
+        indent: Indentation of the printed result.
+
+    Returns:
+        Time per call in seconds.
+    """
+    times = timeit.repeat(fct, number=iter_num, repeat=rep_num)
+    time_sec = min(times) / iter_num
+    print(f"{' ' * indent}{name:<12}{FormatTime(time_sec):>14}")
+    return time_sec
+
+
+def FormatTime(time_sec: float) -> str:
+    """
+    Format a time with the most suitable unit.
+
+    Args:
+        time_sec: Time in seconds.
+
+    Returns:
+        Formatted time.
+    """
+    for unit, unit_sec in (("s", 1.0), ("ms", 1e-3), ("us", 1e-6)):
+        if time_sec >= unit_sec:
+            return f"{time_sec / unit_sec:.2f} {unit}"
+    return f"{time_sec * 1e9:.1f} ns"
+
+
+def CreateChat(chat_idx: int) -> pyrogram.types.Chat:
+    """
+    Create a chat, like the ones of commands.
+
+    Args:
+        chat_idx: Chat index.
+
+    Returns:
+        Chat object.
+    """
+    return pyrogram.types.Chat(id=-1000000000000 - chat_idx, type=ChatType.SUPERGROUP, title=f"Group {chat_idx}")
+
+
+def LoadConfig(config_file: str,
+               backend: str,
+               jobs_num: int) -> ConfigObject:
+    """
+    Load the configuration, disabling logging and warm up.
+
+    Args:
+        config_file: Configuration file.
+        backend: Scheduler backend.
+        jobs_num: Maximum number of jobs.
+
+    Returns:
+        Configuration object.
+    """
+    # The loader prints the configuration
+    with contextlib.redirect_stdout(io.StringIO()):
+        config = ConfigFileSectionsLoader.Load(config_file, BotConfig)
+    config.SetValue(BotConfigTypes.LOG_LEVEL, logging.CRITICAL)
+    config.SetValue(BotConfigTypes.LOG_CONSOLE_ENABLED, False)
+    config.SetValue(BotConfigTypes.LOG_FILE_ENABLED, False)
+    config.SetValue(BotConfigTypes.TASKS_MAX_NUM, jobs_num)
+    config.SetValue(BotConfigTypes.TASKS_SCHEDULER_BACKEND, backend)
+    config.SetValue(BotConfigTypes.TASKS_WARMUP_SEC, 0)
+    return config
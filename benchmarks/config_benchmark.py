@@ -0,0 +1,55 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+"""
+Benchmark of configuration reads, comparing the attribute access of the configuration snapshot with
+ConfigObject.GetValue (type check and dictionary lookup for every call).
+
+Usage (from the repository root):
+    python -m benchmarks.config_benchmark [-n ITERATIONS]
+"""
+
+import argparse
+
+from benchmarks.common import Benchmark
+from telegram_crypto_price_bot.bot.bot_config_snapshot import BotConfigSnapshot
+from telegram_crypto_price_bot.bot.bot_config_types import BotConfigTypes
+from telegram_crypto_price_bot.config.config_object import ConfigObject
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description="Configuration reads benchmark")
+    parser.add_argument("-n", "--iterations", type=int, default=1000000, help="number of iterations")
+    args = parser.parse_args()
+
+    config = ConfigObject()
+    for config_type in BotConfigTypes:
+        config.SetValue(config_type, config_type.value)
+
+    print("Single value read (CHART_DISPLAY)")
+    prev_time = Benchmark("GetValue", lambda: config.GetValue(BotConfigTypes.CHART_DISPLAY), args.iterations)
+    curr_time = Benchmark("snapshot", lambda: config.Snapshot(BotConfigSnapshot).chart_display, args.iterations)
+    print(f"  speedup     {prev_time / curr_time:>14.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+"""
+Benchmark of the memory used by price tasks, measured with tracemalloc.
+For each number of jobs, it measures the bytes per job of the job records alone and of the jobs started
+through the scheduler (including job IDs, the jobs dictionary and the scheduler backend).
+Chats are created like for commands and only referenced by the jobs, so their memory is counted if kept.
+
+Usage (from the repository root):
+    python -m benchmarks.job_memory_benchmark [-j JOBS_NUM ...] [-c CONFIG_FILE] [-b BACKEND]
+"""
+
+import argparse
+import asyncio
+import gc
+import tracemalloc
+from typing import Awaitable, Callable
+
+import pyrogram
+
+from benchmarks.common import CreateChat, LoadConfig
+from telegram_crypto_price_bot.bot.bot_config import PriceBotConfigConst
+from telegram_crypto_price_bot.coin_info.coin_info_job import CoinInfoJob, CoinInfoJobData
+from telegram_crypto_price_bot.coin_info.coin_info_scheduler import CoinInfoScheduler
+from telegram_crypto_price_bot.info_message_sender.coin_info_message_sender import CoinInfoMessageSender
+from telegram_crypto_price_bot.logger.logger import Logger
+from telegram_crypto_price_bot.translation.translation_loader import TranslationLoader
+
+
+async def BenchmarkMemory(name: str,
+                          fct: Callable[[int], Awaitable[None]],
+                          jobs_num: int) -> float:
+    """
+    Benchmark the memory allocated by a function for each job.
+
+    Args:
+        name: Benchmark name.
+        fct: Coroutine function creating a job, called for each job index.
+        jobs_num: Number of jobs.
+
+    Returns:
+        Bytes per job.
+    """
+    gc.collect()
+    tracemalloc.start()
+    start_size = tracemalloc.get_traced_memory()[0]
+    for i in range(jobs_num):
+        await fct(i)
+    gc.collect()
+    end_size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    job_bytes = (end_size - start_size) / jobs_num
+    print(f"    {name:<12}{job_bytes:>10.0f} bytes/job")
+    return job_bytes
+
+
+async def Run(args: argparse.Namespace) -> None:
+    """
+    Run the benchmark.
+
+    Args:
+        args: Command line arguments.
+    """
+    config = LoadConfig(args.config, args.backend, max(args.jobs))
+    logger = Logger(config)
+    translator = TranslationLoader(logger)
+    translator.Load()
+    # The client is never started, no connection is made
+    client = pyrogram.Client("benchmark", in_memory=True)
+
+    for jobs_num in args.jobs:
+        print(f"{jobs_num} jobs")
+
+        coin_info_msg_sender = CoinInfoMessageSender(client, config, logger, translator)
+        jobs = []
+
+        async def create_job(i: int) -> None:
+            chat = CreateChat(i)
+            jobs.append(
+                CoinInfoJob(logger, coin_info_msg_sender, CoinInfoJobData(chat.id, chat.title, 0, 24, i % 24, "bitcoin", "usd", 1))
+            )
+
+        await BenchmarkMemory("record", create_job, jobs_num)
+        jobs.clear()
+
+        scheduler = CoinInfoScheduler(client, config, logger, translator)
+        await BenchmarkMemory(args.backend, lambda i: scheduler.Start(CreateChat(i), 0, 24, i % 24, "bitcoin", "usd", 1), jobs_num)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description="Price tasks memory benchmark")
+    parser.add_argument("-j", "--jobs", type=int, nargs="+", default=[10000, 100000], help="numbers of jobs")
+    parser.add_argument("-c", "--config", default="app/conf/config.ini", help="configuration file")
+    parser.add_argument("-b", "--backend", default="timing_wheel", choices=PriceBotConfigConst.TASKS_SCHEDULER_BACKENDS,
+                        help="scheduler backend")
+    args = parser.parse_args()
+
+    asyncio.run(Run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,361 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+"""
+Synthetic load benchmark, for sizing the bot before onboarding large communities.
+For each number of jobs, it starts the jobs in synthetic chats and runs them for some minutes in test mode
+(i.e. every minute), against a fake Telegram client and a local CoinGecko stand-in (started in a separate process),
+both with configurable latency and error rate.
+Each number of jobs is run in its own process, so that memory and CPU usage are measured separately. It measures:
+- throughput: completed job runs per second
+- latency: time from the scheduled minute to the last Telegram call of a job run (percentiles)
+- CPU: CPU time of the process (including chart rendering threads) per job run, and as percentage of wall time
+- memory: peak resident memory of the process
+
+Jobs are spread evenly over the coins, so jobs of the same coin share data and charts like in real usage.
+Logging is disabled, as it would only measure the console speed.
+Only Unix-like systems are supported, since the resource module is used for memory.
+
+Usage (from the repository root):
+    python -m benchmarks.load_benchmark [-j JOBS_NUM ...] [-m MINUTES] [-n COINS_NUM] [-c CONFIG_FILE] [-b BACKEND]
+                                        [--tg-latency-ms MS] [--tg-error-rate RATE]
+                                        [--cg-latency-ms MS] [--cg-error-rate RATE] [--cg-429-rate RATE]
+                                        [--cg-timeout-rate RATE] [--cg-port PORT]
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import random
+import resource
+import socket
+import sys
+import time
+from multiprocessing.connection import Connection
+from typing import Any, Dict, List, Tuple
+
+import pyrogram
+
+from benchmarks.coingecko_stand_in import RunServer
+from benchmarks.common import CreateChat, LoadConfig
+from telegram_crypto_price_bot.bot.bot_config import PriceBotConfigConst
+from telegram_crypto_price_bot.bot.bot_config_types import BotConfigTypes
+from telegram_crypto_price_bot.coin_info.coin_info_scheduler import CoinInfoScheduler
+from telegram_crypto_price_bot.config.config_object import ConfigObject
+from telegram_crypto_price_bot.logger.logger import Logger
+from telegram_crypto_price_bot.translation.translation_loader import TranslationLoader
+
+
+# Maximum time for completing the job runs after the measured minutes
+DRAIN_MAX_SEC: float = 60.0
+# Time without Telegram calls after which job runs are considered completed
+DRAIN_IDLE_SEC: float = 2.0
+
+
+class FakeTelegramClient(pyrogram.Client):
+    """
+    Fake Telegram client, which is never connected.
+    Calls used by jobs wait for a random latency and fail with the configured error rate.
+    The time of the last call of each job run is recorded.
+    """
+
+    latency_sec: float
+    error_rate: float
+    msg_id: int
+    calls_cnt: int
+    errors_cnt: int
+    last_call_time: float
+    run_end_times: Dict[Tuple[int, int], float]
+
+    def __init__(self,
+                 latency_sec: float,
+                 error_rate: float) -> None:
+        """
+        Initialize the client.
+
+        Args:
+            latency_sec: Mean latency in seconds (exponentially distributed).
+            error_rate: Fraction of calls failing.
+        """
+        super().__init__("benchmark", in_memory=True)
+        self.latency_sec = latency_sec
+        self.error_rate = error_rate
+        self.msg_id = 0
+        self.calls_cnt = 0
+        self.errors_cnt = 0
+        self.last_call_time = 0.0
+        self.run_end_times = {}
+
+    async def send_message(self, chat_id: int, *args: Any, **kwargs: Any) -> pyrogram.types.Message:
+        """Send a message."""
+        return await self.__Call(chat_id)
+
+    async def send_photo(self, chat_id: int, *args: Any, **kwargs: Any) -> pyrogram.types.Message:
+        """Send a photo."""
+        return await self.__Call(chat_id)
+
+    async def edit_message_text(self, chat_id: int, *args: Any, **kwargs: Any) -> pyrogram.types.Message:
+        """Edit the text of a message."""
+        return await self.__Call(chat_id)
+
+    async def edit_message_media(self, chat_id: int, *args: Any, **kwargs: Any) -> pyrogram.types.Message:
+        """Edit the media of a message."""
+        return await self.__Call(chat_id)
+
+    async def delete_messages(self, chat_id: int, *args: Any, **kwargs: Any) -> int:
+        """Delete messages."""
+        await self.__Call(chat_id)
+        return 1
+
+    async def __Call(self,
+                     chat_id: int) -> pyrogram.types.Message:
+        """
+        Simulate a call to Telegram.
+
+        Args:
+            chat_id: Chat ID.
+
+        Returns:
+            Message.
+        """
+        self.calls_cnt += 1
+        if self.latency_sec > 0:
+            await asyncio.sleep(random.expovariate(1 / self.latency_sec))
+
+        now = time.time()
+        self.last_call_time = now
+        # The scheduled minute of the run is assumed to be the current one
+        run_key = (chat_id, int(now // 60))
+        self.run_end_times[run_key] = now
+
+        if random.random() < self.error_rate:
+            self.errors_cnt += 1
+            raise pyrogram.errors.InternalServerError()
+        self.msg_id += 1
+        return pyrogram.types.Message(id=self.msg_id)
+
+
+def LoadTestModeConfig(args: argparse.Namespace,
+                       jobs_num: int) -> ConfigObject:
+    """
+    Load the configuration, in test mode and disabling logging and warm up.
+
+    Args:
+        args: Command line arguments.
+        jobs_num: Number of jobs.
+
+    Returns:
+        Configuration object.
+    """
+    config = LoadConfig(args.config, args.backend, jobs_num)
+    config.SetValue(BotConfigTypes.APP_TEST_MODE, True)
+    config.SetValue(BotConfigTypes.COINGECKO_API_BASE_URL, f"http://127.0.0.1:{args.cg_port}/api/v3")
+    # The stand-in has no rate limit
+    config.SetValue(BotConfigTypes.COINGECKO_API_RATE_LIMIT, 1000000)
+    return config
+
+
+def Percentile(values: List[float],
+               perc: float) -> float:
+    """
+    Get a percentile of values (nearest rank).
+
+    Args:
+        values: Sorted values.
+        perc: Percentile, from 0 to 100.
+
+    Returns:
+        Percentile value (0 if no values).
+    """
+    if len(values) == 0:
+        return 0.0
+    return values[min(len(values) - 1, max(0, int(round(perc / 100 * len(values))) - 1))]
+
+
+async def RunLoad(args: argparse.Namespace,
+                  jobs_num: int) -> Dict[str, float]:
+    """
+    Run the load with a number of jobs.
+
+    Args:
+        args: Command line arguments.
+        jobs_num: Number of jobs.
+
+    Returns:
+        Results.
+    """
+    config = LoadTestModeConfig(args, jobs_num)
+    logger = Logger(config)
+    translator = TranslationLoader(logger)
+    translator.Load()
+    client = FakeTelegramClient(args.tg_latency_ms / 1000, args.tg_error_rate)
+
+    scheduler = CoinInfoScheduler(client, config, logger, translator)
+    for i in range(jobs_num):
+        await scheduler.Start(CreateChat(i), 0, 1, 0, f"coin{i % args.coins}", "usd", 1)
+
+    # Measure from the beginning of the next minute, when all jobs are due
+    await asyncio.sleep(60 - time.time() % 60)
+    start_minute = int(time.time() // 60)
+    start_time = time.time()
+    start_cpu_time = time.process_time()
+    await asyncio.sleep(args.minutes * 60)
+
+    # Let the job runs of the last minute complete
+    drain_end_time = time.time() + DRAIN_MAX_SEC
+    while time.time() < drain_end_time and (
+        scheduler.job_queue.Depth() > 0 or time.time() - client.last_call_time < DRAIN_IDLE_SEC
+    ):
+        await asyncio.sleep(0.1)
+    elapsed_time = time.time() - start_time
+    cpu_time = time.process_time() - start_cpu_time
+
+    latencies = sorted(
+        end_time - minute * 60
+        for (_, minute), end_time in client.run_end_times.items()
+        if start_minute <= minute < start_minute + args.minutes
+    )
+    stats = await scheduler.GetStats()
+    # Peak resident memory is in kilobytes on Linux and in bytes on macOS
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * (1 if sys.platform == "darwin" else 1024)
+
+    return {
+        "runs": len(latencies),
+        "expected_runs": jobs_num * args.minutes,
+        "throughput": len(latencies) / elapsed_time,
+        "lat_p50": Percentile(latencies, 50),
+        "lat_p95": Percentile(latencies, 95),
+        "lat_p99": Percentile(latencies, 99),
+        "lat_max": latencies[-1] if len(latencies) > 0 else 0.0,
+        "cpu_perc": cpu_time / elapsed_time * 100,
+        "cpu_ms_per_run": cpu_time / max(1, len(latencies)) * 1e3,
+        "peak_rss_mb": peak_rss / (1024 * 1024),
+        "tg_errors": client.errors_cnt,
+        "dropped": stats.queue_dropped_cnt,
+        "coalesced": stats.queue_coalesced_cnt,
+    }
+
+
+def RunLoadProcess(args: argparse.Namespace,
+                   jobs_num: int,
+                   conn: Connection) -> None:
+    """
+    Run the load in a separate process, sending back the results.
+
+    Args:
+        args: Command line arguments.
+        jobs_num: Number of jobs.
+        conn: Connection to the main process.
+    """
+    conn.send(asyncio.run(RunLoad(args, jobs_num)))
+    conn.close()
+
+
+def WaitServer(port: int,
+               timeout_sec: float) -> None:
+    """
+    Wait for the CoinGecko stand-in to accept connections.
+
+    Args:
+        port: Port.
+        timeout_sec: Timeout in seconds.
+
+    Raises:
+        TimeoutError: If the server is not ready in time.
+    """
+    deadline = time.monotonic() + timeout_sec
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=1.0):
+                return
+        except OSError:
+            time.sleep(0.1)
+    raise TimeoutError("CoinGecko stand-in not started")
+
+
+def PrintResults(jobs_num: int,
+                 res: Dict[str, float]) -> None:
+    """
+    Print the results of a number of jobs.
+
+    Args:
+        jobs_num: Number of jobs.
+        res: Results.
+    """
+    print(f"{jobs_num} jobs")
+    print(f"    {'runs':<16}{res['runs']:>10.0f} / {res['expected_runs']:.0f} "
+          f"(dropped: {res['dropped']:.0f}, coalesced: {res['coalesced']:.0f}, Telegram errors: {res['tg_errors']:.0f})")
+    print(f"    {'throughput':<16}{res['throughput']:>10.2f} runs/s")
+    print(f"    {'latency p50':<16}{res['lat_p50']:>10.3f} s")
+    print(f"    {'latency p95':<16}{res['lat_p95']:>10.3f} s")
+    print(f"    {'latency p99':<16}{res['lat_p99']:>10.3f} s")
+    print(f"    {'latency max':<16}{res['lat_max']:>10.3f} s")
+    print(f"    {'CPU':<16}{res['cpu_perc']:>10.1f} % ({res['cpu_ms_per_run']:.2f} ms/run)")
+    print(f"    {'peak memory':<16}{res['peak_rss_mb']:>10.1f} MB")
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description="Synthetic load benchmark")
+    parser.add_argument("-j", "--jobs", type=int, nargs="+", default=[100, 1000], help="numbers of jobs")
+    parser.add_argument("-m", "--minutes", type=int, default=2, help="number of measured minutes")
+    parser.add_argument("-n", "--coins", type=int, default=20, help="number of distinct coins")
+    parser.add_argument("-c", "--config", default="app/conf/config.ini", help="configuration file")
+    parser.add_argument("-b", "--backend", default="timing_wheel", choices=PriceBotConfigConst.TASKS_SCHEDULER_BACKENDS,
+                        help="scheduler backend")
+    parser.add_argument("--tg-latency-ms", type=float, default=100.0, help="mean latency of Telegram calls in milliseconds")
+    parser.add_argument("--tg-error-rate", type=float, default=0.0, help="fraction of Telegram calls failing")
+    parser.add_argument("--cg-latency-ms", type=float, default=200.0, help="mean latency of CoinGecko requests in milliseconds")
+    parser.add_argument("--cg-error-rate", type=float, default=0.0, help="fraction of CoinGecko requests failing with a server error")
+    parser.add_argument("--cg-429-rate", dest="cg_rate_429", type=float, default=0.0,
+                        help="fraction of CoinGecko requests failing with 429")
+    parser.add_argument("--cg-timeout-rate", type=float, default=0.0, help="fraction of CoinGecko requests never replied")
+    parser.add_argument("--cg-port", type=int, default=8765, help="port of the CoinGecko stand-in")
+    args = parser.parse_args()
+
+    mp_ctx = multiprocessing.get_context("spawn")
+    server_process = mp_ctx.Process(
+        target=RunServer,
+        args=([
+            "--port", str(args.cg_port),
+            "--latency-ms", str(args.cg_latency_ms),
+            "--error-rate", str(args.cg_error_rate),
+            "--429-rate", str(args.cg_rate_429),
+            "--timeout-rate", str(args.cg_timeout_rate),
+        ],),
+        daemon=True
+    )
+    server_process.start()
+    try:
+        WaitServer(args.cg_port, 10.0)
+        for jobs_num in args.jobs:
+            parent_conn, child_conn = mp_ctx.Pipe()
+            load_process = mp_ctx.Process(target=RunLoadProcess, args=(args, jobs_num, child_conn))
+            load_process.start()
+            child_conn.close()
+            PrintResults(jobs_num, parent_conn.recv())
+            load_process.join()
+    finally:
+        server_process.terminate()
+
+
+if __name__ == "__main__":
+    main()
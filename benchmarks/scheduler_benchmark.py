@@ -0,0 +1,163 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+"""
+Benchmark of the scheduler backends, comparing APScheduler with the timing wheel for different numbers of jobs.
+For each number of jobs, it measures the time for adding the jobs, for getting the next runs within one hour
+(as done by the warmer) and for running the jobs due at the beginning of the current hour, through the
+RunDueJobs method of the backends.
+
+Usage (from the repository root):
+    python -m benchmarks.scheduler_benchmark [-j JOBS_NUM ...] [-r REPETITIONS]
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta
+from typing import List, Union
+
+from benchmarks.common import Benchmark, FormatTime
+from telegram_crypto_price_bot.bot.bot_config_types import BotConfigTypes
+from telegram_crypto_price_bot.coin_info.coin_info_apscheduler_backend import CoinInfoApSchedulerBackend
+from telegram_crypto_price_bot.coin_info.coin_info_timing_wheel_backend import CoinInfoTimingWheelBackend
+from telegram_crypto_price_bot.config.config_object import ConfigObject
+from telegram_crypto_price_bot.logger.logger import Logger
+
+
+SchedulerBackend = Union[CoinInfoApSchedulerBackend, CoinInfoTimingWheelBackend]
+
+
+async def JobFct(job_idx: int,
+                 run_job_idxs: List[int]) -> None:
+    """
+    Job function, only keeping track of its run.
+
+    Args:
+        job_idx: Job index.
+        run_job_idxs: Indexes of the jobs run.
+    """
+    run_job_idxs.append(job_idx)
+
+
+def CreateConfig() -> ConfigObject:
+    """
+    Create the configuration for the backends.
+    The misfire grace time is one hour, so that the runs due at the beginning of the current hour are not missed.
+
+    Returns:
+        Configuration object.
+    """
+    config = ConfigObject()
+    config.SetValue(BotConfigTypes.TASKS_MISFIRE_GRACE_TIME_SEC, 3600)
+    config.SetValue(BotConfigTypes.TASKS_COALESCE, True)
+    config.SetValue(BotConfigTypes.LOG_LEVEL, logging.CRITICAL)
+    config.SetValue(BotConfigTypes.LOG_CONSOLE_ENABLED, False)
+    config.SetValue(BotConfigTypes.LOG_FILE_ENABLED, False)
+    return config
+
+
+async def BenchmarkBackend(backend: SchedulerBackend,
+                           jobs_num: int,
+                           rep_num: int) -> List[float]:
+    """
+    Benchmark a backend.
+    Each job runs once a day, with start hours evenly distributed, so 1/24 of the jobs is due every hour.
+
+    Args:
+        backend: Backend.
+        jobs_num: Number of jobs.
+        rep_num: Number of repetitions.
+
+    Returns:
+        Times in seconds (add, next runs, due tick).
+    """
+    hour_start = datetime.now().astimezone().replace(minute=0, second=0, microsecond=0)
+    due_job_ids = [f"job{i}" for i in range(jobs_num) if i % 24 == hour_start.hour]
+    run_job_idxs: List[int] = []
+
+    def add_jobs() -> None:
+        for i in range(jobs_num):
+            backend.AddJob(f"job{i}", [i % 24], False, JobFct, (i, run_job_idxs))
+
+    def make_due() -> None:
+        if isinstance(backend, CoinInfoApSchedulerBackend):
+            for job_id in due_job_ids:
+                backend.scheduler.modify_job(job_id, next_run_time=hour_start)
+        else:
+            backend.last_tick_time = hour_start - timedelta(minutes=1)
+
+    # Jobs are added only once, the measured time is not repeated
+    times = [Benchmark("add", add_jobs, 1, rep_num=1, indent=4)]
+    times.append(Benchmark("next runs", lambda: backend.NextRuns(hour_start + timedelta(hours=1)), 1, rep_num, indent=4))
+
+    due_times = []
+    for _ in range(rep_num):
+        make_due()
+        run_job_idxs.clear()
+        start = time.perf_counter()
+        # Measured until all the due jobs are running, since APScheduler processes them asynchronously
+        backend.RunDueJobs()
+        while len(run_job_idxs) < len(due_job_ids):
+            await asyncio.sleep(0)
+        due_times.append(time.perf_counter() - start)
+    times.append(min(due_times))
+    print(f"    {'due tick':<12}{FormatTime(times[-1]):>14} ({len(due_job_ids)} due jobs)")
+
+    return times
+
+
+async def Run(jobs_nums: List[int],
+              rep_num: int) -> None:
+    """
+    Run the benchmark.
+
+    Args:
+        jobs_nums: Numbers of jobs.
+        rep_num: Number of repetitions.
+    """
+    config = CreateConfig()
+    logger = Logger(config)
+    # APScheduler logs each job run
+    logging.getLogger("apscheduler").setLevel(logging.CRITICAL)
+
+    for jobs_num in jobs_nums:
+        print(f"{jobs_num} jobs")
+        print("  apscheduler")
+        prev_times = await BenchmarkBackend(CoinInfoApSchedulerBackend(config, logger), jobs_num, rep_num)
+        print("  timing_wheel")
+        curr_times = await BenchmarkBackend(CoinInfoTimingWheelBackend(config, logger), jobs_num, rep_num)
+        print("  speedup     " + "  ".join(f"{prev / curr:.2f}x" for prev, curr in zip(prev_times, curr_times)))
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description="Scheduler backends benchmark")
+    parser.add_argument("-j", "--jobs", type=int, nargs="+", default=[1000, 10000, 100000], help="numbers of jobs")
+    parser.add_argument("-r", "--repetitions", type=int, default=5, help="number of repetitions")
+    args = parser.parse_args()
+
+    asyncio.run(Run(args.jobs, args.repetitions))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""
+Benchmark of translation sentences formatting, comparing the parsed templates of TranslationLoader with the
+previous implementation (dictionary lookup and str.format for every call).
+
+Usage (from the repository root):
+    python -m benchmarks.translation_benchmark [-n ITERATIONS]
+"""
+
+import argparse
+import logging
+from typing import Any, Dict
+
+from benchmarks.common import Benchmark
+from telegram_crypto_price_bot.bot.bot_config_types import BotConfigTypes
+from telegram_crypto_price_bot.config.config_object import ConfigObject
+from telegram_crypto_price_bot.logger.logger import Logger
+from telegram_crypto_price_bot.translation.translation_loader import TranslationLoader
+
+
+class PlainTranslationLoader:
+    """Previous implementation of translation loader: plain strings formatted for every call."""
+
+    sentences: Dict[str, str]
+
+    def __init__(self,
+                 translator: TranslationLoader) -> None:
+        """
+        Initialize the loader with the same sentences of a translation loader.
+
+        Args:
+            translator: Translation loader.
+        """
+        self.sentences = {sentence_id: str(sentence) for sentence_id, sentence in translator.sentences.items()}
+
+    def GetSentence(self,
+                    sentence_id: str,
+                    **kwargs: Any) -> str:
+        """
+        Get a translated sentence by ID with optional formatting.
+
+        Args:
+            sentence_id: The sentence identifier.
+            **kwargs: Keyword arguments for string formatting.
+
+        Returns:
+            Formatted translated sentence.
+        """
+        return self.sentences[sentence_id].format(**kwargs)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description="Translation formatting benchmark")
+    parser.add_argument("-n", "--iterations", type=int, default=200000, help="number of iterations")
+    args = parser.parse_args()
+
+    config = ConfigObject()
+    config.SetValue(BotConfigTypes.LOG_LEVEL, logging.WARNING)
+    config.SetValue(BotConfigTypes.LOG_CONSOLE_ENABLED, False)
+    config.SetValue(BotConfigTypes.LOG_FILE_ENABLED, False)
+
+    translator = TranslationLoader(Logger(config))
+    translator.Load()
+    plain_translator = PlainTranslationLoader(translator)
+
+    cases = {
+        "Static sentence (TASK_RUNNING_MSG)": ("TASK_RUNNING_MSG", {}),
+        "Sentence with placeholders (API_ERR_MSG)": ("API_ERR_MSG", {"coin_id": "bitcoin", "coin_vs": "usd"}),
+    }
+    for case_name, (sentence_id, kwargs) in cases.items():
+        print(case_name)
+        prev_time = Benchmark("previous", lambda: plain_translator.GetSentence(sentence_id, **kwargs), args.iterations)
+        curr_time = Benchmark("current", lambda: translator.GetSentence(sentence_id, **kwargs), args.iterations)
+        print(f"  speedup     {prev_time / curr_time:>14.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -18,11 +18,14 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 
-from typing import Any
+import asyncio
+import signal
+from typing import Any, Optional
 
 import pyrogram
 from pyrogram import Client, idle
 
+from telegram_crypto_price_bot.bot.bot_config_reloader import BotConfigReloader
 from telegram_crypto_price_bot.bot.bot_config_types import BotConfigTypes
 from telegram_crypto_price_bot.bot.bot_handlers_config_typing import BotHandlersConfigType
 from telegram_crypto_price_bot.command.command_dispatcher import CommandDispatcher, CommandTypes
@@ -40,10 +43,12 @@ class BotBase:
     config: ConfigObject
     logger: Logger
     translator: TranslationLoader
+    config_reloader: BotConfigReloader
     client: pyrogram.Client
     cmd_dispatcher: CommandDispatcher
     msg_dispatcher: MessageDispatcher
     handlers_config: BotHandlersConfigType
+    reload_task: Optional["asyncio.Task[bool]"]
 
     def __init__(self,
                  config_file: str,
@@ -61,7 +66,9 @@ class BotBase:
         self.logger = Logger(self.config)
         self.translator = TranslationLoader(self.logger)
         self.translator.Load(self.config.GetValue(BotConfigTypes.APP_LANG_FILE))
+        self.config_reloader = BotConfigReloader(config_file, config_sections, self.config, self.logger, self.translator)
         self.handlers_config = handlers_config
+        self.reload_task = None
         self.cmd_dispatcher = CommandDispatcher(self.config, self.logger, self.translator)
         self.msg_dispatcher = MessageDispatcher(self.config, self.logger, self.translator)
         self.logger.GetLogger().info("Bot initialization completed")
@@ -77,9 +84,33 @@ class BotBase:
     async def Run(self) -> None:
         """Start the bot client."""
         self.logger.GetLogger().info("Bot started!\n")
+        self.__SetupReloadSignal()
         async with self.client:
             await idle()
 
+    async def ReloadConfig(self) -> bool:
+        """
+        Reload the configuration file, without restarting the bot.
+
+        Returns:
+            True if reloaded, False otherwise.
+        """
+        return self.config_reloader.Reload()
+
+    def __SetupReloadSignal(self) -> None:
+        """Setup the SIGHUP signal for reloading the configuration file."""
+        # Not available on Windows
+        if not hasattr(signal, "SIGHUP"):
+            return
+
+        asyncio.get_running_loop().add_signal_handler(signal.SIGHUP, self.__OnReloadSignal)
+        self.logger.GetLogger().info("Send SIGHUP to reload the configuration file")
+
+    def __OnReloadSignal(self) -> None:
+        """Reload the configuration file when SIGHUP is received."""
+        # Signal handlers are plain callbacks, so the reload is executed in a task (referenced until the next signal)
+        self.reload_task = asyncio.get_running_loop().create_task(self.ReloadConfig())
+
     def __SetupHandlers(self,
                         handlers_config: BotHandlersConfigType) -> None:
         """
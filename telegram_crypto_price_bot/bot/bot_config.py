@@ -69,6 +69,9 @@ class PriceBotConfigConst:
     """Constants for price bot configuration."""
 
     LINE_STYLES: Tuple[str, ...] = ("-", "--", "-.", ":", " ", "")
+    CHART_RENDERERS: Tuple[str, ...] = ("matplotlib", "pillow")
+    TASKS_QUEUE_OVERFLOW_POLICIES: Tuple[str, ...] = ("drop", "delay", "coalesce")
+    TASKS_SCHEDULER_BACKENDS: Tuple[str, ...] = ("apscheduler", "timing_wheel")
 
 
 BotConfig: ConfigSectionsType = {
@@ -103,6 +106,66 @@ BotConfig: ConfigSectionsType = {
             "name": "app_lang_file",
             "def_val": None,
         },
+        {
+            "type": BotConfigTypes.APP_MEMORY_PROFILING,
+            "name": "app_memory_profiling",
+            "conv_fct": Utils.StrToBool,
+            "def_val": False,
+        },
+        {
+            "type": BotConfigTypes.APP_CPU_PROFILING,
+            "name": "app_cpu_profiling",
+            "conv_fct": Utils.StrToBool,
+            "def_val": False,
+        },
+        {
+            "type": BotConfigTypes.APP_LOOP_LAG_THRESHOLD_MS,
+            "name": "app_loop_lag_threshold_ms",
+            "conv_fct": Utils.StrToInt,
+            "def_val": 100,
+            "valid_if": lambda cfg, val: val >= 0,
+        },
+        {
+            "type": BotConfigTypes.APP_TRACE_SAMPLE_RATE,
+            "name": "app_trace_sample_rate",
+            "conv_fct": Utils.StrToFloat,
+            "def_val": 0.0,
+            "valid_if": lambda cfg, val: 0 <= val <= 1,
+        },
+        {
+            "type": BotConfigTypes.APP_TRACE_FILE_NAME,
+            "name": "app_trace_file_name",
+            "def_val": "logs/crypto_price_bot_traces.json",
+            "load_if": lambda cfg: cfg.GetValue(BotConfigTypes.APP_TRACE_SAMPLE_RATE) > 0,
+        },
+        {
+            "type": BotConfigTypes.APP_HEALTH_ENABLED,
+            "name": "app_health_enabled",
+            "conv_fct": Utils.StrToBool,
+            "def_val": False,
+        },
+        {
+            "type": BotConfigTypes.APP_HEALTH_HOST,
+            "name": "app_health_host",
+            "def_val": "127.0.0.1",
+            "load_if": lambda cfg: cfg.GetValue(BotConfigTypes.APP_HEALTH_ENABLED),
+        },
+        {
+            "type": BotConfigTypes.APP_HEALTH_PORT,
+            "name": "app_health_port",
+            "conv_fct": Utils.StrToInt,
+            "def_val": 8080,
+            "load_if": lambda cfg: cfg.GetValue(BotConfigTypes.APP_HEALTH_ENABLED),
+            "valid_if": lambda cfg, val: 0 < val < 65536,
+        },
+        {
+            "type": BotConfigTypes.APP_HEALTH_MAX_LOOP_LAG_MS,
+            "name": "app_health_max_loop_lag_ms",
+            "conv_fct": Utils.StrToInt,
+            "def_val": 1000,
+            "load_if": lambda cfg: cfg.GetValue(BotConfigTypes.APP_HEALTH_ENABLED),
+            "valid_if": lambda cfg, val: val > 0,
+        },
     ],
     # Task
     "task": [
@@ -113,6 +176,73 @@ BotConfig: ConfigSectionsType = {
             "def_val": 20,
             "valid_if": lambda cfg, val: val > 0,
         },
+        {
+            "type": BotConfigTypes.TASKS_SHARDS_NUM,
+            "name": "tasks_shards_num",
+            "conv_fct": Utils.StrToInt,
+            "def_val": 1,
+            "valid_if": lambda cfg, val: val > 0,
+        },
+        {
+            "type": BotConfigTypes.TASKS_SCHEDULER_BACKEND,
+            "name": "tasks_scheduler_backend",
+            "def_val": "apscheduler",
+            "valid_if": lambda cfg, val: val in PriceBotConfigConst.TASKS_SCHEDULER_BACKENDS,
+        },
+        {
+            "type": BotConfigTypes.TASKS_WORKERS_NUM,
+            "name": "tasks_workers_num",
+            "conv_fct": Utils.StrToInt,
+            "def_val": 4,
+            "valid_if": lambda cfg, val: val > 0,
+        },
+        {
+            "type": BotConfigTypes.TASKS_QUEUE_MAX_SIZE,
+            "name": "tasks_queue_max_size",
+            "conv_fct": Utils.StrToInt,
+            "def_val": 100,
+            "valid_if": lambda cfg, val: val > 0,
+        },
+        {
+            "type": BotConfigTypes.TASKS_QUEUE_OVERFLOW_POLICY,
+            "name": "tasks_queue_overflow_policy",
+            "def_val": "coalesce",
+            "valid_if": lambda cfg, val: val in PriceBotConfigConst.TASKS_QUEUE_OVERFLOW_POLICIES,
+        },
+        {
+            "type": BotConfigTypes.TASKS_MISFIRE_GRACE_TIME_SEC,
+            "name": "tasks_misfire_grace_time_sec",
+            "conv_fct": Utils.StrToInt,
+            "def_val": 60,
+            "valid_if": lambda cfg, val: val > 0,
+        },
+        {
+            "type": BotConfigTypes.TASKS_COALESCE,
+            "name": "tasks_coalesce",
+            "conv_fct": Utils.StrToBool,
+            "def_val": True,
+        },
+        {
+            "type": BotConfigTypes.TASKS_MAX_INSTANCES,
+            "name": "tasks_max_instances",
+            "conv_fct": Utils.StrToInt,
+            "def_val": 1,
+            "valid_if": lambda cfg, val: val > 0,
+        },
+        {
+            "type": BotConfigTypes.TASKS_WARMUP_SEC,
+            "name": "tasks_warmup_sec",
+            "conv_fct": Utils.StrToInt,
+            "def_val": 0,
+            "valid_if": lambda cfg, val: val >= 0,
+        },
+        {
+            "type": BotConfigTypes.TASKS_FANOUT_MAX_SENDS,
+            "name": "tasks_fanout_max_sends",
+            "conv_fct": Utils.StrToInt,
+            "def_val": 10,
+            "valid_if": lambda cfg, val: val > 0,
+        },
     ],
     # Coingecko
     "coingecko": [
@@ -126,6 +256,11 @@ BotConfig: ConfigSectionsType = {
             "name": "coingecko_api_key_pro",
             "def_val": "",
         },
+        {
+            "type": BotConfigTypes.COINGECKO_API_BASE_URL,
+            "name": "coingecko_api_base_url",
+            "def_val": "",
+        },
         {
             "type": BotConfigTypes.COINGECKO_API_MAX_RETRIES,
             "name": "coingecko_api_max_retries",
@@ -138,6 +273,74 @@ BotConfig: ConfigSectionsType = {
             "conv_fct": Utils.StrToFloat,
             "def_val": 10.0,
         },
+        {
+            "type": BotConfigTypes.COINGECKO_API_RATE_LIMIT,
+            "name": "coingecko_api_rate_limit",
+            "conv_fct": Utils.StrToInt,
+            "def_val": 0,
+            "valid_if": lambda cfg, val: val >= 0,
+        },
+        {
+            "type": BotConfigTypes.COINGECKO_API_STALE_MAX_AGE_SEC,
+            "name": "coingecko_api_stale_max_age_sec",
+            "conv_fct": Utils.StrToInt,
+            "def_val": 0,
+            "valid_if": lambda cfg, val: val >= 0,
+        },
+        {
+            "type": BotConfigTypes.COINGECKO_API_STALE_WAIT_SEC,
+            "name": "coingecko_api_stale_wait_sec",
+            "conv_fct": Utils.StrToFloat,
+            "def_val": 5.0,
+            "load_if": lambda cfg: cfg.GetValue(BotConfigTypes.COINGECKO_API_STALE_MAX_AGE_SEC) > 0,
+            "valid_if": lambda cfg, val: val >= 0,
+        },
+        {
+            "type": BotConfigTypes.COINGECKO_API_CB_ENABLED,
+            "name": "coingecko_api_cb_enabled",
+            "conv_fct": Utils.StrToBool,
+            "def_val": True,
+        },
+        {
+            "type": BotConfigTypes.COINGECKO_API_CB_FAILURE_RATE,
+            "name": "coingecko_api_cb_failure_rate",
+            "conv_fct": Utils.StrToFloat,
+            "def_val": 0.5,
+            "load_if": lambda cfg: cfg.GetValue(BotConfigTypes.COINGECKO_API_CB_ENABLED),
+            "valid_if": lambda cfg, val: 0 < val <= 1,
+        },
+        {
+            "type": BotConfigTypes.COINGECKO_API_CB_MIN_REQUESTS,
+            "name": "coingecko_api_cb_min_requests",
+            "conv_fct": Utils.StrToInt,
+            "def_val": 10,
+            "load_if": lambda cfg: cfg.GetValue(BotConfigTypes.COINGECKO_API_CB_ENABLED),
+            "valid_if": lambda cfg, val: val > 0,
+        },
+        {
+            "type": BotConfigTypes.COINGECKO_API_CB_WINDOW_SEC,
+            "name": "coingecko_api_cb_window_sec",
+            "conv_fct": Utils.StrToFloat,
+            "def_val": 60.0,
+            "load_if": lambda cfg: cfg.GetValue(BotConfigTypes.COINGECKO_API_CB_ENABLED),
+            "valid_if": lambda cfg, val: val > 0,
+        },
+        {
+            "type": BotConfigTypes.COINGECKO_API_CB_OPEN_SEC,
+            "name": "coingecko_api_cb_open_sec",
+            "conv_fct": Utils.StrToFloat,
+            "def_val": 30.0,
+            "load_if": lambda cfg: cfg.GetValue(BotConfigTypes.COINGECKO_API_CB_ENABLED),
+            "valid_if": lambda cfg, val: val > 0,
+        },
+        {
+            "type": BotConfigTypes.COINGECKO_API_CB_PROBES_NUM,
+            "name": "coingecko_api_cb_probes_num",
+            "conv_fct": Utils.StrToInt,
+            "def_val": 1,
+            "load_if": lambda cfg: cfg.GetValue(BotConfigTypes.COINGECKO_API_CB_ENABLED),
+            "valid_if": lambda cfg, val: val > 0,
+        },
         # For retro-compatibility
         {
             "type": BotConfigTypes.COINGECKO_API_KEY_PRO,
@@ -153,6 +356,13 @@ BotConfig: ConfigSectionsType = {
             "conv_fct": Utils.StrToBool,
             "def_val": True,
         },
+        {
+            "type": BotConfigTypes.CHART_RENDERER,
+            "name": "chart_renderer",
+            "def_val": "matplotlib",
+            "load_if": lambda cfg: cfg.GetValue(BotConfigTypes.CHART_DISPLAY),
+            "valid_if": lambda cfg, val: val in PriceBotConfigConst.CHART_RENDERERS,
+        },
         {
             "type": BotConfigTypes.CHART_DATE_FORMAT,
             "name": "chart_date_format",
@@ -0,0 +1,208 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+import configparser
+from typing import Any, Callable, Optional, Set, Tuple
+
+from defusedxml import ElementTree
+
+from telegram_crypto_price_bot.bot.bot_config_types import BotConfigTypes
+from telegram_crypto_price_bot.chart_info.chart_info_file_saver import chart_render_cache
+from telegram_crypto_price_bot.config.config_file_sections_loader import ConfigFileSectionsLoader
+from telegram_crypto_price_bot.config.config_loader_ex import ConfigFieldNotExistentError, ConfigFieldValueError
+from telegram_crypto_price_bot.config.config_object import ConfigObject, ConfigTypes
+from telegram_crypto_price_bot.config.config_typing import ConfigSectionsType
+from telegram_crypto_price_bot.logger.logger import Logger
+from telegram_crypto_price_bot.price_info.price_info_builder import price_info_text_cache
+from telegram_crypto_price_bot.translation.translation_loader import TranslationLoader
+
+
+class BotConfigReloaderConst:
+    """Constants for bot configuration reloader class."""
+
+    # Values used only at startup (Telegram session, shard processes, job queue and scheduler), kept until restart
+    RESTART_TYPES: Tuple[BotConfigTypes, ...] = (
+        BotConfigTypes.API_ID,
+        BotConfigTypes.API_HASH,
+        BotConfigTypes.BOT_TOKEN,
+        BotConfigTypes.SESSION_NAME,
+        BotConfigTypes.APP_HEALTH_ENABLED,
+        BotConfigTypes.APP_HEALTH_HOST,
+        BotConfigTypes.APP_HEALTH_PORT,
+        BotConfigTypes.TASKS_SHARDS_NUM,
+        BotConfigTypes.TASKS_SCHEDULER_BACKEND,
+        BotConfigTypes.TASKS_WORKERS_NUM,
+        BotConfigTypes.TASKS_QUEUE_MAX_SIZE,
+        BotConfigTypes.TASKS_MISFIRE_GRACE_TIME_SEC,
+        BotConfigTypes.TASKS_COALESCE,
+        BotConfigTypes.TASKS_MAX_INSTANCES,
+        BotConfigTypes.TASKS_WARMUP_SEC,
+    )
+    # Values changed at runtime by commands, kept as they are
+    RUNTIME_TYPES: Tuple[BotConfigTypes, ...] = (
+        BotConfigTypes.APP_TEST_MODE,
+    )
+    LOG_TYPES_PREFIX: str = "LOG_"
+    CHART_TYPES_PREFIX: str = "CHART_"
+
+
+class BotConfigReloader:
+    """
+    Class for reloading the configuration file without restarting the bot.
+    The new configuration is validated and then swapped into the configuration object shared by all components,
+    so scheduled jobs, caches and the Telegram session are kept.
+    """
+
+    config_file: str
+    config_sections: ConfigSectionsType
+    config: ConfigObject
+    logger: Logger
+    translator: TranslationLoader
+    adapt_config_fct: Optional[Callable[[ConfigObject], None]]
+
+    def __init__(self,
+                 config_file: str,
+                 config_sections: ConfigSectionsType,
+                 config: ConfigObject,
+                 logger: Logger,
+                 translator: TranslationLoader,
+                 *,
+                 adapt_config_fct: Optional[Callable[[ConfigObject], None]] = None) -> None:
+        """
+        Initialize the configuration reloader.
+
+        Args:
+            config_file: Path to the configuration file.
+            config_sections: Configuration sections to load.
+            config: Configuration object to be updated.
+            logger: Logger instance.
+            translator: Translation loader.
+            adapt_config_fct: Function for adapting the loaded configuration before applying it (optional).
+        """
+        self.config_file = config_file
+        self.config_sections = config_sections
+        self.config = config
+        self.logger = logger
+        self.translator = translator
+        self.adapt_config_fct = adapt_config_fct
+
+    def Reload(self) -> bool:
+        """
+        Reload the configuration file.
+        If the file (or the language file it refers to) is not valid, the current configuration is kept.
+
+        Returns:
+            True if reloaded, False otherwise.
+        """
+        self.logger.GetLogger().info(f"Reloading configuration file {self.config_file}...")
+
+        try:
+            new_config = ConfigFileSectionsLoader.Load(self.config_file, self.config_sections)
+        except (ConfigFieldNotExistentError, ConfigFieldValueError, ValueError, configparser.Error):
+            self.logger.GetLogger().exception("Configuration file not valid, keeping the current configuration")
+            return False
+
+        if self.adapt_config_fct is not None:
+            self.adapt_config_fct(new_config)
+        self.__KeepValues(new_config)
+
+        # The language file is always loaded again, since its content may have changed.
+        # It is loaded before updating the configuration, so that nothing is applied if it is not valid.
+        try:
+            self.translator.Load(new_config.GetValue(BotConfigTypes.APP_LANG_FILE))
+        except (ElementTree.ParseError, OSError, ValueError):
+            self.logger.GetLogger().exception("Language file not valid, keeping the current configuration")
+            return False
+
+        changed_types = self.__GetChangedTypes(new_config)
+        # All components share the configuration object, so they get the new values at once
+        self.config.Update(new_config)
+        self.__ApplyChanges(changed_types)
+
+        self.logger.GetLogger().info(f"Configuration reloaded, {len(changed_types)} value(s) changed")
+        return True
+
+    def __KeepValues(self,
+                     new_config: ConfigObject) -> None:
+        """
+        Keep the current values that cannot be reloaded.
+
+        Args:
+            new_config: Loaded configuration object.
+        """
+        for config_type in BotConfigReloaderConst.RESTART_TYPES:
+            if self.__GetValue(new_config, config_type) != self.__GetValue(self.config, config_type):
+                self.logger.GetLogger().warning(
+                    f'Configuration value "{config_type.name.lower()}" changed, restart the bot to apply it'
+                )
+
+        for config_type in BotConfigReloaderConst.RESTART_TYPES + BotConfigReloaderConst.RUNTIME_TYPES:
+            if self.config.IsValueSet(config_type):
+                new_config.SetValue(config_type, self.config.GetValue(config_type))
+
+    def __GetChangedTypes(self,
+                          new_config: ConfigObject) -> Set[ConfigTypes]:
+        """
+        Get the configuration types whose value changed.
+
+        Args:
+            new_config: Loaded configuration object.
+
+        Returns:
+            Changed configuration types.
+        """
+        return {
+            config_type
+            for config_type in set(self.config.config) | set(new_config.config)
+            if self.__GetValue(new_config, config_type) != self.__GetValue(self.config, config_type)
+        }
+
+    def __ApplyChanges(self,
+                       changed_types: Set[ConfigTypes]) -> None:
+        """
+        Apply the new configuration to the components that do not read it at every use.
+        CoinGecko API objects detect the new configuration by themselves, at the next request.
+
+        Args:
+            changed_types: Changed configuration types.
+        """
+        changed_names = [config_type.name for config_type in changed_types]
+
+        if any(name.startswith(BotConfigReloaderConst.LOG_TYPES_PREFIX) for name in changed_names):
+            self.logger.Reload()
+        price_info_text_cache.Clear()
+        if any(name.startswith(BotConfigReloaderConst.CHART_TYPES_PREFIX) for name in changed_names):
+            chart_render_cache.Clear()
+
+    @staticmethod
+    def __GetValue(config: ConfigObject,
+                   config_type: ConfigTypes) -> Any:
+        """
+        Get a configuration value, if set.
+
+        Args:
+            config: Configuration object.
+            config_type: Configuration type.
+
+        Returns:
+            Configuration value, None if not set.
+        """
+        return config.GetValue(config_type) if config.IsValueSet(config_type) else None
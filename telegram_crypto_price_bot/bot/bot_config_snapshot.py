@@ -0,0 +1,108 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+from typing import NamedTuple, Optional
+
+
+class BotConfigSnapshot(NamedTuple):
+    """
+    Immutable and typed snapshot of the bot configuration, got by ConfigObject.Snapshot.
+    Each field is named as the lower-case name of its configuration type (e.g. BotConfigTypes.CHART_DISPLAY
+    is read as snapshot.chart_display). Values that are not loaded because of their load_if condition are None.
+    """
+
+    # Pyrogram
+    api_id: str
+    api_hash: str
+    bot_token: str
+    session_name: str
+    # App
+    app_test_mode: bool
+    app_lang_file: Optional[str]
+    app_memory_profiling: bool
+    app_cpu_profiling: bool
+    app_loop_lag_threshold_ms: int
+    app_trace_sample_rate: float
+    app_health_enabled: bool
+    # Task
+    tasks_max_num: int
+    tasks_shards_num: int
+    tasks_scheduler_backend: str
+    tasks_workers_num: int
+    tasks_queue_max_size: int
+    tasks_queue_overflow_policy: str
+    tasks_misfire_grace_time_sec: int
+    tasks_coalesce: bool
+    tasks_max_instances: int
+    tasks_warmup_sec: int
+    tasks_fanout_max_sends: int
+    # Coingecko
+    coingecko_api_key_demo: str
+    coingecko_api_key_pro: str
+    coingecko_api_base_url: str
+    coingecko_api_max_retries: int
+    coingecko_api_timeout_sec: float
+    coingecko_api_rate_limit: int
+    coingecko_api_stale_max_age_sec: int
+    coingecko_api_cb_enabled: bool
+    # Chart
+    chart_display: bool
+    # Price
+    price_display_market_cap: bool
+    price_display_market_cap_rank: bool
+    # Logging
+    log_level: int
+    log_console_enabled: bool
+    log_file_enabled: bool
+
+    # Values loaded only if enabled (fields with defaults shall follow the other ones)
+    # App
+    app_trace_file_name: Optional[str] = None
+    app_health_host: Optional[str] = None
+    app_health_port: Optional[int] = None
+    app_health_max_loop_lag_ms: Optional[int] = None
+    # Coingecko
+    coingecko_api_stale_wait_sec: Optional[float] = None
+    coingecko_api_cb_failure_rate: Optional[float] = None
+    coingecko_api_cb_min_requests: Optional[int] = None
+    coingecko_api_cb_window_sec: Optional[float] = None
+    coingecko_api_cb_open_sec: Optional[float] = None
+    coingecko_api_cb_probes_num: Optional[int] = None
+    # Chart
+    chart_renderer: Optional[str] = None
+    chart_date_format: Optional[str] = None
+    chart_background_color: Optional[str] = None
+    chart_title_color: Optional[str] = None
+    chart_frame_color: Optional[str] = None
+    chart_axes_color: Optional[str] = None
+    chart_line_color: Optional[str] = None
+    chart_line_style: Optional[str] = None
+    chart_line_width: Optional[int] = None
+    chart_display_grid: Optional[bool] = None
+    chart_grid_max_size: Optional[int] = None
+    chart_grid_color: Optional[str] = None
+    chart_grid_line_style: Optional[str] = None
+    chart_grid_line_width: Optional[int] = None
+    # Logging
+    log_file_name: Optional[str] = None
+    log_file_use_rotating: Optional[bool] = None
+    log_file_append: Optional[bool] = None
+    log_file_max_bytes: Optional[int] = None
+    log_file_backup_cnt: Optional[int] = None
@@ -34,15 +34,45 @@ class BotConfigTypes(ConfigTypes):
     # App
     APP_TEST_MODE = auto()
     APP_LANG_FILE = auto()
+    APP_MEMORY_PROFILING = auto()
+    APP_CPU_PROFILING = auto()
+    APP_LOOP_LAG_THRESHOLD_MS = auto()
+    APP_TRACE_SAMPLE_RATE = auto()
+    APP_TRACE_FILE_NAME = auto()
+    APP_HEALTH_ENABLED = auto()
+    APP_HEALTH_HOST = auto()
+    APP_HEALTH_PORT = auto()
+    APP_HEALTH_MAX_LOOP_LAG_MS = auto()
     # Task
     TASKS_MAX_NUM = auto()
+    TASKS_SHARDS_NUM = auto()
+    TASKS_SCHEDULER_BACKEND = auto()
+    TASKS_WORKERS_NUM = auto()
+    TASKS_QUEUE_MAX_SIZE = auto()
+    TASKS_QUEUE_OVERFLOW_POLICY = auto()
+    TASKS_MISFIRE_GRACE_TIME_SEC = auto()
+    TASKS_COALESCE = auto()
+    TASKS_MAX_INSTANCES = auto()
+    TASKS_WARMUP_SEC = auto()
+    TASKS_FANOUT_MAX_SENDS = auto()
     # Coingecko
     COINGECKO_API_KEY_DEMO = auto()
     COINGECKO_API_KEY_PRO = auto()
+    COINGECKO_API_BASE_URL = auto()
     COINGECKO_API_MAX_RETRIES = auto()
     COINGECKO_API_TIMEOUT_SEC = auto()
+    COINGECKO_API_RATE_LIMIT = auto()
+    COINGECKO_API_STALE_MAX_AGE_SEC = auto()
+    COINGECKO_API_STALE_WAIT_SEC = auto()
+    COINGECKO_API_CB_ENABLED = auto()
+    COINGECKO_API_CB_FAILURE_RATE = auto()
+    COINGECKO_API_CB_MIN_REQUESTS = auto()
+    COINGECKO_API_CB_WINDOW_SEC = auto()
+    COINGECKO_API_CB_OPEN_SEC = auto()
+    COINGECKO_API_CB_PROBES_NUM = auto()
     # Chart
     CHART_DISPLAY = auto()
+    CHART_RENDERER = auto()
     CHART_DATE_FORMAT = auto()
     CHART_BACKGROUND_COLOR = auto()
     CHART_TITLE_COLOR = auto()
@@ -56,6 +56,14 @@ BotHandlersConfig: BotHandlersConfigType = {
             "callback": lambda self, client, message: self.DispatchCommand(client, message, CommandTypes.VERSION_CMD),
             "filters": filters.command(["pricebot_version"]),
         },
+        {
+            "callback": (
+                lambda self, client, message: self.DispatchCommand(
+                    client, message, CommandTypes.RELOAD_CONFIG_CMD, reload_config_fct=self.ReloadConfig
+                )
+            ),
+            "filters": filters.command(["pricebot_reload_config"]),
+        },
         #
         # Price commands (single call)
         #
@@ -106,6 +114,38 @@ BotHandlersConfig: BotHandlersConfigType = {
             ),
             "filters": filters.command(["pricebot_task_resume"]),
         },
+        {
+            "callback": (
+                lambda self, client, message: self.DispatchCommand(
+                    client, message, CommandTypes.PRICE_TASK_START_BULK_CMD, coin_info_scheduler=self.coin_info_scheduler
+                )
+            ),
+            "filters": filters.command(["pricebot_task_start_bulk"]),
+        },
+        {
+            "callback": (
+                lambda self, client, message: self.DispatchCommand(
+                    client, message, CommandTypes.PRICE_TASK_STOP_BULK_CMD, coin_info_scheduler=self.coin_info_scheduler
+                )
+            ),
+            "filters": filters.command(["pricebot_task_stop_bulk"]),
+        },
+        {
+            "callback": (
+                lambda self, client, message: self.DispatchCommand(
+                    client, message, CommandTypes.PRICE_TASK_PAUSE_BULK_CMD, coin_info_scheduler=self.coin_info_scheduler
+                )
+            ),
+            "filters": filters.command(["pricebot_task_pause_bulk"]),
+        },
+        {
+            "callback": (
+                lambda self, client, message: self.DispatchCommand(
+                    client, message, CommandTypes.PRICE_TASK_RESUME_BULK_CMD, coin_info_scheduler=self.coin_info_scheduler
+                )
+            ),
+            "filters": filters.command(["pricebot_task_resume_bulk"]),
+        },
         {
             "callback": (
                 lambda self, client, message: self.DispatchCommand(
@@ -122,6 +162,14 @@ BotHandlersConfig: BotHandlersConfigType = {
             ),
             "filters": filters.command(["pricebot_task_delete_last_msg"]),
         },
+        {
+            "callback": (
+                lambda self, client, message: self.DispatchCommand(
+                    client, message, CommandTypes.PRICE_TASK_EDIT_LAST_MSG_CMD, coin_info_scheduler=self.coin_info_scheduler
+                )
+            ),
+            "filters": filters.command(["pricebot_task_edit_last_msg"]),
+        },
         {
             "callback": (
                 lambda self, client, message: self.DispatchCommand(
@@ -130,6 +178,54 @@ BotHandlersConfig: BotHandlersConfigType = {
             ),
             "filters": filters.command(["pricebot_task_info"]),
         },
+        {
+            "callback": (
+                lambda self, client, message: self.DispatchCommand(
+                    client, message, CommandTypes.PRICE_TASK_STATS_CMD, coin_info_scheduler=self.coin_info_scheduler
+                )
+            ),
+            "filters": filters.command(["pricebot_task_stats"]),
+        },
+        {
+            "callback": (
+                lambda self, client, message: self.DispatchCommand(
+                    client, message, CommandTypes.MEMORY_START_CMD, profiling_controller=self.profiling_controller
+                )
+            ),
+            "filters": filters.command(["pricebot_memory_start"]),
+        },
+        {
+            "callback": (
+                lambda self, client, message: self.DispatchCommand(
+                    client, message, CommandTypes.MEMORY_SNAPSHOT_CMD, profiling_controller=self.profiling_controller
+                )
+            ),
+            "filters": filters.command(["pricebot_memory_snapshot"]),
+        },
+        {
+            "callback": (
+                lambda self, client, message: self.DispatchCommand(
+                    client, message, CommandTypes.MEMORY_STOP_CMD, profiling_controller=self.profiling_controller
+                )
+            ),
+            "filters": filters.command(["pricebot_memory_stop"]),
+        },
+        {
+            "callback": (
+                lambda self, client, message: self.DispatchCommand(
+                    client, message, CommandTypes.PROFILE_START_CMD, profiling_controller=self.profiling_controller
+                )
+            ),
+            "filters": filters.command(["pricebot_profile_start"]),
+        },
+        {
+            "callback": (
+                lambda self, client, message: self.DispatchCommand(
+                    client, message, CommandTypes.PROFILE_STOP_CMD, profiling_controller=self.profiling_controller
+                )
+            ),
+            "filters": filters.command(["pricebot_profile_stop"]),
+        },
         #
         # Update status messages
         #
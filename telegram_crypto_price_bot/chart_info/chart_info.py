@@ -20,8 +20,10 @@
 
 from typing import Dict, List, Union
 
+from telegram_crypto_price_bot.coingecko.coingecko_fetched_data import CoinGeckoFetchedData
 
-class ChartInfo:
+
+class ChartInfo(CoinGeckoFetchedData):
     """Class for storing and accessing chart information for cryptocurrency prices."""
 
     coin_id: str
@@ -44,6 +46,7 @@ class ChartInfo:
             coin_vs: Currency to compare against (e.g., 'usd').
             last_days: Number of days of historical data.
         """
+        super().__init__()
         self.coin_id = coin_id
         self.coin_vs = coin_vs
         self.last_days = last_days
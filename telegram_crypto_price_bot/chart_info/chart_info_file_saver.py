@@ -18,21 +18,27 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 
+import asyncio
 import os
 import secrets
 import string
+import time
 from datetime import datetime
 from threading import Lock
-from typing import Optional
+from typing import Dict, Optional, Tuple, Union
 
 import matplotlib
 from matplotlib import pyplot as plt
 
+from telegram_crypto_price_bot.bot.bot_config_snapshot import BotConfigSnapshot
 from telegram_crypto_price_bot.bot.bot_config_types import BotConfigTypes
 from telegram_crypto_price_bot.chart_info.chart_info import ChartInfo
+from telegram_crypto_price_bot.chart_info.chart_info_pillow_file_saver import ChartInfoPillowFileSaver
 from telegram_crypto_price_bot.config.config_object import ConfigObject
 from telegram_crypto_price_bot.logger.logger import Logger
 from telegram_crypto_price_bot.misc.formatters import CoinIdFormatter, PriceFormatter
+from telegram_crypto_price_bot.priority.priority_gate import PriorityGate
+from telegram_crypto_price_bot.profiling.sampling_profiler import ProfiledStage
 from telegram_crypto_price_bot.translation.translation_loader import TranslationLoader
 from telegram_crypto_price_bot.utils.utils import Synchronized
 
@@ -41,12 +47,15 @@ from telegram_crypto_price_bot.utils.utils import Synchronized
 matplotlib.use("Agg")
 # Lock for thread safety when creating charts
 plot_lock: Lock = Lock()
+# Gate for rendering charts one at a time, interactive commands first
+chart_render_gate: PriorityGate = PriorityGate("render", 1)
 
 
 class ChartInfoFileSaverConst:
     """Constants for chart info file saver class."""
 
     CHART_IMG_EXT: str = ".png"
+    PILLOW_RENDERER: str = "pillow"
     TMP_FILE_NAME_LEN: int = 16
 
 
@@ -70,6 +79,7 @@ class ChartInfoFileSaver:
         self.translator = translator
 
     @Synchronized(plot_lock)
+    @ProfiledStage("chart_render")
     def SaveToFile(self,
                    chart_info: ChartInfo,
                    file_name: str) -> None:
@@ -80,29 +90,36 @@ class ChartInfoFileSaver:
             chart_info: Chart information to plot and save
             file_name: Path to save the chart image
         """
+        config = self.config.Snapshot(BotConfigSnapshot)
         fig, ax = plt.subplots()
 
-        self.__SetAxesFormatter(ax)
-        self.__SetBackgroundColor(fig, ax)
-        self.__SetAxesColor(ax)
-        self.__SetFrameColor(ax)
-        self.__SetGrid(ax)
-        self.__SetTitle(chart_info, ax)
-        self.__Plot(chart_info, fig, ax)
+        self.__SetAxesFormatter(ax, config)
+        self.__SetBackgroundColor(fig, ax, config)
+        self.__SetAxesColor(ax, config)
+        self.__SetFrameColor(ax, config)
+        self.__SetGrid(ax, config)
+        self.__SetTitle(chart_info, ax, config)
+        self.__Plot(chart_info, fig, ax, config)
         self.__SaveAndClose(fig, file_name)
 
     def __SetAxesFormatter(self,
-                           ax: plt.axes) -> None:
+                           ax: plt.axes,
+                           config: BotConfigSnapshot) -> None:
         """
         Set formatting for chart axes.
 
         Args:
             ax: Matplotlib axes object to configure.
+            config: Configuration snapshot.
         """
-        date_format = self.config.GetValue(BotConfigTypes.CHART_DATE_FORMAT)
-        grid_max_size = self.config.GetValue(BotConfigTypes.CHART_GRID_MAX_SIZE)
-
-        ax.xaxis.set_major_locator(plt.MaxNLocator(grid_max_size))
+        date_format = config.chart_date_format
+        grid_max_size = config.chart_grid_max_size
+        # Chart values are always loaded, since charts are only rendered if displayed
+        assert date_format is not None
+
+        # Grid size is not loaded if the grid is not displayed, in this case ticks are placed by matplotlib
+        if grid_max_size is not None:
+            ax.xaxis.set_major_locator(plt.MaxNLocator(grid_max_size))
         ax.xaxis.set_major_formatter(
             matplotlib.ticker.FuncFormatter(lambda x, p: datetime.fromtimestamp(int(x)).strftime(date_format))
         )
@@ -112,70 +129,84 @@ class ChartInfoFileSaver:
 
     def __SetBackgroundColor(self,
                              fig: plt.figure,
-                             ax: plt.axes) -> None:
+                             ax: plt.axes,
+                             config: BotConfigSnapshot) -> None:
         """
         Set background color for the chart.
 
         Args:
             fig: Matplotlib figure object.
             ax: Matplotlib axes object.
+            config: Configuration snapshot.
         """
-        bckg_color = self.config.GetValue(BotConfigTypes.CHART_BACKGROUND_COLOR)
+        bckg_color = config.chart_background_color
 
         fig.patch.set_facecolor(bckg_color)
         ax.set_facecolor(bckg_color)
 
     def __SetAxesColor(self,
-                       ax: plt.axes) -> None:
+                       ax: plt.axes,
+                       config: BotConfigSnapshot) -> None:
         """
         Set color for chart axes.
 
         Args:
             ax: Matplotlib axes object to configure.
+            config: Configuration snapshot.
         """
-        axes_color = self.config.GetValue(BotConfigTypes.CHART_AXES_COLOR)
+        axes_color = config.chart_axes_color
 
         ax.tick_params(color=axes_color, labelcolor=axes_color)
 
     def __SetFrameColor(self,
-                        ax: plt.axes) -> None:
+                        ax: plt.axes,
+                        config: BotConfigSnapshot) -> None:
         """
         Set color for chart frame.
 
         Args:
             ax: Matplotlib axes object to configure.
+            config: Configuration snapshot.
         """
-        frame_color = self.config.GetValue(BotConfigTypes.CHART_FRAME_COLOR)
+        frame_color = config.chart_frame_color
 
         for spine in ax.spines.values():
             spine.set_edgecolor(frame_color)
 
     def __SetGrid(self,
-                  ax: plt.axes) -> None:
+                  ax: plt.axes,
+                  config: BotConfigSnapshot) -> None:
         """
         Set grid configuration for the chart.
 
         Args:
             ax: Matplotlib axes object to configure.
+            config: Configuration snapshot.
         """
-        display_grid = self.config.GetValue(BotConfigTypes.CHART_DISPLAY_GRID)
-        grid_color = self.config.GetValue(BotConfigTypes.CHART_GRID_COLOR)
-        grid_line_style = self.config.GetValue(BotConfigTypes.CHART_GRID_LINE_STYLE)
-        grid_line_width = self.config.GetValue(BotConfigTypes.CHART_GRID_LINE_WIDTH)
+        # Line properties would enable the grid again, and they are not loaded if the grid is not displayed
+        if not config.chart_display_grid:
+            ax.grid(False)
+            return
+
+        grid_color = config.chart_grid_color
+        grid_line_style = config.chart_grid_line_style
+        grid_line_width = config.chart_grid_line_width
 
-        ax.grid(display_grid, color=grid_color, linestyle=grid_line_style, linewidth=grid_line_width)
+        ax.grid(True, color=grid_color, linestyle=grid_line_style, linewidth=grid_line_width)
 
     def __SetTitle(self,
                    chart_info: ChartInfo,
-                   ax: plt.axes) -> None:
+                   ax: plt.axes,
+                   config: BotConfigSnapshot) -> None:
         """
         Set title for the chart.
 
         Args:
             chart_info: Chart information containing coin details.
             ax: Matplotlib axes object to configure.
+            config: Configuration snapshot.
         """
-        title_color = self.config.GetValue(BotConfigTypes.CHART_TITLE_COLOR)
+        title_color = config.chart_title_color
 
         ax.set_title(
             self.translator.GetSentence(
@@ -190,7 +221,8 @@ class ChartInfoFileSaver:
     def __Plot(self,
                chart_info: ChartInfo,
                fig: plt.figure,
-               ax: plt.axes) -> None:
+               ax: plt.axes,
+               config: BotConfigSnapshot) -> None:
         """
         Plot the chart data.
 
@@ -198,10 +230,11 @@ class ChartInfoFileSaver:
             chart_info: Chart information to plot.
             fig: Matplotlib figure object.
             ax: Matplotlib axes object.
+            config: Configuration snapshot.
         """
-        line_color = self.config.GetValue(BotConfigTypes.CHART_LINE_COLOR)
-        line_style = self.config.GetValue(BotConfigTypes.CHART_LINE_STYLE)
-        line_width = self.config.GetValue(BotConfigTypes.CHART_LINE_WIDTH)
+        line_color = config.chart_line_color
+        line_style = config.chart_line_style
+        line_width = config.chart_line_width
 
         ax.plot(chart_info.X(), chart_info.Y(), color=line_color, linestyle=line_style, linewidth=line_width)
         fig.autofmt_xdate()
@@ -220,12 +253,80 @@ class ChartInfoFileSaver:
         plt.close(fig)
 
 
+class ChartInfoRenderCache:
+    """
+    Cache of rendered charts, so that charts rendered in advance are not rendered again when sent.
+    Charts are identified by the fetched data, so a cached chart is always the same that would be rendered.
+    """
+
+    entries: Dict[Tuple[str, str, int, float], Tuple[bytes, float]]
+
+    def __init__(self) -> None:
+        """Initialize the cache, empty."""
+        self.entries = {}
+
+    def Get(self,
+            chart_info: ChartInfo) -> Optional[bytes]:
+        """
+        Get a rendered chart.
+
+        Args:
+            chart_info: Chart information.
+
+        Returns:
+            Rendered chart image, None if not present or expired.
+        """
+        entry = self.entries.get(self.__Key(chart_info))
+        if entry is None or entry[1] < time.time():
+            return None
+        return entry[0]
+
+    def Put(self,
+            chart_info: ChartInfo,
+            img_data: bytes,
+            max_age_sec: float) -> None:
+        """
+        Store a rendered chart, removing the expired ones.
+
+        Args:
+            chart_info: Chart information.
+            img_data: Rendered chart image.
+            max_age_sec: Maximum age in seconds of the chart data, after which the rendered chart is removed.
+        """
+        now = time.time()
+        self.entries = {key: entry for key, entry in self.entries.items() if entry[1] >= now}
+        expire_time = chart_info.FetchTime() + max_age_sec
+        if expire_time >= now:
+            self.entries[self.__Key(chart_info)] = (img_data, expire_time)
+
+    def Clear(self) -> None:
+        """Remove all rendered charts (e.g. when the chart settings change)."""
+        self.entries = {}
+
+    @staticmethod
+    def __Key(chart_info: ChartInfo) -> Tuple[str, str, int, float]:
+        """
+        Get the cache key of a chart, which identifies the fetched data.
+
+        Args:
+            chart_info: Chart information.
+
+        Returns:
+            Cache key.
+        """
+        return chart_info.CoinId(), chart_info.CoinVs(), chart_info.LastDays(), chart_info.FetchTime()
+
+
+# Shared by all savers
+chart_render_cache: ChartInfoRenderCache = ChartInfoRenderCache()
+
+
 class ChartInfoTmpFileSaver:
     """Class for saving chart information to temporary files."""
 
     logger: Logger
     tmp_file_name: Optional[str]
-    chart_info_file_saver: ChartInfoFileSaver
+    chart_info_file_saver: Union[ChartInfoFileSaver, ChartInfoPillowFileSaver]
 
     def __init__(self,
                  config: ConfigObject,
@@ -241,29 +342,65 @@ class ChartInfoTmpFileSaver:
         """
         self.logger = logger
         self.tmp_file_name = None
-        self.chart_info_file_saver = ChartInfoFileSaver(config, translator)
+        if config.GetValue(BotConfigTypes.CHART_RENDERER) == ChartInfoFileSaverConst.PILLOW_RENDERER:
+            self.chart_info_file_saver = ChartInfoPillowFileSaver(config, translator)
+        else:
+            self.chart_info_file_saver = ChartInfoFileSaver(config, translator)
 
     def __del__(self):
         """Clean up temporary files on object destruction."""
         self.DeleteTmpFile()
 
-    def SaveToTmpFile(self,
-                      chart_info: ChartInfo) -> None:
+    async def SaveToTmpFile(self,
+                            chart_info: ChartInfo) -> None:
         """
         Save chart to a temporary file.
+        Charts are rendered in an executor, so the event loop is not blocked meanwhile. If the chart was already
+        rendered in advance, it is just written to file.
 
         Args:
             chart_info: Chart information to save.
         """
         self.DeleteTmpFile()
         self.tmp_file_name = self.__NewTmpFileName()
-        self.chart_info_file_saver.SaveToFile(chart_info, self.tmp_file_name)
+
+        img_data = chart_render_cache.Get(chart_info)
+        if img_data is not None:
+            with open(self.tmp_file_name, "wb") as fout:
+                fout.write(img_data)
+            self.logger.GetLogger().info(f'Saved pre-rendered chart to file "{self.tmp_file_name}"')
+            return
+
+        async with chart_render_gate:
+            await asyncio.get_running_loop().run_in_executor(None,
+                                                             self.chart_info_file_saver.SaveToFile,
+                                                             chart_info,
+                                                             self.tmp_file_name)
         self.logger.GetLogger().info(
             f"Saved chart information for coin {chart_info.CoinId()}/{chart_info.CoinVs()}, "
             f"last days {chart_info.LastDays()}, number of points ({len(chart_info.X())}, {len(chart_info.Y())}), "
             f'file name: "{self.tmp_file_name}"'
         )
 
+    async def PreRender(self,
+                        chart_info: ChartInfo,
+                        max_age_sec: float) -> None:
+        """
+        Render a chart in advance, storing it to the render cache.
+
+        Args:
+            chart_info: Chart information to render.
+            max_age_sec: Maximum age in seconds of the chart data, after which the rendered chart is removed.
+        """
+        if chart_render_cache.Get(chart_info) is not None:
+            return
+
+        await self.SaveToTmpFile(chart_info)
+        if self.tmp_file_name is not None:
+            with open(self.tmp_file_name, "rb") as fin:
+                chart_render_cache.Put(chart_info, fin.read(), max_age_sec)
+        self.DeleteTmpFile()
+
     def TmpFileName(self) -> Optional[str]:
         """
         Get the temporary file name.
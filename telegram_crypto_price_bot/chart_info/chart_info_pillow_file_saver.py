@@ -0,0 +1,673 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import math
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+from matplotlib import colors as mpl_colors
+from PIL import Image, ImageColor, ImageDraw, ImageFont
+
+from telegram_crypto_price_bot.bot.bot_config_snapshot import BotConfigSnapshot
+from telegram_crypto_price_bot.chart_info.chart_info import ChartInfo
+from telegram_crypto_price_bot.config.config_object import ConfigObject
+from telegram_crypto_price_bot.misc.formatters import CoinIdFormatter, PriceFormatter
+from telegram_crypto_price_bot.profiling.sampling_profiler import ProfiledStage
+from telegram_crypto_price_bot.translation.translation_loader import TranslationLoader
+
+
+FontType = Union[ImageFont.ImageFont, ImageFont.FreeTypeFont]
+PointType = Tuple[float, float]
+RgbType = Tuple[int, int, int]
+
+
+class ChartInfoPillowFileSaverConst:
+    """Constants for chart info Pillow file saver class."""
+
+    IMG_WIDTH: int = 640
+    IMG_HEIGHT: int = 480
+    DPI: int = 100
+    PNG_COMPRESS_LEVEL: int = 1
+    LABEL_FONT_SIZE: int = 11
+    TITLE_FONT_SIZE: int = 13
+    BORDER: int = 10
+    TICK_LEN: int = 4
+    TICK_PAD: int = 3
+    TITLE_PAD: int = 8
+    Y_MAX_TICKS: int = 9
+    # Used if the grid is not displayed, since its size is not loaded
+    X_DEF_INTERVALS: int = 4
+    Y_MARGIN_PERC: float = 0.05
+    FALLBACK_HALF_SPAN: float = 1.0
+    # Same dash patterns of matplotlib, in units of line width
+    DASH_PATTERNS = {
+        "--": (3.7, 1.6),
+        "-.": (6.4, 1.6, 1.0, 1.6),
+        ":": (1.0, 1.65),
+    }
+    NO_LINE_STYLES: Tuple[str, ...] = (" ", "")
+
+
+class _ChartFont:
+    """
+    Internal class for a chart font.
+    Glyphs are rendered once and then cached, since drawing text is the slowest part of the chart and labels
+    are always made of the same few characters.
+    The font is loaded when the first glyph is rendered. Since charts are rendered in executor threads,
+    rendering is serialized by a lock (FreeType faces are not thread-safe), while cached glyphs are read without it.
+    """
+
+    size: int
+    lock: threading.Lock
+    font: Optional[FontType]
+    glyphs: Dict[str, Tuple[Optional[Image.Image], int, int, int]]
+
+    def __init__(self,
+                 size: int) -> None:
+        """
+        Initialize the font.
+
+        Args:
+            size: Font size.
+        """
+        self.size = size
+        self.lock = threading.Lock()
+        self.font = None
+        self.glyphs = {}
+
+    def GetGlyph(self,
+                 char: str) -> Tuple[Optional[Image.Image], int, int, int]:
+        """
+        Get a glyph, rendering it if not cached.
+
+        Args:
+            char: Character.
+
+        Returns:
+            Glyph as (mask, left offset, top offset, advance). Mask is None for blank glyphs.
+        """
+        glyph = self.glyphs.get(char)
+        if glyph is None:
+            with self.lock:
+                # Check again, another thread may have rendered it in the meantime
+                glyph = self.glyphs.get(char)
+                if glyph is None:
+                    glyph = self.__RenderGlyph(char)
+                    self.glyphs[char] = glyph
+        return glyph
+
+    def __RenderGlyph(self,
+                      char: str) -> Tuple[Optional[Image.Image], int, int, int]:
+        """
+        Render a glyph, loading the font if not loaded yet.
+
+        Args:
+            char: Character.
+
+        Returns:
+            Glyph as (mask, left offset, top offset, advance). Mask is None for blank glyphs.
+        """
+        if self.font is None:
+            self.font = self.__LoadFont(self.size)
+
+        left, top, right, bottom = self.font.getbbox(char)
+        mask = None
+        if right > left and bottom > top:
+            mask = Image.new("L", (int(right - left), int(bottom - top)))
+            ImageDraw.Draw(mask).text((-left, -top), char, fill=255, font=self.font)
+        return mask, int(left), int(top), int(self.font.getlength(char))
+
+    @staticmethod
+    def __LoadFont(size: int) -> FontType:
+        """
+        Load the default font with the specified size.
+
+        Args:
+            size: Font size.
+
+        Returns:
+            Font object.
+        """
+        try:
+            return ImageFont.load_default(size=size)
+        except TypeError:
+            # Pillow < 10.1 only has a fixed-size bitmap font
+            return ImageFont.load_default()
+
+
+class _ChartLabel:
+    """Internal class for a chart text label, measured once when created."""
+
+    text: str
+    font: _ChartFont
+    width: int
+    height: int
+    top: int
+
+    def __init__(self,
+                 text: str,
+                 font: _ChartFont) -> None:
+        """
+        Initialize the label.
+
+        Args:
+            text: Label text.
+            font: Label font.
+        """
+        glyphs = [font.GetGlyph(char) for char in text]
+        tops = [top for mask, _, top, _ in glyphs if mask is not None]
+        bottoms = [top + mask.height for mask, _, top, _ in glyphs if mask is not None]
+
+        self.text = text
+        self.font = font
+        self.width = sum(advance for _, _, _, advance in glyphs)
+        self.top = min(tops, default=0)
+        self.height = max(bottoms, default=0) - self.top
+
+    def Draw(self,
+             img: Image.Image,
+             x: float,
+             y: float,
+             color: RgbType) -> None:
+        """
+        Draw the label.
+
+        Args:
+            img: Image to draw on.
+            x: Left position of the label.
+            y: Top position of the label ink.
+            color: Label color.
+        """
+        pos_x = round(x)
+        pos_y = round(y) - self.top
+        for char in self.text:
+            mask, left, top, advance = self.font.GetGlyph(char)
+            if mask is not None:
+                img.paste(color, (pos_x + left, pos_y + top), mask)
+            pos_x += advance
+
+
+# Fonts are shared by all savers, so that glyphs are rendered only once (they are loaded on first use)
+label_font: _ChartFont = _ChartFont(ChartInfoPillowFileSaverConst.LABEL_FONT_SIZE)
+title_font: _ChartFont = _ChartFont(ChartInfoPillowFileSaverConst.TITLE_FONT_SIZE)
+
+
+class ChartInfoPillowFileSaver:
+    """Class for saving chart information to files by drawing it directly with Pillow (lightweight alternative to matplotlib)."""
+
+    config: ConfigObject
+    translator: TranslationLoader
+
+    def __init__(self,
+                 config: ConfigObject,
+                 translator: TranslationLoader) -> None:
+        """
+        Initialize the chart info file saver.
+
+        Args:
+            config: Configuration object containing chart settings.
+            translator: Translation loader for internationalization.
+        """
+        self.config = config
+        self.translator = translator
+
+    @ProfiledStage("chart_render")
+    def SaveToFile(self,
+                   chart_info: ChartInfo,
+                   file_name: str) -> None:
+        """
+        Save chart to a file.
+
+        Args:
+            chart_info: Chart information to plot and save
+            file_name: Path to save the chart image
+        """
+        # Read configuration once, so that the whole chart is drawn with the same values
+        config = self.config.Snapshot(BotConfigSnapshot)
+        # Chart values are always loaded, since charts are only rendered if displayed
+        assert (config.chart_background_color is not None
+                and config.chart_date_format is not None
+                and config.chart_axes_color is not None
+                and config.chart_frame_color is not None
+                and config.chart_title_color is not None)
+
+        img = Image.new(
+            "RGB",
+            (ChartInfoPillowFileSaverConst.IMG_WIDTH, ChartInfoPillowFileSaverConst.IMG_HEIGHT),
+            self.__GetColor(config.chart_background_color)
+        )
+
+        x_min, x_max = self.__GetRange(chart_info.X(), 0.0)
+        y_min, y_max = self.__GetRange(chart_info.Y(), ChartInfoPillowFileSaverConst.Y_MARGIN_PERC)
+        x_ticks = self.__GetXTicks(x_min, x_max, config.chart_grid_max_size or ChartInfoPillowFileSaverConst.X_DEF_INTERVALS)
+        y_ticks = [y for y in self.__GetYTicks(y_min, y_max) if y_min <= y <= y_max]
+        x_labels = [_ChartLabel(label, label_font) for label in self.__FormatXLabels(x_ticks, config.chart_date_format)]
+        y_labels = [_ChartLabel(PriceFormatter.Format(y), label_font) for y in y_ticks]
+        title = _ChartLabel(self.__GetTitle(chart_info), title_font)
+
+        plot_area = self.__GetPlotArea(x_labels, y_labels, title)
+        left, top, right, bottom = plot_area
+
+        def to_px(x: float, y: float) -> PointType:
+            return (left + (x - x_min) * (right - left) / (x_max - x_min),
+                    bottom - (y - y_min) * (bottom - top) / (y_max - y_min))
+
+        x_ticks_px = [to_px(x, y_min)[0] for x in x_ticks]
+        y_ticks_px = [to_px(x_min, y)[1] for y in y_ticks]
+
+        axes_color = self.__GetColor(config.chart_axes_color)
+
+        self.__DrawGrid(img, plot_area, x_ticks_px, y_ticks_px, config)
+        self.__DrawLine(img, [to_px(x, y) for x, y in zip(chart_info.X(), chart_info.Y())], config)
+        self.__DrawFrame(img, plot_area, self.__GetColor(config.chart_frame_color))
+        self.__DrawXTicks(img, plot_area, x_ticks_px, x_labels, axes_color)
+        self.__DrawYTicks(img, plot_area, y_ticks_px, y_labels, axes_color)
+        self.__DrawTitle(img, plot_area, title, self.__GetColor(config.chart_title_color))
+
+        img.save(file_name, format="PNG", compress_level=ChartInfoPillowFileSaverConst.PNG_COMPRESS_LEVEL)
+
+    @staticmethod
+    def __GetPlotArea(x_labels: List[_ChartLabel],
+                      y_labels: List[_ChartLabel],
+                      title: _ChartLabel) -> Tuple[int, int, int, int]:
+        """
+        Compute the plot area, leaving room for title and tick labels.
+
+        Args:
+            x_labels: Labels of x ticks.
+            y_labels: Labels of y ticks.
+            title: Chart title.
+
+        Returns:
+            Plot area as (left, top, right, bottom).
+        """
+        y_label_width = max((label.width for label in y_labels), default=0)
+        x_label_height = max((label.height for label in x_labels), default=0)
+        x_label_half_width = max((label.width for label in x_labels), default=0) // 2
+
+        ticks_space = ChartInfoPillowFileSaverConst.TICK_LEN + ChartInfoPillowFileSaverConst.TICK_PAD
+        left = ChartInfoPillowFileSaverConst.BORDER + max(y_label_width + ticks_space, x_label_half_width)
+        top = ChartInfoPillowFileSaverConst.BORDER + title.height + ChartInfoPillowFileSaverConst.TITLE_PAD
+        right = ChartInfoPillowFileSaverConst.IMG_WIDTH - ChartInfoPillowFileSaverConst.BORDER - x_label_half_width
+        bottom = ChartInfoPillowFileSaverConst.IMG_HEIGHT - ChartInfoPillowFileSaverConst.BORDER - x_label_height - ticks_space
+
+        return left, top, right, bottom
+
+    def __DrawGrid(self,
+                   img: Image.Image,
+                   plot_area: Tuple[int, int, int, int],
+                   x_ticks_px: List[float],
+                   y_ticks_px: List[float],
+                   config: BotConfigSnapshot) -> None:
+        """
+        Draw the grid, if enabled.
+
+        Args:
+            img: Image to draw on.
+            plot_area: Plot area as (left, top, right, bottom).
+            x_ticks_px: Pixel position of x ticks.
+            y_ticks_px: Pixel position of y ticks.
+            config: Configuration snapshot.
+        """
+        if not config.chart_display_grid:
+            return
+        # Grid values are always loaded if the grid is displayed
+        assert (config.chart_grid_color is not None
+                and config.chart_grid_line_style is not None
+                and config.chart_grid_line_width is not None)
+
+        left, top, right, bottom = plot_area
+        grid_color = self.__GetColor(config.chart_grid_color)
+        grid_line_style = config.chart_grid_line_style
+        grid_line_width = self.__PointsToPixels(config.chart_grid_line_width)
+
+        if grid_line_style in ChartInfoPillowFileSaverConst.NO_LINE_STYLES:
+            return
+        if grid_line_style not in ChartInfoPillowFileSaverConst.DASH_PATTERNS:
+            draw = ImageDraw.Draw(img)
+            for x in x_ticks_px:
+                draw.line([(x, top), (x, bottom)], fill=grid_color, width=grid_line_width)
+            for y in y_ticks_px:
+                draw.line([(left, y), (right, y)], fill=grid_color, width=grid_line_width)
+            return
+
+        # Grid lines are all horizontal or vertical, so the dash pattern is rendered once as a mask and then
+        # pasted for each line, instead of drawing each single dash
+        h_mask = self.__GetDashMask(right - left, grid_line_style, grid_line_width)
+        v_mask = self.__GetDashMask(bottom - top, grid_line_style, grid_line_width).transpose(Image.Transpose.ROTATE_270)
+        for x in x_ticks_px:
+            img.paste(grid_color, (round(x - grid_line_width / 2), top), v_mask)
+        for y in y_ticks_px:
+            img.paste(grid_color, (left, round(y - grid_line_width / 2)), h_mask)
+
+    @staticmethod
+    def __GetDashMask(length: int,
+                      line_style: str,
+                      line_width: int) -> Image.Image:
+        """
+        Get the mask of a horizontal dashed line.
+
+        Args:
+            length: Line length in pixels.
+            line_style: Line style (same as matplotlib).
+            line_width: Line width in pixels.
+
+        Returns:
+            Line mask.
+        """
+        mask = Image.new("L", (length, line_width))
+        draw = ImageDraw.Draw(mask)
+        pattern = [dash_len * line_width for dash_len in ChartInfoPillowFileSaverConst.DASH_PATTERNS[line_style]]
+
+        pos = 0.0
+        pattern_idx = 0
+        while pos < length:
+            # Even index: dash, odd index: gap
+            if pattern_idx % 2 == 0:
+                draw.rectangle((round(pos), 0, round(pos + pattern[pattern_idx]) - 1, line_width - 1), fill=255)
+            pos += pattern[pattern_idx]
+            pattern_idx = (pattern_idx + 1) % len(pattern)
+
+        return mask
+
+    def __DrawLine(self,
+                   img: Image.Image,
+                   points: List[PointType],
+                   config: BotConfigSnapshot) -> None:
+        """
+        Draw the price line.
+
+        Args:
+            img: Image to draw on.
+            points: Line points in pixels.
+            config: Configuration snapshot.
+        """
+        assert (config.chart_line_color is not None
+                and config.chart_line_style is not None
+                and config.chart_line_width is not None)
+
+        self.__DrawStyledLine(ImageDraw.Draw(img),
+                              points,
+                              self.__GetColor(config.chart_line_color),
+                              config.chart_line_style,
+                              self.__PointsToPixels(config.chart_line_width))
+
+    @staticmethod
+    def __DrawFrame(img: Image.Image,
+                    plot_area: Tuple[int, int, int, int],
+                    frame_color: RgbType) -> None:
+        """
+        Draw the frame around the plot area.
+
+        Args:
+            img: Image to draw on.
+            plot_area: Plot area as (left, top, right, bottom).
+            frame_color: Frame color.
+        """
+        ImageDraw.Draw(img).rectangle(plot_area, outline=frame_color)
+
+    @staticmethod
+    def __DrawXTicks(img: Image.Image,
+                     plot_area: Tuple[int, int, int, int],
+                     x_ticks_px: List[float],
+                     x_labels: List[_ChartLabel],
+                     axes_color: RgbType) -> None:
+        """
+        Draw x ticks and their labels.
+
+        Args:
+            img: Image to draw on.
+            plot_area: Plot area as (left, top, right, bottom).
+            x_ticks_px: Pixel position of x ticks.
+            x_labels: Labels of x ticks.
+            axes_color: Axes color.
+        """
+        draw = ImageDraw.Draw(img)
+        bottom = plot_area[3]
+
+        for x, label in zip(x_ticks_px, x_labels):
+            draw.line([(x, bottom), (x, bottom + ChartInfoPillowFileSaverConst.TICK_LEN)], fill=axes_color)
+            label.Draw(img,
+                       x - label.width / 2,
+                       bottom + ChartInfoPillowFileSaverConst.TICK_LEN + ChartInfoPillowFileSaverConst.TICK_PAD,
+                       axes_color)
+
+    @staticmethod
+    def __DrawYTicks(img: Image.Image,
+                     plot_area: Tuple[int, int, int, int],
+                     y_ticks_px: List[float],
+                     y_labels: List[_ChartLabel],
+                     axes_color: RgbType) -> None:
+        """
+        Draw y ticks and their labels.
+
+        Args:
+            img: Image to draw on.
+            plot_area: Plot area as (left, top, right, bottom).
+            y_ticks_px: Pixel position of y ticks.
+            y_labels: Labels of y ticks.
+            axes_color: Axes color.
+        """
+        draw = ImageDraw.Draw(img)
+        left = plot_area[0]
+
+        for y, label in zip(y_ticks_px, y_labels):
+            draw.line([(left - ChartInfoPillowFileSaverConst.TICK_LEN, y), (left, y)], fill=axes_color)
+            label.Draw(img,
+                       left - ChartInfoPillowFileSaverConst.TICK_LEN - ChartInfoPillowFileSaverConst.TICK_PAD - label.width,
+                       y - label.height / 2,
+                       axes_color)
+
+    @staticmethod
+    def __DrawTitle(img: Image.Image,
+                    plot_area: Tuple[int, int, int, int],
+                    title: _ChartLabel,
+                    title_color: RgbType) -> None:
+        """
+        Draw the chart title.
+
+        Args:
+            img: Image to draw on.
+            plot_area: Plot area as (left, top, right, bottom).
+            title: Chart title.
+            title_color: Title color.
+        """
+        title.Draw(img,
+                   (plot_area[0] + plot_area[2] - title.width) / 2,
+                   ChartInfoPillowFileSaverConst.BORDER,
+                   title_color)
+
+    def __GetTitle(self,
+                   chart_info: ChartInfo) -> str:
+        """
+        Get the chart title.
+
+        Args:
+            chart_info: Chart information containing coin details.
+
+        Returns:
+            Chart title.
+        """
+        return self.translator.GetSentence(
+            "CHART_INFO_TITLE_MSG",
+            coin_id=CoinIdFormatter.Format(chart_info.CoinId()),
+            coin_vs=chart_info.CoinVs().upper(),
+            last_days=chart_info.LastDays(),
+        )
+
+    @staticmethod
+    def __FormatXLabels(x_ticks: List[float],
+                        date_format: str) -> List[str]:
+        """
+        Format x ticks as dates.
+
+        Args:
+            x_ticks: X ticks (timestamps).
+            date_format: Date format.
+
+        Returns:
+            List of formatted dates.
+        """
+        return [datetime.fromtimestamp(int(x)).strftime(date_format) for x in x_ticks]
+
+    @staticmethod
+    def __GetXTicks(x_min: float,
+                    x_max: float,
+                    intervals: int) -> List[float]:
+        """
+        Get x ticks, evenly spaced over the data range.
+
+        Args:
+            x_min: Minimum x value.
+            x_max: Maximum x value.
+            intervals: Number of intervals between ticks.
+
+        Returns:
+            List of x ticks.
+        """
+        return [x_min + i * (x_max - x_min) / intervals for i in range(intervals + 1)]
+
+    @staticmethod
+    def __GetYTicks(y_min: float,
+                    y_max: float) -> List[float]:
+        """
+        Get y ticks, rounded to a "nice" step like matplotlib does.
+
+        Args:
+            y_min: Minimum y value.
+            y_max: Maximum y value.
+
+        Returns:
+            List of y ticks.
+        """
+        raw_step = (y_max - y_min) / ChartInfoPillowFileSaverConst.Y_MAX_TICKS
+        magnitude = 10 ** math.floor(math.log10(raw_step))
+        step = next(mult * magnitude for mult in (1, 2, 2.5, 5, 10) if mult * magnitude >= raw_step)
+
+        first = math.ceil(y_min / step) * step
+        return [first + i * step for i in range(int((y_max - first) / step) + 1)]
+
+    @staticmethod
+    def __GetRange(values: Sequence[float],
+                   margin_perc: float) -> Tuple[float, float]:
+        """
+        Get the range of values, with the specified margin.
+        The range is never empty, since values are mapped to pixels by dividing by its span.
+
+        Args:
+            values: Values.
+            margin_perc: Margin to add on both sides, as a fraction of the range.
+
+        Returns:
+            Range as (min, max).
+        """
+        if len(values) == 0:
+            return 0.0, 1.0
+
+        min_val = min(values)
+        max_val = max(values)
+        if min_val == max_val:
+            # Single point or constant values: center them on a fallback span
+            delta = abs(min_val) * margin_perc
+            if min_val - delta == max_val + delta:
+                delta = ChartInfoPillowFileSaverConst.FALLBACK_HALF_SPAN
+            return min_val - delta, max_val + delta
+
+        margin = (max_val - min_val) * margin_perc
+        return min_val - margin, max_val + margin
+
+    @staticmethod
+    def __DrawStyledLine(draw: ImageDraw.ImageDraw,
+                         points: List[PointType],
+                         color: RgbType,
+                         line_style: str,
+                         line_width: int) -> None:
+        """
+        Draw a polyline with the specified matplotlib line style.
+
+        Args:
+            draw: Pillow drawing context.
+            points: Line points in pixels.
+            color: Line color.
+            line_style: Line style (same as matplotlib).
+            line_width: Line width in pixels.
+        """
+        if line_style in ChartInfoPillowFileSaverConst.NO_LINE_STYLES or len(points) < 2:
+            return
+
+        if line_style not in ChartInfoPillowFileSaverConst.DASH_PATTERNS:
+            draw.line(points, fill=color, width=line_width, joint="curve")
+            return
+
+        pattern = [length * line_width for length in ChartInfoPillowFileSaverConst.DASH_PATTERNS[line_style]]
+        pattern_idx = 0
+        remaining = pattern[0]
+        dash_points: List[PointType] = [points[0]]
+
+        for (x0, y0), (x1, y1) in zip(points[:-1], points[1:]):
+            seg_len = math.hypot(x1 - x0, y1 - y0)
+            pos = 0.0
+            while seg_len - pos > remaining:
+                pos += remaining
+                point = (x0 + (x1 - x0) * pos / seg_len, y0 + (y1 - y0) * pos / seg_len)
+                # Even index: dash end, odd index: gap end
+                if pattern_idx % 2 == 0:
+                    dash_points.append(point)
+                    draw.line(dash_points, fill=color, width=line_width)
+                dash_points = [point]
+                pattern_idx = (pattern_idx + 1) % len(pattern)
+                remaining = pattern[pattern_idx]
+            remaining -= seg_len - pos
+            if pattern_idx % 2 == 0:
+                dash_points.append((x1, y1))
+
+        if pattern_idx % 2 == 0 and len(dash_points) > 1:
+            draw.line(dash_points, fill=color, width=line_width)
+
+    @staticmethod
+    def __GetColor(color: str) -> RgbType:
+        """
+        Convert a color from configuration.
+
+        Args:
+            color: Color, in any format known by matplotlib.
+
+        Returns:
+            RGB color.
+        """
+        try:
+            return ImageColor.getrgb(color)[:3]
+        except ValueError:
+            # Color formats only known by matplotlib (e.g. "C0", "tab:blue")
+            return ImageColor.getrgb(mpl_colors.to_hex(color))[:3]
+
+    @staticmethod
+    def __PointsToPixels(points: float) -> int:
+        """
+        Convert a width in points (like matplotlib) to pixels.
+
+        Args:
+            points: Width in points.
+
+        Returns:
+            Width in pixels.
+        """
+        return max(1, round(points * ChartInfoPillowFileSaverConst.DPI / 72))
@@ -0,0 +1,216 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+import sys
+from datetime import datetime
+from typing import Any, List, Tuple
+
+from apscheduler.events import EVENT_JOB_MISSED, EVENT_JOB_SUBMITTED, JobEvent, JobSubmissionEvent
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from typing_extensions import override
+
+from telegram_crypto_price_bot.bot.bot_config_types import BotConfigTypes
+from telegram_crypto_price_bot.coin_info.coin_info_scheduler_backend import CoinInfoJobFct, CoinInfoJobRun, CoinInfoSchedulerBackend
+from telegram_crypto_price_bot.config.config_object import ConfigObject
+from telegram_crypto_price_bot.logger.logger import Logger
+
+
+class CoinInfoApSchedulerBackendConst:
+    """Constants for coin info APScheduler backend class."""
+
+    # Jobs only put runs in the job queue, which limits the running instances of the same job
+    MAX_INSTANCES: int = sys.maxsize
+
+
+class CoinInfoApSchedulerBackend(CoinInfoSchedulerBackend):
+    """Scheduler backend based on APScheduler, with a cron job for each job."""
+
+    scheduler: AsyncIOScheduler
+
+    def __init__(self,
+                 config: ConfigObject,
+                 logger: Logger) -> None:
+        """
+        Initialize the backend and start it.
+        It shall be created with a running event loop.
+
+        Args:
+            config: Configuration object.
+            logger: Logger instance.
+        """
+        super().__init__(logger)
+        self.scheduler = AsyncIOScheduler(
+            job_defaults={
+                "misfire_grace_time": config.GetValue(BotConfigTypes.TASKS_MISFIRE_GRACE_TIME_SEC),
+                "coalesce": config.GetValue(BotConfigTypes.TASKS_COALESCE),
+                "max_instances": CoinInfoApSchedulerBackendConst.MAX_INSTANCES,
+            }
+        )
+        self.scheduler.add_listener(self.__OnJobEvent, EVENT_JOB_MISSED | EVENT_JOB_SUBMITTED)
+        self.scheduler.start()
+
+    @override
+    def AddJob(self,
+               job_id: str,
+               run_values: List[int],
+               is_test_mode: bool,
+               job_fct: CoinInfoJobFct,
+               job_args: Tuple[Any, ...]) -> None:
+        """
+        Add a job.
+
+        Args:
+            job_id: Job ID.
+            run_values: Hours of the day when the job runs (minutes of every hour in test mode).
+            is_test_mode: True for test mode, False otherwise.
+            job_fct: Function executing the job.
+            job_args: Arguments of the function.
+        """
+        cron_str = ",".join(str(run_value) for run_value in run_values)
+        if is_test_mode:
+            self.scheduler.add_job(
+                job_fct,
+                "cron",
+                args=job_args,
+                minute=cron_str,
+                id=job_id
+            )
+        else:
+            self.scheduler.add_job(
+                job_fct,
+                "cron",
+                args=job_args,
+                hour=cron_str,
+                id=job_id
+            )
+
+    @override
+    def RemoveJob(self,
+                  job_id: str) -> None:
+        """
+        Remove a job.
+
+        Args:
+            job_id: Job ID.
+        """
+        self.scheduler.remove_job(job_id)
+
+    @override
+    def PauseJob(self,
+                 job_id: str) -> None:
+        """
+        Pause a job, so that it does not run until resumed.
+
+        Args:
+            job_id: Job ID.
+        """
+        self.scheduler.pause_job(job_id)
+
+    @override
+    def ResumeJob(self,
+                  job_id: str) -> None:
+        """
+        Resume a paused job.
+
+        Args:
+            job_id: Job ID.
+        """
+        self.scheduler.resume_job(job_id)
+
+    @override
+    def HasJob(self,
+               job_id: str) -> bool:
+        """
+        Get if a job exists (either running or paused).
+
+        Args:
+            job_id: Job ID.
+
+        Returns:
+            True if existent, False otherwise.
+        """
+        return self.scheduler.get_job(job_id) is not None
+
+    @override
+    def NextRuns(self,
+                 end_time: datetime) -> List[CoinInfoJobRun]:
+        """
+        Get the next run of the running jobs, if not later than the specified time.
+
+        Args:
+            end_time: End time.
+
+        Returns:
+            Next runs.
+        """
+        return [
+            (sched_job.id, sched_job.next_run_time)
+            for sched_job in self.scheduler.get_jobs()
+            # Paused jobs have no next run time
+            if sched_job.next_run_time is not None and sched_job.next_run_time <= end_time
+        ]
+
+    @override
+    def RunDueJobs(self) -> None:
+        """
+        Run the jobs due since the last check, without waiting for the next one (nothing is run while paused).
+        The scheduler processes the due jobs at the next iteration of the event loop.
+        """
+        self.scheduler.wakeup()
+
+    @override
+    def IsRunning(self) -> bool:
+        """
+        Get if the backend is running.
+
+        Returns:
+            True if running, False otherwise.
+        """
+        return self.scheduler.running
+
+    @override
+    def Pause(self) -> None:
+        """
+        Pause the processing of jobs, e.g. while updating multiple jobs at once.
+        The scheduler wakes up at each job added or modified to recompute its next wake up time, while paused
+        it wakes up only once when resumed.
+        """
+        self.scheduler.pause()
+
+    @override
+    def Resume(self) -> None:
+        """Resume the processing of jobs."""
+        self.scheduler.resume()
+
+    def __OnJobEvent(self,
+                     event: JobEvent) -> None:
+        """
+        Handle scheduler events, to keep track of job runs that are missed or overdue.
+
+        Args:
+            event: Scheduler event
+        """
+        if event.code == EVENT_JOB_MISSED:
+            self._JobMissed(event.job_id)
+        elif isinstance(event, JobSubmissionEvent):
+            # In case of coalescing, the last scheduled run time is the one actually executed
+            run_time = event.scheduled_run_times[-1]
+            self._JobSubmitted(event.job_id, (datetime.now(run_time.tzinfo) - run_time).total_seconds())
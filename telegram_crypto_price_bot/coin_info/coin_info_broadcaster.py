@@ -0,0 +1,156 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+import asyncio
+from typing import Awaitable, Callable, List, Tuple
+
+from telegram_crypto_price_bot.bot.bot_config_snapshot import BotConfigSnapshot
+from telegram_crypto_price_bot.coin_info.coin_info_job import CoinInfoJob
+from telegram_crypto_price_bot.coin_info.coin_info_warmer import CoinInfoWarmer
+from telegram_crypto_price_bot.coingecko.coingecko_price_api import CoinGeckoPriceApiError
+from telegram_crypto_price_bot.config.config_object import ConfigObject
+from telegram_crypto_price_bot.info_message_sender.coin_info_content import CoinInfoContentBuilder
+from telegram_crypto_price_bot.logger.logger import Logger
+from telegram_crypto_price_bot.profiling.sampling_profiler import ProfiledStage
+from telegram_crypto_price_bot.profiling.tracer import tracer
+from telegram_crypto_price_bot.translation.translation_loader import TranslationLoader
+
+
+# Key of jobs sending the same content: (coin ID, coin VS, last days, same message)
+CoinInfoBroadcastKey = Tuple[str, str, int, bool]
+# Job of a broadcast: (job ID, job)
+CoinInfoBroadcastJob = Tuple[str, CoinInfoJob]
+
+
+class CoinInfoBroadcaster:
+    """
+    Broadcaster of coin info to the chats of a group of jobs sending the same content.
+    The content is built only once (i.e. price data fetched, price information built and chart rendered),
+    then sent to all the chats with a bounded number of concurrent sends. A failure in a chat does not affect the other ones.
+    """
+
+    config: ConfigObject
+    logger: Logger
+    content_builder: CoinInfoContentBuilder
+
+    def __init__(self,
+                 config: ConfigObject,
+                 logger: Logger,
+                 translator: TranslationLoader) -> None:
+        """
+        Initialize the broadcaster.
+
+        Args:
+            config: Configuration object.
+            logger: Logger instance.
+            translator: Translation loader.
+        """
+        self.config = config
+        self.logger = logger
+        self.content_builder = CoinInfoContentBuilder(config, logger, translator)
+
+    @staticmethod
+    def GroupKey(job: CoinInfoJob) -> CoinInfoBroadcastKey:
+        """
+        Get the key of a job, jobs with the same key send the same content.
+
+        Args:
+            job: Job.
+
+        Returns:
+            Job key.
+        """
+        data = job.Data()
+        return data.CoinId(), data.CoinVs(), data.LastDays(), job.IsSameMessage()
+
+    @ProfiledStage("job")
+    async def Broadcast(self,
+                        jobs: List[CoinInfoBroadcastJob]) -> None:
+        """
+        Build the content of a group of jobs and send it to their chats.
+        Jobs are assumed to have the same key.
+
+        Args:
+            jobs: Jobs.
+        """
+        # Jobs may have been paused or stopped while waiting
+        jobs = [(job_id, job) for job_id, job in jobs if job.Data().IsRunning()]
+        if len(jobs) == 0:
+            return
+
+        coin_id, coin_vs, last_days, same_msg = self.GroupKey(jobs[0][1])
+        config = self.config.Snapshot(BotConfigSnapshot)
+        max_sends = config.tasks_fanout_max_sends
+        # Data fetched in advance by the warmer is used as is
+        fresh_max_age = CoinInfoWarmer.FreshMaxAge(config.tasks_warmup_sec)
+        self.logger.GetLogger().info(
+            f"Broadcasting price info {coin_id}/{coin_vs} (last days: {last_days}) to {len(jobs)} chat(s)"
+        )
+
+        try:
+            content = await self.content_builder.Build(coin_id, coin_vs, last_days, same_msg, fresh_max_age)
+        except CoinGeckoPriceApiError:
+            self.logger.GetLogger().exception(
+                f"Coingecko API error when retrieving data for coin {coin_id}/{coin_vs}"
+            )
+            await self.__FanOut(jobs, lambda job: job.SendApiError(), max_sends)
+            return
+
+        # The first send uploads the chart, so that the next ones can reuse it
+        await self.__FanOut(jobs[:1], lambda job: job.SendContent(content), max_sends)
+        await self.__FanOut(jobs[1:], lambda job: job.SendContent(content), max_sends)
+
+    async def __FanOut(self,
+                       jobs: List[CoinInfoBroadcastJob],
+                       send_fct: Callable[[CoinInfoJob], Awaitable[None]],
+                       max_sends: int) -> None:
+        """
+        Send to the chats of the specified jobs, with a bounded number of concurrent sends.
+
+        Args:
+            jobs: Jobs.
+            send_fct: Function sending to the chat of a job.
+            max_sends: Maximum number of concurrent sends.
+        """
+        semaphore = asyncio.Semaphore(max_sends)
+        await asyncio.gather(*[self.__Send(semaphore, job_id, job, send_fct) for job_id, job in jobs])
+
+    async def __Send(self,
+                     semaphore: asyncio.Semaphore,
+                     job_id: str,
+                     job: CoinInfoJob,
+                     send_fct: Callable[[CoinInfoJob], Awaitable[None]]) -> None:
+        """
+        Send to the chat of a job, logging any error.
+
+        Args:
+            semaphore: Semaphore bounding the concurrent sends.
+            job_id: Job ID.
+            job: Job.
+            send_fct: Function sending to the chat of the job.
+        """
+        async with semaphore:
+            try:
+                if job.Data().IsRunning():
+                    with tracer.Span("send", job_id=job_id):
+                        await send_fct(job)
+            except Exception:
+                self.logger.GetLogger().exception(f'An error occurred while executing job "{job_id}"')
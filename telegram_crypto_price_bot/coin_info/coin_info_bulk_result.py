@@ -0,0 +1,91 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+from typing import List, Optional, Tuple
+
+
+# Coin pair of a job: (coin ID, coin VS)
+CoinInfoCoinPair = Tuple[str, str]
+# Outcome of a coin pair: (coin pair, exception raised by the operation, None if succeeded)
+CoinInfoBulkOutcome = Tuple[CoinInfoCoinPair, Optional[Exception]]
+
+
+class CoinInfoBulkResult:
+    """Class for the result of an operation on multiple jobs, with the outcome of each coin pair."""
+
+    outcomes: List[CoinInfoBulkOutcome]
+
+    def __init__(self) -> None:
+        """Initialize the result."""
+        self.outcomes = []
+
+    def AddSucceeded(self,
+                     coin_id: str,
+                     coin_vs: str) -> None:
+        """
+        Add a coin pair for which the operation succeeded.
+
+        Args:
+            coin_id: Cryptocurrency coin identifier.
+            coin_vs: Currency to compare against.
+        """
+        self.outcomes.append(((coin_id, coin_vs), None))
+
+    def AddFailed(self,
+                  coin_id: str,
+                  coin_vs: str,
+                  ex: Exception) -> None:
+        """
+        Add a coin pair for which the operation failed.
+
+        Args:
+            coin_id: Cryptocurrency coin identifier.
+            coin_vs: Currency to compare against.
+            ex: Exception raised by the operation.
+        """
+        self.outcomes.append(((coin_id, coin_vs), ex))
+
+    def Outcomes(self) -> List[CoinInfoBulkOutcome]:
+        """
+        Get the outcome of each coin pair, in the same order they were added.
+
+        Returns:
+            Outcomes.
+        """
+        return self.outcomes
+
+    def SucceededCount(self) -> int:
+        """
+        Get the number of coin pairs for which the operation succeeded.
+
+        Returns:
+            Number of succeeded coin pairs.
+        """
+        return sum(1 for _, ex in self.outcomes if ex is None)
+
+    def Count(self) -> int:
+        """
+        Get the total number of coin pairs.
+
+        Returns:
+            Number of coin pairs.
+        """
+        return len(self.outcomes)
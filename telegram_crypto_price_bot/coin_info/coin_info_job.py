@@ -18,20 +18,29 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 
-import pyrogram
+from typing import Optional
 
-from telegram_crypto_price_bot.config.config_object import ConfigObject
+from telegram_crypto_price_bot.info_message_sender.coin_info_content import CoinInfoContent
 from telegram_crypto_price_bot.info_message_sender.coin_info_message_sender import CoinInfoMessageSender
+from telegram_crypto_price_bot.info_message_sender.coin_info_message_state import CoinInfoMessageState
 from telegram_crypto_price_bot.logger.logger import Logger
-from telegram_crypto_price_bot.misc.helpers import ChatHelper
-from telegram_crypto_price_bot.translation.translation_loader import TranslationLoader
 
 
-class CoinInfoJobData:
-    """Data class for storing coin information job parameters."""
+class CoinInfoJobData(CoinInfoMessageState):
+    """
+    Data class for storing coin information job parameters, together with the message state of the job chat.
+    It uses slots and only keeps IDs (not the pyrogram objects), since there is one for each job.
+    """
+
+    __slots__ = (
+        "period_hours",
+        "start_hour",
+        "coin_id",
+        "coin_vs",
+        "last_days",
+        "running",
+    )
 
-    chat: pyrogram.types.Chat
-    topic_id: int
     period_hours: int
     start_hour: int
     coin_id: str
@@ -40,7 +49,8 @@ class CoinInfoJobData:
     running: bool
 
     def __init__(self,
-                 chat: pyrogram.types.Chat,
+                 chat_id: int,
+                 chat_title: Optional[str],
                  topic_id: int,
                  period_hours: int,
                  start_hour: int,
@@ -51,7 +61,8 @@ class CoinInfoJobData:
         Initialize coin info job data.
 
         Args:
-            chat: Telegram chat where the job will run.
+            chat_id: ID of the Telegram chat where the job will run.
+            chat_title: Title of the Telegram chat where the job will run (None if no title).
             topic_id: Telegram topic where the job will run.
             period_hours: Period in hours between job executions.
             start_hour: Starting hour for the job.
@@ -59,8 +70,7 @@ class CoinInfoJobData:
             coin_vs: Currency to compare against.
             last_days: Number of days of historical data to display.
         """
-        self.chat = chat
-        self.topic_id = topic_id
+        super().__init__(chat_id, chat_title, topic_id)
         self.period_hours = period_hours
         self.start_hour = start_hour
         self.coin_id = coin_id
@@ -68,24 +78,6 @@ class CoinInfoJobData:
         self.last_days = last_days
         self.running = True
 
-    def Chat(self) -> pyrogram.types.Chat:
-        """
-        Get the chat associated with this job.
-
-        Returns:
-            The Telegram chat object.
-        """
-        return self.chat
-
-    def TopicId(self) -> int:
-        """
-        Get the topic associated with this job.
-
-        Returns:
-            The Telegram topic ID.
-        """
-        return self.topic_id
-
     def PeriodHours(self) -> int:
         """
         Get the period in hours between job executions.
@@ -151,31 +143,36 @@ class CoinInfoJobData:
 
 
 class CoinInfoJob:
-    """Class for managing and executing coin information jobs."""
+    """
+    Class for managing and executing coin information jobs.
+    The message sender is shared by all jobs, so a job only keeps its data.
+    """
+
+    __slots__ = (
+        "data",
+        "logger",
+        "coin_info_msg_sender",
+    )
 
     data: CoinInfoJobData
     logger: Logger
     coin_info_msg_sender: CoinInfoMessageSender
 
     def __init__(self,
-                 client: pyrogram.Client,
-                 config: ConfigObject,
                  logger: Logger,
-                 translator: TranslationLoader,
+                 coin_info_msg_sender: CoinInfoMessageSender,
                  data: CoinInfoJobData) -> None:
         """
         Initialize coin info job.
 
         Args:
-            client: Pyrogram client instance.
-            config: Configuration object.
             logger: Logger instance.
-            translator: Translation loader.
+            coin_info_msg_sender: Coin info message sender, shared by all jobs.
             data: Job data containing job parameters.
         """
         self.data = data
         self.logger = logger
-        self.coin_info_msg_sender = CoinInfoMessageSender(client, config, logger, translator)
+        self.coin_info_msg_sender = coin_info_msg_sender
 
     def Data(self) -> CoinInfoJobData:
         """
@@ -204,7 +201,17 @@ class CoinInfoJob:
         Args:
             flag: True to delete last message, False otherwise
         """
-        self.coin_info_msg_sender.DeleteLastSentMessage(flag)
+        self.data.DeleteLastSentMessage(flag)
+
+    def EditLastSentMessage(self,
+                            flag: bool) -> None:
+        """
+        Set whether to edit the last sent message in place.
+
+        Args:
+            flag: True to edit last message, False otherwise
+        """
+        self.data.EditLastSentMessage(flag)
 
     def SendInSameMessage(self,
                           flag: bool) -> None:
@@ -214,23 +221,28 @@ class CoinInfoJob:
         Args:
             flag: True to send in same message, False otherwise
         """
-        self.coin_info_msg_sender.SendInSameMessage(flag)
+        self.data.SendInSameMessage(flag)
+
+    def IsSameMessage(self) -> bool:
+        """
+        Get whether updates are sent in the same message.
+
+        Returns:
+            True if sent in same message, False otherwise
+        """
+        return self.data.IsSameMessage()
 
-    async def DoJob(self,
-                    chat: pyrogram.types.Chat,
-                    topic_id: int,
-                    coin_id: str,
-                    coin_vs: str,
-                    last_days: int) -> None:
+    async def SendContent(self,
+                          content: CoinInfoContent) -> None:
         """
-        Execute the job by sending coin information to the chat.
+        Execute the job by sending an already built coin information content to the chat.
 
         Args:
-            chat: Telegram chat to send the message to
-            topic_id: Telegram topic to send the message to
-            coin_id: Cryptocurrency coin identifier
-            coin_vs: Currency to compare against
-            last_days: Number of days of historical data to display
-        """
-        self.logger.GetLogger().info(f"Coin job started in chat {ChatHelper.GetTitleOrId(chat)} ({topic_id})")
-        await self.coin_info_msg_sender.SendMessage(chat, topic_id, coin_id, coin_vs, last_days)
+            content: Coin info content
+        """
+        self.logger.GetLogger().info(f"Coin job started in chat {self.data.ChatTitleOrId()} ({self.data.TopicId()})")
+        await self.coin_info_msg_sender.SendContent(self.data, content)
+
+    async def SendApiError(self) -> None:
+        """Execute the job by notifying a CoinGecko API error to the chat."""
+        await self.coin_info_msg_sender.SendApiError(self.data, self.data.CoinId(), self.data.CoinVs())
@@ -0,0 +1,333 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import asyncio
+import time
+from typing import Dict, List, Set, Tuple
+
+from telegram_crypto_price_bot.bot.bot_config_types import BotConfigTypes
+from telegram_crypto_price_bot.coin_info.coin_info_broadcaster import CoinInfoBroadcaster, CoinInfoBroadcastKey
+from telegram_crypto_price_bot.coin_info.coin_info_job import CoinInfoJob
+from telegram_crypto_price_bot.config.config_object import ConfigObject
+from telegram_crypto_price_bot.logger.logger import Logger
+from telegram_crypto_price_bot.priority.priority_lane import PriorityLane, PriorityLanes
+from telegram_crypto_price_bot.profiling.tracer import tracer
+from telegram_crypto_price_bot.translation.translation_loader import TranslationLoader
+
+
+# Job of a group: (job ID, job, enqueue time)
+CoinInfoJobQueueGroupJob = Tuple[str, CoinInfoJob, float]
+# Queue entry: (priority, sequence number, group key, group jobs)
+CoinInfoJobQueueEntry = Tuple[int, int, CoinInfoBroadcastKey, List[CoinInfoJobQueueGroupJob]]
+
+
+class CoinInfoJobQueueConst:
+    """Constants for coin info job queue class."""
+
+    OVERFLOW_POLICY_DROP: str = "drop"
+    OVERFLOW_POLICY_DELAY: str = "delay"
+    OVERFLOW_POLICY_COALESCE: str = "coalesce"
+
+
+class CoinInfoJobQueue:
+    """
+    Bounded priority queue between the scheduler and the execution of coin info jobs.
+    Due jobs are put in the queue and executed by a fixed number of workers, so that the number of jobs running
+    at the same time is bounded even if many of them are due at the same time.
+    Jobs with a shorter period are executed first, since they are more sensitive to delays.
+    Due jobs sending the same content are grouped while waiting in the queue, so that the content is built once
+    and broadcast to all their chats.
+    A job run is a running instance of the job from when it is put in the queue until it is executed, the number of
+    running instances of the same job is limited here (and not by the scheduler backend, which only puts jobs in the
+    queue).
+    """
+
+    config: ConfigObject
+    logger: Logger
+    broadcaster: CoinInfoBroadcaster
+    queue: asyncio.PriorityQueue
+    workers: List[asyncio.Future]
+    pending_job_ids: Set[str]
+    depth: int
+    pending_groups: Dict[CoinInfoBroadcastKey, List[CoinInfoJobQueueGroupJob]]
+    max_instances: int
+    instances: Dict[str, int]
+    seq_num: int
+    dropped_cnt: int
+    skipped_cnt: int
+    coalesced_cnt: int
+    grouped_cnt: int
+    executed_cnt: int
+    total_wait_time: float
+    max_wait_time: float
+    last_run_time: float
+
+    def __init__(self,
+                 config: ConfigObject,
+                 logger: Logger,
+                 translator: TranslationLoader) -> None:
+        """
+        Initialize the job queue and start its workers.
+        It shall be created with a running event loop.
+
+        Args:
+            config: Configuration object.
+            logger: Logger instance.
+            translator: Translation loader.
+        """
+        self.config = config
+        self.logger = logger
+        self.broadcaster = CoinInfoBroadcaster(config, logger, translator)
+        self.queue = asyncio.PriorityQueue(maxsize=config.GetValue(BotConfigTypes.TASKS_QUEUE_MAX_SIZE))
+        self.pending_job_ids = set()
+        self.depth = 0
+        self.pending_groups = {}
+        self.max_instances = config.GetValue(BotConfigTypes.TASKS_MAX_INSTANCES)
+        self.instances = {}
+        self.seq_num = 0
+        self.dropped_cnt = 0
+        self.skipped_cnt = 0
+        self.coalesced_cnt = 0
+        self.grouped_cnt = 0
+        self.executed_cnt = 0
+        self.total_wait_time = 0.0
+        self.max_wait_time = 0.0
+        self.last_run_time = 0.0
+        self.workers = [
+            asyncio.ensure_future(self.__Worker()) for _ in range(config.GetValue(BotConfigTypes.TASKS_WORKERS_NUM))
+        ]
+
+    async def Put(self,
+                  job_id: str,
+                  job: CoinInfoJob) -> None:
+        """
+        Put a due job in the queue.
+        If the queue is full, the job is handled depending on the overflow policy:
+        - drop: the job run is discarded
+        - delay: wait until there is room in the queue
+        - coalesce: same as delay, but a job run is also discarded if the same job is already waiting in the queue
+        A job run is also discarded if the maximum number of running instances of the job is reached.
+        A job sending the same content of a group already waiting in the queue joins it, without taking room in the queue.
+        If the job itself is already in that group (whatever the policy), the new run is coalesced with it, so that the
+        content is never sent twice to the same chat.
+
+        Args:
+            job_id: Job ID.
+            job: Job to be executed.
+        """
+        overflow_policy = self.config.GetValue(BotConfigTypes.TASKS_QUEUE_OVERFLOW_POLICY)
+
+        if overflow_policy == CoinInfoJobQueueConst.OVERFLOW_POLICY_COALESCE and job_id in self.pending_job_ids:
+            self.coalesced_cnt += 1
+            self.logger.GetLogger().warning(f'Job "{job_id}" already waiting in queue, coalesced with the new run')
+            return
+        if self.instances.get(job_id, 0) >= self.max_instances:
+            self.skipped_cnt += 1
+            self.logger.GetLogger().warning(f'Job "{job_id}" skipped its run, maximum number of running instances reached')
+            return
+
+        group_key = CoinInfoBroadcaster.GroupKey(job)
+        group = self.pending_groups.get(group_key)
+        if group is not None:
+            # Jobs with the same key are always in the same pending group, so the job is in this group if pending
+            if job_id in self.pending_job_ids:
+                self.coalesced_cnt += 1
+                self.logger.GetLogger().warning(f'Job "{job_id}" already waiting in queue, coalesced with the new run')
+                return
+            self.grouped_cnt += 1
+            self.__AddInstance(job_id)
+            self.pending_job_ids.add(job_id)
+            self.depth += 1
+            group.append((job_id, job, time.monotonic()))
+            return
+
+        if overflow_policy == CoinInfoJobQueueConst.OVERFLOW_POLICY_DROP and self.queue.full():
+            self.dropped_cnt += 1
+            self.logger.GetLogger().warning(f'Job queue full ({self.queue.qsize()} groups of jobs), job "{job_id}" dropped')
+            return
+        if self.queue.full():
+            self.logger.GetLogger().warning(f'Job queue full ({self.queue.qsize()} groups of jobs), job "{job_id}" delayed')
+
+        self.seq_num += 1
+        self.__AddInstance(job_id)
+        self.pending_job_ids.add(job_id)
+        self.depth += 1
+        group = [(job_id, job, time.monotonic())]
+        self.pending_groups[group_key] = group
+        await self.queue.put((job.Data().PeriodHours(), self.seq_num, group_key, group))
+
+    def Depth(self) -> int:
+        """
+        Get the number of jobs waiting in the queue.
+
+        Returns:
+            Number of waiting jobs.
+        """
+        return self.depth
+
+    def IsFull(self) -> bool:
+        """
+        Get if the queue is full, i.e. new job runs are dropped or wait for a free slot.
+
+        Returns:
+            True if full, False otherwise.
+        """
+        return self.queue.full()
+
+    def IsRunning(self) -> bool:
+        """
+        Get if the workers are running.
+
+        Returns:
+            True if running, False otherwise.
+        """
+        return all(not worker.done() for worker in self.workers)
+
+    def DroppedCount(self) -> int:
+        """
+        Get the number of job runs dropped because the queue was full.
+
+        Returns:
+            Number of dropped job runs.
+        """
+        return self.dropped_cnt
+
+    def CoalescedCount(self) -> int:
+        """
+        Get the number of job runs coalesced with a run already waiting in the queue.
+
+        Returns:
+            Number of coalesced job runs.
+        """
+        return self.coalesced_cnt
+
+    def SkippedCount(self) -> int:
+        """
+        Get the number of job runs skipped, since the maximum number of running instances was reached.
+
+        Returns:
+            Number of skipped job runs.
+        """
+        return self.skipped_cnt
+
+    def GroupedCount(self) -> int:
+        """
+        Get the number of job runs grouped with another job run sending the same content.
+
+        Returns:
+            Number of grouped job runs.
+        """
+        return self.grouped_cnt
+
+    def ExecutedCount(self) -> int:
+        """
+        Get the number of jobs taken from the queue by workers.
+
+        Returns:
+            Number of executed jobs.
+        """
+        return self.executed_cnt
+
+    def AverageWaitTime(self) -> float:
+        """
+        Get the average time spent by jobs in the queue.
+
+        Returns:
+            Average wait time in seconds.
+        """
+        return self.total_wait_time / self.executed_cnt if self.executed_cnt > 0 else 0.0
+
+    def MaxWaitTime(self) -> float:
+        """
+        Get the maximum time spent by a job in the queue.
+
+        Returns:
+            Maximum wait time in seconds.
+        """
+        return self.max_wait_time
+
+    def LastRunTime(self) -> float:
+        """
+        Get the time when a group of jobs was last executed successfully.
+
+        Returns:
+            Time since epoch in seconds (0 if never executed).
+        """
+        return self.last_run_time
+
+    async def __Worker(self) -> None:
+        """Worker executing groups of jobs from the queue."""
+        while True:
+            entry: CoinInfoJobQueueEntry = await self.queue.get()
+            _, _, group_key, group = entry
+            # From now on, jobs sending the same content start a new group
+            del self.pending_groups[group_key]
+
+            dequeue_time = time.monotonic()
+            self.depth -= len(group)
+            for job_id, _, enqueue_time in group:
+                self.pending_job_ids.discard(job_id)
+                wait_time = dequeue_time - enqueue_time
+                self.executed_cnt += 1
+                self.total_wait_time += wait_time
+                self.max_wait_time = max(self.max_wait_time, wait_time)
+
+            try:
+                self.logger.GetLogger().info(
+                    f"Group of {len(group)} job(s) {group_key} dequeued after {dequeue_time - group[0][2]:.3f} sec, "
+                    f"queue depth: {self.queue.qsize()}"
+                )
+                with PriorityLane(PriorityLanes.SCHEDULED), tracer.Trace(self.config,
+                                                                         "job",
+                                                                         group[0][0],
+                                                                         job_ids=[job_id for job_id, _, _ in group]):
+                    # Times are converted from the monotonic clock to the one of traces
+                    time_offset = time.time() - time.monotonic()
+                    tracer.AddSpan("queue_wait", group[0][2] + time_offset, dequeue_time + time_offset)
+                    await self.broadcaster.Broadcast([(job_id, job) for job_id, job, _ in group])
+                self.last_run_time = time.time()
+            except Exception:
+                self.logger.GetLogger().exception(f"An error occurred while executing group of jobs {group_key}")
+            finally:
+                for job_id, _, _ in group:
+                    self.__RemoveInstance(job_id)
+                self.queue.task_done()
+
+    def __AddInstance(self,
+                      job_id: str) -> None:
+        """
+        Add a running instance of a job.
+
+        Args:
+            job_id: Job ID.
+        """
+        self.instances[job_id] = self.instances.get(job_id, 0) + 1
+
+    def __RemoveInstance(self,
+                         job_id: str) -> None:
+        """
+        Remove a running instance of a job.
+
+        Args:
+            job_id: Job ID.
+        """
+        instances_num = self.instances.pop(job_id) - 1
+        if instances_num > 0:
+            self.instances[job_id] = instances_num
@@ -18,16 +18,27 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 
-from typing import Dict
+from contextlib import contextmanager
+from typing import Awaitable, Callable, Dict, Iterator, List, Optional, Tuple
 
 import pyrogram
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
 
 from telegram_crypto_price_bot.bot.bot_config_types import BotConfigTypes
+from telegram_crypto_price_bot.coin_info.coin_info_apscheduler_backend import CoinInfoApSchedulerBackend
+from telegram_crypto_price_bot.coin_info.coin_info_bulk_result import CoinInfoBulkResult, CoinInfoCoinPair
 from telegram_crypto_price_bot.coin_info.coin_info_job import CoinInfoJob, CoinInfoJobData
+from telegram_crypto_price_bot.coin_info.coin_info_job_queue import CoinInfoJobQueue
+from telegram_crypto_price_bot.coin_info.coin_info_scheduler_backend import CoinInfoSchedulerBackend
+from telegram_crypto_price_bot.coin_info.coin_info_scheduler_stats import CoinInfoSchedulerStats
+from telegram_crypto_price_bot.coin_info.coin_info_timing_wheel_backend import CoinInfoTimingWheelBackend
+from telegram_crypto_price_bot.coin_info.coin_info_warmer import CoinInfoWarmer
+from telegram_crypto_price_bot.coingecko.coingecko_circuit_breaker import coingecko_circuit_breaker
 from telegram_crypto_price_bot.config.config_object import ConfigObject
+from telegram_crypto_price_bot.info_message_sender.coin_info_message_sender import CoinInfoMessageSender
 from telegram_crypto_price_bot.logger.logger import Logger
 from telegram_crypto_price_bot.misc.helpers import ChatHelper
+from telegram_crypto_price_bot.priority.priority_lane_metrics import priority_lane_metrics
+from telegram_crypto_price_bot.profiling.loop_lag_monitor import LoopLagMonitor
 from telegram_crypto_price_bot.translation.translation_loader import TranslationLoader
 from telegram_crypto_price_bot.utils.wrapped_list import WrappedList
 
@@ -59,6 +70,11 @@ class CoinInfoSchedulerConst:
     MAX_START_HOUR: int = 23
     MIN_PERIOD_HOURS: int = 1
     MAX_PERIOD_HOURS: int = 24
+    TIMING_WHEEL_BACKEND: str = "timing_wheel"
+
+
+# Coin of a job to be started: (coin ID, coin VS, last days)
+CoinInfoJobCoin = Tuple[str, str, int]
 
 
 class CoinInfoJobsList(WrappedList):
@@ -117,11 +133,14 @@ class CoinInfoJobsList(WrappedList):
 class CoinInfoScheduler:
     """Scheduler for managing scheduled coin information jobs."""
 
-    client: pyrogram.Client
     config: ConfigObject
     logger: Logger
+    coin_info_msg_sender: CoinInfoMessageSender
     jobs: Dict[str, CoinInfoJob]
-    scheduler: AsyncIOScheduler
+    job_queue: CoinInfoJobQueue
+    backend: CoinInfoSchedulerBackend
+    warmer: Optional[CoinInfoWarmer]
+    loop_lag_monitor: LoopLagMonitor
     translator: TranslationLoader
 
     def __init__(self,
@@ -138,16 +157,54 @@ class CoinInfoScheduler:
             logger: Logger instance.
             translator: Translation loader.
         """
-        self.client = client
         self.config = config
         self.logger = logger
         self.translator = translator
+        self.coin_info_msg_sender = CoinInfoMessageSender(client, config, logger, translator)
         self.jobs = {}
-        self.scheduler = AsyncIOScheduler()
-        self.scheduler.start()
+        self.job_queue = CoinInfoJobQueue(config, logger, translator)
+        if config.GetValue(BotConfigTypes.TASKS_SCHEDULER_BACKEND) == CoinInfoSchedulerConst.TIMING_WHEEL_BACKEND:
+            self.backend = CoinInfoTimingWheelBackend(config, logger)
+        else:
+            self.backend = CoinInfoApSchedulerBackend(config, logger)
+        self.warmer = (
+            CoinInfoWarmer(config, logger, translator, self.backend, self.jobs)
+            if config.GetValue(BotConfigTypes.TASKS_WARMUP_SEC) > 0
+            else None
+        )
+        self.loop_lag_monitor = LoopLagMonitor(config, logger)
+
+    async def GetStats(self) -> CoinInfoSchedulerStats:
+        """
+        Get the scheduler statistics.
+        The scheduler is reported as running only if both its backend and the workers of the job queue are running.
 
-    def GetJobsInChat(self,
-                      chat: pyrogram.types.Chat) -> CoinInfoJobsList:
+        Returns:
+            Scheduler statistics.
+        """
+        stats = CoinInfoSchedulerStats()
+        stats.running = self.backend.IsRunning() and self.job_queue.IsRunning()
+        stats.queue_depth = self.job_queue.Depth()
+        stats.queue_full = self.job_queue.IsFull()
+        stats.queue_dropped_cnt = self.job_queue.DroppedCount()
+        stats.queue_coalesced_cnt = self.job_queue.CoalescedCount()
+        stats.queue_grouped_cnt = self.job_queue.GroupedCount()
+        stats.queue_executed_cnt = self.job_queue.ExecutedCount()
+        stats.queue_avg_wait_time = self.job_queue.AverageWaitTime()
+        stats.queue_max_wait_time = self.job_queue.MaxWaitTime()
+        stats.queue_last_run_time = self.job_queue.LastRunTime()
+        stats.missed_cnt = self.backend.MissedCount()
+        stats.skipped_cnt = self.job_queue.SkippedCount()
+        stats.overdue_cnt = self.backend.OverdueCount()
+        stats.max_delay = self.backend.MaxDelay()
+        stats.lanes_stats = priority_lane_metrics.GetStats()
+        stats.circuit_breaker_stats = coingecko_circuit_breaker.GetStats()
+        stats.loop_lag_stats = self.loop_lag_monitor.GetStats()
+
+        return stats
+
+    async def GetJobsInChat(self,
+                            chat: pyrogram.types.Chat) -> CoinInfoJobsList:
         """
         Get the list of active jobs in a chat.
 
@@ -164,11 +221,11 @@ class CoinInfoScheduler:
 
         return jobs_list
 
-    def IsActiveInChat(self,
-                       chat: pyrogram.types.Chat,
-                       topic_id: int,
-                       coin_id: str,
-                       coin_vs: str) -> bool:
+    async def IsActiveInChat(self,
+                             chat: pyrogram.types.Chat,
+                             topic_id: int,
+                             coin_id: str,
+                             coin_vs: str) -> bool:
         """
         Check if a job is active in a chat.
 
@@ -181,17 +238,16 @@ class CoinInfoScheduler:
         Returns:
             True if job is active, False otherwise.
         """
-        job_id = self.__GetJobId(chat, topic_id, coin_id, coin_vs)
-        return job_id in self.jobs and self.scheduler.get_job(job_id) is not None
+        return self.__IsActive(self.__GetJobId(chat, topic_id, coin_id, coin_vs))
 
-    def Start(self,
-              chat: pyrogram.types.Chat,
-              topic_id: int,
-              period_hours: int,
-              start_hour: int,
-              coin_id: str,
-              coin_vs: str,
-              last_days: int) -> None:
+    async def Start(self,
+                    chat: pyrogram.types.Chat,
+                    topic_id: int,
+                    period_hours: int,
+                    start_hour: int,
+                    coin_id: str,
+                    coin_vs: str,
+                    last_days: int) -> None:
         """
         Start a new scheduled job.
 
@@ -212,7 +268,7 @@ class CoinInfoScheduler:
         """
         job_id = self.__GetJobId(chat, topic_id, coin_id, coin_vs)
 
-        if self.IsActiveInChat(chat, topic_id, coin_id, coin_vs):
+        if self.__IsActive(job_id):
             self.logger.GetLogger().error(
                 f'Job "{job_id}" already active in chat {ChatHelper.GetTitleOrId(chat)} ({topic_id}), cannot start it'
             )
@@ -234,11 +290,11 @@ class CoinInfoScheduler:
         self.__CreateJob(job_id, chat, topic_id, period_hours, start_hour, coin_id, coin_vs, last_days)
         self.__AddJob(job_id, chat, topic_id, period_hours, start_hour, coin_id, coin_vs, last_days)
 
-    def Stop(self,
-             chat: pyrogram.types.Chat,
-             topic_id: int,
-             coin_id: str,
-             coin_vs: str) -> None:
+    async def Stop(self,
+                   chat: pyrogram.types.Chat,
+                   topic_id: int,
+                   coin_id: str,
+                   coin_vs: str) -> None:
         """
         Stop a scheduled job.
 
@@ -253,22 +309,22 @@ class CoinInfoScheduler:
         """
         job_id = self.__GetJobId(chat, topic_id, coin_id, coin_vs)
 
-        if not self.IsActiveInChat(chat, topic_id, coin_id, coin_vs):
+        if not self.__IsActive(job_id):
             self.logger.GetLogger().error(
                 f'Job "{job_id}" not active in chat {ChatHelper.GetTitleOrId(chat)} ({topic_id}), cannot stop it'
             )
             raise CoinInfoJobNotExistentError()
 
-        self.scheduler.remove_job(job_id)
-        self.jobs.pop(job_id, None)
+        self.backend.RemoveJob(job_id)
+        self.__RemoveJob(job_id)
 
         self.logger.GetLogger().info(
             f'Stopped job "{job_id}" in chat {ChatHelper.GetTitleOrId(chat)} ({topic_id}), '
             f'number of active jobs: {self.__GetTotalJobCount()}'
         )
 
-    def StopAll(self,
-                chat: pyrogram.types.Chat) -> None:
+    async def StopAll(self,
+                      chat: pyrogram.types.Chat) -> None:
         """
         Stop all jobs in a chat.
 
@@ -282,15 +338,15 @@ class CoinInfoScheduler:
             return
 
         for job_id in job_ids:
-            self.scheduler.remove_job(job_id)
-            self.jobs.pop(job_id, None)
+            self.backend.RemoveJob(job_id)
+            self.__RemoveJob(job_id)
             self.logger.GetLogger().info(f'Stopped job "{job_id}" in chat {ChatHelper.GetTitleOrId(chat)}')
         self.logger.GetLogger().info(
             f"Removed all jobs in chat {ChatHelper.GetTitleOrId(chat)}, number of active jobs: {self.__GetTotalJobCount()}"
         )
 
-    def ChatLeft(self,
-                 chat: pyrogram.types.Chat) -> None:
+    async def ChatLeft(self,
+                       chat: pyrogram.types.Chat) -> None:
         """
         Handle bot leaving a chat by stopping all jobs.
 
@@ -298,13 +354,13 @@ class CoinInfoScheduler:
             chat: Telegram chat that was left
         """
         self.logger.GetLogger().info(f"Left chat {ChatHelper.GetTitleOrId(chat)}, stopping all chat jobs...")
-        self.StopAll(chat)
+        await self.StopAll(chat)
 
-    def Pause(self,
-              chat: pyrogram.types.Chat,
-              topic_id: int,
-              coin_id: str,
-              coin_vs: str) -> None:
+    async def Pause(self,
+                    chat: pyrogram.types.Chat,
+                    topic_id: int,
+                    coin_id: str,
+                    coin_vs: str) -> None:
         """
         Pause a scheduled job.
 
@@ -319,21 +375,21 @@ class CoinInfoScheduler:
         """
         job_id = self.__GetJobId(chat, topic_id, coin_id, coin_vs)
 
-        if not self.IsActiveInChat(chat, topic_id, coin_id, coin_vs):
+        if not self.__IsActive(job_id):
             self.logger.GetLogger().error(
                 f'Job "{job_id}" not active in chat {ChatHelper.GetTitleOrId(chat)} ({topic_id}), cannot pause it'
             )
             raise CoinInfoJobNotExistentError()
 
         self.jobs[job_id].SetRunning(False)
-        self.scheduler.pause_job(job_id)
+        self.backend.PauseJob(job_id)
         self.logger.GetLogger().info(f'Paused job "{job_id}" in chat {ChatHelper.GetTitleOrId(chat)} ({topic_id})')
 
-    def Resume(self,
-               chat: pyrogram.types.Chat,
-               topic_id: int,
-               coin_id: str,
-               coin_vs: str) -> None:
+    async def Resume(self,
+                     chat: pyrogram.types.Chat,
+                     topic_id: int,
+                     coin_id: str,
+                     coin_vs: str) -> None:
         """
         Resume a paused job.
 
@@ -348,22 +404,107 @@ class CoinInfoScheduler:
         """
         job_id = self.__GetJobId(chat, topic_id, coin_id, coin_vs)
 
-        if not self.IsActiveInChat(chat, topic_id, coin_id, coin_vs):
+        if not self.__IsActive(job_id):
             self.logger.GetLogger().error(
                 f'Job "{job_id}" not active in chat {ChatHelper.GetTitleOrId(chat)} ({topic_id}), cannot resume it'
             )
             raise CoinInfoJobNotExistentError()
 
         self.jobs[job_id].SetRunning(True)
-        self.scheduler.resume_job(job_id)
+        self.backend.ResumeJob(job_id)
         self.logger.GetLogger().info(f'Resumed job "{job_id}" in chat {ChatHelper.GetTitleOrId(chat)} ({topic_id})')
 
-    def SendInSameMessage(self,
-                          chat: pyrogram.types.Chat,
-                          topic_id: int,
-                          coin_id: str,
-                          coin_vs: str,
-                          flag: bool) -> None:
+    async def StartMultiple(self,
+                            chat: pyrogram.types.Chat,
+                            topic_id: int,
+                            period_hours: int,
+                            start_hour: int,
+                            coins: List[CoinInfoJobCoin]) -> CoinInfoBulkResult:
+        """
+        Start multiple scheduled jobs with the same period and start hour.
+        The scheduler is updated once for all jobs, a failure for a job does not prevent the other ones from starting.
+
+        Args:
+            chat: Telegram chat where the jobs will run.
+            topic_id: Telegram topic where the jobs will run.
+            period_hours: Period in hours between executions.
+            start_hour: Starting hour for the jobs.
+            coins: Coins of the jobs.
+
+        Returns:
+            Result for each coin pair.
+        """
+        result = CoinInfoBulkResult()
+        with self.__BatchedUpdate():
+            for coin_id, coin_vs, last_days in coins:
+                try:
+                    await self.Start(chat, topic_id, period_hours, start_hour, coin_id, coin_vs, last_days)
+                except (CoinInfoJobAlreadyExistentError,
+                        CoinInfoJobInvalidPeriodError,
+                        CoinInfoJobInvalidStartError,
+                        CoinInfoJobMaxNumError) as ex:
+                    result.AddFailed(coin_id, coin_vs, ex)
+                else:
+                    result.AddSucceeded(coin_id, coin_vs)
+        return result
+
+    async def StopMultiple(self,
+                           chat: pyrogram.types.Chat,
+                           topic_id: int,
+                           coin_pairs: List[CoinInfoCoinPair]) -> CoinInfoBulkResult:
+        """
+        Stop multiple scheduled jobs.
+
+        Args:
+            chat: Telegram chat where the jobs are running
+            topic_id: Telegram topic where the jobs are running
+            coin_pairs: Coin pairs of the jobs
+
+        Returns:
+            Result for each coin pair
+        """
+        return await self.__ApplyMultiple(coin_pairs, lambda coin_id, coin_vs: self.Stop(chat, topic_id, coin_id, coin_vs))
+
+    async def PauseMultiple(self,
+                            chat: pyrogram.types.Chat,
+                            topic_id: int,
+                            coin_pairs: List[CoinInfoCoinPair]) -> CoinInfoBulkResult:
+        """
+        Pause multiple scheduled jobs.
+
+        Args:
+            chat: Telegram chat where the jobs are running
+            topic_id: Telegram topic where the jobs are running
+            coin_pairs: Coin pairs of the jobs
+
+        Returns:
+            Result for each coin pair
+        """
+        return await self.__ApplyMultiple(coin_pairs, lambda coin_id, coin_vs: self.Pause(chat, topic_id, coin_id, coin_vs))
+
+    async def ResumeMultiple(self,
+                             chat: pyrogram.types.Chat,
+                             topic_id: int,
+                             coin_pairs: List[CoinInfoCoinPair]) -> CoinInfoBulkResult:
+        """
+        Resume multiple paused jobs.
+
+        Args:
+            chat: Telegram chat where the jobs are running
+            topic_id: Telegram topic where the jobs are running
+            coin_pairs: Coin pairs of the jobs
+
+        Returns:
+            Result for each coin pair
+        """
+        return await self.__ApplyMultiple(coin_pairs, lambda coin_id, coin_vs: self.Resume(chat, topic_id, coin_id, coin_vs))
+
+    async def SendInSameMessage(self,
+                                chat: pyrogram.types.Chat,
+                                topic_id: int,
+                                coin_id: str,
+                                coin_vs: str,
+                                flag: bool) -> None:
         """
         Set whether to send updates in the same message.
 
@@ -379,7 +520,7 @@ class CoinInfoScheduler:
         """
         job_id = self.__GetJobId(chat, topic_id, coin_id, coin_vs)
 
-        if not self.IsActiveInChat(chat, topic_id, coin_id, coin_vs):
+        if not self.__IsActive(job_id):
             self.logger.GetLogger().error(f'Job "{job_id}" not active in chat {ChatHelper.GetTitleOrId(chat)} ({topic_id})')
             raise CoinInfoJobNotExistentError()
 
@@ -388,12 +529,12 @@ class CoinInfoScheduler:
             f'Set send in same message to {flag} for job "{job_id}" in chat {ChatHelper.GetTitleOrId(chat)} ({topic_id})'
         )
 
-    def DeleteLastSentMessage(self,
-                              chat: pyrogram.types.Chat,
-                              topic_id: int,
-                              coin_id: str,
-                              coin_vs: str,
-                              flag: bool) -> None:
+    async def DeleteLastSentMessage(self,
+                                    chat: pyrogram.types.Chat,
+                                    topic_id: int,
+                                    coin_id: str,
+                                    coin_vs: str,
+                                    flag: bool) -> None:
         """
         Set whether to delete the last sent message.
 
@@ -409,7 +550,7 @@ class CoinInfoScheduler:
         """
         job_id = self.__GetJobId(chat, topic_id, coin_id, coin_vs)
 
-        if not self.IsActiveInChat(chat, topic_id, coin_id, coin_vs):
+        if not self.__IsActive(job_id):
             self.logger.GetLogger().error(f'Job "{job_id}" not active in chat {ChatHelper.GetTitleOrId(chat)} ({topic_id})')
             raise CoinInfoJobNotExistentError()
 
@@ -418,6 +559,36 @@ class CoinInfoScheduler:
             f'Set delete last message to {flag} for job "{job_id}" in chat {ChatHelper.GetTitleOrId(chat)} ({topic_id})'
         )
 
+    async def EditLastSentMessage(self,
+                                  chat: pyrogram.types.Chat,
+                                  topic_id: int,
+                                  coin_id: str,
+                                  coin_vs: str,
+                                  flag: bool) -> None:
+        """
+        Set whether to edit the last sent message in place.
+
+        Args:
+            chat: Telegram chat where the job is running
+            topic_id: Telegram topic where the job is running
+            coin_id: Cryptocurrency coin identifier
+            coin_vs: Currency to compare against
+            flag: True to edit last message, False otherwise
+
+        Raises:
+            CoinInfoJobNotExistentError: If job does not exist
+        """
+        job_id = self.__GetJobId(chat, topic_id, coin_id, coin_vs)
+
+        if not self.__IsActive(job_id):
+            self.logger.GetLogger().error(f'Job "{job_id}" not active in chat {ChatHelper.GetTitleOrId(chat)} ({topic_id})')
+            raise CoinInfoJobNotExistentError()
+
+        self.jobs[job_id].EditLastSentMessage(flag)
+        self.logger.GetLogger().info(
+            f'Set edit last message to {flag} for job "{job_id}" in chat {ChatHelper.GetTitleOrId(chat)} ({topic_id})'
+        )
+
     def __CreateJob(self,
                     job_id: str,
                     chat: pyrogram.types.Chat,
@@ -440,11 +611,11 @@ class CoinInfoScheduler:
             coin_vs: Currency to compare against
             last_days: Number of days of historical data
         """
-        self.jobs[job_id] = CoinInfoJob(self.client,
-                                        self.config,
-                                        self.logger,
-                                        self.translator,
-                                        CoinInfoJobData(chat, topic_id, period, start, coin_id, coin_vs, last_days))
+        self.jobs[job_id] = CoinInfoJob(
+            self.logger,
+            self.coin_info_msg_sender,
+            CoinInfoJobData(chat.id, chat.title, topic_id, period, start, coin_id, coin_vs, last_days)
+        )
 
     def __AddJob(self,
                  job_id: str,
@@ -469,29 +640,77 @@ class CoinInfoScheduler:
             last_days: Number of days of historical data
         """
         is_test_mode = self.config.GetValue(BotConfigTypes.APP_TEST_MODE)
-        cron_str = self.__BuildCronString(period, start, is_test_mode)
-        if is_test_mode:
-            self.scheduler.add_job(
-                self.jobs[job_id].DoJob,
-                "cron",
-                args=(chat, topic_id, coin_id, coin_vs, last_days),
-                minute=cron_str,
-                id=job_id
-            )
-        else:
-            self.scheduler.add_job(
-                self.jobs[job_id].DoJob,
-                "cron",
-                args=(chat, topic_id, coin_id, coin_vs, last_days),
-                hour=cron_str,
-                id=job_id
-            )
+        run_values = self.__BuildRunValues(period, start, is_test_mode)
+        self.backend.AddJob(job_id, run_values, is_test_mode, self.job_queue.Put, (job_id, self.jobs[job_id]))
         per_sym = "minute(s)" if is_test_mode else "hour(s)"
         self.logger.GetLogger().info(
             f'Started job "{job_id}" in chat {ChatHelper.GetTitleOrId(chat)} ({topic_id}) [parameters: {period} {per_sym}, '
-            f"{coin_id}, {coin_vs}, {last_days}], number of active jobs: {self.__GetTotalJobCount()}, cron: {cron_str}"
+            f"{coin_id}, {coin_vs}, {last_days}], number of active jobs: {self.__GetTotalJobCount()}, "
+            f"runs: {','.join(str(run_value) for run_value in run_values)}"
         )
 
+    async def __ApplyMultiple(self,
+                              coin_pairs: List[CoinInfoCoinPair],
+                              job_fct: Callable[[str, str], Awaitable[None]]) -> CoinInfoBulkResult:
+        """
+        Apply an operation to multiple existing jobs, updating the scheduler once for all of them.
+
+        Args:
+            coin_pairs: Coin pairs of the jobs
+            job_fct: Operation to apply to the job of a coin pair
+
+        Returns:
+            Result for each coin pair
+        """
+        result = CoinInfoBulkResult()
+        with self.__BatchedUpdate():
+            for coin_id, coin_vs in coin_pairs:
+                try:
+                    await job_fct(coin_id, coin_vs)
+                except CoinInfoJobNotExistentError as ex:
+                    result.AddFailed(coin_id, coin_vs, ex)
+                else:
+                    result.AddSucceeded(coin_id, coin_vs)
+        return result
+
+    @contextmanager
+    def __BatchedUpdate(self) -> Iterator[None]:
+        """
+        Context manager for updating multiple jobs at once.
+        The processing of jobs is paused during the update, so that the backend processes the changes only once at the end.
+        """
+        self.backend.Pause()
+        try:
+            yield
+        finally:
+            self.backend.Resume()
+
+    def __RemoveJob(self,
+                    job_id: str) -> None:
+        """
+        Remove a job instance.
+
+        Args:
+            job_id: Unique identifier for the job
+        """
+        job = self.jobs.pop(job_id, None)
+        # Mark the job as not running, so that it is skipped if already waiting in the job queue
+        if job is not None:
+            job.SetRunning(False)
+
+    def __IsActive(self,
+                   job_id: str) -> bool:
+        """
+        Get if a job is active.
+
+        Args:
+            job_id: Job ID.
+
+        Returns:
+            True if active, False otherwise.
+        """
+        return job_id in self.jobs and self.backend.HasJob(job_id)
+
     @staticmethod
     def __GetJobId(chat: pyrogram.types.Chat,
                    topic_id: int,
@@ -521,11 +740,11 @@ class CoinInfoScheduler:
         return len(self.jobs)
 
     @staticmethod
-    def __BuildCronString(period: int,
-                          start_val: int,
-                          is_test_mode: bool) -> str:
+    def __BuildRunValues(period: int,
+                         start_val: int,
+                         is_test_mode: bool) -> List[int]:
         """
-        Build a cron expression string for job scheduling.
+        Build the values when a job runs.
 
         Args:
             period: Period between executions
@@ -533,19 +752,18 @@ class CoinInfoScheduler:
             is_test_mode: True for test mode (minutes), False for production (hours)
 
         Returns:
-            Cron expression string
+            Hours of the day (minutes of every hour in test mode)
         """
         max_val = 24 if not is_test_mode else 60
 
-        cron_str = ""
-
         loop_cnt = max_val // period
         if max_val % period != 0:
             loop_cnt += 1
 
+        run_values = []
         t = start_val
         for _ in range(loop_cnt):
-            cron_str += f"{t},"
+            run_values.append(t)
             t = (t + period) % max_val
 
-        return cron_str[:-1]
+        return run_values
@@ -0,0 +1,213 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Any, Awaitable, Callable, List, Tuple
+
+from telegram_crypto_price_bot.logger.logger import Logger
+
+
+# Function executing a job
+CoinInfoJobFct = Callable[..., Awaitable[None]]
+# Scheduled run of a job: (job ID, run time)
+CoinInfoJobRun = Tuple[str, datetime]
+
+
+class CoinInfoSchedulerBackendConst:
+    """Constants for coin info scheduler backends."""
+
+    # A job run is considered overdue if it is submitted later than this
+    OVERDUE_THRESHOLD_SEC: float = 1.0
+
+
+class CoinInfoSchedulerBackend(ABC):
+    """
+    Abstract base class for scheduler backends, triggering jobs at their scheduled times.
+    It also keeps track of job runs that are missed or overdue, to see if the bot falls behind schedule.
+    Backends only put due jobs in the job queue, so the number of running instances of a job is limited there.
+    """
+
+    logger: Logger
+    missed_cnt: int
+    overdue_cnt: int
+    max_delay: float
+
+    def __init__(self,
+                 logger: Logger) -> None:
+        """
+        Initialize the backend.
+
+        Args:
+            logger: Logger instance.
+        """
+        self.logger = logger
+        self.missed_cnt = 0
+        self.overdue_cnt = 0
+        self.max_delay = 0.0
+
+    def MissedCount(self) -> int:
+        """
+        Get the number of job runs missed, i.e. later than the misfire grace time.
+
+        Returns:
+            Number of missed job runs.
+        """
+        return self.missed_cnt
+
+    def OverdueCount(self) -> int:
+        """
+        Get the number of job runs submitted later than the overdue threshold.
+
+        Returns:
+            Number of overdue job runs.
+        """
+        return self.overdue_cnt
+
+    def MaxDelay(self) -> float:
+        """
+        Get the maximum delay of a job run submission.
+
+        Returns:
+            Maximum delay in seconds.
+        """
+        return self.max_delay
+
+    @abstractmethod
+    def AddJob(self,
+               job_id: str,
+               run_values: List[int],
+               is_test_mode: bool,
+               job_fct: CoinInfoJobFct,
+               job_args: Tuple[Any, ...]) -> None:
+        """
+        Add a job.
+
+        Args:
+            job_id: Job ID.
+            run_values: Hours of the day when the job runs (minutes of every hour in test mode).
+            is_test_mode: True for test mode, False otherwise.
+            job_fct: Function executing the job.
+            job_args: Arguments of the function.
+        """
+
+    @abstractmethod
+    def RemoveJob(self,
+                  job_id: str) -> None:
+        """
+        Remove a job.
+
+        Args:
+            job_id: Job ID.
+        """
+
+    @abstractmethod
+    def PauseJob(self,
+                 job_id: str) -> None:
+        """
+        Pause a job, so that it does not run until resumed.
+
+        Args:
+            job_id: Job ID.
+        """
+
+    @abstractmethod
+    def ResumeJob(self,
+                  job_id: str) -> None:
+        """
+        Resume a paused job.
+
+        Args:
+            job_id: Job ID.
+        """
+
+    @abstractmethod
+    def HasJob(self,
+               job_id: str) -> bool:
+        """
+        Get if a job exists (either running or paused).
+
+        Args:
+            job_id: Job ID.
+
+        Returns:
+            True if existent, False otherwise.
+        """
+
+    @abstractmethod
+    def NextRuns(self,
+                 end_time: datetime) -> List[CoinInfoJobRun]:
+        """
+        Get the next run of the running jobs, if not later than the specified time.
+
+        Args:
+            end_time: End time.
+
+        Returns:
+            Next runs.
+        """
+
+    @abstractmethod
+    def RunDueJobs(self) -> None:
+        """Run the jobs due since the last check, without waiting for the next one (nothing is run while paused)."""
+
+    @abstractmethod
+    def IsRunning(self) -> bool:
+        """
+        Get if the backend is running.
+
+        Returns:
+            True if running, False otherwise.
+        """
+
+    @abstractmethod
+    def Pause(self) -> None:
+        """Pause the processing of jobs, e.g. while updating multiple jobs at once."""
+
+    @abstractmethod
+    def Resume(self) -> None:
+        """Resume the processing of jobs."""
+
+    def _JobMissed(self,
+                   job_id: str) -> None:
+        """
+        Notify that a job run was missed.
+
+        Args:
+            job_id: Job ID.
+        """
+        self.missed_cnt += 1
+        self.logger.GetLogger().warning(f'Job "{job_id}" missed its run, later than the misfire grace time')
+
+    def _JobSubmitted(self,
+                      job_id: str,
+                      delay: float) -> None:
+        """
+        Notify that a job run was submitted.
+
+        Args:
+            job_id: Job ID.
+            delay: Delay in seconds with respect to the scheduled run time.
+        """
+        self.max_delay = max(self.max_delay, delay)
+        if delay > CoinInfoSchedulerBackendConst.OVERDUE_THRESHOLD_SEC:
+            self.overdue_cnt += 1
+            self.logger.GetLogger().warning(f'Job "{job_id}" is overdue by {delay:.3f} sec')
@@ -0,0 +1,96 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+from telegram_crypto_price_bot.coingecko.coingecko_circuit_breaker import CoinGeckoCircuitBreakerStats
+from telegram_crypto_price_bot.priority.priority_lane_metrics import PriorityLaneMetrics, PriorityLaneStatsType
+from telegram_crypto_price_bot.profiling.loop_lag_monitor import LoopLagStats
+
+
+class CoinInfoSchedulerStats:
+    """Class for a snapshot of coin info scheduler statistics, to see if the bot falls behind schedule."""
+
+    running: bool
+    queue_depth: int
+    queue_full: bool
+    queue_dropped_cnt: int
+    queue_coalesced_cnt: int
+    queue_grouped_cnt: int
+    queue_executed_cnt: int
+    queue_avg_wait_time: float
+    queue_max_wait_time: float
+    queue_last_run_time: float
+    missed_cnt: int
+    skipped_cnt: int
+    overdue_cnt: int
+    max_delay: float
+    lanes_stats: PriorityLaneStatsType
+    circuit_breaker_stats: CoinGeckoCircuitBreakerStats
+    loop_lag_stats: LoopLagStats
+
+    def __init__(self) -> None:
+        """Initialize the statistics."""
+        self.running = False
+        self.queue_depth = 0
+        self.queue_full = False
+        self.queue_dropped_cnt = 0
+        self.queue_coalesced_cnt = 0
+        self.queue_grouped_cnt = 0
+        self.queue_executed_cnt = 0
+        self.queue_avg_wait_time = 0.0
+        self.queue_max_wait_time = 0.0
+        self.queue_last_run_time = 0.0
+        self.missed_cnt = 0
+        self.skipped_cnt = 0
+        self.overdue_cnt = 0
+        self.max_delay = 0.0
+        self.lanes_stats = {}
+        self.circuit_breaker_stats = CoinGeckoCircuitBreakerStats()
+        self.loop_lag_stats = LoopLagStats()
+
+    def Merge(self,
+              other: "CoinInfoSchedulerStats") -> None:
+        """
+        Merge statistics of another scheduler (e.g. another shard) into these ones.
+
+        Args:
+            other: Other statistics.
+        """
+        executed_cnt = self.queue_executed_cnt + other.queue_executed_cnt
+        if executed_cnt > 0:
+            self.queue_avg_wait_time = (
+                self.queue_avg_wait_time * self.queue_executed_cnt + other.queue_avg_wait_time * other.queue_executed_cnt
+            ) / executed_cnt
+
+        self.running = self.running and other.running
+        self.queue_depth += other.queue_depth
+        self.queue_full = self.queue_full or other.queue_full
+        self.queue_dropped_cnt += other.queue_dropped_cnt
+        self.queue_coalesced_cnt += other.queue_coalesced_cnt
+        self.queue_grouped_cnt += other.queue_grouped_cnt
+        self.queue_executed_cnt = executed_cnt
+        self.queue_max_wait_time = max(self.queue_max_wait_time, other.queue_max_wait_time)
+        self.queue_last_run_time = max(self.queue_last_run_time, other.queue_last_run_time)
+        self.missed_cnt += other.missed_cnt
+        self.skipped_cnt += other.skipped_cnt
+        self.overdue_cnt += other.overdue_cnt
+        self.max_delay = max(self.max_delay, other.max_delay)
+        PriorityLaneMetrics.MergeStats(self.lanes_stats, other.lanes_stats)
+        self.circuit_breaker_stats.Merge(other.circuit_breaker_stats)
+        self.loop_lag_stats.Merge(other.loop_lag_stats)
@@ -0,0 +1,220 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import asyncio
+import multiprocessing
+import threading
+import time
+from multiprocessing.connection import Connection
+from multiprocessing.process import BaseProcess
+from typing import Any, List, Tuple
+
+from telegram_crypto_price_bot.bot.bot_config_types import BotConfigTypes
+from telegram_crypto_price_bot.coin_info.coin_info_shard_worker import (
+    CoinInfoShardError,
+    CoinInfoShardWorkerConst,
+    CoinInfoShardWorkerMain,
+)
+from telegram_crypto_price_bot.coingecko.coingecko_rate_limiter import coingecko_rate_limiter
+from telegram_crypto_price_bot.config.config_object import ConfigObject
+from telegram_crypto_price_bot.logger.logger import Logger
+
+
+class CoinInfoShardPoolConst:
+    """Constants for coin info shard pool class."""
+
+    REQUEST_TIMEOUT_SEC: float = 10.0
+
+
+class CoinInfoShardPool:
+    """
+    Pool of shard processes, each one running a shard worker.
+    Requests are addressed to a target of the worker (e.g. its scheduler or its profiling controller) and
+    executed in the worker event loop, while the result is sent back through the connection to the shard.
+    """
+
+    config: ConfigObject
+    logger: Logger
+    processes: List[BaseProcess]
+    conns: List[Connection]
+    conn_locks: List[threading.Lock]
+    req_id: int
+
+    def __init__(self,
+                 config_file: str,
+                 config: ConfigObject,
+                 logger: Logger) -> None:
+        """
+        Initialize the pool and start the shard processes.
+
+        Args:
+            config_file: Path to the configuration file, loaded again by shard processes.
+            config: Configuration object.
+            logger: Logger instance.
+        """
+        self.config = config
+        self.logger = logger
+        self.processes = []
+        self.conns = []
+        self.conn_locks = []
+        self.req_id = 0
+        coingecko_rate_limiter.SetShare(CoinInfoShardWorkerConst.MAIN_RATE_LIMIT_SHARE)
+
+        # Spawn is used on all platforms, since forking a process with a running event loop is not safe
+        mp_ctx = multiprocessing.get_context("spawn")
+        for shard_idx in range(self.config.GetValue(BotConfigTypes.TASKS_SHARDS_NUM)):
+            parent_conn, child_conn = mp_ctx.Pipe()
+            process = mp_ctx.Process(
+                target=CoinInfoShardWorkerMain,
+                args=(config_file, shard_idx, child_conn),
+                name=f"CoinInfoShard-{shard_idx}",
+                daemon=True
+            )
+            process.start()
+            child_conn.close()
+
+            self.processes.append(process)
+            self.conns.append(parent_conn)
+            self.conn_locks.append(threading.Lock())
+
+        self.logger.GetLogger().info(f"Started {len(self.processes)} shard processes")
+
+    def Count(self) -> int:
+        """
+        Get the number of shards.
+
+        Returns:
+            Number of shards.
+        """
+        return len(self.conns)
+
+    def IsAlive(self) -> bool:
+        """
+        Get if all shard processes are alive.
+
+        Returns:
+            True if alive, False otherwise.
+        """
+        return all(process.is_alive() for process in self.processes)
+
+    async def ReloadConfig(self) -> bool:
+        """
+        Reload the configuration file in all shards.
+
+        Returns:
+            True if reloaded by all shards, False otherwise.
+        """
+        # A shard failing to reload shall not prevent the other ones from reloading (errors are already logged)
+        results = await asyncio.gather(
+            *(self.Request(shard_idx, CoinInfoShardWorkerConst.WORKER_TARGET, "ReloadConfig") for shard_idx in range(self.Count())),
+            return_exceptions=True
+        )
+        return all(res is True for res in results)
+
+    async def RequestAll(self,
+                         target: str,
+                         method_name: str,
+                         *args: Any) -> List[Any]:
+        """
+        Send a request to all shards concurrently and wait for their results.
+
+        Args:
+            target: Target of the request in the worker.
+            method_name: Name of the target method.
+            *args: Method arguments.
+
+        Returns:
+            Result of the target method for each shard.
+
+        Raises:
+            CoinInfoShardError: If a shard fails to execute the request or does not reply in time.
+            Any exception raised by the target method.
+        """
+        return await asyncio.gather(*(self.Request(shard_idx, target, method_name, *args) for shard_idx in range(self.Count())))
+
+    async def Request(self,
+                      shard_idx: int,
+                      target: str,
+                      method_name: str,
+                      *args: Any) -> Any:
+        """
+        Send a request to a shard and wait for its result.
+        The connection is blocking, so the exchange is executed in the default executor and the event loop keeps
+        serving updates while the shard executes the request.
+
+        Args:
+            shard_idx: Shard index.
+            target: Target of the request in the worker.
+            method_name: Name of the target method.
+            *args: Method arguments.
+
+        Returns:
+            Result of the target method.
+
+        Raises:
+            CoinInfoShardError: If the shard fails to execute the request or does not reply in time.
+            Any exception raised by the target method.
+        """
+        self.req_id += 1
+        request = (self.req_id, target, method_name, args, self.config.GetValue(BotConfigTypes.APP_TEST_MODE))
+
+        succeeded, res = await asyncio.get_running_loop().run_in_executor(None, self.__ExchangeRequest, shard_idx, request)
+        if not succeeded:
+            raise res
+        return res
+
+    def __ExchangeRequest(self,
+                          shard_idx: int,
+                          request: Tuple[int, str, str, Tuple[Any, ...], bool]) -> Tuple[bool, Any]:
+        """
+        Send a request to a shard and receive its reply, blocking until the reply arrives or the timeout expires.
+        Exchanges with the same shard are serialized by a lock held for the whole exchange (also when the awaiting
+        caller is cancelled), so that replies are always read by the thread that sent the request.
+
+        Args:
+            shard_idx: Shard index.
+            request: Request as (request ID, target, method name, arguments, test mode).
+
+        Returns:
+            Tuple (True, result) if succeeded, (False, exception) otherwise.
+
+        Raises:
+            CoinInfoShardError: If the shard is not reachable or does not reply in time.
+        """
+        conn = self.conns[shard_idx]
+
+        with self.conn_locks[shard_idx]:
+            try:
+                conn.send(request)
+
+                deadline = time.monotonic() + CoinInfoShardPoolConst.REQUEST_TIMEOUT_SEC
+                while conn.poll(max(0.0, deadline - time.monotonic())):
+                    req_id, succeeded, res = conn.recv()
+                    # Skip replies to previous requests that timed out
+                    if req_id == request[0]:
+                        return succeeded, res
+            except (EOFError, OSError) as ex:
+                self.logger.GetLogger().error(
+                    f"Shard {shard_idx} is not reachable (process exit code: {self.processes[shard_idx].exitcode})"
+                )
+                raise CoinInfoShardError() from ex
+
+        self.logger.GetLogger().error(f'Shard {shard_idx} did not reply in time to request "{request[1]}.{request[2]}"')
+        raise CoinInfoShardError()
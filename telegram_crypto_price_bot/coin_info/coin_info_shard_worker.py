@@ -0,0 +1,243 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import asyncio
+import os
+from multiprocessing.connection import Connection
+from typing import Any, Dict, Optional, Tuple, Type
+
+import pyrogram
+from pyrogram import Client
+
+from telegram_crypto_price_bot.bot.bot_config import BotConfig
+from telegram_crypto_price_bot.bot.bot_config_reloader import BotConfigReloader
+from telegram_crypto_price_bot.bot.bot_config_types import BotConfigTypes
+from telegram_crypto_price_bot.coin_info.coin_info_scheduler import (
+    CoinInfoJobAlreadyExistentError,
+    CoinInfoJobInvalidPeriodError,
+    CoinInfoJobInvalidStartError,
+    CoinInfoJobMaxNumError,
+    CoinInfoJobNotExistentError,
+    CoinInfoJobsList,
+    CoinInfoScheduler,
+)
+from telegram_crypto_price_bot.coingecko.coingecko_rate_limiter import coingecko_rate_limiter
+from telegram_crypto_price_bot.config.config_file_sections_loader import ConfigFileSectionsLoader
+from telegram_crypto_price_bot.config.config_object import ConfigObject
+from telegram_crypto_price_bot.logger.logger import Logger
+from telegram_crypto_price_bot.profiling.memory_profiler import MemoryProfilerNotStartedError
+from telegram_crypto_price_bot.profiling.profiling_controller import ProfilingController
+from telegram_crypto_price_bot.profiling.sampling_profiler import SamplingProfilerAlreadyRunningError
+from telegram_crypto_price_bot.translation.translation_loader import TranslationLoader
+
+
+class CoinInfoShardError(Exception):
+    """Exception raised when a shard fails to execute a request."""
+
+
+class CoinInfoShardWorkerConst:
+    """Constants for coin info shard worker class."""
+
+    SHARD_SUFFIX: str = "_shard{shard_idx}"
+    # Targets of the requests
+    SCHEDULER_TARGET: str = "scheduler"
+    PROFILING_TARGET: str = "profiling"
+    WORKER_TARGET: str = "worker"
+    # Share of the CoinGecko rate limit used by the main process, which only serves commands (the rest is split
+    # among the shards, which run the tasks)
+    MAIN_RATE_LIMIT_SHARE: float = 0.1
+    # Errors that are sent back as they are, the other ones are reported as CoinInfoShardError
+    REQUEST_ERRORS: Tuple[Type[Exception], ...] = (
+        CoinInfoJobAlreadyExistentError,
+        CoinInfoJobInvalidPeriodError,
+        CoinInfoJobInvalidStartError,
+        CoinInfoJobMaxNumError,
+        CoinInfoJobNotExistentError,
+        MemoryProfilerNotStartedError,
+        SamplingProfilerAlreadyRunningError,
+    )
+
+
+class CoinInfoShardWorker:
+    """
+    Worker owning the coin info jobs of a single shard, meant to be run in its own process.
+    It receives requests from the main process through a connection, executes them on the requested target
+    (its own scheduler, its profiling controller or the worker itself) and sends back the result.
+    Jobs are executed with its own Telegram client, which does not receive updates.
+    """
+
+    config: ConfigObject
+    logger: Logger
+    translator: TranslationLoader
+    config_reloader: BotConfigReloader
+    client: pyrogram.Client
+    conn: Connection
+    shard_idx: int
+    coin_info_scheduler: Optional[CoinInfoScheduler]
+    profiling_controller: ProfilingController
+
+    def __init__(self,
+                 config_file: str,
+                 shard_idx: int,
+                 conn: Connection) -> None:
+        """
+        Initialize the shard worker.
+
+        Args:
+            config_file: Path to the configuration file.
+            shard_idx: Shard index.
+            conn: Connection to the main process.
+        """
+        self.shard_idx = shard_idx
+        self.config = ConfigFileSectionsLoader.Load(config_file, BotConfig)
+        self.__AdaptConfig(self.config)
+        coingecko_rate_limiter.SetShare(
+            (1.0 - CoinInfoShardWorkerConst.MAIN_RATE_LIMIT_SHARE) / self.config.GetValue(BotConfigTypes.TASKS_SHARDS_NUM)
+        )
+
+        self.logger = Logger(self.config)
+        self.translator = TranslationLoader(self.logger)
+        self.translator.Load(self.config.GetValue(BotConfigTypes.APP_LANG_FILE))
+        self.config_reloader = BotConfigReloader(
+            config_file, BotConfig, self.config, self.logger, self.translator, adapt_config_fct=self.__AdaptConfig
+        )
+        self.client = Client(
+            self.config.GetValue(BotConfigTypes.SESSION_NAME),
+            api_id=self.config.GetValue(BotConfigTypes.API_ID),
+            api_hash=self.config.GetValue(BotConfigTypes.API_HASH),
+            bot_token=self.config.GetValue(BotConfigTypes.BOT_TOKEN),
+            no_updates=True,
+        )
+        self.conn = conn
+        self.coin_info_scheduler = None
+        self.profiling_controller = ProfilingController(self.logger)
+
+    async def Run(self) -> None:
+        """Run the shard worker until the connection to the main process is closed."""
+        loop = asyncio.get_running_loop()
+        # The scheduler shall be created with a running event loop
+        self.coin_info_scheduler = CoinInfoScheduler(self.client, self.config, self.logger, self.translator)
+
+        async with self.client:
+            self.logger.GetLogger().info(f"Shard {self.shard_idx} started")
+            await loop.run_in_executor(None, self.__ServeRequests, loop)
+
+        self.logger.GetLogger().info(f"Shard {self.shard_idx} stopped")
+
+    async def ReloadConfig(self) -> bool:
+        """
+        Reload the configuration file.
+
+        Returns:
+            True if reloaded, False otherwise.
+        """
+        return self.config_reloader.Reload()
+
+    def __ServeRequests(self,
+                        loop: asyncio.AbstractEventLoop) -> None:
+        """
+        Serve requests from the main process, until the connection is closed.
+        Requests are executed in the event loop, so the scheduler is only accessed by the event loop thread.
+
+        Args:
+            loop: Event loop.
+        """
+        while True:
+            try:
+                req_id, target, method_name, args, test_mode = self.conn.recv()
+            except EOFError:
+                break
+
+            future = asyncio.run_coroutine_threadsafe(self.__ExecuteRequest(target, method_name, args, test_mode), loop)
+            self.conn.send((req_id, *future.result()))
+
+    async def __ExecuteRequest(self,
+                               target: str,
+                               method_name: str,
+                               args: Tuple[Any, ...],
+                               test_mode: bool) -> Tuple[bool, Any]:
+        """
+        Execute a request on its target.
+
+        Args:
+            target: Target of the request.
+            method_name: Name of the target method.
+            args: Method arguments.
+            test_mode: Test mode of the main process, which can be changed by commands at runtime.
+
+        Returns:
+            Tuple (True, result) if succeeded, (False, exception) otherwise.
+        """
+        targets: Dict[str, Any] = {
+            CoinInfoShardWorkerConst.SCHEDULER_TARGET: self.coin_info_scheduler,
+            CoinInfoShardWorkerConst.PROFILING_TARGET: self.profiling_controller,
+            CoinInfoShardWorkerConst.WORKER_TARGET: self,
+        }
+
+        self.config.SetValue(BotConfigTypes.APP_TEST_MODE, test_mode)
+        try:
+            res = await getattr(targets[target], method_name)(*args)
+        except CoinInfoShardWorkerConst.REQUEST_ERRORS as ex:
+            return False, ex
+        except Exception:
+            self.logger.GetLogger().exception(f'Shard {self.shard_idx} failed to execute request "{target}.{method_name}"')
+            return False, CoinInfoShardError()
+
+        # The jobs list cannot be sent as it is, since it contains the translator
+        if isinstance(res, CoinInfoJobsList):
+            res = res.GetList()
+        return True, res
+
+    def __AdaptConfig(self,
+                      config: ConfigObject) -> None:
+        """
+        Adapt a loaded configuration to the shard.
+        Each shard has its own session, log file and trace file, since they cannot be shared among processes.
+
+        Args:
+            config: Configuration object.
+        """
+        shard_suffix = CoinInfoShardWorkerConst.SHARD_SUFFIX.format(shard_idx=self.shard_idx)
+
+        config.SetValue(BotConfigTypes.SESSION_NAME, config.GetValue(BotConfigTypes.SESSION_NAME) + shard_suffix)
+        if config.GetValue(BotConfigTypes.LOG_FILE_ENABLED):
+            log_file_root, log_file_ext = os.path.splitext(config.GetValue(BotConfigTypes.LOG_FILE_NAME))
+            config.SetValue(BotConfigTypes.LOG_FILE_NAME, log_file_root + shard_suffix + log_file_ext)
+        if config.GetValue(BotConfigTypes.APP_TRACE_SAMPLE_RATE) > 0:
+            trace_file_root, trace_file_ext = os.path.splitext(config.GetValue(BotConfigTypes.APP_TRACE_FILE_NAME))
+            config.SetValue(BotConfigTypes.APP_TRACE_FILE_NAME, trace_file_root + shard_suffix + trace_file_ext)
+
+
+def CoinInfoShardWorkerMain(config_file: str,
+                            shard_idx: int,
+                            conn: Connection) -> None:
+    """
+    Entry point of a shard worker process.
+
+    Args:
+        config_file: Path to the configuration file.
+        shard_idx: Shard index.
+        conn: Connection to the main process.
+    """
+
+    async def run() -> None:
+        await CoinInfoShardWorker(config_file, shard_idx, conn).Run()
+
+    asyncio.run(run())
@@ -0,0 +1,404 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+from typing import Any, List
+
+import pyrogram
+
+from telegram_crypto_price_bot.coin_info.coin_info_bulk_result import CoinInfoBulkResult, CoinInfoCoinPair
+from telegram_crypto_price_bot.coin_info.coin_info_scheduler import CoinInfoJobCoin, CoinInfoJobsList
+from telegram_crypto_price_bot.coin_info.coin_info_scheduler_stats import CoinInfoSchedulerStats
+from telegram_crypto_price_bot.coin_info.coin_info_shard_pool import CoinInfoShardPool
+from telegram_crypto_price_bot.coin_info.coin_info_shard_worker import CoinInfoShardWorkerConst
+from telegram_crypto_price_bot.coingecko.coingecko_circuit_breaker import coingecko_circuit_breaker
+from telegram_crypto_price_bot.config.config_object import ConfigObject
+from telegram_crypto_price_bot.logger.logger import Logger
+from telegram_crypto_price_bot.priority.priority_lane_metrics import priority_lane_metrics
+from telegram_crypto_price_bot.profiling.loop_lag_monitor import LoopLagMonitor
+from telegram_crypto_price_bot.translation.translation_loader import TranslationLoader
+
+
+class CoinInfoShardedScheduler:
+    """
+    Scheduler for managing coin info jobs partitioned across multiple shard processes.
+    Each chat is owned by the shard its identifier hashes into, so the jobs of a chat (and the state of their scheduler)
+    only live in that shard. It has the same interface of CoinInfoScheduler, so it can be used in its place by commands.
+    Shard processes are owned by the shard pool, which is shared with the profiling controller.
+    """
+
+    shard_pool: CoinInfoShardPool
+    config: ConfigObject
+    logger: Logger
+    translator: TranslationLoader
+    loop_lag_monitor: LoopLagMonitor
+
+    def __init__(self,
+                 shard_pool: CoinInfoShardPool,
+                 config: ConfigObject,
+                 logger: Logger,
+                 translator: TranslationLoader) -> None:
+        """
+        Initialize the sharded scheduler.
+
+        Args:
+            shard_pool: Shard pool.
+            config: Configuration object.
+            logger: Logger instance.
+            translator: Translation loader.
+        """
+        self.shard_pool = shard_pool
+        self.config = config
+        self.logger = logger
+        self.translator = translator
+        # Commands are executed in this process, so its event loop is monitored too
+        self.loop_lag_monitor = LoopLagMonitor(config, logger)
+
+    async def GetStats(self) -> CoinInfoSchedulerStats:
+        """
+        Get the scheduler statistics, merged from all shards.
+        Priority lanes and circuit breaker statistics also include the ones of this process, where commands are executed.
+
+        Returns:
+            Scheduler statistics.
+        """
+        stats = CoinInfoSchedulerStats()
+        stats.lanes_stats = priority_lane_metrics.GetStats()
+        stats.circuit_breaker_stats = coingecko_circuit_breaker.GetStats()
+        stats.loop_lag_stats = self.loop_lag_monitor.GetStats()
+        # No scheduler runs in this process, so the running state is only the one of the shards
+        stats.running = True
+        for shard_stats in await self.shard_pool.RequestAll(CoinInfoShardWorkerConst.SCHEDULER_TARGET, "GetStats"):
+            stats.Merge(shard_stats)
+
+        return stats
+
+    async def GetJobsInChat(self,
+                            chat: pyrogram.types.Chat) -> CoinInfoJobsList:
+        """
+        Get the list of active jobs in a chat.
+
+        Args:
+            chat: Telegram chat to get jobs for.
+
+        Returns:
+            List of active jobs in the chat.
+        """
+        jobs_list = CoinInfoJobsList(self.translator)
+        jobs_list.AddMultiple(await self.__Request(chat, "GetJobsInChat"))
+
+        return jobs_list
+
+    async def IsActiveInChat(self,
+                             chat: pyrogram.types.Chat,
+                             topic_id: int,
+                             coin_id: str,
+                             coin_vs: str) -> bool:
+        """
+        Check if a job is active in a chat.
+
+        Args:
+            chat: Telegram chat.
+            topic_id: Telegram topic.
+            coin_id: Cryptocurrency coin identifier.
+            coin_vs: Currency to compare against.
+
+        Returns:
+            True if job is active, False otherwise.
+        """
+        return await self.__Request(chat, "IsActiveInChat", topic_id, coin_id, coin_vs)
+
+    async def Start(self,
+                    chat: pyrogram.types.Chat,
+                    topic_id: int,
+                    period_hours: int,
+                    start_hour: int,
+                    *,
+                    coin_id: str,
+                    coin_vs: str,
+                    last_days: int) -> None:
+        """
+        Start a new scheduled job.
+        The maximum number of jobs is applied to each shard. Coin parameters are keyword-only, since they are
+        only forwarded to the shard and coin_id and coin_vs are easily swapped.
+
+        Args:
+            chat: Telegram chat where the job will run.
+            topic_id: Telegram topic where the job will run.
+            period_hours: Period in hours between executions.
+            start_hour: Starting hour for the job.
+            coin_id: Cryptocurrency coin identifier.
+            coin_vs: Currency to compare against.
+            last_days: Number of days of historical data.
+
+        Raises:
+            CoinInfoJobAlreadyExistentError: If job already exists.
+            CoinInfoJobInvalidPeriodError: If period is invalid.
+            CoinInfoJobInvalidStartError: If start hour is invalid.
+            CoinInfoJobMaxNumError: If maximum number of jobs reached.
+        """
+        await self.__Request(chat, "Start", topic_id, period_hours, start_hour, coin_id, coin_vs, last_days)
+
+    async def Stop(self,
+                   chat: pyrogram.types.Chat,
+                   topic_id: int,
+                   coin_id: str,
+                   coin_vs: str) -> None:
+        """
+        Stop a scheduled job.
+
+        Args:
+            chat: Telegram chat where the job is running
+            topic_id: Telegram topic where the job is running
+            coin_id: Cryptocurrency coin identifier
+            coin_vs: Currency to compare against
+
+        Raises:
+            CoinInfoJobNotExistentError: If job does not exist
+        """
+        await self.__Request(chat, "Stop", topic_id, coin_id, coin_vs)
+
+    async def StopAll(self,
+                      chat: pyrogram.types.Chat) -> None:
+        """
+        Stop all jobs in a chat.
+
+        Args:
+            chat: Telegram chat to stop all jobs in
+        """
+        await self.__Request(chat, "StopAll")
+
+    async def ChatLeft(self,
+                       chat: pyrogram.types.Chat) -> None:
+        """
+        Handle bot leaving a chat by stopping all jobs.
+
+        Args:
+            chat: Telegram chat that was left
+        """
+        await self.__Request(chat, "ChatLeft")
+
+    async def Pause(self,
+                    chat: pyrogram.types.Chat,
+                    topic_id: int,
+                    coin_id: str,
+                    coin_vs: str) -> None:
+        """
+        Pause a scheduled job.
+
+        Args:
+            chat: Telegram chat where the job is running
+            topic_id: Telegram topic where the job is running
+            coin_id: Cryptocurrency coin identifier
+            coin_vs: Currency to compare against
+
+        Raises:
+            CoinInfoJobNotExistentError: If job does not exist
+        """
+        await self.__Request(chat, "Pause", topic_id, coin_id, coin_vs)
+
+    async def Resume(self,
+                     chat: pyrogram.types.Chat,
+                     topic_id: int,
+                     coin_id: str,
+                     coin_vs: str) -> None:
+        """
+        Resume a paused job.
+
+        Args:
+            chat: Telegram chat where the job is running
+            topic_id: Telegram topic where the job is running
+            coin_id: Cryptocurrency coin identifier
+            coin_vs: Currency to compare against
+
+        Raises:
+            CoinInfoJobNotExistentError: If job does not exist
+        """
+        await self.__Request(chat, "Resume", topic_id, coin_id, coin_vs)
+
+    async def StartMultiple(self,
+                            chat: pyrogram.types.Chat,
+                            topic_id: int,
+                            period_hours: int,
+                            start_hour: int,
+                            coins: List[CoinInfoJobCoin]) -> CoinInfoBulkResult:
+        """
+        Start multiple scheduled jobs with the same period and start hour.
+        All jobs are started by the shard owning the chat with a single request.
+
+        Args:
+            chat: Telegram chat where the jobs will run.
+            topic_id: Telegram topic where the jobs will run.
+            period_hours: Period in hours between executions.
+            start_hour: Starting hour for the jobs.
+            coins: Coins of the jobs.
+
+        Returns:
+            Result for each coin pair.
+        """
+        return await self.__Request(chat, "StartMultiple", topic_id, period_hours, start_hour, coins)
+
+    async def StopMultiple(self,
+                           chat: pyrogram.types.Chat,
+                           topic_id: int,
+                           coin_pairs: List[CoinInfoCoinPair]) -> CoinInfoBulkResult:
+        """
+        Stop multiple scheduled jobs.
+
+        Args:
+            chat: Telegram chat where the jobs are running
+            topic_id: Telegram topic where the jobs are running
+            coin_pairs: Coin pairs of the jobs
+
+        Returns:
+            Result for each coin pair
+        """
+        return await self.__Request(chat, "StopMultiple", topic_id, coin_pairs)
+
+    async def PauseMultiple(self,
+                            chat: pyrogram.types.Chat,
+                            topic_id: int,
+                            coin_pairs: List[CoinInfoCoinPair]) -> CoinInfoBulkResult:
+        """
+        Pause multiple scheduled jobs.
+
+        Args:
+            chat: Telegram chat where the jobs are running
+            topic_id: Telegram topic where the jobs are running
+            coin_pairs: Coin pairs of the jobs
+
+        Returns:
+            Result for each coin pair
+        """
+        return await self.__Request(chat, "PauseMultiple", topic_id, coin_pairs)
+
+    async def ResumeMultiple(self,
+                             chat: pyrogram.types.Chat,
+                             topic_id: int,
+                             coin_pairs: List[CoinInfoCoinPair]) -> CoinInfoBulkResult:
+        """
+        Resume multiple paused jobs.
+
+        Args:
+            chat: Telegram chat where the jobs are running
+            topic_id: Telegram topic where the jobs are running
+            coin_pairs: Coin pairs of the jobs
+
+        Returns:
+            Result for each coin pair
+        """
+        return await self.__Request(chat, "ResumeMultiple", topic_id, coin_pairs)
+
+    async def SendInSameMessage(self,
+                                chat: pyrogram.types.Chat,
+                                topic_id: int,
+                                coin_id: str,
+                                coin_vs: str,
+                                flag: bool) -> None:
+        """
+        Set whether to send updates in the same message.
+
+        Args:
+            chat: Telegram chat where the job is running
+            topic_id: Telegram topic where the job is running
+            coin_id: Cryptocurrency coin identifier
+            coin_vs: Currency to compare against
+            flag: True to send in same message, False otherwise
+
+        Raises:
+            CoinInfoJobNotExistentError: If job does not exist
+        """
+        await self.__Request(chat, "SendInSameMessage", topic_id, coin_id, coin_vs, flag)
+
+    async def DeleteLastSentMessage(self,
+                                    chat: pyrogram.types.Chat,
+                                    topic_id: int,
+                                    coin_id: str,
+                                    coin_vs: str,
+                                    flag: bool) -> None:
+        """
+        Set whether to delete the last sent message.
+
+        Args:
+            chat: Telegram chat where the job is running
+            topic_id: Telegram topic where the job is running
+            coin_id: Cryptocurrency coin identifier
+            coin_vs: Currency to compare against
+            flag: True to delete last message, False otherwise
+
+        Raises:
+            CoinInfoJobNotExistentError: If job does not exist
+        """
+        await self.__Request(chat, "DeleteLastSentMessage", topic_id, coin_id, coin_vs, flag)
+
+    async def EditLastSentMessage(self,
+                                  chat: pyrogram.types.Chat,
+                                  topic_id: int,
+                                  coin_id: str,
+                                  coin_vs: str,
+                                  flag: bool) -> None:
+        """
+        Set whether to edit the last sent message in place.
+
+        Args:
+            chat: Telegram chat where the job is running
+            topic_id: Telegram topic where the job is running
+            coin_id: Cryptocurrency coin identifier
+            coin_vs: Currency to compare against
+            flag: True to edit last message, False otherwise
+
+        Raises:
+            CoinInfoJobNotExistentError: If job does not exist
+        """
+        await self.__Request(chat, "EditLastSentMessage", topic_id, coin_id, coin_vs, flag)
+
+    async def __Request(self,
+                        chat: pyrogram.types.Chat,
+                        method_name: str,
+                        *args: Any) -> Any:
+        """
+        Send a request to the shard owning the chat and wait for its result.
+
+        Args:
+            chat: Telegram chat.
+            method_name: Name of the scheduler method.
+            *args: Method arguments, except the chat.
+
+        Returns:
+            Result of the scheduler method.
+
+        Raises:
+            CoinInfoShardError: If the shard fails to execute the request or does not reply in time.
+            Any exception raised by the scheduler method.
+        """
+        shard_idx = self.__GetShardIndex(chat)
+        return await self.shard_pool.Request(shard_idx, CoinInfoShardWorkerConst.SCHEDULER_TARGET, method_name, chat, *args)
+
+    def __GetShardIndex(self,
+                        chat: pyrogram.types.Chat) -> int:
+        """
+        Get the index of the shard owning a chat.
+
+        Args:
+            chat: Telegram chat.
+
+        Returns:
+            Shard index.
+        """
+        return chat.id % self.shard_pool.Count()
@@ -0,0 +1,354 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+import asyncio
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Set, Tuple
+
+from typing_extensions import override
+
+from telegram_crypto_price_bot.bot.bot_config_types import BotConfigTypes
+from telegram_crypto_price_bot.coin_info.coin_info_scheduler_backend import CoinInfoJobFct, CoinInfoJobRun, CoinInfoSchedulerBackend
+from telegram_crypto_price_bot.config.config_object import ConfigObject
+from telegram_crypto_price_bot.logger.logger import Logger
+
+
+class CoinInfoTimingWheelBackendConst:
+    """Constants for coin info timing wheel backend class."""
+
+    HOURS_PER_DAY: int = 24
+    MINUTES_PER_HOUR: int = 60
+    SLOTS_NUM: int = HOURS_PER_DAY * MINUTES_PER_HOUR
+    TICK_DELTA: timedelta = timedelta(minutes=1)
+
+
+class CoinInfoTimingWheelJob:
+    """Job of the timing wheel."""
+
+    slot_indexes: List[int]
+    job_fct: CoinInfoJobFct
+    job_args: Tuple[Any, ...]
+    paused: bool
+
+    def __init__(self,
+                 slot_indexes: List[int],
+                 job_fct: CoinInfoJobFct,
+                 job_args: Tuple[Any, ...]) -> None:
+        """
+        Initialize the job.
+
+        Args:
+            slot_indexes: Indexes of the slots when the job runs.
+            job_fct: Function executing the job.
+            job_args: Arguments of the function.
+        """
+        self.slot_indexes = slot_indexes
+        self.job_fct = job_fct
+        self.job_args = job_args
+        self.paused = False
+
+
+class CoinInfoTimingWheelBackend(CoinInfoSchedulerBackend):
+    """
+    Scheduler backend based on a timing wheel, with a slot for each minute of the day.
+    Jobs are put in the slots of their run times, so that at each tick (every minute) the due jobs are found
+    directly in the current slot, without going through all the jobs: the cost of a tick only depends on the number of due jobs.
+    Paused jobs are taken out of their slots, so they cost nothing until resumed.
+    """
+
+    loop: asyncio.AbstractEventLoop
+    misfire_grace_time: int
+    coalesce: bool
+    slots: List[Set[str]]
+    jobs: Dict[str, CoinInfoTimingWheelJob]
+    last_tick_time: datetime
+    tick_handle: asyncio.TimerHandle
+    running: bool
+    paused: bool
+
+    def __init__(self,
+                 config: ConfigObject,
+                 logger: Logger) -> None:
+        """
+        Initialize the backend and start it.
+        It shall be created with a running event loop.
+
+        Args:
+            config: Configuration object.
+            logger: Logger instance.
+        """
+        super().__init__(logger)
+        self.loop = asyncio.get_running_loop()
+        self.misfire_grace_time = config.GetValue(BotConfigTypes.TASKS_MISFIRE_GRACE_TIME_SEC)
+        self.coalesce = config.GetValue(BotConfigTypes.TASKS_COALESCE)
+        self.slots = [set() for _ in range(CoinInfoTimingWheelBackendConst.SLOTS_NUM)]
+        self.jobs = {}
+        # Runs of the current minute are already passed
+        self.last_tick_time = self.__Now().replace(second=0, microsecond=0)
+        self.paused = False
+        self.__ScheduleTick()
+        self.running = True
+
+    @override
+    def AddJob(self,
+               job_id: str,
+               run_values: List[int],
+               is_test_mode: bool,
+               job_fct: CoinInfoJobFct,
+               job_args: Tuple[Any, ...]) -> None:
+        """
+        Add a job.
+
+        Args:
+            job_id: Job ID.
+            run_values: Hours of the day when the job runs (minutes of every hour in test mode).
+            is_test_mode: True for test mode, False otherwise.
+            job_fct: Function executing the job.
+            job_args: Arguments of the function.
+        """
+        if is_test_mode:
+            slot_indexes = [
+                hour * CoinInfoTimingWheelBackendConst.MINUTES_PER_HOUR + minute
+                for hour in range(CoinInfoTimingWheelBackendConst.HOURS_PER_DAY)
+                for minute in run_values
+            ]
+        else:
+            slot_indexes = [hour * CoinInfoTimingWheelBackendConst.MINUTES_PER_HOUR for hour in run_values]
+
+        self.jobs[job_id] = CoinInfoTimingWheelJob(slot_indexes, job_fct, job_args)
+        for slot_idx in slot_indexes:
+            self.slots[slot_idx].add(job_id)
+
+    @override
+    def RemoveJob(self,
+                  job_id: str) -> None:
+        """
+        Remove a job.
+
+        Args:
+            job_id: Job ID.
+        """
+        job = self.jobs.pop(job_id)
+        if not job.paused:
+            self.__RemoveFromSlots(job_id, job)
+
+    @override
+    def PauseJob(self,
+                 job_id: str) -> None:
+        """
+        Pause a job, so that it does not run until resumed.
+
+        Args:
+            job_id: Job ID.
+        """
+        job = self.jobs[job_id]
+        if not job.paused:
+            job.paused = True
+            self.__RemoveFromSlots(job_id, job)
+
+    @override
+    def ResumeJob(self,
+                  job_id: str) -> None:
+        """
+        Resume a paused job.
+
+        Args:
+            job_id: Job ID.
+        """
+        job = self.jobs[job_id]
+        if job.paused:
+            job.paused = False
+            for slot_idx in job.slot_indexes:
+                self.slots[slot_idx].add(job_id)
+
+    @override
+    def HasJob(self,
+               job_id: str) -> bool:
+        """
+        Get if a job exists (either running or paused).
+
+        Args:
+            job_id: Job ID.
+
+        Returns:
+            True if existent, False otherwise.
+        """
+        return job_id in self.jobs
+
+    @override
+    def NextRuns(self,
+                 end_time: datetime) -> List[CoinInfoJobRun]:
+        """
+        Get the next run of the running jobs, if not later than the specified time.
+        Only the slots until the end time are visited, at most one turn of the wheel.
+
+        Args:
+            end_time: End time.
+
+        Returns:
+            Next runs.
+        """
+        next_runs: Dict[str, datetime] = {}
+        for run_time in self.__TickTimes(self.last_tick_time, end_time):
+            for job_id in self.slots[self.__SlotIndex(run_time)]:
+                next_runs.setdefault(job_id, run_time)
+        return list(next_runs.items())
+
+    @override
+    def RunDueJobs(self) -> None:
+        """Run the jobs due since the last tick (more than one minute if the event loop was stalled), if not paused."""
+        if self.paused:
+            return
+
+        now = self.__Now()
+        tick_time = now.replace(second=0, microsecond=0)
+        # Timer fired slightly in advance
+        if tick_time <= self.last_tick_time:
+            return
+
+        due_runs: List[CoinInfoJobRun] = [
+            (job_id, run_time)
+            for run_time in self.__TickTimes(self.last_tick_time, tick_time)
+            for job_id in self.slots[self.__SlotIndex(run_time)]
+        ]
+        self.last_tick_time = tick_time
+        if self.coalesce:
+            # Only the last run of each job is kept
+            due_runs = list(dict(due_runs).items())
+
+        for job_id, run_time in due_runs:
+            self.__RunJob(job_id, (now - run_time).total_seconds())
+
+    @override
+    def IsRunning(self) -> bool:
+        """
+        Get if the backend is running, i.e. if the next tick is scheduled.
+        A tick running late (e.g. if the event loop is stalled) does not stop the backend.
+
+        Returns:
+            True if running, False otherwise.
+        """
+        return self.running and not self.tick_handle.cancelled()
+
+    @override
+    def Pause(self) -> None:
+        """Pause the processing of jobs, e.g. while updating multiple jobs at once."""
+        self.paused = True
+
+    @override
+    def Resume(self) -> None:
+        """Resume the processing of jobs, the runs due in the meantime are processed at the next tick."""
+        self.paused = False
+
+    def __ScheduleTick(self) -> None:
+        """Schedule the next tick at the beginning of the next minute."""
+        now = self.__Now()
+        next_tick_time = now.replace(second=0, microsecond=0) + CoinInfoTimingWheelBackendConst.TICK_DELTA
+        self.tick_handle = self.loop.call_later((next_tick_time - now).total_seconds(), self.__Tick)
+
+    def __Tick(self) -> None:
+        """Run the jobs due since the last tick and schedule the next one."""
+        try:
+            self.RunDueJobs()
+        except Exception:
+            self.logger.GetLogger().exception("An error occurred while running due jobs")
+
+        try:
+            self.__ScheduleTick()
+        except Exception:
+            self.running = False
+            self.logger.GetLogger().exception("Unable to schedule the next tick, timing wheel stopped")
+
+    def __RunJob(self,
+                 job_id: str,
+                 delay: float) -> None:
+        """
+        Run a due job, unless it is too late.
+        The job only puts the run in the job queue, which limits the running instances of the same job.
+
+        Args:
+            job_id: Job ID.
+            delay: Delay in seconds with respect to the scheduled run time.
+        """
+        job = self.jobs[job_id]
+        if delay > self.misfire_grace_time:
+            self._JobMissed(job_id)
+            return
+
+        asyncio.ensure_future(job.job_fct(*job.job_args))
+        self._JobSubmitted(job_id, delay)
+
+    def __RemoveFromSlots(self,
+                          job_id: str,
+                          job: CoinInfoTimingWheelJob) -> None:
+        """
+        Remove a job from its slots.
+
+        Args:
+            job_id: Job ID.
+            job: Job.
+        """
+        for slot_idx in job.slot_indexes:
+            self.slots[slot_idx].discard(job_id)
+
+    @staticmethod
+    def __TickTimes(start_time: datetime,
+                    end_time: datetime) -> List[datetime]:
+        """
+        Get the tick times after the start time and not later than the end time, at most one turn of the wheel.
+
+        Args:
+            start_time: Start time (excluded).
+            end_time: End time (included).
+
+        Returns:
+            Tick times.
+        """
+        ticks_num = min(
+            int((end_time - start_time) / CoinInfoTimingWheelBackendConst.TICK_DELTA),
+            CoinInfoTimingWheelBackendConst.SLOTS_NUM
+        )
+        return [start_time + CoinInfoTimingWheelBackendConst.TICK_DELTA * (i + 1) for i in range(ticks_num)]
+
+    @staticmethod
+    def __SlotIndex(tick_time: datetime) -> int:
+        """
+        Get the slot index of a tick time.
+        The tick time is converted to the current local time, so that slots follow daylight saving time changes.
+
+        Args:
+            tick_time: Tick time.
+
+        Returns:
+            Slot index.
+        """
+        tick_time = tick_time.astimezone()
+        return tick_time.hour * CoinInfoTimingWheelBackendConst.MINUTES_PER_HOUR + tick_time.minute
+
+    @staticmethod
+    def __Now() -> datetime:
+        """
+        Get the current local time, like cron triggers.
+
+        Returns:
+            Current local time, timezone aware.
+        """
+        return datetime.now().astimezone()
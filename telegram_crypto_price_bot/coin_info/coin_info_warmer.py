@@ -0,0 +1,177 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Set, Tuple
+
+from telegram_crypto_price_bot.bot.bot_config_types import BotConfigTypes
+from telegram_crypto_price_bot.chart_info.chart_info_file_saver import ChartInfoTmpFileSaver
+from telegram_crypto_price_bot.coin_info.coin_info_job import CoinInfoJob
+from telegram_crypto_price_bot.coin_info.coin_info_scheduler_backend import CoinInfoJobRun, CoinInfoSchedulerBackend
+from telegram_crypto_price_bot.coingecko.coingecko_price_api import CoinGeckoPriceApi
+from telegram_crypto_price_bot.config.config_object import ConfigObject
+from telegram_crypto_price_bot.logger.logger import Logger
+from telegram_crypto_price_bot.translation.translation_loader import TranslationLoader
+
+
+# Data needed by a job: (coin ID, coin VS, last days)
+CoinInfoWarmerEntry = Tuple[str, str, int]
+
+
+class CoinInfoWarmerConst:
+    """Constants for coin info warmer class."""
+
+    # Data fetched in advance is used for this time after the scheduled run, since jobs may wait in queue
+    FRESH_MARGIN_SEC: int = 60
+    # Maximum sleep time, so that jobs added in the meantime are taken into account
+    MAX_SLEEP_SEC: float = 60.0
+
+
+class CoinInfoWarmer:
+    """
+    Warmer for coin info jobs.
+    Some seconds before jobs run, it fetches price data and renders charts of all the jobs due, so that
+    jobs only need to send messages at the scheduled time.
+    """
+
+    config: ConfigObject
+    logger: Logger
+    translator: TranslationLoader
+    backend: CoinInfoSchedulerBackend
+    jobs: Dict[str, CoinInfoJob]
+    coingecko_api: CoinGeckoPriceApi
+    warmup_sec: int
+    warmed_runs: Set[CoinInfoJobRun]
+
+    def __init__(self,
+                 config: ConfigObject,
+                 logger: Logger,
+                 translator: TranslationLoader,
+                 backend: CoinInfoSchedulerBackend,
+                 jobs: Dict[str, CoinInfoJob]) -> None:
+        """
+        Initialize the warmer and start it.
+
+        Args:
+            config: Configuration object.
+            logger: Logger instance.
+            translator: Translation loader.
+            backend: Scheduler backend of the jobs.
+            jobs: Jobs, by ID.
+        """
+        self.config = config
+        self.logger = logger
+        self.translator = translator
+        self.backend = backend
+        self.jobs = jobs
+        self.coingecko_api = CoinGeckoPriceApi(config, logger)
+        self.warmup_sec = config.GetValue(BotConfigTypes.TASKS_WARMUP_SEC)
+        self.warmed_runs = set()
+        asyncio.ensure_future(self.__Run())
+
+    @staticmethod
+    def FreshMaxAge(warmup_sec: int) -> float:
+        """
+        Get the maximum age of data fetched in advance that is used by the jobs, instead of requesting it again.
+        Only the jobs (and the warmer itself) use it, other requests keep the cache default.
+
+        Args:
+            warmup_sec: Warm up time in seconds.
+
+        Returns:
+            Maximum age in seconds (0 if warm up is disabled).
+        """
+        return warmup_sec + CoinInfoWarmerConst.FRESH_MARGIN_SEC if warmup_sec > 0 else 0.0
+
+    async def __Run(self) -> None:
+        """Warm up data before each scheduled run."""
+        while True:
+            try:
+                await asyncio.sleep(self.__WarmDueJobs())
+            except Exception:
+                self.logger.GetLogger().exception("An error occurred while warming up jobs")
+                await asyncio.sleep(CoinInfoWarmerConst.MAX_SLEEP_SEC)
+
+    def __WarmDueJobs(self) -> float:
+        """
+        Start warming up the jobs whose next run is within the warm up time, if not already done.
+
+        Returns:
+            Time in seconds to wait before the next check.
+        """
+        now = datetime.now(timezone.utc)
+        warmup_delta = timedelta(seconds=self.warmup_sec)
+        # Runs already happened are not needed anymore
+        self.warmed_runs = {run for run in self.warmed_runs if run[1] >= now}
+
+        due_runs: Set[CoinInfoJobRun] = set()
+        sleep_sec = CoinInfoWarmerConst.MAX_SLEEP_SEC
+        end_time = now + warmup_delta + timedelta(seconds=CoinInfoWarmerConst.MAX_SLEEP_SEC)
+        for run in self.backend.NextRuns(end_time):
+            if run in self.warmed_runs:
+                continue
+            wait_sec = (run[1] - warmup_delta - now).total_seconds()
+            if wait_sec <= 0:
+                due_runs.add(run)
+            else:
+                sleep_sec = min(sleep_sec, wait_sec)
+
+        if len(due_runs) > 0:
+            self.warmed_runs |= due_runs
+            asyncio.ensure_future(self.__Warm([run[0] for run in due_runs]))
+
+        return sleep_sec
+
+    async def __Warm(self,
+                     job_ids: List[str]) -> None:
+        """
+        Fetch price data and render charts of the specified jobs.
+
+        Args:
+            job_ids: Job IDs.
+        """
+        entries: Set[CoinInfoWarmerEntry] = set()
+        for job_id in job_ids:
+            job = self.jobs.get(job_id)
+            if job is not None and job.Data().IsRunning():
+                data = job.Data()
+                entries.add((data.CoinId(), data.CoinVs(), data.LastDays()))
+
+        self.logger.GetLogger().info(f"Warming up {len(entries)} coin(s) for {len(job_ids)} job(s)")
+        results = await asyncio.gather(*[self.__WarmEntry(entry) for entry in entries], return_exceptions=True)
+        for entry, result in zip(entries, results):
+            if isinstance(result, Exception):
+                self.logger.GetLogger().warning(f"Unable to warm up coin {entry}: {result!r}")
+
+    async def __WarmEntry(self,
+                          entry: CoinInfoWarmerEntry) -> None:
+        """
+        Fetch price data and render the chart of a coin.
+
+        Args:
+            entry: Coin data.
+        """
+        coin_id, coin_vs, last_days = entry
+        fresh_max_age = self.FreshMaxAge(self.warmup_sec)
+        await self.coingecko_api.GetPriceInfo(coin_id, coin_vs, fresh_max_age)
+        if self.config.GetValue(BotConfigTypes.CHART_DISPLAY):
+            chart_info = await self.coingecko_api.GetChartInfo(coin_id, coin_vs, last_days, fresh_max_age)
+            await ChartInfoTmpFileSaver(self.config, self.logger, self.translator).PreRender(chart_info, fresh_max_age)
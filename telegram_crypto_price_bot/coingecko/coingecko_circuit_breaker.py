@@ -0,0 +1,278 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import time
+from collections import deque
+from enum import Enum, auto, unique
+from typing import Deque, Tuple
+
+from telegram_crypto_price_bot.logger.logger import Logger
+
+
+class CoinGeckoCircuitOpenError(Exception):
+    """Exception raised when a request is rejected because the circuit is open."""
+
+
+@unique
+class CoinGeckoCircuitStates(Enum):
+    """Enumeration of circuit states, from the best to the worst one."""
+
+    CLOSED = auto()
+    HALF_OPEN = auto()
+    OPEN = auto()
+
+
+class CoinGeckoCircuitBreakerStats:
+    """Class for a snapshot of circuit breaker statistics."""
+
+    state: CoinGeckoCircuitStates
+    opened_cnt: int
+    rejected_cnt: int
+
+    def __init__(self) -> None:
+        """Initialize the statistics."""
+        self.state = CoinGeckoCircuitStates.CLOSED
+        self.opened_cnt = 0
+        self.rejected_cnt = 0
+
+    def Merge(self,
+              other: "CoinGeckoCircuitBreakerStats") -> None:
+        """
+        Merge statistics of another circuit breaker (e.g. of another process) into these ones.
+        The resulting state is the worst one.
+
+        Args:
+            other: Other statistics.
+        """
+        self.state = max(self.state, other.state, key=lambda state: state.value)
+        self.opened_cnt += other.opened_cnt
+        self.rejected_cnt += other.rejected_cnt
+
+
+class CoinGeckoCircuitBreaker:
+    """
+    Circuit breaker for CoinGecko requests, shared by all the API instances of the process.
+    The circuit opens when the failure rate in the last window exceeds the threshold: requests are then rejected
+    immediately, without loading the failing server. After the open time, the circuit becomes half-open and a limited
+    number of probe requests are let through: if they succeed the circuit closes, otherwise it opens again.
+    """
+
+    enabled: bool
+    failure_rate: float
+    min_requests: int
+    window_sec: float
+    open_sec: float
+    probes_num: int
+    state: CoinGeckoCircuitStates
+    opened_time: float
+    probes_running: int
+    results: Deque[Tuple[float, bool]]
+    opened_cnt: int
+    rejected_cnt: int
+
+    def __init__(self) -> None:
+        """Initialize the circuit breaker, disabled."""
+        self.enabled = False
+        self.failure_rate = 1.0
+        self.min_requests = 1
+        self.window_sec = 0.0
+        self.open_sec = 0.0
+        self.probes_num = 1
+        self.state = CoinGeckoCircuitStates.CLOSED
+        self.opened_time = 0.0
+        self.probes_running = 0
+        self.results = deque()
+        self.opened_cnt = 0
+        self.rejected_cnt = 0
+
+    def SetParams(self,
+                  failure_rate: float,
+                  min_requests: int,
+                  window_sec: float,
+                  open_sec: float,
+                  probes_num: int) -> None:
+        """
+        Set the circuit breaker parameters, enabling it.
+
+        Args:
+            failure_rate: Failure rate (0..1) opening the circuit.
+            min_requests: Minimum number of requests in the window for evaluating the failure rate.
+            window_sec: Window in seconds for evaluating the failure rate.
+            open_sec: Time in seconds before letting probe requests through.
+            probes_num: Number of probe requests let through when half-open.
+        """
+        self.enabled = True
+        self.failure_rate = failure_rate
+        self.min_requests = min_requests
+        self.window_sec = window_sec
+        self.open_sec = open_sec
+        self.probes_num = probes_num
+
+    def Disable(self) -> None:
+        """Disable the circuit breaker, closing the circuit."""
+        self.enabled = False
+        self.state = CoinGeckoCircuitStates.CLOSED
+        self.probes_running = 0
+        self.results.clear()
+
+    def Allow(self,
+              logger: Logger) -> bool:
+        """
+        Check if a request can be sent.
+
+        Args:
+            logger: Logger instance.
+
+        Returns:
+            True if the request is a probe (i.e. the circuit is half-open), false otherwise.
+
+        Raises:
+            CoinGeckoCircuitOpenError: If the request is rejected.
+        """
+        if not self.enabled:
+            return False
+
+        if self.state == CoinGeckoCircuitStates.OPEN and time.monotonic() - self.opened_time >= self.open_sec:
+            self.__SetState(CoinGeckoCircuitStates.HALF_OPEN, logger)
+
+        if self.state == CoinGeckoCircuitStates.CLOSED:
+            return False
+        if self.state == CoinGeckoCircuitStates.HALF_OPEN and self.probes_running < self.probes_num:
+            self.probes_running += 1
+            return True
+
+        self.rejected_cnt += 1
+        raise CoinGeckoCircuitOpenError()
+
+    def RecordSuccess(self,
+                      is_probe: bool,
+                      logger: Logger) -> None:
+        """
+        Record a successful request.
+
+        Args:
+            is_probe: True if the request is a probe, as returned by Allow.
+            logger: Logger instance.
+        """
+        if not self.enabled:
+            return
+
+        if is_probe:
+            self.probes_running -= 1
+            if self.state == CoinGeckoCircuitStates.HALF_OPEN:
+                self.__SetState(CoinGeckoCircuitStates.CLOSED, logger)
+        elif self.state == CoinGeckoCircuitStates.CLOSED:
+            self.__AddResult(True)
+
+    def RecordFailure(self,
+                      is_probe: bool,
+                      logger: Logger) -> None:
+        """
+        Record a failed request.
+
+        Args:
+            is_probe: True if the request is a probe, as returned by Allow.
+            logger: Logger instance.
+        """
+        if not self.enabled:
+            return
+
+        if is_probe:
+            self.probes_running -= 1
+            if self.state == CoinGeckoCircuitStates.HALF_OPEN:
+                self.__SetState(CoinGeckoCircuitStates.OPEN, logger)
+        elif self.state == CoinGeckoCircuitStates.CLOSED:
+            self.__AddResult(False)
+            failures_num = sum(1 for _, is_success in self.results if not is_success)
+            if len(self.results) >= self.min_requests and failures_num >= self.failure_rate * len(self.results):
+                self.__SetState(CoinGeckoCircuitStates.OPEN, logger)
+
+    def RecordIgnored(self,
+                      is_probe: bool) -> None:
+        """
+        Record a request whose result does not tell if the server is working (e.g. invalid coin).
+
+        Args:
+            is_probe: True if the request is a probe, as returned by Allow.
+        """
+        if self.enabled and is_probe:
+            self.probes_running -= 1
+
+    def State(self) -> CoinGeckoCircuitStates:
+        """
+        Get the circuit state.
+
+        Returns:
+            Circuit state.
+        """
+        return self.state
+
+    def GetStats(self) -> CoinGeckoCircuitBreakerStats:
+        """
+        Get the circuit breaker statistics.
+
+        Returns:
+            Circuit breaker statistics.
+        """
+        stats = CoinGeckoCircuitBreakerStats()
+        stats.state = self.state
+        stats.opened_cnt = self.opened_cnt
+        stats.rejected_cnt = self.rejected_cnt
+        return stats
+
+    def __AddResult(self,
+                    is_success: bool) -> None:
+        """
+        Add a request result to the window.
+
+        Args:
+            is_success: True if successful, false otherwise.
+        """
+        now = time.monotonic()
+        self.results.append((now, is_success))
+        while len(self.results) > 0 and self.results[0][0] < now - self.window_sec:
+            self.results.popleft()
+
+    def __SetState(self,
+                   state: CoinGeckoCircuitStates,
+                   logger: Logger) -> None:
+        """
+        Set the circuit state.
+
+        Args:
+            state: New state.
+            logger: Logger instance.
+        """
+        if state == CoinGeckoCircuitStates.OPEN:
+            self.opened_time = time.monotonic()
+            self.opened_cnt += 1
+            logger.GetLogger().warning(
+                f"CoinGecko circuit breaker: {self.state.name} -> {state.name}, "
+                f"rejecting requests for {self.open_sec:.1f} sec"
+            )
+        else:
+            logger.GetLogger().info(f"CoinGecko circuit breaker: {self.state.name} -> {state.name}")
+
+        self.state = state
+        self.results.clear()
+
+
+# Shared by all the API instances, since they all send requests to the same server
+coingecko_circuit_breaker: CoinGeckoCircuitBreaker = CoinGeckoCircuitBreaker()
@@ -0,0 +1,102 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import copy
+import itertools
+import math
+import time
+from typing import Iterator, TypeVar
+
+
+# Generator of snapshot IDs
+snapshot_ids: Iterator[int] = itertools.count()
+
+
+class CoinGeckoFetchedData:
+    """Base class for data fetched from CoinGecko, keeping track of when it was fetched."""
+
+    snapshot_id: int
+    fetch_time: float
+    is_stale: bool
+
+    def __init__(self) -> None:
+        """Initialize the fetched data."""
+        self.snapshot_id = next(snapshot_ids)
+        self.fetch_time = time.time()
+        self.is_stale = False
+
+    def SnapshotId(self) -> int:
+        """
+        Get the snapshot ID, which identifies the fetched data (also when served stale).
+
+        Returns:
+            Snapshot ID.
+        """
+        return self.snapshot_id
+
+    def FetchTime(self) -> float:
+        """
+        Get the time when the data was fetched.
+
+        Returns:
+            Fetch time (epoch).
+        """
+        return self.fetch_time
+
+    def Age(self) -> float:
+        """
+        Get the age of the data.
+
+        Returns:
+            Age in seconds.
+        """
+        return time.time() - self.fetch_time
+
+    def AgeMinutes(self) -> int:
+        """
+        Get the age of the data in minutes, rounded up.
+
+        Returns:
+            Age in minutes.
+        """
+        return math.ceil(self.Age() / 60)
+
+    def IsStale(self) -> bool:
+        """
+        Get if the data is stale, i.e. it was served from cache because fresh data was not available.
+
+        Returns:
+            True if stale, false otherwise.
+        """
+        return self.is_stale
+
+    def ToStale(self: "CoinGeckoFetchedDataType") -> "CoinGeckoFetchedDataType":
+        """
+        Get a stale copy of the data.
+
+        Returns:
+            Stale copy of the data.
+        """
+        stale_data = copy.copy(self)
+        stale_data.is_stale = True
+        return stale_data
+
+
+CoinGeckoFetchedDataType = TypeVar("CoinGeckoFetchedDataType", bound=CoinGeckoFetchedData)
@@ -19,12 +19,15 @@
 # THE SOFTWARE.
 import json
 import logging
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from typing import Any, Dict
 
 import httpx
 from httpx import AsyncClient
 from tenacity import (
     AsyncRetrying,
+    RetryCallState,
     RetryError,
     before_sleep_log,
     retry_if_exception,
@@ -33,11 +36,19 @@ from tenacity import (
     wait_exponential,
 )
 
-from telegram_crypto_price_bot.bot.bot_config_types import BotConfigTypes
+from telegram_crypto_price_bot.bot.bot_config_snapshot import BotConfigSnapshot
 from telegram_crypto_price_bot.chart_info.chart_info import ChartInfo
+from telegram_crypto_price_bot.coingecko.coingecko_circuit_breaker import (
+    CoinGeckoCircuitBreaker,
+    CoinGeckoCircuitOpenError,
+    coingecko_circuit_breaker,
+)
+from telegram_crypto_price_bot.coingecko.coingecko_price_cache import CoinGeckoPriceCache, coingecko_price_cache
+from telegram_crypto_price_bot.coingecko.coingecko_rate_limiter import CoinGeckoRateLimiter, coingecko_rate_limiter
 from telegram_crypto_price_bot.config.config_object import ConfigObject
 from telegram_crypto_price_bot.logger.logger import Logger
 from telegram_crypto_price_bot.price_info.price_info import PriceInfo
+from telegram_crypto_price_bot.profiling.tracer import tracer
 
 
 class CoinGeckoPriceApiError(Exception):
@@ -54,14 +65,28 @@ class CoinGeckoPriceApiConst:
 
     RETRY_DELAY: int = 2
 
+    # Default rate limits (calls per minute) of CoinGecko plans (without key the limit is not known, requests are only
+    # paused when it is exceeded)
+    RATE_LIMIT_PRO: int = 500
+    RATE_LIMIT_DEMO: int = 30
+    RATE_LIMIT_NO_KEY: int = 0
+    # Pause when the rate limit is exceeded and the Retry-After header is not present
+    DEF_RETRY_AFTER_SEC: float = 60.0
+
 
 class CoinGeckoPriceApi:
     """API wrapper for retrieving cryptocurrency price and chart data from CoinGecko."""
 
     api_base_url: str
+    circuit_breaker: CoinGeckoCircuitBreaker
+    config: ConfigObject
+    config_snapshot: BotConfigSnapshot
     headers: Dict[str, str]
     logger: Logger
+    price_cache: CoinGeckoPriceCache
+    rate_limiter: CoinGeckoRateLimiter
     retry_strategy: AsyncRetrying
+    retry_wait: wait_exponential
     timeout: float
 
     def __init__(self,
@@ -74,52 +99,27 @@ class CoinGeckoPriceApi:
             config: Configuration object containing API key.
             logger: Logger instance.
         """
+        self.config = config
         self.logger = logger
-        self.timeout = config.GetValue(BotConfigTypes.COINGECKO_API_TIMEOUT_SEC)
-        # Pro key
-        api_key_pro = config.GetValue(BotConfigTypes.COINGECKO_API_KEY_PRO)
-        if api_key_pro:
-            self.headers = {
-                CoinGeckoPriceApiConst.HEADER_API_KEY_PRO: api_key_pro
-            }
-            self.api_base_url = CoinGeckoPriceApiConst.API_PRO_URL_BASE
-        else:
-            # Demo key
-            api_key_demo = config.GetValue(BotConfigTypes.COINGECKO_API_KEY_DEMO)
-            if api_key_demo:
-                self.headers = {
-                    CoinGeckoPriceApiConst.HEADER_API_KEY_DEMO: api_key_demo
-                }
-            else:
-                self.headers = {}
-            self.api_base_url = CoinGeckoPriceApiConst.API_DEMO_URL_BASE
-
-        self.retry_strategy = AsyncRetrying(
-            stop=stop_after_attempt(config.GetValue(BotConfigTypes.COINGECKO_API_MAX_RETRIES)),
-            wait=wait_exponential(multiplier=CoinGeckoPriceApiConst.RETRY_DELAY,
-                                  min=CoinGeckoPriceApiConst.RETRY_DELAY),
-            retry=(
-                retry_if_exception_type(
-                    (httpx.NetworkError, httpx.ProtocolError, httpx.TimeoutException)
-                ) |
-                retry_if_exception(
-                    # Too many requests
-                    lambda e: isinstance(e, httpx.HTTPStatusError) and e.response.status_code == 429
-                )
-            ),
-            before_sleep=before_sleep_log(logger.GetLogger(), logging.WARNING),
-            reraise=False
-        )
+        self.rate_limiter = coingecko_rate_limiter
+        self.circuit_breaker = coingecko_circuit_breaker
+        self.price_cache = coingecko_price_cache
+        self.retry_wait = wait_exponential(multiplier=CoinGeckoPriceApiConst.RETRY_DELAY,
+                                           min=CoinGeckoPriceApiConst.RETRY_DELAY)
+        self.__ApplyConfig()
 
     async def GetPriceInfo(self,
                            coin_id: str,
-                           coin_vs: str) -> PriceInfo:
+                           coin_vs: str,
+                           fresh_max_age_sec: float = 0.0) -> PriceInfo:
         """
         Get current price information for a cryptocurrency.
+        If stale data is enabled, the last good data may be returned when CoinGecko is failing or slow.
 
         Args:
             coin_id: Cryptocurrency coin identifier.
             coin_vs: Currency to compare against.
+            fresh_max_age_sec: Maximum age in seconds of cached data returned without requesting it (0 to always request data).
 
         Returns:
             Price information object.
@@ -127,15 +127,67 @@ class CoinGeckoPriceApi:
         Raises:
             CoinGeckoPriceApiError: If API request fails.
         """
-        coin_info = await self.__SendRequestWithRetry(f"coins/{coin_id}", {})
-        return PriceInfo(coin_info, coin_vs)
+        return await self.price_cache.Get(
+            ("price", coin_id, coin_vs),
+            lambda: self.__GetPriceInfo(coin_id, coin_vs),
+            self.logger,
+            fresh_max_age_sec
+        )
 
     async def GetChartInfo(self,
                            coin_id: str,
                            coin_vs: str,
-                           last_days: int) -> ChartInfo:
+                           last_days: int,
+                           fresh_max_age_sec: float = 0.0) -> ChartInfo:
         """
         Get historical chart data for a cryptocurrency.
+        If stale data is enabled, the last good data may be returned when CoinGecko is failing or slow.
+
+        Args:
+            coin_id: Cryptocurrency coin identifier.
+            coin_vs: Currency to compare against.
+            last_days: Number of days of historical data to retrieve.
+            fresh_max_age_sec: Maximum age in seconds of cached data returned without requesting it (0 to always request data).
+
+        Returns:
+            Chart information object.
+
+        Raises:
+            CoinGeckoPriceApiError: If API request fails.
+        """
+        return await self.price_cache.Get(
+            ("chart", coin_id, coin_vs, last_days),
+            lambda: self.__GetChartInfo(coin_id, coin_vs, last_days),
+            self.logger,
+            fresh_max_age_sec
+        )
+
+    async def __GetPriceInfo(self,
+                             coin_id: str,
+                             coin_vs: str) -> PriceInfo:
+        """
+        Fetch current price information for a cryptocurrency.
+
+        Args:
+            coin_id: Cryptocurrency coin identifier.
+            coin_vs: Currency to compare against.
+
+        Returns:
+            Price information object.
+
+        Raises:
+            CoinGeckoPriceApiError: If API request fails.
+        """
+        coin_info = await self.__SendRequestWithRetry(f"coins/{coin_id}", {})
+        with tracer.Span("price_info_parse"):
+            return PriceInfo(coin_info, coin_vs)
+
+    async def __GetChartInfo(self,
+                             coin_id: str,
+                             coin_vs: str,
+                             last_days: int) -> ChartInfo:
+        """
+        Fetch historical chart data for a cryptocurrency.
 
         Args:
             coin_id: Cryptocurrency coin identifier.
@@ -155,7 +207,81 @@ class CoinGeckoPriceApi:
                 "days": last_days,
             }
         )
-        return ChartInfo(chart_info, coin_id, coin_vs, last_days)
+        with tracer.Span("chart_info_parse"):
+            return ChartInfo(chart_info, coin_id, coin_vs, last_days)
+
+    def __ApplyConfig(self) -> None:
+        """
+        Apply the configuration, both to this instance and to the shared rate limiter, circuit breaker and cache.
+        It is called again when the configuration is reloaded, so that the new settings are used by the next request.
+        """
+        config = self.config.Snapshot(BotConfigSnapshot)
+        self.config_snapshot = config
+
+        self.timeout = config.coingecko_api_timeout_sec
+        # Pro key
+        if config.coingecko_api_key_pro:
+            self.headers = {
+                CoinGeckoPriceApiConst.HEADER_API_KEY_PRO: config.coingecko_api_key_pro
+            }
+            self.api_base_url = CoinGeckoPriceApiConst.API_PRO_URL_BASE
+            rate_limit = CoinGeckoPriceApiConst.RATE_LIMIT_PRO
+        else:
+            # Demo key
+            if config.coingecko_api_key_demo:
+                self.headers = {
+                    CoinGeckoPriceApiConst.HEADER_API_KEY_DEMO: config.coingecko_api_key_demo
+                }
+                rate_limit = CoinGeckoPriceApiConst.RATE_LIMIT_DEMO
+            else:
+                self.headers = {}
+                rate_limit = CoinGeckoPriceApiConst.RATE_LIMIT_NO_KEY
+            self.api_base_url = CoinGeckoPriceApiConst.API_DEMO_URL_BASE
+        if config.coingecko_api_base_url:
+            self.api_base_url = config.coingecko_api_base_url
+
+        if config.coingecko_api_rate_limit > 0:
+            rate_limit = config.coingecko_api_rate_limit
+        # In sharded mode, each process only uses its share (set once by the process itself)
+        self.rate_limiter.SetRateLimit(rate_limit)
+
+        if config.coingecko_api_cb_enabled:
+            # Parameters are always loaded if enabled
+            assert (config.coingecko_api_cb_failure_rate is not None
+                    and config.coingecko_api_cb_min_requests is not None
+                    and config.coingecko_api_cb_window_sec is not None
+                    and config.coingecko_api_cb_open_sec is not None
+                    and config.coingecko_api_cb_probes_num is not None)
+            self.circuit_breaker.SetParams(config.coingecko_api_cb_failure_rate,
+                                           config.coingecko_api_cb_min_requests,
+                                           config.coingecko_api_cb_window_sec,
+                                           config.coingecko_api_cb_open_sec,
+                                           config.coingecko_api_cb_probes_num)
+        else:
+            self.circuit_breaker.Disable()
+
+        if config.coingecko_api_stale_max_age_sec > 0:
+            # Wait time is always loaded if enabled
+            assert config.coingecko_api_stale_wait_sec is not None
+            self.price_cache.SetStaleParams(config.coingecko_api_stale_max_age_sec, config.coingecko_api_stale_wait_sec)
+        else:
+            self.price_cache.SetStaleParams(0, 0.0)
+
+        self.retry_strategy = AsyncRetrying(
+            stop=stop_after_attempt(config.coingecko_api_max_retries),
+            wait=self.__GetRetryWait,
+            retry=(
+                retry_if_exception_type(
+                    (httpx.NetworkError, httpx.ProtocolError, httpx.TimeoutException)
+                ) |
+                retry_if_exception(
+                    # Too many requests
+                    lambda e: isinstance(e, httpx.HTTPStatusError) and e.response.status_code == 429
+                )
+            ),
+            before_sleep=before_sleep_log(self.logger.GetLogger(), logging.WARNING),
+            reraise=False
+        )
 
     async def __SendRequestWithRetry(
         self,
@@ -173,13 +299,24 @@ class CoinGeckoPriceApi:
             JSON response as dictionary.
 
         Raises:
-            CoinGeckoPriceApiError: If all retry attempts fail.
+            CoinGeckoPriceApiError: If all retry attempts fail, the request fails with a status that is not retried or the circuit is open.
         """
+        # Configuration reloaded
+        if self.config.Snapshot(BotConfigSnapshot) is not self.config_snapshot:
+            self.__ApplyConfig()
+
         try:
             return await self.retry_strategy(self.__SendRequest, url, params)
         except RetryError as e:
             self.logger.GetLogger().error(f"All attempts failed for CoinGecko request for URL {url}")
             raise CoinGeckoPriceApiError() from e
+        except CoinGeckoCircuitOpenError as e:
+            self.logger.GetLogger().error(f"CoinGecko circuit breaker open, request for URL {url} rejected")
+            raise CoinGeckoPriceApiError() from e
+        except httpx.HTTPStatusError as e:
+            # Errors that are not retried (e.g. server errors or invalid coin)
+            self.logger.GetLogger().error(f"CoinGecko request for URL {url} failed with status {e.response.status_code}")
+            raise CoinGeckoPriceApiError() from e
 
     async def __SendRequest(
         self,
@@ -201,12 +338,107 @@ class CoinGeckoPriceApi:
             httpx.NetworkError: If network error occurs.
             httpx.ProtocolError: If protocol error occurs.
             httpx.TimeoutException: If request times out.
+            CoinGeckoCircuitOpenError: If the circuit is open.
         """
+        is_probe = self.circuit_breaker.Allow(self.logger)
+        try:
+            response_json = await self.__SendHttpRequest(url, params)
+        except (httpx.NetworkError, httpx.ProtocolError, httpx.TimeoutException):
+            self.circuit_breaker.RecordFailure(is_probe, self.logger)
+            raise
+        except httpx.HTTPStatusError as e:
+            # Server errors mean that the server is failing, client errors (e.g. invalid coin or rate limit) do not
+            if e.response.status_code >= 500:
+                self.circuit_breaker.RecordFailure(is_probe, self.logger)
+            else:
+                self.circuit_breaker.RecordIgnored(is_probe)
+            raise
+        except BaseException:
+            self.circuit_breaker.RecordIgnored(is_probe)
+            raise
+        else:
+            self.circuit_breaker.RecordSuccess(is_probe, self.logger)
+            return response_json
+
+    async def __SendHttpRequest(
+        self,
+        url: str,
+        params: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Send HTTP request to CoinGecko API, respecting the rate limit.
+
+        Args:
+            url: API endpoint path.
+            params: Query parameters for the request.
+
+        Returns:
+            JSON response as dictionary.
+
+        Raises:
+            httpx.HTTPStatusError: If HTTP request fails.
+            httpx.NetworkError: If network error occurs.
+            httpx.ProtocolError: If protocol error occurs.
+            httpx.TimeoutException: If request times out.
+        """
+        with tracer.Span("coingecko_rate_limit"):
+            await self.rate_limiter.Acquire()
+        self.logger.GetLogger().debug(
+            f"CoinGecko rate limit budget: {self.rate_limiter.UsedInLastMinute()}/{self.rate_limiter.RateLimit()} calls in the last minute"
+        )
+
         async with AsyncClient(
             base_url=self.api_base_url,
             headers=self.headers,
             timeout=self.timeout
         ) as client:
-            response = await client.get(url, params=params)
+            with tracer.Span("coingecko_request", url=url):
+                response = await client.get(url, params=params)
+            if response.status_code == 429:
+                retry_after = self.__GetRetryAfter(response)
+                self.logger.GetLogger().warning(f"CoinGecko rate limit exceeded, pausing requests for {retry_after:.1f} sec")
+                self.rate_limiter.Pause(retry_after)
             response.raise_for_status()
-            return json.loads(response.content.decode("utf-8"))
+            with tracer.Span("json_parse"):
+                return json.loads(response.content.decode("utf-8"))
+
+    def __GetRetryWait(self,
+                       retry_state: RetryCallState) -> float:
+        """
+        Get the wait time before retrying a request.
+
+        Args:
+            retry_state: Retry state.
+
+        Returns:
+            Wait time in seconds.
+        """
+        ex = retry_state.outcome.exception() if retry_state.outcome is not None else None
+        # Too many requests: the rate limiter already pauses all requests as needed
+        if isinstance(ex, httpx.HTTPStatusError) and ex.response.status_code == 429:
+            return 0.0
+        return self.retry_wait(retry_state)
+
+    @staticmethod
+    def __GetRetryAfter(response: httpx.Response) -> float:
+        """
+        Get the pause requested by the Retry-After header of a response.
+
+        Args:
+            response: HTTP response.
+
+        Returns:
+            Pause in seconds.
+        """
+        retry_after = response.headers.get("Retry-After")
+        if retry_after is None:
+            return CoinGeckoPriceApiConst.DEF_RETRY_AFTER_SEC
+        # Retry-After can be either a number of seconds or a date
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, (parsedate_to_datetime(retry_after) - datetime.now(timezone.utc)).total_seconds())
+        except (TypeError, ValueError):
+            return CoinGeckoPriceApiConst.DEF_RETRY_AFTER_SEC
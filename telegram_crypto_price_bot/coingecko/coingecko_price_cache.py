@@ -0,0 +1,198 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import asyncio
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Set, Tuple, cast
+
+from telegram_crypto_price_bot.coingecko.coingecko_fetched_data import CoinGeckoFetchedData, CoinGeckoFetchedDataType
+from telegram_crypto_price_bot.logger.logger import Logger
+
+
+class CoinGeckoPriceCacheConst:
+    """Constants for CoinGecko price cache."""
+
+    MAX_ENTRIES: int = 1024
+
+
+# Cache key, e.g. (data kind, coin ID, coin VS)
+CoinGeckoPriceCacheKey = Tuple[Any, ...]
+
+
+class CoinGeckoPriceCache:
+    """
+    Stale-while-revalidate cache for CoinGecko data, shared by all the API instances of the process.
+    Fresh data is always requested, but if it fails or does not arrive in time, the last good data is served (marked
+    as stale) while the request goes on in background to refresh it. While CoinGecko keeps failing, stale data is
+    served immediately. Data older than the maximum staleness is never served.
+    Callers can also specify a fresh maximum age (e.g. tasks whose data is prefetched just before they run), data
+    younger than it is served to them without requesting it.
+    Concurrent requests for the same data are also merged into a single one.
+    Since keys come from user input, the least recently used data is removed when the cache is full.
+    """
+
+    max_age_sec: int
+    wait_sec: float
+    entries: "OrderedDict[CoinGeckoPriceCacheKey, CoinGeckoFetchedData]"
+    refreshes: Dict[CoinGeckoPriceCacheKey, "asyncio.Future[Any]"]
+    failing_keys: Set[CoinGeckoPriceCacheKey]
+
+    def __init__(self) -> None:
+        """Initialize the cache, disabled."""
+        self.max_age_sec = 0
+        self.wait_sec = 0.0
+        self.entries = OrderedDict()
+        self.refreshes = {}
+        self.failing_keys = set()
+
+    def SetStaleParams(self,
+                       max_age_sec: int,
+                       wait_sec: float) -> None:
+        """
+        Set the stale data parameters.
+
+        Args:
+            max_age_sec: Maximum age in seconds of stale data (0 to disable the cache).
+            wait_sec: Time in seconds to wait for fresh data before serving stale data.
+        """
+        self.max_age_sec = max_age_sec
+        self.wait_sec = wait_sec
+
+    async def Get(self,
+                  key: CoinGeckoPriceCacheKey,
+                  fetch_fct: Callable[[], Awaitable[CoinGeckoFetchedDataType]],
+                  logger: Logger,
+                  fresh_max_age_sec: float = 0.0) -> CoinGeckoFetchedDataType:
+        """
+        Get data, fresh if possible, otherwise stale.
+
+        Args:
+            key: Cache key.
+            fetch_fct: Function fetching fresh data.
+            logger: Logger instance.
+            fresh_max_age_sec: Maximum age in seconds of data served without requesting it (0 to always request data).
+
+        Returns:
+            Data.
+
+        Raises:
+            Exception: Any exception raised by the fetch function, if no stale data is available.
+        """
+        if self.max_age_sec <= 0 and fresh_max_age_sec <= 0:
+            return await fetch_fct()
+
+        entry = self.__GetEntry(key, fresh_max_age_sec)
+        if entry is not None and entry.Age() <= fresh_max_age_sec:
+            return cast(CoinGeckoFetchedDataType, entry)
+
+        refresh = self.refreshes.get(key)
+        if refresh is None:
+            refresh = asyncio.ensure_future(self.__Refresh(key, fetch_fct))
+            # Retrieve the exception if nobody awaits the refresh (i.e. stale data was served)
+            refresh.add_done_callback(lambda fut: fut.cancelled() or fut.exception())
+            self.refreshes[key] = refresh
+
+        # No stale data to serve
+        if entry is None or entry.Age() > self.max_age_sec:
+            return cast(CoinGeckoFetchedDataType, await asyncio.shield(refresh))
+        if key in self.failing_keys:
+            logger.GetLogger().warning(f"CoinGecko failing for {key}, serving data {entry.Age():.0f} sec old")
+            return cast(CoinGeckoFetchedDataType, entry.ToStale())
+
+        try:
+            return cast(CoinGeckoFetchedDataType, await asyncio.wait_for(asyncio.shield(refresh), self.wait_sec))
+        except asyncio.TimeoutError:
+            logger.GetLogger().warning(
+                f"CoinGecko too slow for {key}, serving data {entry.Age():.0f} sec old and refreshing it in background"
+            )
+        except Exception:
+            logger.GetLogger().exception(f"CoinGecko error for {key}, serving data {entry.Age():.0f} sec old")
+
+        return cast(CoinGeckoFetchedDataType, entry.ToStale())
+
+    async def __Refresh(self,
+                        key: CoinGeckoPriceCacheKey,
+                        fetch_fct: Callable[[], Awaitable[CoinGeckoFetchedData]]) -> CoinGeckoFetchedData:
+        """
+        Fetch fresh data and store it.
+
+        Args:
+            key: Cache key.
+            fetch_fct: Function fetching fresh data.
+
+        Returns:
+            Fresh data.
+        """
+        try:
+            data = await fetch_fct()
+        except Exception:
+            # Only needed to serve stale data, so keys without data are not tracked
+            if key in self.entries:
+                self.failing_keys.add(key)
+            raise
+        else:
+            self.__PutEntry(key, data)
+            return data
+        finally:
+            del self.refreshes[key]
+
+    def __GetEntry(self,
+                   key: CoinGeckoPriceCacheKey,
+                   fresh_max_age_sec: float) -> Optional[CoinGeckoFetchedData]:
+        """
+        Get the cached data, if not older than the maximum staleness (or the fresh maximum age).
+        Older data is kept, since other callers may accept it (it is replaced when data is fetched again, or removed
+        when the cache is full and it is the least recently used).
+
+        Args:
+            key: Cache key.
+            fresh_max_age_sec: Fresh maximum age in seconds of the caller.
+
+        Returns:
+            Cached data, None if not present or too old.
+        """
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        self.entries.move_to_end(key)
+        if entry.Age() > max(self.max_age_sec, fresh_max_age_sec):
+            return None
+        return entry
+
+    def __PutEntry(self,
+                   key: CoinGeckoPriceCacheKey,
+                   data: CoinGeckoFetchedData) -> None:
+        """
+        Store data, removing the least recently used one if the cache is full.
+
+        Args:
+            key: Cache key.
+            data: Data.
+        """
+        self.entries[key] = data
+        self.entries.move_to_end(key)
+        self.failing_keys.discard(key)
+        if len(self.entries) > CoinGeckoPriceCacheConst.MAX_ENTRIES:
+            old_key, _ = self.entries.popitem(last=False)
+            self.failing_keys.discard(old_key)
+
+
+# Shared by all the API instances, so that all tasks and commands benefit from the same data
+coingecko_price_cache: CoinGeckoPriceCache = CoinGeckoPriceCache()
@@ -0,0 +1,210 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import asyncio
+import heapq
+import time
+from collections import deque
+from typing import Deque, List, Optional, Tuple
+
+from telegram_crypto_price_bot.priority.priority_lane import PriorityLane
+from telegram_crypto_price_bot.priority.priority_lane_metrics import priority_lane_metrics
+
+
+class CoinGeckoRateLimiterConst:
+    """Constants for CoinGecko rate limiter class."""
+
+    # Resource name for priority lane metrics
+    RESOURCE_NAME: str = "coingecko"
+    # Rate limits are computed by CoinGecko over a minute
+    WINDOW_SEC: float = 60.0
+    # Fraction of the rate limit actually used, to stay just under it
+    LIMIT_HEADROOM: float = 0.9
+
+
+class CoinGeckoRateLimiter:
+    """
+    Rate limiter for CoinGecko requests, shared by all the API instances of the process.
+    Permits are handed out evenly spaced, so that requests never exceed the rate limit even when many of them
+    are due at the same time. Waiting callers get permits by priority lane, so interactive commands are served
+    before scheduled tasks. When the rate limit is exceeded anyway, all callers are paused.
+    If the rate limit is shared with other processes (i.e. in sharded mode), the process only uses its share of it.
+    """
+
+    total_calls_per_min: int
+    share: float
+    calls_per_min: int
+    interval: float
+    next_slot: float
+    paused_until: float
+    seq_num: int
+    waiters: List[Tuple[int, int, asyncio.Future]]
+    grant_handle: Optional[asyncio.TimerHandle]
+    grant_times: Deque[float]
+
+    def __init__(self) -> None:
+        """Initialize the rate limiter, with no limit."""
+        self.total_calls_per_min = 0
+        self.share = 1.0
+        self.calls_per_min = 0
+        self.interval = 0.0
+        self.next_slot = 0.0
+        self.paused_until = 0.0
+        self.seq_num = 0
+        self.waiters = []
+        self.grant_handle = None
+        self.grant_times = deque()
+
+    def SetRateLimit(self,
+                     calls_per_min: int) -> None:
+        """
+        Set the rate limit.
+
+        Args:
+            calls_per_min: Maximum number of calls per minute, for all the processes (0 for no limit).
+        """
+        self.total_calls_per_min = calls_per_min
+        self.__UpdateInterval()
+
+    def SetShare(self,
+                 share: float) -> None:
+        """
+        Set the share of the rate limit used by this process.
+
+        Args:
+            share: Share of the rate limit, from 0 to 1.
+        """
+        self.share = share
+        self.__UpdateInterval()
+
+    def RateLimit(self) -> int:
+        """
+        Get the rate limit of this process.
+
+        Returns:
+            Maximum number of calls per minute (0 for no limit).
+        """
+        return self.calls_per_min
+
+    async def Acquire(self) -> None:
+        """Wait for a permit to send a request, in the priority lane of the current task."""
+        lane = PriorityLane.Current()
+        start_time = time.monotonic()
+
+        if len(self.waiters) == 0 and self.__NextGrantTime() <= start_time:
+            self.__Grant(start_time)
+        else:
+            fut = asyncio.get_running_loop().create_future()
+            self.seq_num += 1
+            heapq.heappush(self.waiters, (lane.value, self.seq_num, fut))
+            self.__ScheduleGrant()
+            await fut
+
+        priority_lane_metrics.Add(CoinGeckoRateLimiterConst.RESOURCE_NAME, lane, time.monotonic() - start_time)
+
+    def Pause(self,
+              pause_sec: float) -> None:
+        """
+        Pause all callers, because the rate limit was exceeded.
+
+        Args:
+            pause_sec: Pause in seconds.
+        """
+        self.paused_until = max(self.paused_until, time.monotonic() + pause_sec)
+        # Slots restart from the end of the pause
+        self.next_slot = self.paused_until
+        if self.grant_handle is not None:
+            self.grant_handle.cancel()
+            self.grant_handle = None
+        self.__ScheduleGrant()
+
+    def UsedInLastMinute(self) -> int:
+        """
+        Get the number of permits handed out in the last minute, i.e. the consumed budget.
+
+        Returns:
+            Number of permits.
+        """
+        self.__RemoveOldGrantTimes()
+        return len(self.grant_times)
+
+    def __UpdateInterval(self) -> None:
+        """Update the rate limit of this process and the interval between permits."""
+        self.calls_per_min = (
+            max(1, int(self.total_calls_per_min * self.share)) if self.total_calls_per_min > 0 else 0
+        )
+        self.interval = (
+            CoinGeckoRateLimiterConst.WINDOW_SEC / (self.calls_per_min * CoinGeckoRateLimiterConst.LIMIT_HEADROOM)
+            if self.calls_per_min > 0
+            else 0.0
+        )
+
+    def __RemoveOldGrantTimes(self) -> None:
+        """Remove the times of permits handed out more than a minute ago."""
+        min_time = time.monotonic() - CoinGeckoRateLimiterConst.WINDOW_SEC
+        while len(self.grant_times) > 0 and self.grant_times[0] < min_time:
+            self.grant_times.popleft()
+
+    def __NextGrantTime(self) -> float:
+        """
+        Get the time when the next permit can be handed out.
+
+        Returns:
+            Time (monotonic clock).
+        """
+        return max(self.next_slot, self.paused_until)
+
+    def __Grant(self,
+                now: float) -> None:
+        """
+        Record a permit handed out.
+
+        Args:
+            now: Current time (monotonic clock).
+        """
+        self.next_slot = now + self.interval
+        self.grant_times.append(now)
+        self.__RemoveOldGrantTimes()
+
+    def __ScheduleGrant(self) -> None:
+        """Schedule the hand out of the next permit to waiting callers, if not already scheduled."""
+        if self.grant_handle is None and len(self.waiters) > 0:
+            delay = max(0.0, self.__NextGrantTime() - time.monotonic())
+            self.grant_handle = asyncio.get_running_loop().call_later(delay, self.__GrantToWaiter)
+
+    def __GrantToWaiter(self) -> None:
+        """Hand out a permit to the waiting caller with the highest priority."""
+        self.grant_handle = None
+
+        now = time.monotonic()
+        if self.__NextGrantTime() <= now:
+            while len(self.waiters) > 0:
+                fut = heapq.heappop(self.waiters)[2]
+                # Skip callers that were cancelled while waiting
+                if not fut.done():
+                    fut.set_result(None)
+                    self.__Grant(now)
+                    break
+
+        self.__ScheduleGrant()
+
+
+# Shared by all the API instances, since the rate limit applies to the API key (i.e. to the whole process)
+coingecko_rate_limiter: CoinGeckoRateLimiter = CoinGeckoRateLimiter()
@@ -30,6 +30,8 @@ from telegram_crypto_price_bot.logger.logger import Logger
 from telegram_crypto_price_bot.message.message_sender import MessageSender
 from telegram_crypto_price_bot.misc.chat_members import ChatMembersGetter
 from telegram_crypto_price_bot.misc.helpers import ChatHelper, UserHelper
+from telegram_crypto_price_bot.priority.priority_lane import PriorityLane, PriorityLanes
+from telegram_crypto_price_bot.profiling.sampling_profiler import ProfiledStage
 from telegram_crypto_price_bot.translation.translation_loader import TranslationLoader
 
 
@@ -64,39 +66,42 @@ class CommandBase(ABC):
         self.translator = translator
         self.message_sender = MessageSender(client, logger)
 
+    @ProfiledStage("command")
     async def Execute(self,
                       message: pyrogram.types.Message,
                       **kwargs: Any) -> None:
         """
         Execute the command with authorization and error handling.
+        Commands are executed in the interactive lane, so they take precedence over scheduled tasks.
 
         Args:
             message: Telegram message containing the command.
             **kwargs: Additional keyword arguments for the command.
         """
-        self.message = message
-        self.cmd_data = CommandData(message)
+        with PriorityLane(PriorityLanes.INTERACTIVE):
+            self.message = message
+            self.cmd_data = CommandData(message)
 
-        self.__LogCommand()
+            self.__LogCommand()
 
-        if self._IsUserAnonymous() and not self._IsChannel():
-            self.logger.GetLogger().warning("An anonymous user tried to execute the command, exiting")
-            return
+            if self._IsUserAnonymous() and not self._IsChannel():
+                self.logger.GetLogger().warning("An anonymous user tried to execute the command, exiting")
+                return
 
-        if not await self._IsUserAuthorized():
-            if self._IsPrivateChat():
-                await self._SendMessage(self.translator.GetSentence("AUTH_ONLY_ERR_MSG"))
+            if not await self._IsUserAuthorized():
+                if self._IsPrivateChat():
+                    await self._SendMessage(self.translator.GetSentence("AUTH_ONLY_ERR_MSG"))
 
-            self.logger.GetLogger().warning(
-                f"User {UserHelper.GetNameOrId(self.cmd_data.User())} tried to execute the command but it's not authorized"
-            )
-            return
+                self.logger.GetLogger().warning(
+                    f"User {UserHelper.GetNameOrId(self.cmd_data.User())} tried to execute the command but it's not authorized"
+                )
+                return
 
-        try:
-            await self._ExecuteCommand(**kwargs)
-        except RPCError:
-            await self._SendMessage(self.translator.GetSentence("GENERIC_ERR_MSG"))
-            self.logger.GetLogger().exception(f"An error occurred while executing command {self.cmd_data.Name()}")
+            try:
+                await self._ExecuteCommand(**kwargs)
+            except RPCError:
+                await self._SendMessage(self.translator.GetSentence("GENERIC_ERR_MSG"))
+                self.logger.GetLogger().exception(f"An error occurred while executing command {self.cmd_data.Name()}")
 
     async def _SendMessage(self,
                            msg: str) -> None:
@@ -28,15 +28,27 @@ from telegram_crypto_price_bot.command.commands import (
     AliveCmd,
     HelpCmd,
     IsTestModeCmd,
+    MemorySnapshotCmd,
+    MemoryStartCmd,
+    MemoryStopCmd,
     PriceGetSingleCmd,
     PriceTaskDeleteLastMsgCmd,
+    PriceTaskEditLastMsgCmd,
     PriceTaskInfoCmd,
+    PriceTaskPauseBulkCmd,
     PriceTaskPauseCmd,
+    PriceTaskResumeBulkCmd,
     PriceTaskResumeCmd,
     PriceTaskSendInSameMsgCmd,
+    PriceTaskStartBulkCmd,
     PriceTaskStartCmd,
+    PriceTaskStatsCmd,
     PriceTaskStopAllCmd,
+    PriceTaskStopBulkCmd,
     PriceTaskStopCmd,
+    ProfileStartCmd,
+    ProfileStopCmd,
+    ReloadConfigCmd,
     SetTestModeCmd,
     VersionCmd,
 )
@@ -55,15 +67,27 @@ class CommandTypes(Enum):
     SET_TEST_MODE_CMD = auto()
     IS_TEST_MODE_CMD = auto()
     VERSION_CMD = auto()
+    RELOAD_CONFIG_CMD = auto()
     PRICE_GET_SINGLE_CMD = auto()
     PRICE_TASK_START_CMD = auto()
     PRICE_TASK_STOP_CMD = auto()
     PRICE_TASK_STOP_ALL_CMD = auto()
     PRICE_TASK_PAUSE_CMD = auto()
     PRICE_TASK_RESUME_CMD = auto()
+    PRICE_TASK_START_BULK_CMD = auto()
+    PRICE_TASK_STOP_BULK_CMD = auto()
+    PRICE_TASK_PAUSE_BULK_CMD = auto()
+    PRICE_TASK_RESUME_BULK_CMD = auto()
     PRICE_TASK_SEND_IN_SAME_MSG_CMD = auto()
     PRICE_TASK_DELETE_LAST_MSG_CMD = auto()
+    PRICE_TASK_EDIT_LAST_MSG_CMD = auto()
     PRICE_TASK_INFO_CMD = auto()
+    PRICE_TASK_STATS_CMD = auto()
+    MEMORY_START_CMD = auto()
+    MEMORY_SNAPSHOT_CMD = auto()
+    MEMORY_STOP_CMD = auto()
+    PROFILE_START_CMD = auto()
+    PROFILE_STOP_CMD = auto()
 
 
 class CommandDispatcherConst:
@@ -76,15 +100,27 @@ class CommandDispatcherConst:
         CommandTypes.SET_TEST_MODE_CMD: SetTestModeCmd,
         CommandTypes.IS_TEST_MODE_CMD: IsTestModeCmd,
         CommandTypes.VERSION_CMD: VersionCmd,
+        CommandTypes.RELOAD_CONFIG_CMD: ReloadConfigCmd,
         CommandTypes.PRICE_GET_SINGLE_CMD: PriceGetSingleCmd,
         CommandTypes.PRICE_TASK_START_CMD: PriceTaskStartCmd,
         CommandTypes.PRICE_TASK_STOP_CMD: PriceTaskStopCmd,
         CommandTypes.PRICE_TASK_STOP_ALL_CMD: PriceTaskStopAllCmd,
         CommandTypes.PRICE_TASK_PAUSE_CMD: PriceTaskPauseCmd,
         CommandTypes.PRICE_TASK_RESUME_CMD: PriceTaskResumeCmd,
+        CommandTypes.PRICE_TASK_START_BULK_CMD: PriceTaskStartBulkCmd,
+        CommandTypes.PRICE_TASK_STOP_BULK_CMD: PriceTaskStopBulkCmd,
+        CommandTypes.PRICE_TASK_PAUSE_BULK_CMD: PriceTaskPauseBulkCmd,
+        CommandTypes.PRICE_TASK_RESUME_BULK_CMD: PriceTaskResumeBulkCmd,
         CommandTypes.PRICE_TASK_SEND_IN_SAME_MSG_CMD: PriceTaskSendInSameMsgCmd,
         CommandTypes.PRICE_TASK_DELETE_LAST_MSG_CMD: PriceTaskDeleteLastMsgCmd,
+        CommandTypes.PRICE_TASK_EDIT_LAST_MSG_CMD: PriceTaskEditLastMsgCmd,
         CommandTypes.PRICE_TASK_INFO_CMD: PriceTaskInfoCmd,
+        CommandTypes.PRICE_TASK_STATS_CMD: PriceTaskStatsCmd,
+        CommandTypes.MEMORY_START_CMD: MemoryStartCmd,
+        CommandTypes.MEMORY_SNAPSHOT_CMD: MemorySnapshotCmd,
+        CommandTypes.MEMORY_STOP_CMD: MemoryStopCmd,
+        CommandTypes.PROFILE_START_CMD: ProfileStartCmd,
+        CommandTypes.PROFILE_STOP_CMD: ProfileStopCmd,
     }
 
 
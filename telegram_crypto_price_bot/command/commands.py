@@ -18,12 +18,13 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 
-from typing import Any, Callable, Coroutine
+from typing import Any, Callable, Coroutine, Dict, List, Type
 
 from typing_extensions import override
 
 from telegram_crypto_price_bot._version import __version__
 from telegram_crypto_price_bot.bot.bot_config_types import BotConfigTypes
+from telegram_crypto_price_bot.coin_info.coin_info_bulk_result import CoinInfoBulkResult, CoinInfoCoinPair
 from telegram_crypto_price_bot.coin_info.coin_info_scheduler import (
     CoinInfoJobAlreadyExistentError,
     CoinInfoJobInvalidPeriodError,
@@ -31,10 +32,15 @@ from telegram_crypto_price_bot.coin_info.coin_info_scheduler import (
     CoinInfoJobMaxNumError,
     CoinInfoJobNotExistentError,
 )
+from telegram_crypto_price_bot.coin_info.coin_info_scheduler_stats import CoinInfoSchedulerStats
 from telegram_crypto_price_bot.command.command_base import CommandBase
 from telegram_crypto_price_bot.command.command_data import CommandParameterError
 from telegram_crypto_price_bot.info_message_sender.coin_info_message_sender import CoinInfoMessageSender
+from telegram_crypto_price_bot.info_message_sender.coin_info_message_state import CoinInfoMessageState
 from telegram_crypto_price_bot.misc.helpers import UserHelper
+from telegram_crypto_price_bot.profiling.memory_profiler import MemoryProfileReport, MemoryProfilerNotStartedError
+from telegram_crypto_price_bot.profiling.sampling_profiler import SamplingProfilerAlreadyRunningError
+from telegram_crypto_price_bot.profiling.tracer import tracer
 
 
 def GroupChatOnly(exec_cmd_fct: Callable[..., Coroutine[Any, Any, None]]) -> Callable[..., Coroutine[Any, Any, None]]:
@@ -57,6 +63,46 @@ def GroupChatOnly(exec_cmd_fct: Callable[..., Coroutine[Any, Any, None]]) -> Cal
     return decorated
 
 
+def MemoryProfilingOnly(exec_cmd_fct: Callable[..., Coroutine[Any, Any, None]]) -> Callable[..., Coroutine[Any, Any, None]]:
+    """
+    Decorator to restrict commands to when memory profiling is enabled in the configuration.
+
+    Args:
+        exec_cmd_fct: Command execution function to decorate
+
+    Returns:
+        Decorated function that checks for memory profiling before execution
+    """
+
+    async def decorated(self: Any, **kwargs: Any) -> None:
+        if not self.config.GetValue(BotConfigTypes.APP_MEMORY_PROFILING):
+            await self._SendMessage(self.translator.GetSentence("MEMORY_PROFILING_DISABLED_ERR_MSG"))
+        else:
+            await exec_cmd_fct(self, **kwargs)
+
+    return decorated
+
+
+def CpuProfilingOnly(exec_cmd_fct: Callable[..., Coroutine[Any, Any, None]]) -> Callable[..., Coroutine[Any, Any, None]]:
+    """
+    Decorator to restrict commands to when CPU profiling is enabled in the configuration.
+
+    Args:
+        exec_cmd_fct: Command execution function to decorate
+
+    Returns:
+        Decorated function that checks for CPU profiling before execution
+    """
+
+    async def decorated(self: Any, **kwargs: Any) -> None:
+        if not self.config.GetValue(BotConfigTypes.APP_CPU_PROFILING):
+            await self._SendMessage(self.translator.GetSentence("CPU_PROFILING_DISABLED_ERR_MSG"))
+        else:
+            await exec_cmd_fct(self, **kwargs)
+
+    return decorated
+
+
 class HelpCmd(CommandBase):
     """Command to display help information."""
 
@@ -111,6 +157,20 @@ class IsTestModeCmd(CommandBase):
             await self._SendMessage(self.translator.GetSentence("IS_TEST_MODE_DIS_CMD"))
 
 
+class ReloadConfigCmd(CommandBase):
+    """Command to reload the configuration file."""
+
+    @override
+    @GroupChatOnly
+    async def _ExecuteCommand(self,
+                              **kwargs: Any) -> None:
+        """Execute the reload configuration command."""
+        if await kwargs["reload_config_fct"]():
+            await self._SendMessage(self.translator.GetSentence("RELOAD_CONFIG_OK_CMD"))
+        else:
+            await self._SendMessage(self.translator.GetSentence("RELOAD_CONFIG_ERR_CMD"))
+
+
 class VersionCmd(CommandBase):
     """Command to display bot version."""
 
@@ -137,9 +197,12 @@ class PriceGetSingleCmd(CommandBase):
         except CommandParameterError:
             await self._SendMessage(self.translator.GetSentence("PARAM_ERR_MSG"))
         else:
+            chat = self.cmd_data.Chat()
+            msg_state = CoinInfoMessageState(chat.id, chat.title, self.message.message_thread_id)
+            msg_state.SendInSameMessage(same_msg)
             coin_info_sender = CoinInfoMessageSender(self.client, self.config, self.logger, self.translator)
-            coin_info_sender.SendInSameMessage(same_msg)
-            await coin_info_sender.SendMessage(self.cmd_data.Chat(), self.message.message_thread_id, coin_id, coin_vs, last_days)
+            with tracer.Trace(self.config, "get_single", f"{chat.id}/{self.message.id}", coin_id=coin_id, coin_vs=coin_vs):
+                await coin_info_sender.SendMessage(msg_state, coin_id, coin_vs, last_days)
 
 
 class PriceTaskStartCmd(CommandBase):
@@ -160,13 +223,13 @@ class PriceTaskStartCmd(CommandBase):
             await self._SendMessage(self.translator.GetSentence("PARAM_ERR_MSG"))
         else:
             try:
-                kwargs["coin_info_scheduler"].Start(self.cmd_data.Chat(),
-                                                    self.message.message_thread_id,
-                                                    period_hours,
-                                                    start_hour,
-                                                    coin_id,
-                                                    coin_vs,
-                                                    last_days)
+                await kwargs["coin_info_scheduler"].Start(self.cmd_data.Chat(),
+                                                          self.message.message_thread_id,
+                                                          period_hours,
+                                                          start_hour,
+                                                          coin_id=coin_id,
+                                                          coin_vs=coin_vs,
+                                                          last_days=last_days)
                 await self._SendMessage(
                     self.translator.GetSentence(
                         "PRICE_TASK_START_OK_CMD",
@@ -202,7 +265,7 @@ class PriceTaskStopCmd(CommandBase):
             await self._SendMessage(self.translator.GetSentence("PARAM_ERR_MSG"))
         else:
             try:
-                kwargs["coin_info_scheduler"].Stop(self.cmd_data.Chat(), self.message.message_thread_id, coin_id, coin_vs)
+                await kwargs["coin_info_scheduler"].Stop(self.cmd_data.Chat(), self.message.message_thread_id, coin_id, coin_vs)
                 await self._SendMessage(self.translator.GetSentence("PRICE_TASK_STOP_OK_CMD", coin_id=coin_id, coin_vs=coin_vs))
             except CoinInfoJobNotExistentError:
                 await self._SendMessage(self.translator.GetSentence("TASK_NOT_EXISTENT_ERR_MSG", coin_id=coin_id, coin_vs=coin_vs))
@@ -216,7 +279,7 @@ class PriceTaskStopAllCmd(CommandBase):
     async def _ExecuteCommand(self,
                               **kwargs: Any) -> None:
         """Execute the price task stop all command."""
-        kwargs["coin_info_scheduler"].StopAll(self.cmd_data.Chat())
+        await kwargs["coin_info_scheduler"].StopAll(self.cmd_data.Chat())
         await self._SendMessage(self.translator.GetSentence("PRICE_TASK_STOP_ALL_CMD"))
 
 
@@ -235,7 +298,7 @@ class PriceTaskPauseCmd(CommandBase):
             await self._SendMessage(self.translator.GetSentence("PARAM_ERR_MSG"))
         else:
             try:
-                kwargs["coin_info_scheduler"].Pause(self.cmd_data.Chat(), self.message.message_thread_id, coin_id, coin_vs)
+                await kwargs["coin_info_scheduler"].Pause(self.cmd_data.Chat(), self.message.message_thread_id, coin_id, coin_vs)
                 await self._SendMessage(self.translator.GetSentence("PRICE_TASK_PAUSE_OK_CMD", coin_id=coin_id, coin_vs=coin_vs))
             except CoinInfoJobNotExistentError:
                 await self._SendMessage(self.translator.GetSentence("TASK_NOT_EXISTENT_ERR_MSG", coin_id=coin_id, coin_vs=coin_vs))
@@ -256,12 +319,166 @@ class PriceTaskResumeCmd(CommandBase):
             await self._SendMessage(self.translator.GetSentence("PARAM_ERR_MSG"))
         else:
             try:
-                kwargs["coin_info_scheduler"].Resume(self.cmd_data.Chat(), self.message.message_thread_id, coin_id, coin_vs)
+                await kwargs["coin_info_scheduler"].Resume(self.cmd_data.Chat(), self.message.message_thread_id, coin_id, coin_vs)
                 await self._SendMessage(self.translator.GetSentence("PRICE_TASK_RESUME_OK_CMD", coin_id=coin_id, coin_vs=coin_vs))
             except CoinInfoJobNotExistentError:
                 await self._SendMessage(self.translator.GetSentence("TASK_NOT_EXISTENT_ERR_MSG", coin_id=coin_id, coin_vs=coin_vs))
 
 
+class PriceTaskBulkCmdConst:
+    """Constants for price task bulk commands."""
+
+    ERR_TO_SENTENCE: Dict[Type[Exception], str] = {
+        CoinInfoJobAlreadyExistentError: "TASK_EXISTENT_BULK_ERR_MSG",
+        CoinInfoJobInvalidPeriodError: "TASK_PERIOD_BULK_ERR_MSG",
+        CoinInfoJobInvalidStartError: "TASK_START_BULK_ERR_MSG",
+        CoinInfoJobMaxNumError: "MAX_TASK_BULK_ERR_MSG",
+        CoinInfoJobNotExistentError: "TASK_NOT_EXISTENT_BULK_ERR_MSG",
+    }
+
+
+class PriceTaskBulkCmdBase(CommandBase):
+    """Base class for commands applied to multiple price tasks at once, replying with a single summary message."""
+
+    def _GetCoinPairs(self,
+                      start_idx: int) -> List[CoinInfoCoinPair]:
+        """
+        Get the coin pairs from the command parameters, i.e. a sequence of COIN_ID COIN_VS parameters.
+
+        Args:
+            start_idx: Index of the first parameter
+
+        Returns:
+            Coin pairs
+
+        Raises:
+            CommandParameterError: If coin pairs are missing or incomplete
+        """
+        params = self.cmd_data.Params()
+        params_num = params.Count() - start_idx
+        if params_num <= 0 or params_num % 2 != 0:
+            raise CommandParameterError("Invalid coin pairs")
+
+        return [
+            (params.GetAsString(idx), params.GetAsString(idx + 1))
+            for idx in range(start_idx, params.Count(), 2)
+        ]
+
+    async def _SendBulkResult(self,
+                              sentence_id: str,
+                              result: CoinInfoBulkResult,
+                              **kwargs: Any) -> None:
+        """
+        Send the summary message of a bulk operation.
+
+        Args:
+            sentence_id: Sentence ID of the summary message
+            result: Bulk operation result
+            **kwargs: Additional sentence parameters
+        """
+        results_str = "\n".join(
+            [
+                self.translator.GetSentence("PRICE_TASK_BULK_OK_MSG", coin_id=coin_id, coin_vs=coin_vs)
+                if ex is None
+                else self.translator.GetSentence(
+                    "PRICE_TASK_BULK_ERR_MSG",
+                    coin_id=coin_id,
+                    coin_vs=coin_vs,
+                    reason=self.translator.GetSentence(PriceTaskBulkCmdConst.ERR_TO_SENTENCE[type(ex)]),
+                )
+                for (coin_id, coin_vs), ex in result.Outcomes()
+            ]
+        )
+        await self._SendMessage(
+            self.translator.GetSentence(
+                sentence_id,
+                ok_num=result.SucceededCount(),
+                tot_num=result.Count(),
+                results=results_str,
+                **kwargs,
+            )
+        )
+
+
+class PriceTaskStartBulkCmd(PriceTaskBulkCmdBase):
+    """Command to start multiple scheduled cryptocurrency price tasks with the same parameters."""
+
+    @override
+    @GroupChatOnly
+    async def _ExecuteCommand(self,
+                              **kwargs: Any) -> None:
+        """Execute the price task start bulk command."""
+        try:
+            period_hours = self.cmd_data.Params().GetAsInt(0)
+            start_hour = self.cmd_data.Params().GetAsInt(1)
+            last_days = self.cmd_data.Params().GetAsInt(2)
+            coin_pairs = self._GetCoinPairs(3)
+        except CommandParameterError:
+            await self._SendMessage(self.translator.GetSentence("PARAM_ERR_MSG"))
+        else:
+            result = await kwargs["coin_info_scheduler"].StartMultiple(self.cmd_data.Chat(),
+                                                                       self.message.message_thread_id,
+                                                                       period_hours,
+                                                                       start_hour,
+                                                                       [(coin_id, coin_vs, last_days) for coin_id, coin_vs in coin_pairs])
+            await self._SendBulkResult("PRICE_TASK_START_BULK_CMD",
+                                       result,
+                                       period=period_hours,
+                                       start=start_hour,
+                                       last_days=last_days)
+
+
+class PriceTaskStopBulkCmd(PriceTaskBulkCmdBase):
+    """Command to stop multiple scheduled cryptocurrency price tasks."""
+
+    @override
+    @GroupChatOnly
+    async def _ExecuteCommand(self,
+                              **kwargs: Any) -> None:
+        """Execute the price task stop bulk command."""
+        try:
+            coin_pairs = self._GetCoinPairs(0)
+        except CommandParameterError:
+            await self._SendMessage(self.translator.GetSentence("PARAM_ERR_MSG"))
+        else:
+            result = await kwargs["coin_info_scheduler"].StopMultiple(self.cmd_data.Chat(), self.message.message_thread_id, coin_pairs)
+            await self._SendBulkResult("PRICE_TASK_STOP_BULK_CMD", result)
+
+
+class PriceTaskPauseBulkCmd(PriceTaskBulkCmdBase):
+    """Command to pause multiple scheduled cryptocurrency price tasks."""
+
+    @override
+    @GroupChatOnly
+    async def _ExecuteCommand(self,
+                              **kwargs: Any) -> None:
+        """Execute the price task pause bulk command."""
+        try:
+            coin_pairs = self._GetCoinPairs(0)
+        except CommandParameterError:
+            await self._SendMessage(self.translator.GetSentence("PARAM_ERR_MSG"))
+        else:
+            result = await kwargs["coin_info_scheduler"].PauseMultiple(self.cmd_data.Chat(), self.message.message_thread_id, coin_pairs)
+            await self._SendBulkResult("PRICE_TASK_PAUSE_BULK_CMD", result)
+
+
+class PriceTaskResumeBulkCmd(PriceTaskBulkCmdBase):
+    """Command to resume multiple paused cryptocurrency price tasks."""
+
+    @override
+    @GroupChatOnly
+    async def _ExecuteCommand(self,
+                              **kwargs: Any) -> None:
+        """Execute the price task resume bulk command."""
+        try:
+            coin_pairs = self._GetCoinPairs(0)
+        except CommandParameterError:
+            await self._SendMessage(self.translator.GetSentence("PARAM_ERR_MSG"))
+        else:
+            result = await kwargs["coin_info_scheduler"].ResumeMultiple(self.cmd_data.Chat(), self.message.message_thread_id, coin_pairs)
+            await self._SendBulkResult("PRICE_TASK_RESUME_BULK_CMD", result)
+
+
 class PriceTaskSendInSameMsgCmd(CommandBase):
     """Command to configure whether task updates are sent in the same message."""
 
@@ -278,11 +495,11 @@ class PriceTaskSendInSameMsgCmd(CommandBase):
             await self._SendMessage(self.translator.GetSentence("PARAM_ERR_MSG"))
         else:
             try:
-                kwargs["coin_info_scheduler"].SendInSameMessage(self.cmd_data.Chat(),
-                                                                self.message.message_thread_id,
-                                                                coin_id,
-                                                                coin_vs,
-                                                                flag)
+                await kwargs["coin_info_scheduler"].SendInSameMessage(self.cmd_data.Chat(),
+                                                                      self.message.message_thread_id,
+                                                                      coin_id,
+                                                                      coin_vs,
+                                                                      flag)
                 await self._SendMessage(
                     self.translator.GetSentence("PRICE_TASK_SEND_IN_SAME_MSG_OK_CMD", coin_id=coin_id, coin_vs=coin_vs, flag=flag)
                 )
@@ -306,11 +523,11 @@ class PriceTaskDeleteLastMsgCmd(CommandBase):
             await self._SendMessage(self.translator.GetSentence("PARAM_ERR_MSG"))
         else:
             try:
-                kwargs["coin_info_scheduler"].DeleteLastSentMessage(self.cmd_data.Chat(),
-                                                                    self.message.message_thread_id,
-                                                                    coin_id,
-                                                                    coin_vs,
-                                                                    flag)
+                await kwargs["coin_info_scheduler"].DeleteLastSentMessage(self.cmd_data.Chat(),
+                                                                          self.message.message_thread_id,
+                                                                          coin_id,
+                                                                          coin_vs,
+                                                                          flag)
                 await self._SendMessage(
                     self.translator.GetSentence("PRICE_TASK_DELETE_LAST_MSG_OK_CMD", coin_id=coin_id, coin_vs=coin_vs, flag=flag)
                 )
@@ -318,6 +535,34 @@ class PriceTaskDeleteLastMsgCmd(CommandBase):
                 await self._SendMessage(self.translator.GetSentence("TASK_NOT_EXISTENT_ERR_MSG", coin_id=coin_id, coin_vs=coin_vs))
 
 
+class PriceTaskEditLastMsgCmd(CommandBase):
+    """Command to configure whether the last sent message should be edited in place."""
+
+    @override
+    @GroupChatOnly
+    async def _ExecuteCommand(self,
+                              **kwargs: Any) -> None:
+        """Execute the price task edit last message command."""
+        try:
+            coin_id = self.cmd_data.Params().GetAsString(0)
+            coin_vs = self.cmd_data.Params().GetAsString(1)
+            flag = self.cmd_data.Params().GetAsBool(2)
+        except CommandParameterError:
+            await self._SendMessage(self.translator.GetSentence("PARAM_ERR_MSG"))
+        else:
+            try:
+                await kwargs["coin_info_scheduler"].EditLastSentMessage(self.cmd_data.Chat(),
+                                                                        self.message.message_thread_id,
+                                                                        coin_id,
+                                                                        coin_vs,
+                                                                        flag)
+                await self._SendMessage(
+                    self.translator.GetSentence("PRICE_TASK_EDIT_LAST_MSG_OK_CMD", coin_id=coin_id, coin_vs=coin_vs, flag=flag)
+                )
+            except CoinInfoJobNotExistentError:
+                await self._SendMessage(self.translator.GetSentence("TASK_NOT_EXISTENT_ERR_MSG", coin_id=coin_id, coin_vs=coin_vs))
+
+
 class PriceTaskInfoCmd(CommandBase):
     """Command to display information about active price tasks in a chat."""
 
@@ -326,7 +571,7 @@ class PriceTaskInfoCmd(CommandBase):
     async def _ExecuteCommand(self,
                               **kwargs: Any) -> None:
         """Execute the price task info command."""
-        jobs_list = kwargs["coin_info_scheduler"].GetJobsInChat(self.cmd_data.Chat())
+        jobs_list = await kwargs["coin_info_scheduler"].GetJobsInChat(self.cmd_data.Chat())
 
         if jobs_list.Any():
             await self._SendMessage(
@@ -334,3 +579,229 @@ class PriceTaskInfoCmd(CommandBase):
             )
         else:
             await self._SendMessage(self.translator.GetSentence("PRICE_TASK_INFO_NO_TASK_CMD"))
+
+
+class PriceTaskStatsCmd(CommandBase):
+    """Command to display statistics about the execution of price tasks."""
+
+    @override
+    async def _ExecuteCommand(self,
+                              **kwargs: Any) -> None:
+        """Execute the price task stats command."""
+        stats = await kwargs["coin_info_scheduler"].GetStats()
+
+        await self._SendMessage(
+            self.translator.GetSentence(
+                "PRICE_TASK_STATS_CMD",
+                queue_depth=stats.queue_depth,
+                queue_executed=stats.queue_executed_cnt,
+                queue_avg_wait=stats.queue_avg_wait_time,
+                queue_max_wait=stats.queue_max_wait_time,
+                queue_dropped=stats.queue_dropped_cnt,
+                queue_coalesced=stats.queue_coalesced_cnt,
+                queue_grouped=stats.queue_grouped_cnt,
+                overdue=stats.overdue_cnt,
+                max_delay=stats.max_delay,
+                missed=stats.missed_cnt,
+                skipped=stats.skipped_cnt,
+                lanes=self.__BuildLanesStats(stats),
+                cb_state=self.translator.GetSentence(f"CIRCUIT_STATE_{stats.circuit_breaker_stats.state.name}"),
+                cb_opened=stats.circuit_breaker_stats.opened_cnt,
+                cb_rejected=stats.circuit_breaker_stats.rejected_cnt,
+                loop_avg_lag=stats.loop_lag_stats.AverageLag(),
+                loop_max_lag=stats.loop_lag_stats.max_lag,
+                loop_slow=stats.loop_lag_stats.slow_cnt,
+                loop_slow_callbacks=self.__BuildSlowCallbacksStats(stats),
+            )
+        )
+
+    def __BuildLanesStats(self,
+                          stats: CoinInfoSchedulerStats) -> str:
+        """
+        Build the string of priority lanes statistics.
+
+        Args:
+            stats: Scheduler statistics.
+
+        Returns:
+            Priority lanes statistics string.
+        """
+        lanes_stats_str = [
+            self.translator.GetSentence(
+                "PRICE_TASK_STATS_LANE_MSG",
+                resource=resource_name,
+                lane=self.translator.GetSentence(f"PRIORITY_LANE_{lane.name}"),
+                count=lane_stats.count,
+                avg_wait=lane_stats.AverageTime(),
+                max_wait=lane_stats.max_time,
+            )
+            for resource_name, lanes_stats in sorted(stats.lanes_stats.items())
+            for lane, lane_stats in sorted(lanes_stats.items(), key=lambda item: item[0].value)
+        ]
+        if len(lanes_stats_str) == 0:
+            return self.translator.GetSentence("PRICE_TASK_STATS_NO_LANE_MSG")
+        return "\n".join(lanes_stats_str)
+
+    def __BuildSlowCallbacksStats(self,
+                                  stats: CoinInfoSchedulerStats) -> str:
+        """
+        Build the string of the slowest event loop callbacks.
+
+        Args:
+            stats: Scheduler statistics.
+
+        Returns:
+            Slowest event loop callbacks string.
+        """
+        if len(stats.loop_lag_stats.slow_callbacks) == 0:
+            return self.translator.GetSentence("PRICE_TASK_STATS_NO_SLOW_CALLBACK_MSG")
+        return "\n".join(
+            self.translator.GetSentence("PRICE_TASK_STATS_SLOW_CALLBACK_MSG", name=name, duration=duration)
+            for name, duration in stats.loop_lag_stats.slow_callbacks
+        )
+
+
+class MemoryStartCmd(CommandBase):
+    """Command to start memory profiling, taking the baseline snapshot."""
+
+    @override
+    @MemoryProfilingOnly
+    async def _ExecuteCommand(self,
+                              **kwargs: Any) -> None:
+        """Execute the memory start command."""
+        await kwargs["profiling_controller"].StartMemoryProfiling()
+        await self._SendMessage(self.translator.GetSentence("MEMORY_START_CMD"))
+
+
+class MemorySnapshotCmdConst:
+    """Constants for memory snapshot command class."""
+
+    DEF_TOP_NUM: int = 10
+    MAX_TOP_NUM: int = 50
+
+
+class MemorySnapshotCmd(CommandBase):
+    """Command to take a memory snapshot and compare it with the baseline."""
+
+    @override
+    @MemoryProfilingOnly
+    async def _ExecuteCommand(self,
+                              **kwargs: Any) -> None:
+        """Execute the memory snapshot command."""
+        try:
+            top_num = self.cmd_data.Params().GetAsInt(0, MemorySnapshotCmdConst.DEF_TOP_NUM)
+        except CommandParameterError:
+            await self._SendMessage(self.translator.GetSentence("PARAM_ERR_MSG"))
+            return
+
+        if top_num <= 0 or top_num > MemorySnapshotCmdConst.MAX_TOP_NUM:
+            await self._SendMessage(self.translator.GetSentence("PARAM_ERR_MSG"))
+            return
+
+        try:
+            reports = await kwargs["profiling_controller"].GetMemoryProfiles(top_num)
+        except MemoryProfilerNotStartedError:
+            await self._SendMessage(self.translator.GetSentence("MEMORY_NOT_STARTED_ERR_MSG"))
+        else:
+            await self._SendMessage(
+                self.translator.GetSentence(
+                    "MEMORY_SNAPSHOT_CMD",
+                    processes="\n\n".join(self.__BuildReport(report) for report in reports),
+                )
+            )
+
+    def __BuildReport(self,
+                      report: MemoryProfileReport) -> str:
+        """
+        Build the string of a memory profile report.
+
+        Args:
+            report: Memory profile report.
+
+        Returns:
+            Memory profile report string.
+        """
+        sites_str = [
+            self.translator.GetSentence(
+                "MEMORY_SNAPSHOT_SITE_MSG",
+                site=site,
+                size_diff_kb=size_diff / 1024,
+                count_diff=count_diff,
+            )
+            for site, size_diff, count_diff in report.top_sites
+        ]
+        return self.translator.GetSentence(
+            "MEMORY_SNAPSHOT_PROCESS_MSG",
+            pid=report.process_id,
+            traced_mb=report.traced_size / (1024 * 1024),
+            peak_mb=report.traced_peak_size / (1024 * 1024),
+            size_diff_kb=report.size_diff / 1024,
+            objects=", ".join(f"{name} **{count}**" for name, count in report.object_counts.items()),
+            sites=("\n".join(sites_str) if len(sites_str) > 0 else self.translator.GetSentence("MEMORY_SNAPSHOT_NO_SITE_MSG")),
+        )
+
+
+class MemoryStopCmd(CommandBase):
+    """Command to stop memory profiling."""
+
+    @override
+    @MemoryProfilingOnly
+    async def _ExecuteCommand(self,
+                              **kwargs: Any) -> None:
+        """Execute the memory stop command."""
+        await kwargs["profiling_controller"].StopMemoryProfiling()
+        await self._SendMessage(self.translator.GetSentence("MEMORY_STOP_CMD"))
+
+
+class ProfileStartCmdConst:
+    """Constants for profile start command class."""
+
+    DEF_DURATION_SEC: int = 60
+    MAX_DURATION_SEC: int = 600
+
+
+class ProfileStartCmd(CommandBase):
+    """Command to start CPU profiling for a bounded window."""
+
+    @override
+    @CpuProfilingOnly
+    async def _ExecuteCommand(self,
+                              **kwargs: Any) -> None:
+        """Execute the profile start command."""
+        try:
+            duration_sec = self.cmd_data.Params().GetAsInt(0, ProfileStartCmdConst.DEF_DURATION_SEC)
+        except CommandParameterError:
+            await self._SendMessage(self.translator.GetSentence("PARAM_ERR_MSG"))
+            return
+
+        if duration_sec <= 0 or duration_sec > ProfileStartCmdConst.MAX_DURATION_SEC:
+            await self._SendMessage(self.translator.GetSentence("PARAM_ERR_MSG"))
+            return
+
+        try:
+            await kwargs["profiling_controller"].StartCpuProfiling(duration_sec)
+        except SamplingProfilerAlreadyRunningError:
+            await self._SendMessage(self.translator.GetSentence("CPU_PROFILING_RUNNING_ERR_MSG"))
+        else:
+            await self._SendMessage(self.translator.GetSentence("PROFILE_START_CMD", duration_sec=duration_sec))
+
+
+class ProfileStopCmd(CommandBase):
+    """Command to stop CPU profiling before the end of the window."""
+
+    @override
+    @CpuProfilingOnly
+    async def _ExecuteCommand(self,
+                              **kwargs: Any) -> None:
+        """Execute the profile stop command."""
+        files = await kwargs["profiling_controller"].StopCpuProfiling()
+
+        if len(files) == 0:
+            await self._SendMessage(self.translator.GetSentence("PROFILE_STOP_NO_FILE_CMD"))
+        else:
+            await self._SendMessage(
+                self.translator.GetSentence(
+                    "PROFILE_STOP_CMD",
+                    files_list="\n".join(f"• {file_name}" for file_name in files),
+                )
+            )
@@ -19,7 +19,11 @@
 # THE SOFTWARE.
 
 from enum import Enum
-from typing import Any, Dict
+from typing import Any, Dict, Type, TypeVar
+
+
+# Snapshot type (e.g. a NamedTuple with a field for each configuration value)
+ConfigSnapshotType = TypeVar("ConfigSnapshotType")
 
 
 class ConfigTypes(Enum):
@@ -30,10 +34,12 @@ class ConfigObject:
     """Object for storing and accessing configuration values."""
 
     config: Dict[ConfigTypes, Any]
+    snapshots: Dict[type, Any]
 
     def __init__(self) -> None:
         """Initialize an empty configuration object."""
         self.config = {}
+        self.snapshots = {}
 
     def GetValue(self,
                  config_type: ConfigTypes) -> Any:
@@ -68,7 +74,24 @@ class ConfigObject:
         """
         if not isinstance(config_type, ConfigTypes):
             raise TypeError("BotConfig type is not an enumerative of ConfigTypes")
+        # Setting the same value again shall not invalidate the snapshot
+        if config_type in self.config and self.config[config_type] == value:
+            return
         self.config[config_type] = value
+        # Readers holding the previous snapshot keep a consistent view, new readers get the updated one
+        self.snapshots = {}
+
+    def Update(self,
+               config: "ConfigObject") -> None:
+        """
+        Replace all values with the ones of another configuration object.
+        Values are swapped all at once, so readers never see a mix of old and new values.
+
+        Args:
+            config: Configuration object to get values from.
+        """
+        self.config = dict(config.config)
+        self.snapshots = {}
 
     def IsValueSet(self,
                    config_type: ConfigTypes) -> bool:
@@ -82,3 +105,22 @@ class ConfigObject:
             True if the value is set, False otherwise.
         """
         return config_type in self.config
+
+    def Snapshot(self,
+                 snapshot_class: Type[ConfigSnapshotType]) -> ConfigSnapshotType:
+        """
+        Get an immutable snapshot of the configuration values, for fast and typed reads in hot paths.
+        The snapshot class is constructed with a keyword argument for each value, named as the lower-case name of its
+        configuration type. The snapshot is built on first access and replaced as a whole when a value is set.
+
+        Args:
+            snapshot_class: Snapshot class.
+
+        Returns:
+            Snapshot object.
+        """
+        snapshot = self.snapshots.get(snapshot_class)
+        if snapshot is None:
+            snapshot = snapshot_class(**{config_type.name.lower(): value for config_type, value in self.config.items()})
+            self.snapshots[snapshot_class] = snapshot
+        return snapshot
@@ -0,0 +1,268 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import asyncio
+import json
+import time
+from http import HTTPStatus
+from typing import Any, Dict, Optional, Tuple, Union
+
+import pyrogram
+
+from telegram_crypto_price_bot.bot.bot_config_types import BotConfigTypes
+from telegram_crypto_price_bot.coin_info.coin_info_scheduler import CoinInfoScheduler
+from telegram_crypto_price_bot.coin_info.coin_info_shard_worker import CoinInfoShardError
+from telegram_crypto_price_bot.coin_info.coin_info_sharded_scheduler import CoinInfoShardedScheduler
+from telegram_crypto_price_bot.config.config_object import ConfigObject
+from telegram_crypto_price_bot.logger.logger import Logger
+
+
+class HealthServerConst:
+    """Constants for health server class."""
+
+    LIVE_PATH: str = "/health/live"
+    READY_PATH: str = "/health/ready"
+    # Maximum time for a client to send its request
+    REQUEST_TIMEOUT_SEC: float = 5.0
+    # Period of the readiness refresh
+    READINESS_REFRESH_SEC: float = 2.0
+    # Maximum age of the readiness for the bot to be ready (e.g. if refreshing it hangs waiting for shards)
+    READINESS_MAX_AGE_SEC: float = 30.0
+
+
+# HTTP response: (status, body)
+HealthResponse = Tuple[HTTPStatus, Dict[str, Any]]
+
+
+class HealthServer:
+    """
+    Small HTTP server reporting liveness and readiness of the bot, so that orchestrators can restart or drain it.
+    It is served by the event loop of the bot, so a blocked event loop also makes the liveness check fail (by timeout).
+    - GET /health/live: always 200, if the event loop is able to reply
+    - GET /health/ready: 200 if the bot is able to execute tasks in time, 503 otherwise, with the details in the body
+    The readiness is refreshed periodically by a background task and requests only read the last one, so that probes
+    never wait for the scheduler (or for shard processes) and do not add load to the event loop they are measuring.
+    """
+
+    config: ConfigObject
+    logger: Logger
+    client: pyrogram.Client
+    coin_info_scheduler: Union[CoinInfoScheduler, CoinInfoShardedScheduler]
+    server: Optional[asyncio.AbstractServer]
+    refresh_task: Optional[asyncio.Future]
+    readiness: HealthResponse
+    readiness_time: float
+
+    def __init__(self,
+                 config: ConfigObject,
+                 logger: Logger,
+                 client: pyrogram.Client,
+                 coin_info_scheduler: Union[CoinInfoScheduler, CoinInfoShardedScheduler]) -> None:
+        """
+        Initialize the health server.
+
+        Args:
+            config: Configuration object.
+            logger: Logger object.
+            client: Pyrogram client.
+            coin_info_scheduler: Coin info scheduler.
+        """
+        self.config = config
+        self.logger = logger
+        self.client = client
+        self.coin_info_scheduler = coin_info_scheduler
+        self.server = None
+        self.refresh_task = None
+        self.readiness = (HTTPStatus.SERVICE_UNAVAILABLE, {"ready": False})
+        self.readiness_time = 0.0
+
+    async def Start(self) -> None:
+        """Start serving requests."""
+        host = self.config.GetValue(BotConfigTypes.APP_HEALTH_HOST)
+        port = self.config.GetValue(BotConfigTypes.APP_HEALTH_PORT)
+        await self.__RefreshReadiness()
+        self.refresh_task = asyncio.ensure_future(self.__RefreshReadinessPeriodically())
+        self.server = await asyncio.start_server(self.__HandleConnection, host, port)
+        self.logger.GetLogger().info(f"Health server listening on {host}:{port}")
+
+    async def Stop(self) -> None:
+        """Stop serving requests."""
+        if self.refresh_task is not None:
+            self.refresh_task.cancel()
+            self.refresh_task = None
+        if self.server is None:
+            return
+        self.server.close()
+        await self.server.wait_closed()
+        self.server = None
+
+    def GetReadiness(self) -> HealthResponse:
+        """
+        Get the last refreshed readiness of the bot.
+        The bot is not ready if the readiness was not refreshed recently.
+
+        Returns:
+            HTTP status and body.
+        """
+        status, body = self.readiness
+        readiness_age = time.monotonic() - self.readiness_time
+        if readiness_age <= HealthServerConst.READINESS_MAX_AGE_SEC:
+            return status, body
+        return HTTPStatus.SERVICE_UNAVAILABLE, {**body, "readiness_age_sec": round(readiness_age, 3), "ready": False}
+
+    async def __RefreshReadinessPeriodically(self) -> None:
+        """Refresh the readiness periodically, until cancelled."""
+        while True:
+            await asyncio.sleep(HealthServerConst.READINESS_REFRESH_SEC)
+            await self.__RefreshReadiness()
+
+    async def __RefreshReadiness(self) -> None:
+        """Refresh the readiness of the bot."""
+        try:
+            self.readiness = await self.__ComputeReadiness()
+        except Exception:
+            self.logger.GetLogger().exception("An error occurred while refreshing readiness")
+            self.readiness = (HTTPStatus.SERVICE_UNAVAILABLE, {"ready": False})
+        self.readiness_time = time.monotonic()
+
+    async def __ComputeReadiness(self) -> HealthResponse:
+        """
+        Compute the readiness of the bot.
+        The bot is not ready if it is not connected to Telegram, if the scheduler is not running, or if it is overloaded
+        (i.e. the task queue is full or the event loop was recently late). The other values are only reported.
+
+        Returns:
+            HTTP status and body.
+        """
+        body: Dict[str, Any] = {
+            "telegram_connected": bool(self.client.is_connected),
+        }
+        try:
+            stats = await self.coin_info_scheduler.GetStats()
+        except CoinInfoShardError:
+            body["scheduler_running"] = False
+            body["ready"] = False
+            return HTTPStatus.SERVICE_UNAVAILABLE, body
+
+        max_loop_lag = self.config.GetValue(BotConfigTypes.APP_HEALTH_MAX_LOOP_LAG_MS) / 1000
+        body.update({
+            "scheduler_running": stats.running,
+            "queue_depth": stats.queue_depth,
+            "queue_max_size": self.config.GetValue(BotConfigTypes.TASKS_QUEUE_MAX_SIZE),
+            "queue_full": stats.queue_full,
+            "last_task_run_age_sec": (
+                round(time.time() - stats.queue_last_run_time, 3) if stats.queue_last_run_time > 0 else None
+            ),
+            "coingecko_circuit_state": stats.circuit_breaker_stats.state.name.lower(),
+            "loop_recent_max_lag_sec": round(stats.loop_lag_stats.recent_max_lag, 3),
+            "loop_avg_lag_sec": round(stats.loop_lag_stats.AverageLag(), 3),
+            "loop_max_lag_sec": round(stats.loop_lag_stats.max_lag, 3),
+        })
+        body["ready"] = (
+            body["telegram_connected"]
+            and body["scheduler_running"]
+            and not stats.queue_full
+            and stats.loop_lag_stats.recent_max_lag <= max_loop_lag
+        )
+        return (HTTPStatus.OK if body["ready"] else HTTPStatus.SERVICE_UNAVAILABLE), body
+
+    async def __HandleConnection(self,
+                                 reader: asyncio.StreamReader,
+                                 writer: asyncio.StreamWriter) -> None:
+        """
+        Handle a client connection, serving a single request.
+
+        Args:
+            reader: Stream reader.
+            writer: Stream writer.
+        """
+        try:
+            request_line = await asyncio.wait_for(self.__ReadRequest(reader), HealthServerConst.REQUEST_TIMEOUT_SEC)
+            status, body = await self.__GetResponse(request_line)
+            self.__WriteResponse(writer, status, body)
+            await writer.drain()
+        except (asyncio.TimeoutError, ConnectionError, asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+            pass
+        except Exception:
+            self.logger.GetLogger().exception("An error occurred while serving health request")
+        finally:
+            writer.close()
+
+    async def __GetResponse(self,
+                            request_line: str) -> HealthResponse:
+        """
+        Get the response to a request.
+
+        Args:
+            request_line: Request line (e.g. "GET /health/live HTTP/1.1").
+
+        Returns:
+            HTTP status and body.
+        """
+        try:
+            method, path, _ = request_line.split()
+        except ValueError:
+            return HTTPStatus.BAD_REQUEST, {}
+        if path not in (HealthServerConst.LIVE_PATH, HealthServerConst.READY_PATH):
+            return HTTPStatus.NOT_FOUND, {}
+        if method != "GET":
+            return HTTPStatus.METHOD_NOT_ALLOWED, {}
+        if path == HealthServerConst.LIVE_PATH:
+            return HTTPStatus.OK, {"alive": True}
+        return self.GetReadiness()
+
+    @staticmethod
+    async def __ReadRequest(reader: asyncio.StreamReader) -> str:
+        """
+        Read a request, returning its request line (headers are not used).
+
+        Args:
+            reader: Stream reader.
+
+        Returns:
+            Request line.
+        """
+        request_line = (await reader.readuntil(b"\r\n")).decode("latin-1").strip()
+        while (await reader.readuntil(b"\r\n")) != b"\r\n":
+            pass
+        return request_line
+
+    @staticmethod
+    def __WriteResponse(writer: asyncio.StreamWriter,
+                        status: HTTPStatus,
+                        body: Dict[str, Any]) -> None:
+        """
+        Write a response, closing the connection after it.
+
+        Args:
+            writer: Stream writer.
+            status: HTTP status.
+            body: Body, sent as JSON.
+        """
+        body_bytes = json.dumps(body).encode("utf-8")
+        writer.write(
+            (
+                f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+                "Content-Type: application/json\r\n"
+                f"Content-Length: {len(body_bytes)}\r\n"
+                "Connection: close\r\n"
+                "\r\n"
+            ).encode("latin-1") + body_bytes
+        )
@@ -18,50 +18,21 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 
+
 from typing import Any
 
 import pyrogram
 from typing_extensions import override
 
-from telegram_crypto_price_bot.chart_info.chart_info_file_saver import ChartInfoTmpFileSaver
-from telegram_crypto_price_bot.config.config_object import ConfigObject
 from telegram_crypto_price_bot.info_message_sender.info_message_sender_base import InfoMessageSenderBase
-from telegram_crypto_price_bot.logger.logger import Logger
-from telegram_crypto_price_bot.price_info.price_info_builder import PriceInfoBuilder
-from telegram_crypto_price_bot.translation.translation_loader import TranslationLoader
 
 
 class ChartPriceInfoMessageSender(InfoMessageSenderBase):
     """Message sender for chart and price information in the same message."""
 
-    config: ConfigObject
-    logger: Logger
-    translator: TranslationLoader
-    price_info_builder: PriceInfoBuilder
-
-    def __init__(self,
-                 client: pyrogram.Client,
-                 config: ConfigObject,
-                 logger: Logger,
-                 translator: TranslationLoader) -> None:
-        """
-        Initialize the chart price info message sender.
-
-        Args:
-            client: Pyrogram client instance
-            config: Configuration object
-            logger: Logger instance
-            translator: Translation loader
-        """
-        super().__init__(client, config, logger)
-        self.config = config
-        self.logger = logger
-        self.translator = translator
-        self.price_info_builder = PriceInfoBuilder(config, translator)
-
     @override
     async def _SendMessage(self,
-                           chat: pyrogram.types.Chat,
+                           chat_id: int,
                            topic_id: int,
                            *args: Any,
                            **kwargs: Any) -> pyrogram.types.Message:
@@ -69,9 +40,9 @@ class ChartPriceInfoMessageSender(InfoMessageSenderBase):
         Send chart image with price information as caption.
 
         Args:
-            chat: Telegram chat to send message to
+            chat_id: ID of the Telegram chat to send message to
             topic_id: Telegram topic to send message to
-            *args: Arguments containing coin_id, coin_vs, last_days
+            *args: Arguments containing the coin info content
             **kwargs: Additional keyword arguments
 
         Returns:
@@ -80,18 +51,41 @@ class ChartPriceInfoMessageSender(InfoMessageSenderBase):
         Raises:
             RuntimeError: If unable to save chart to file
         """
-        chart_info = await self._CoinGeckoPriceApi().GetChartInfo(args[0], args[1], args[2])
-        price_info = await self._CoinGeckoPriceApi().GetPriceInfo(args[0], args[1])
+        content = args[0]
+        message = await self._MessageSender().SendPhoto(chat_id,
+                                                        topic_id,
+                                                        content.Photo(),
+                                                        caption=content.PriceInfo(),
+                                                        **kwargs)
+        content.SetSentPhoto(message)
+        return message
 
-        price_info_str = self.price_info_builder.Build(price_info)
-        chart_info_saver = ChartInfoTmpFileSaver(self.config, self.logger, self.translator)
-        chart_info_saver.SaveToTmpFile(chart_info)
-        tmp_file_name = chart_info_saver.TmpFileName()
-        if tmp_file_name is None:
-            raise RuntimeError("Unable to save chart to file")
+    @override
+    async def _EditMessage(self,
+                           chat_id: int,
+                           message_id: int,
+                           *args: Any,
+                           **kwargs: Any) -> pyrogram.types.Message:
+        """
+        Replace the chart image and price information caption of a message.
 
-        return await self._MessageSender().SendPhoto(chat,
-                                                     topic_id,
-                                                     tmp_file_name,
-                                                     caption=price_info_str,
-                                                     **kwargs)
+        Args:
+            chat_id: ID of the Telegram chat containing the message
+            message_id: ID of the message to edit
+            *args: Arguments containing the coin info content
+            **kwargs: Additional keyword arguments
+
+        Returns:
+            Edited message object
+
+        Raises:
+            RuntimeError: If unable to save chart to file
+        """
+        content = args[0]
+        edited_message = await self._MessageSender().EditMessagePhoto(chat_id,
+                                                                      message_id,
+                                                                      content.Photo(),
+                                                                      caption=content.PriceInfo(),
+                                                                      **kwargs)
+        content.SetSentPhoto(edited_message)
+        return edited_message
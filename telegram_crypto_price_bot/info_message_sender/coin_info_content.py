@@ -0,0 +1,207 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+from typing import Optional
+
+import pyrogram
+
+from telegram_crypto_price_bot.bot.bot_config_snapshot import BotConfigSnapshot
+from telegram_crypto_price_bot.chart_info.chart_info_file_saver import ChartInfoTmpFileSaver
+from telegram_crypto_price_bot.coingecko.coingecko_price_api import CoinGeckoPriceApi
+from telegram_crypto_price_bot.config.config_object import ConfigObject
+from telegram_crypto_price_bot.logger.logger import Logger
+from telegram_crypto_price_bot.price_info.price_info_builder import PriceInfoBuilder
+from telegram_crypto_price_bot.profiling.tracer import tracer
+from telegram_crypto_price_bot.translation.translation_loader import TranslationLoader
+
+
+class CoinInfoContent:
+    """
+    Content of a coin info message, built once and sent to any number of chats.
+    After the chart is uploaded the first time, the uploaded photo is reused for next sends.
+    """
+
+    same_msg: bool
+    price_info_str: str
+    chart_info_saver: Optional[ChartInfoTmpFileSaver]
+    chart_caption: str
+    photo_file_id: Optional[str]
+
+    def __init__(self,
+                 same_msg: bool,
+                 price_info_str: str,
+                 chart_info_saver: Optional[ChartInfoTmpFileSaver],
+                 chart_caption: str) -> None:
+        """
+        Initialize the content.
+
+        Args:
+            same_msg: True if chart and price shall be sent in the same message, False otherwise
+            price_info_str: Price information
+            chart_info_saver: Chart saved to a temporary file (None if the chart is not displayed)
+            chart_caption: Caption of the chart when sent in a separate message
+        """
+        self.same_msg = same_msg
+        self.price_info_str = price_info_str
+        self.chart_info_saver = chart_info_saver
+        self.chart_caption = chart_caption
+        self.photo_file_id = None
+
+    def IsSameMessage(self) -> bool:
+        """
+        Get if chart and price shall be sent in the same message.
+
+        Returns:
+            True if same message, False otherwise
+        """
+        return self.same_msg
+
+    def HasChart(self) -> bool:
+        """
+        Get if the content has a chart.
+
+        Returns:
+            True if chart is present, False otherwise
+        """
+        return self.chart_info_saver is not None
+
+    def PriceInfo(self) -> str:
+        """
+        Get the price information.
+
+        Returns:
+            Price information
+        """
+        return self.price_info_str
+
+    def ChartCaption(self) -> str:
+        """
+        Get the caption of the chart when sent in a separate message.
+
+        Returns:
+            Chart caption, empty if none
+        """
+        return self.chart_caption
+
+    def Photo(self) -> str:
+        """
+        Get the chart photo to be sent, i.e. the uploaded photo if any, the temporary file otherwise.
+
+        Returns:
+            Photo file ID or path
+
+        Raises:
+            RuntimeError: If unable to save chart to file
+        """
+        if self.photo_file_id is not None:
+            return self.photo_file_id
+
+        tmp_file_name = self.chart_info_saver.TmpFileName() if self.chart_info_saver is not None else None
+        if tmp_file_name is None:
+            raise RuntimeError("Unable to save chart to file")
+        return tmp_file_name
+
+    def SetSentPhoto(self,
+                     message: pyrogram.types.Message) -> None:
+        """
+        Store the photo of a sent message, so that it is reused instead of uploading the chart again.
+
+        Args:
+            message: Sent message
+        """
+        if self.photo_file_id is None and message.photo is not None:
+            self.photo_file_id = message.photo.file_id
+
+
+class CoinInfoContentBuilder:
+    """Builder of coin info content, fetching price data and rendering the chart."""
+
+    config: ConfigObject
+    logger: Logger
+    translator: TranslationLoader
+    coingecko_api: CoinGeckoPriceApi
+    price_info_builder: PriceInfoBuilder
+
+    def __init__(self,
+                 config: ConfigObject,
+                 logger: Logger,
+                 translator: TranslationLoader) -> None:
+        """
+        Initialize the content builder.
+
+        Args:
+            config: Configuration object
+            logger: Logger instance
+            translator: Translation loader
+        """
+        self.config = config
+        self.logger = logger
+        self.translator = translator
+        self.coingecko_api = CoinGeckoPriceApi(config, logger)
+        self.price_info_builder = PriceInfoBuilder(config, translator)
+
+    async def Build(self,
+                    coin_id: str,
+                    coin_vs: str,
+                    last_days: int,
+                    same_msg: bool,
+                    fresh_max_age_sec: float = 0.0) -> CoinInfoContent:
+        """
+        Build the content of a coin info message.
+
+        Args:
+            coin_id: Cryptocurrency coin identifier
+            coin_vs: Currency to compare against
+            last_days: Number of days of historical data
+            same_msg: True to send chart and price in the same message, False otherwise
+            fresh_max_age_sec: Maximum age in seconds of cached data used without requesting it (0 to always request data)
+
+        Returns:
+            Coin info content
+
+        Raises:
+            CoinGeckoPriceApiError: If unable to get data from CoinGecko
+        """
+        with tracer.Span("price_info_fetch"):
+            price_info = await self.coingecko_api.GetPriceInfo(coin_id, coin_vs, fresh_max_age_sec)
+        with tracer.Span("price_info_build"):
+            price_info_str = self.price_info_builder.Build(price_info)
+        if not self.config.Snapshot(BotConfigSnapshot).chart_display:
+            return CoinInfoContent(False, price_info_str, None, "")
+
+        with tracer.Span("chart_info_fetch"):
+            chart_info = await self.coingecko_api.GetChartInfo(coin_id, coin_vs, last_days, fresh_max_age_sec)
+        chart_info_saver = ChartInfoTmpFileSaver(self.config, self.logger, self.translator)
+        with tracer.Span("chart_render"):
+            await chart_info_saver.SaveToTmpFile(chart_info)
+
+        stale_str = (
+            self.translator.GetSentence("STALE_DATA_MSG", age_min=chart_info.AgeMinutes())
+            if chart_info.IsStale()
+            else ""
+        )
+        if not same_msg:
+            return CoinInfoContent(False, price_info_str, chart_info_saver, stale_str)
+
+        # Stale price is already marked by the builder
+        if stale_str and not price_info.IsStale():
+            price_info_str += "\n" + stale_str
+        return CoinInfoContent(True, price_info_str, chart_info_saver, "")
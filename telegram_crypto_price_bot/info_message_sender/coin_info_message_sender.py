@@ -18,30 +18,38 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 
+from typing import Optional, Tuple
+
 import pyrogram
 
-from telegram_crypto_price_bot.bot.bot_config_types import BotConfigTypes
 from telegram_crypto_price_bot.coingecko.coingecko_price_api import CoinGeckoPriceApiError
 from telegram_crypto_price_bot.config.config_object import ConfigObject
 from telegram_crypto_price_bot.info_message_sender.chart_info_message_sender import ChartInfoMessageSender
 from telegram_crypto_price_bot.info_message_sender.chart_price_info_message_sender import ChartPriceInfoMessageSender
+from telegram_crypto_price_bot.info_message_sender.coin_info_content import CoinInfoContent, CoinInfoContentBuilder
+from telegram_crypto_price_bot.info_message_sender.coin_info_message_state import CoinInfoMessageState
 from telegram_crypto_price_bot.info_message_sender.price_info_message_sender import PriceInfoMessageSender
 from telegram_crypto_price_bot.logger.logger import Logger
+from telegram_crypto_price_bot.message.message_deleter import MessageDeleter
 from telegram_crypto_price_bot.message.message_sender import MessageSender
 from telegram_crypto_price_bot.translation.translation_loader import TranslationLoader
 
 
 class CoinInfoMessageSender:
-    """Message sender for cryptocurrency information combining chart and price data."""
+    """
+    Message sender for cryptocurrency information combining chart and price data.
+    It is stateless, so a single instance is shared by all jobs: the sending flags and the last sent messages
+    of each chat are kept in its message state.
+    """
 
     config: ConfigObject
     logger: Logger
     translator: TranslationLoader
-    delete_last_sent_msg: bool
-    send_in_same_msg: bool
+    content_builder: CoinInfoContentBuilder
     chart_price_info_msg_sender: ChartPriceInfoMessageSender
     chart_info_msg_sender: ChartInfoMessageSender
     price_info_msg_sender: PriceInfoMessageSender
+    msg_deleter: MessageDeleter
     msg_sender: MessageSender
 
     def __init__(self,
@@ -61,74 +69,156 @@ class CoinInfoMessageSender:
         self.config = config
         self.logger = logger
         self.translator = translator
-        self.delete_last_sent_msg = True
-        self.send_in_same_msg = True
-        self.chart_price_info_msg_sender = ChartPriceInfoMessageSender(client, config, logger, translator)
-        self.chart_info_msg_sender = ChartInfoMessageSender(client, config, logger, translator)
-        self.price_info_msg_sender = PriceInfoMessageSender(client, config, logger, translator)
+        self.content_builder = CoinInfoContentBuilder(config, logger, translator)
+        self.chart_price_info_msg_sender = ChartPriceInfoMessageSender(client, logger)
+        self.chart_info_msg_sender = ChartInfoMessageSender(client, logger)
+        self.price_info_msg_sender = PriceInfoMessageSender(client, logger)
+        self.msg_deleter = MessageDeleter(client, logger)
         self.msg_sender = MessageSender(client, logger)
 
-    def DeleteLastSentMessage(self,
-                              flag: bool) -> None:
+    async def SendMessage(self,
+                          state: CoinInfoMessageState,
+                          coin_id: str,
+                          coin_vs: str,
+                          last_days: int) -> None:
         """
-        Set whether to delete the last sent message.
+        Send cryptocurrency information message to chat.
 
         Args:
-            flag: True to delete last message, False otherwise
+            state: Message state of the chat
+            coin_id: Cryptocurrency coin identifier
+            coin_vs: Currency to compare against
+            last_days: Number of days of historical data
         """
-        self.delete_last_sent_msg = flag
+        try:
+            content = await self.content_builder.Build(coin_id, coin_vs, last_days, state.IsSameMessage())
+        except CoinGeckoPriceApiError:
+            self.logger.GetLogger().exception(
+                f"Coingecko API error when retrieving data for coin {coin_id}/{coin_vs}"
+            )
+            await self.SendApiError(state, coin_id, coin_vs)
+        else:
+            await self.SendContent(state, content)
 
-    def SendInSameMessage(self,
-                          flag: bool) -> None:
+    async def SendContent(self,
+                          state: CoinInfoMessageState,
+                          content: CoinInfoContent) -> None:
         """
-        Set whether to send chart and price in the same message.
+        Send an already built cryptocurrency information content to chat.
+        If the last sent messages are edited, only the messages that could not be edited are sent again.
 
         Args:
-            flag: True to send in same message, False otherwise
+            state: Message state of the chat
+            content: Coin info content
         """
-        self.send_in_same_msg = flag
+        chat_id = state.ChatId()
+        topic_id = state.TopicId()
 
-    async def SendMessage(self,
-                          chat: pyrogram.types.Chat,
-                          topic_id: int,
-                          coin_id: str,
-                          coin_vs: str,
-                          last_days: int) -> None:
+        price_edited = chart_edited = False
+        if state.IsEditLastSentMessage():
+            self.logger.GetLogger().info(f"Editing price info in {chat_id} ({topic_id})")
+            price_edited, chart_edited = await self.__EditLastSentMessages(state, content)
+            if price_edited and chart_edited:
+                return
+            self.logger.GetLogger().info("Unable to edit the last sent message, sending a new one")
+
+        if state.IsDeleteLastSentMessage():
+            await self.__DeleteLastSentMessages(state, price_edited)
+
+        self.logger.GetLogger().info(f"Sending price info to {chat_id} ({topic_id})")
+
+        if content.IsSameMessage():
+            state.SetLastChartPriceMessageId(
+                await self.chart_price_info_msg_sender.SendMessage(chat_id, topic_id, content)
+            )
+        else:
+            if not price_edited:
+                state.SetLastPriceMessageId(
+                    await self.price_info_msg_sender.SendMessage(chat_id, topic_id, content)
+                )
+
+            if content.HasChart():
+                state.SetLastChartMessageId(
+                    await self.chart_info_msg_sender.SendMessage(chat_id, topic_id, content)
+                )
+
+    async def SendApiError(self,
+                           state: CoinInfoMessageState,
+                           coin_id: str,
+                           coin_vs: str) -> None:
         """
-        Send cryptocurrency information message to chat.
+        Notify a CoinGecko API error to the chat.
+        The last sent messages are deleted (if enabled), unless they are edited in place.
 
         Args:
-            chat: Telegram chat to send message to
-            topic_id: Telegram topic to send message to
+            state: Message state of the chat
             coin_id: Cryptocurrency coin identifier
             coin_vs: Currency to compare against
-            last_days: Number of days of historical data
         """
-        if self.delete_last_sent_msg:
-            await self.chart_info_msg_sender.DeleteLastSentMessage()
-            await self.chart_price_info_msg_sender.DeleteLastSentMessage()
-            await self.price_info_msg_sender.DeleteLastSentMessage()
-
-        self.logger.GetLogger().info(
-            f"Sending price info {coin_id}/{coin_vs} (last days: {last_days}) to {chat.id} ({topic_id})"
+        if state.IsDeleteLastSentMessage() and not state.IsEditLastSentMessage():
+            await self.__DeleteLastSentMessages(state)
+
+        await self.msg_sender.SendMessage(
+            state.ChatId(),
+            state.TopicId(),
+            self.translator.GetSentence("API_ERR_MSG",
+                                        coin_id=coin_id,
+                                        coin_vs=coin_vs)
         )
 
-        try:
-            if self.send_in_same_msg and self.config.GetValue(BotConfigTypes.CHART_DISPLAY):
-                await self.chart_price_info_msg_sender.SendMessage(chat, topic_id, coin_id, coin_vs, last_days)
-            else:
-                await self.price_info_msg_sender.SendMessage(chat, topic_id, coin_id, coin_vs)
+    async def __DeleteLastSentMessages(self,
+                                       state: CoinInfoMessageState,
+                                       keep_price: bool = False) -> None:
+        """
+        Delete the last sent messages.
 
-                if self.config.GetValue(BotConfigTypes.CHART_DISPLAY):
-                    await self.chart_info_msg_sender.SendMessage(chat, topic_id, coin_id, coin_vs, last_days)
-        except CoinGeckoPriceApiError:
-            self.logger.GetLogger().exception(
-                f"Coingecko API error when retrieving data for coin {coin_id}/{coin_vs}"
-            )
-            await self.msg_sender.SendMessage(
-                chat,
-                topic_id,
-                self.translator.GetSentence("API_ERR_MSG",
-                                            coin_id=coin_id,
-                                            coin_vs=coin_vs)
-            )
+        Args:
+            state: Message state of the chat
+            keep_price: True to keep the price message (e.g. if just edited), False otherwise
+        """
+        await self.__DeleteMessage(state, state.LastChartMessageId())
+        state.SetLastChartMessageId(None)
+        await self.__DeleteMessage(state, state.LastChartPriceMessageId())
+        state.SetLastChartPriceMessageId(None)
+        if not keep_price:
+            await self.__DeleteMessage(state, state.LastPriceMessageId())
+            state.SetLastPriceMessageId(None)
+
+    async def __DeleteMessage(self,
+                              state: CoinInfoMessageState,
+                              msg_id: Optional[int]) -> None:
+        """
+        Delete a message if it exists.
+
+        Args:
+            state: Message state of the chat
+            msg_id: Message ID, None if no message
+        """
+        if msg_id is not None:
+            await self.msg_deleter.DeleteMessage(state.ChatId(), msg_id)
+
+    async def __EditLastSentMessages(self,
+                                     state: CoinInfoMessageState,
+                                     content: CoinInfoContent) -> Tuple[bool, bool]:
+        """
+        Edit the last sent messages in place.
+        In separate messages mode, the chart is edited only if the price was, otherwise both are sent again in order.
+
+        Args:
+            state: Message state of the chat
+            content: Coin info content
+
+        Returns:
+            Tuple of flags, True if the price and the chart (True if no chart) were edited, False otherwise
+        """
+        chat_id = state.ChatId()
+
+        if content.IsSameMessage():
+            edited = await self.chart_price_info_msg_sender.EditMessage(chat_id, state.LastChartPriceMessageId(), content)
+            return edited, edited
+
+        if not await self.price_info_msg_sender.EditMessage(chat_id, state.LastPriceMessageId(), content):
+            return False, False
+        if content.HasChart():
+            return True, await self.chart_info_msg_sender.EditMessage(chat_id, state.LastChartMessageId(), content)
+        return True, True
@@ -0,0 +1,217 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+from typing import Optional
+
+from telegram_crypto_price_bot.misc.helpers import ChatHelper
+
+
+class CoinInfoMessageState:
+    """
+    State of the coin info messages of a chat: destination, sending flags and IDs of the last sent messages.
+    It uses slots, since there is one for each job.
+    """
+
+    __slots__ = (
+        "chat_id",
+        "chat_title",
+        "topic_id",
+        "delete_last_sent_msg",
+        "edit_last_sent_msg",
+        "send_in_same_msg",
+        "last_chart_price_msg_id",
+        "last_price_msg_id",
+        "last_chart_msg_id",
+    )
+
+    chat_id: int
+    chat_title: Optional[str]
+    topic_id: int
+    delete_last_sent_msg: bool
+    edit_last_sent_msg: bool
+    send_in_same_msg: bool
+    last_chart_price_msg_id: Optional[int]
+    last_price_msg_id: Optional[int]
+    last_chart_msg_id: Optional[int]
+
+    def __init__(self,
+                 chat_id: int,
+                 chat_title: Optional[str],
+                 topic_id: int) -> None:
+        """
+        Initialize the message state.
+
+        Args:
+            chat_id: ID of the Telegram chat where messages are sent.
+            chat_title: Title of the Telegram chat (None if no title).
+            topic_id: Telegram topic where messages are sent.
+        """
+        self.chat_id = chat_id
+        self.chat_title = chat_title
+        self.topic_id = topic_id
+        self.delete_last_sent_msg = True
+        self.edit_last_sent_msg = False
+        self.send_in_same_msg = True
+        self.last_chart_price_msg_id = None
+        self.last_price_msg_id = None
+        self.last_chart_msg_id = None
+
+    def ChatId(self) -> int:
+        """
+        Get the chat ID.
+
+        Returns:
+            Telegram chat ID.
+        """
+        return self.chat_id
+
+    def ChatTitleOrId(self) -> str:
+        """
+        Get the chat title with ID or just ID if no title, for logging.
+
+        Returns:
+            Chat title with ID or just ID.
+        """
+        return ChatHelper.FormatTitleOrId(self.chat_id, self.chat_title)
+
+    def TopicId(self) -> int:
+        """
+        Get the topic ID.
+
+        Returns:
+            Telegram topic ID.
+        """
+        return self.topic_id
+
+    def DeleteLastSentMessage(self,
+                              flag: bool) -> None:
+        """
+        Set whether to delete the last sent message.
+
+        Args:
+            flag: True to delete last message, False otherwise
+        """
+        self.delete_last_sent_msg = flag
+
+    def IsDeleteLastSentMessage(self) -> bool:
+        """
+        Get whether the last sent message is deleted.
+
+        Returns:
+            True if deleted, False otherwise
+        """
+        return self.delete_last_sent_msg
+
+    def EditLastSentMessage(self,
+                            flag: bool) -> None:
+        """
+        Set whether to edit the last sent message in place instead of sending a new one.
+        If the last message cannot be edited, a new one is sent (deleting the last one if enabled).
+
+        Args:
+            flag: True to edit last message, False otherwise
+        """
+        self.edit_last_sent_msg = flag
+
+    def IsEditLastSentMessage(self) -> bool:
+        """
+        Get whether the last sent message is edited in place.
+
+        Returns:
+            True if edited, False otherwise
+        """
+        return self.edit_last_sent_msg
+
+    def SendInSameMessage(self,
+                          flag: bool) -> None:
+        """
+        Set whether to send chart and price in the same message.
+
+        Args:
+            flag: True to send in same message, False otherwise
+        """
+        self.send_in_same_msg = flag
+
+    def IsSameMessage(self) -> bool:
+        """
+        Get whether chart and price are sent in the same message.
+
+        Returns:
+            True if sent in same message, False otherwise
+        """
+        return self.send_in_same_msg
+
+    def LastChartPriceMessageId(self) -> Optional[int]:
+        """
+        Get the ID of the last sent chart and price message.
+
+        Returns:
+            Message ID, None if no message
+        """
+        return self.last_chart_price_msg_id
+
+    def SetLastChartPriceMessageId(self,
+                                   msg_id: Optional[int]) -> None:
+        """
+        Set the ID of the last sent chart and price message.
+
+        Args:
+            msg_id: Message ID, None if no message
+        """
+        self.last_chart_price_msg_id = msg_id
+
+    def LastPriceMessageId(self) -> Optional[int]:
+        """
+        Get the ID of the last sent price message.
+
+        Returns:
+            Message ID, None if no message
+        """
+        return self.last_price_msg_id
+
+    def SetLastPriceMessageId(self,
+                              msg_id: Optional[int]) -> None:
+        """
+        Set the ID of the last sent price message.
+
+        Args:
+            msg_id: Message ID, None if no message
+        """
+        self.last_price_msg_id = msg_id
+
+    def LastChartMessageId(self) -> Optional[int]:
+        """
+        Get the ID of the last sent chart message.
+
+        Returns:
+            Message ID, None if no message
+        """
+        return self.last_chart_msg_id
+
+    def SetLastChartMessageId(self,
+                              msg_id: Optional[int]) -> None:
+        """
+        Set the ID of the last sent chart message.
+
+        Args:
+            msg_id: Message ID, None if no message
+        """
+        self.last_chart_msg_id = msg_id
@@ -22,70 +22,83 @@ from abc import ABC, abstractmethod
 from typing import Any, Optional
 
 import pyrogram
+from pyrogram.errors import MessageNotModified, RPCError
 
-from telegram_crypto_price_bot.coingecko.coingecko_price_api import CoinGeckoPriceApi
-from telegram_crypto_price_bot.config.config_object import ConfigObject
 from telegram_crypto_price_bot.logger.logger import Logger
-from telegram_crypto_price_bot.message.message_deleter import MessageDeleter
 from telegram_crypto_price_bot.message.message_sender import MessageSender
 
 
 class InfoMessageSenderBase(ABC):
-    """Abstract base class for information message senders."""
+    """
+    Abstract base class for information message senders.
+    Senders are stateless and shared by all jobs: the IDs of the sent messages are returned to the caller,
+    that keeps them to edit or delete the messages later.
+    """
 
-    last_sent_msg: Optional[pyrogram.types.Message]
-    coingecko_api: CoinGeckoPriceApi
-    message_deleter: MessageDeleter
+    logger: Logger
     message_sender: MessageSender
 
     def __init__(self,
                  client: pyrogram.Client,
-                 config: ConfigObject,
                  logger: Logger) -> None:
         """
         Initialize the info message sender base.
 
         Args:
             client: Pyrogram client instance.
-            config: Configuration object.
             logger: Logger instance.
         """
-        self.last_sent_msg = None
-        self.coingecko_api = CoinGeckoPriceApi(config, logger)
-        self.message_deleter = MessageDeleter(client, logger)
+        self.logger = logger
         self.message_sender = MessageSender(client, logger)
 
     async def SendMessage(self,
-                          chat: pyrogram.types.Chat,
+                          chat_id: int,
                           topic_id: int,
                           *args: Any,
-                          **kwargs: Any) -> None:
+                          **kwargs: Any) -> int:
         """
-        Send message and store the last sent message.
+        Send message.
 
         Args:
-            chat: Telegram chat to send message to.
+            chat_id: ID of the Telegram chat to send message to.
             topic_id: Telegram topic to send message to.
             *args: Additional positional arguments.
             **kwargs: Additional keyword arguments.
-        """
-        self.last_sent_msg = await self._SendMessage(chat, topic_id, *args, **kwargs)
-
-    async def DeleteLastSentMessage(self) -> None:
-        """Delete the last sent message if it exists."""
-        if self.last_sent_msg is not None:
-            await self.message_deleter.DeleteMessage(self.last_sent_msg)
 
-        self.last_sent_msg = None
+        Returns:
+            ID of the sent message.
+        """
+        return (await self._SendMessage(chat_id, topic_id, *args, **kwargs)).id
 
-    def _CoinGeckoPriceApi(self) -> CoinGeckoPriceApi:
+    async def EditMessage(self,
+                          chat_id: int,
+                          message_id: Optional[int],
+                          *args: Any,
+                          **kwargs: Any) -> bool:
         """
-        Get the CoinGecko API instance.
+        Edit a message in place, with updated information.
+
+        Args:
+            chat_id: ID of the Telegram chat containing the message.
+            message_id: ID of the message to edit, None if there is no message.
+            *args: Additional positional arguments.
+            **kwargs: Additional keyword arguments.
 
         Returns:
-            CoinGecko API instance.
+            True if edited (or already up to date), False if there is no message to edit or it cannot be edited.
         """
-        return self.coingecko_api
+        if message_id is None:
+            return False
+
+        try:
+            await self._EditMessage(chat_id, message_id, *args, **kwargs)
+        except MessageNotModified:
+            # Same content, the message is already up to date
+            pass
+        except RPCError:
+            self.logger.GetLogger().exception(f"Unable to edit message {message_id}")
+            return False
+        return True
 
     def _MessageSender(self) -> MessageSender:
         """
@@ -98,7 +111,7 @@ class InfoMessageSenderBase(ABC):
 
     @abstractmethod
     async def _SendMessage(self,
-                           chat: pyrogram.types.Chat,
+                           chat_id: int,
                            topic_id: int,
                            *args: Any,
                            **kwargs: Any) -> pyrogram.types.Message:
@@ -106,7 +119,7 @@ class InfoMessageSenderBase(ABC):
         Send message implementation to be provided by subclasses.
 
         Args:
-            chat: Telegram chat to send message to
+            chat_id: ID of the Telegram chat to send message to
             topic_id: Telegram topic to send message to
             *args: Additional positional arguments
             **kwargs: Additional keyword arguments
@@ -114,3 +127,22 @@ class InfoMessageSenderBase(ABC):
         Returns:
             Sent message object
         """
+
+    @abstractmethod
+    async def _EditMessage(self,
+                           chat_id: int,
+                           message_id: int,
+                           *args: Any,
+                           **kwargs: Any) -> pyrogram.types.Message:
+        """
+        Edit message implementation to be provided by subclasses.
+
+        Args:
+            chat_id: ID of the Telegram chat containing the message
+            message_id: ID of the message to edit
+            *args: Additional positional arguments
+            **kwargs: Additional keyword arguments
+
+        Returns:
+            Edited message object
+        """
@@ -18,43 +18,21 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 
+
 from typing import Any
 
 import pyrogram
 from typing_extensions import override
 
-from telegram_crypto_price_bot.config.config_object import ConfigObject
 from telegram_crypto_price_bot.info_message_sender.info_message_sender_base import InfoMessageSenderBase
-from telegram_crypto_price_bot.logger.logger import Logger
-from telegram_crypto_price_bot.price_info.price_info_builder import PriceInfoBuilder
-from telegram_crypto_price_bot.translation.translation_loader import TranslationLoader
 
 
 class PriceInfoMessageSender(InfoMessageSenderBase):
     """Message sender for price information in a single message."""
 
-    price_info_builder: PriceInfoBuilder
-
-    def __init__(self,
-                 client: pyrogram.Client,
-                 config: ConfigObject,
-                 logger: Logger,
-                 translator: TranslationLoader) -> None:
-        """
-        Initialize the price info message sender.
-
-        Args:
-            client: Pyrogram client instance
-            config: Configuration object
-            logger: Logger instance
-            translator: Translation loader
-        """
-        super().__init__(client, config, logger)
-        self.price_info_builder = PriceInfoBuilder(config, translator)
-
     @override
     async def _SendMessage(self,
-                           chat: pyrogram.types.Chat,
+                           chat_id: int,
                            topic_id: int,
                            *args: Any,
                            **kwargs: Any) -> pyrogram.types.Message:
@@ -62,15 +40,32 @@ class PriceInfoMessageSender(InfoMessageSenderBase):
         Send price information message.
 
         Args:
-            chat: Telegram chat to send message to
+            chat_id: ID of the Telegram chat to send message to
             topic_id: Telegram topic to send message to
-            *args: Arguments containing coin_id, coin_vs
+            *args: Arguments containing the coin info content
             **kwargs: Additional keyword arguments
 
         Returns:
             Sent message object
         """
-        price_info = await self._CoinGeckoPriceApi().GetPriceInfo(args[0], args[1])
-        price_info_str = self.price_info_builder.Build(price_info)
+        return (await self._MessageSender().SendMessage(chat_id, topic_id, args[0].PriceInfo()))[0]
 
-        return (await self._MessageSender().SendMessage(chat, topic_id, price_info_str))[0]
+    @override
+    async def _EditMessage(self,
+                           chat_id: int,
+                           message_id: int,
+                           *args: Any,
+                           **kwargs: Any) -> pyrogram.types.Message:
+        """
+        Edit price information message.
+
+        Args:
+            chat_id: ID of the Telegram chat containing the message
+            message_id: ID of the message to edit
+            *args: Arguments containing the coin info content
+            **kwargs: Additional keyword arguments
+
+        Returns:
+            Edited message object
+        """
+        return await self._MessageSender().EditMessageText(chat_id, message_id, args[0].PriceInfo())
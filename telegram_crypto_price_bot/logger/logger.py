@@ -33,6 +33,8 @@ class LoggerConst:
     LOGGER_NAME: str = ""
     LOG_CONSOLE_FORMAT: str = "%(asctime)-15s %(levelname)s - %(message)s"
     LOG_FILE_FORMAT: str = "%(asctime)-15s %(levelname)s - [%(name)s.%(funcName)s:%(lineno)d] %(message)s"
+    # Directory for diagnostic files (e.g. profiles) when logging to file is disabled
+    DEF_LOG_DIR: str = "logs"
 
 
 class Logger:
@@ -62,6 +64,24 @@ class Logger:
         """
         return self.logger
 
+    def LogDir(self) -> str:
+        """
+        Get the logs directory, i.e. the directory of the log file if logging to file is enabled.
+
+        Returns:
+            Logs directory.
+        """
+        if self.config.GetValue(BotConfigTypes.LOG_FILE_ENABLED):
+            return os.path.dirname(self.config.GetValue(BotConfigTypes.LOG_FILE_NAME)) or os.curdir
+        return LoggerConst.DEF_LOG_DIR
+
+    def Reload(self) -> None:
+        """Reconfigure the logger with the current configuration (e.g. after the configuration is reloaded)."""
+        for handler in self.logger.handlers[:]:
+            self.logger.removeHandler(handler)
+            handler.close()
+        self.__Init()
+
     def __Init(self) -> None:
         """Initialize logger with configured handlers."""
         self.__ConfigureRootLogger()
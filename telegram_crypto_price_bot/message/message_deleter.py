@@ -24,6 +24,7 @@ import pyrogram
 import pyrogram.errors.exceptions as pyrogram_ex
 
 from telegram_crypto_price_bot.logger.logger import Logger
+from telegram_crypto_price_bot.profiling.tracer import tracer
 
 
 class MessageDeleter:
@@ -46,31 +47,35 @@ class MessageDeleter:
         self.logger = logger
 
     async def DeleteMessage(self,
-                            message: pyrogram.types.Message) -> bool:
+                            chat_id: int,
+                            message_id: int) -> bool:
         """
         Delete a single message.
 
         Args:
-            message: Message to delete.
+            chat_id: ID of the chat containing the message.
+            message_id: ID of the message to delete.
 
         Returns:
             True if message was deleted successfully, False otherwise.
         """
         try:
-            if message.chat is not None:
-                await self.client.delete_messages(message.chat.id, message.id)
-                return True
+            with tracer.Span("message_delete"):
+                await self.client.delete_messages(chat_id, message_id)
+            return True
         except pyrogram_ex.forbidden_403.MessageDeleteForbidden:
-            self.logger.GetLogger().exception(f"Unable to delete message {message.id}")
+            self.logger.GetLogger().exception(f"Unable to delete message {message_id}")
         return False
 
     async def DeleteMessages(self,
-                             messages: List[pyrogram.types.Message]) -> None:
+                             chat_id: int,
+                             message_ids: List[int]) -> None:
         """
         Delete multiple messages.
 
         Args:
-            messages: List of messages to delete.
+            chat_id: ID of the chat containing the messages.
+            message_ids: List of IDs of the messages to delete.
         """
-        for message in messages:
-            await self.DeleteMessage(message)
+        for message_id in message_ids:
+            await self.DeleteMessage(chat_id, message_id)
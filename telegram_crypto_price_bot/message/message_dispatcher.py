@@ -124,7 +124,7 @@ class MessageDispatcher:
             **kwargs: Additional keyword arguments
         """
         if message.left_chat_member is not None and message.left_chat_member.is_self:
-            kwargs["coin_info_scheduler"].ChatLeft(message.chat)
+            await kwargs["coin_info_scheduler"].ChatLeft(message.chat)
 
     async def __OnJoinedMember(self,
                                client,
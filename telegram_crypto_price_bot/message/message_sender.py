@@ -22,8 +22,11 @@ import asyncio
 from typing import Any, List, Union
 
 import pyrogram
+from pyrogram.types import InputMediaPhoto
 
 from telegram_crypto_price_bot.logger.logger import Logger
+from telegram_crypto_price_bot.priority.priority_gate import PriorityGate
+from telegram_crypto_price_bot.profiling.tracer import tracer
 
 
 class MessageSenderConst:
@@ -31,6 +34,11 @@ class MessageSenderConst:
 
     MSG_MAX_LEN: int = 4096
     SEND_MSG_SLEEP_TIME_SEC: float = 0.1
+    MAX_CONCURRENT_SENDS: int = 10
+
+
+# Gate for limiting concurrent sends, interactive commands first
+message_send_gate: PriorityGate = PriorityGate("send", MessageSenderConst.MAX_CONCURRENT_SENDS)
 
 
 class MessageSender:
@@ -53,7 +61,7 @@ class MessageSender:
         self.logger = logger
 
     async def SendMessage(self,
-                          receiver: Union[pyrogram.types.Chat, pyrogram.types.User],
+                          receiver: Union[pyrogram.types.Chat, pyrogram.types.User, int],
                           topic_id: int,
                           msg: str,
                           **kwargs: Any) -> List[pyrogram.types.Message]:
@@ -61,7 +69,7 @@ class MessageSender:
         Send a message, automatically splitting if it exceeds maximum length.
 
         Args:
-            receiver: Chat or user to send message to.
+            receiver: Chat or user (or its ID) to send message to.
             topic_id: Topic to send message to.
             msg: Message text to send.
             **kwargs: Additional keyword arguments.
@@ -73,7 +81,7 @@ class MessageSender:
         return await self.__SendSplitMessage(receiver, topic_id, self.__SplitMessage(msg), **kwargs)
 
     async def SendPhoto(self,
-                        receiver: Union[pyrogram.types.Chat, pyrogram.types.User],
+                        receiver: Union[pyrogram.types.Chat, pyrogram.types.User, int],
                         topic_id: int,
                         photo: str,
                         **kwargs: Any) -> pyrogram.types.Message:
@@ -81,7 +89,7 @@ class MessageSender:
         Send a photo message.
 
         Args:
-            receiver: Chat or user to send photo to.
+            receiver: Chat or user (or its ID) to send photo to.
             topic_id: Topic to send photo to.
             photo: Path to photo file.
             **kwargs: Additional keyword arguments.
@@ -89,10 +97,59 @@ class MessageSender:
         Returns:
             Sent message object.
         """
-        return await self.client.send_photo(receiver.id, photo, message_thread_id=topic_id, **kwargs)
+        async with message_send_gate:
+            with tracer.Span("photo_send"):
+                return await self.client.send_photo(self.__ReceiverId(receiver), photo, message_thread_id=topic_id, **kwargs)
+
+    async def EditMessageText(self,
+                              chat_id: int,
+                              message_id: int,
+                              msg: str,
+                              **kwargs: Any) -> pyrogram.types.Message:
+        """
+        Edit the text of a message.
+        Differently from sending, the text cannot be split, so it shall not exceed the maximum length.
+
+        Args:
+            chat_id: ID of the chat containing the message.
+            message_id: ID of the message to edit.
+            msg: New message text.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            Edited message object.
+        """
+        self.logger.GetLogger().info(f"Editing message {message_id} (length: {len(msg)}):\n{msg}")
+        async with message_send_gate:
+            with tracer.Span("message_edit"):
+                return await self.client.edit_message_text(chat_id, message_id, msg, **kwargs)
+
+    async def EditMessagePhoto(self,
+                               chat_id: int,
+                               message_id: int,
+                               photo: str,
+                               caption: str = "",
+                               **kwargs: Any) -> pyrogram.types.Message:
+        """
+        Replace the photo of a message.
+
+        Args:
+            chat_id: ID of the chat containing the message.
+            message_id: ID of the message to edit.
+            photo: Path to new photo file.
+            caption: New photo caption.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            Edited message object.
+        """
+        self.logger.GetLogger().info(f"Editing photo of message {message_id}")
+        async with message_send_gate:
+            with tracer.Span("photo_edit"):
+                return await self.client.edit_message_media(chat_id, message_id, InputMediaPhoto(photo, caption=caption), **kwargs)
 
     async def __SendSplitMessage(self,
-                                 receiver: Union[pyrogram.types.Chat, pyrogram.types.User],
+                                 receiver: Union[pyrogram.types.Chat, pyrogram.types.User, int],
                                  topic_id: int,
                                  split_msg: List[str],
                                  **kwargs) -> List[pyrogram.types.Message]:
@@ -100,7 +157,7 @@ class MessageSender:
         Send multiple message parts with delay between sends.
 
         Args:
-            receiver: Chat or user to send messages to.
+            receiver: Chat or user (or its ID) to send messages to.
             topic_id: Topic to send messages to.
             split_msg: List of message parts to send.
             **kwargs: Additional keyword arguments.
@@ -111,13 +168,28 @@ class MessageSender:
         sent_msgs = []
 
         for msg_part in split_msg:
-            sent_msgs.append(
-                await self.client.send_message(receiver.id, msg_part, message_thread_id=topic_id, **kwargs)
-            )
+            async with message_send_gate:
+                with tracer.Span("message_send"):
+                    sent_msgs.append(
+                        await self.client.send_message(self.__ReceiverId(receiver), msg_part, message_thread_id=topic_id, **kwargs)
+                    )
             await asyncio.sleep(MessageSenderConst.SEND_MSG_SLEEP_TIME_SEC)
 
         return sent_msgs
 
+    @staticmethod
+    def __ReceiverId(receiver: Union[pyrogram.types.Chat, pyrogram.types.User, int]) -> int:
+        """
+        Get the ID of a receiver.
+
+        Args:
+            receiver: Chat or user, or its ID.
+
+        Returns:
+            Receiver ID.
+        """
+        return receiver if isinstance(receiver, int) else receiver.id
+
     def __SplitMessage(self,
                        msg: str) -> List[str]:
         """
@@ -64,7 +64,22 @@ class ChatHelper:
         Returns:
             Chat title with ID or just ID.
         """
-        return f"'{chat.title}' (ID: {chat.id})" if chat.title is not None else f"{chat.id}"
+        return ChatHelper.FormatTitleOrId(chat.id, chat.title)
+
+    @staticmethod
+    def FormatTitleOrId(chat_id: int,
+                        title: Optional[str]) -> str:
+        """
+        Format a chat title with ID or just ID if no title, when only the chat ID and title are available.
+
+        Args:
+            chat_id: Chat ID.
+            title: Chat title, or None.
+
+        Returns:
+            Chat title with ID or just ID.
+        """
+        return f"'{title}' (ID: {chat_id})" if title is not None else f"{chat_id}"
 
     @staticmethod
     def IsPrivateChat(chat: pyrogram.types.Chat,
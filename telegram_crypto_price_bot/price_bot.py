@@ -18,16 +18,29 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 
+from typing import Optional, Union
+
+from typing_extensions import override
+
 from telegram_crypto_price_bot.bot.bot_base import BotBase
 from telegram_crypto_price_bot.bot.bot_config import BotConfig
+from telegram_crypto_price_bot.bot.bot_config_types import BotConfigTypes
 from telegram_crypto_price_bot.bot.bot_handlers_config import BotHandlersConfig
 from telegram_crypto_price_bot.coin_info.coin_info_scheduler import CoinInfoScheduler
+from telegram_crypto_price_bot.coin_info.coin_info_shard_pool import CoinInfoShardPool
+from telegram_crypto_price_bot.coin_info.coin_info_sharded_scheduler import CoinInfoShardedScheduler
+from telegram_crypto_price_bot.health.health_server import HealthServer
+from telegram_crypto_price_bot.profiling.profiling_controller import ProfilingController
+from telegram_crypto_price_bot.profiling.sharded_profiling_controller import ShardedProfilingController
 
 
 class PriceBot(BotBase):
     """Main cryptocurrency price bot implementation."""
 
-    coin_info_scheduler: CoinInfoScheduler
+    shard_pool: Optional[CoinInfoShardPool]
+    coin_info_scheduler: Union[CoinInfoScheduler, CoinInfoShardedScheduler]
+    profiling_controller: ProfilingController
+    health_server: Optional[HealthServer]
 
     def __init__(self,
                  config_file: str) -> None:
@@ -38,10 +51,56 @@ class PriceBot(BotBase):
             config_file: Path to configuration file
         """
         super().__init__(config_file, BotConfig, BotHandlersConfig)
-        self.coin_info_scheduler = CoinInfoScheduler(
-            self.client,
-            self.config,
-            self.logger,
-            self.translator
+        if self.config.GetValue(BotConfigTypes.TASKS_SHARDS_NUM) > 1:
+            # Jobs are executed by shard processes, this process only receives updates and routes commands
+            self.shard_pool = CoinInfoShardPool(config_file, self.config, self.logger)
+            self.coin_info_scheduler = CoinInfoShardedScheduler(
+                self.shard_pool,
+                self.config,
+                self.logger,
+                self.translator
+            )
+            self.profiling_controller = ShardedProfilingController(self.logger, self.shard_pool)
+        else:
+            self.shard_pool = None
+            self.coin_info_scheduler = CoinInfoScheduler(
+                self.client,
+                self.config,
+                self.logger,
+                self.translator
+            )
+            self.profiling_controller = ProfilingController(self.logger)
+        self.health_server = (
+            HealthServer(self.config, self.logger, self.client, self.coin_info_scheduler)
+            if self.config.GetValue(BotConfigTypes.APP_HEALTH_ENABLED)
+            else None
         )
         self.logger.GetLogger().info("PriceBot initialized")
+
+    @override
+    async def Run(self) -> None:
+        """Start the health server, if enabled, and the bot client."""
+        if self.health_server is None:
+            await super().Run()
+            return
+
+        await self.health_server.Start()
+        try:
+            await super().Run()
+        finally:
+            await self.health_server.Stop()
+
+    @override
+    async def ReloadConfig(self) -> bool:
+        """
+        Reload the configuration file, without restarting the bot.
+        In sharded mode, the configuration is reloaded by shard processes too.
+
+        Returns:
+            True if reloaded, False otherwise.
+        """
+        if not await super().ReloadConfig():
+            return False
+        if self.shard_pool is not None:
+            return await self.shard_pool.ReloadConfig()
+        return True
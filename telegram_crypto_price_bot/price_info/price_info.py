@@ -21,6 +21,7 @@
 from enum import Enum, auto, unique
 from typing import Any, Dict
 
+from telegram_crypto_price_bot.coingecko.coingecko_fetched_data import CoinGeckoFetchedData
 from telegram_crypto_price_bot.utils.utils import Utils
 
 
@@ -43,7 +44,7 @@ class PriceInfoTypes(Enum):
     PRICE_CHANGE_PERC_30D = auto()
 
 
-class PriceInfo:
+class PriceInfo(CoinGeckoFetchedData):
     """Class for storing cryptocurrency price information."""
 
     info: Dict[PriceInfoTypes, Any]
@@ -58,6 +59,7 @@ class PriceInfo:
             coin_data: Raw coin data from API.
             coin_vs: Currency to compare against.
         """
+        super().__init__()
         self.info = {
             PriceInfoTypes.COIN_NAME: coin_data["name"],
             PriceInfoTypes.COIN_SYMBOL: coin_data["symbol"].upper(),
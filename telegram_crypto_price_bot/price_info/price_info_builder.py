@@ -18,7 +18,10 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 
-from telegram_crypto_price_bot.bot.bot_config_types import BotConfigTypes
+from collections import OrderedDict
+from typing import Hashable, Optional, Tuple
+
+from telegram_crypto_price_bot.bot.bot_config_snapshot import BotConfigSnapshot
 from telegram_crypto_price_bot.config.config_object import ConfigObject
 from telegram_crypto_price_bot.misc.formatters import (
     CoinPairFormatter,
@@ -36,6 +39,62 @@ class PriceInfoBuilderConst:
 
     ALIGN_LEN: int = 16
     MARKDOWN_CODE_DELIM: str = "```"
+    TEXT_CACHE_MAX_SIZE: int = 256
+
+
+# Text cache key: (price snapshot ID, language, display flags)
+PriceInfoTextCacheKey = Tuple[Hashable, ...]
+
+
+class PriceInfoTextCache:
+    """
+    Cache of built price information messages, shared by all builders.
+    When the same price data is sent to many chats, the message is built only once.
+    """
+
+    texts: "OrderedDict[PriceInfoTextCacheKey, str]"
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        self.texts = OrderedDict()
+
+    def Get(self,
+            key: PriceInfoTextCacheKey) -> Optional[str]:
+        """
+        Get a message.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            Message, None if not present.
+        """
+        text = self.texts.get(key)
+        if text is not None:
+            self.texts.move_to_end(key)
+        return text
+
+    def Put(self,
+            key: PriceInfoTextCacheKey,
+            text: str) -> None:
+        """
+        Store a message, removing the least recently used one if the cache is full.
+
+        Args:
+            key: Cache key.
+            text: Message.
+        """
+        self.texts[key] = text
+        if len(self.texts) > PriceInfoBuilderConst.TEXT_CACHE_MAX_SIZE:
+            self.texts.popitem(last=False)
+
+    def Clear(self) -> None:
+        """Remove all messages (e.g. when the translation is reloaded)."""
+        self.texts.clear()
+
+
+# Shared by all builders
+price_info_text_cache: PriceInfoTextCache = PriceInfoTextCache()
 
 
 class PriceInfoBuilder:
@@ -61,6 +120,7 @@ class PriceInfoBuilder:
               price_info: PriceInfo) -> str:
         """
         Build a formatted price information message.
+        Messages are cached, so the same price data is formatted only once.
 
         Args:
             price_info: Price information to format.
@@ -68,49 +128,85 @@ class PriceInfoBuilder:
         Returns:
             Formatted price information message string.
         """
-        coin_vs = price_info.GetData(PriceInfoTypes.COIN_VS)
-        coin_vs_sym = price_info.GetData(PriceInfoTypes.COIN_VS_SYMBOL)
-
-        coin_pair = CoinPairFormatter.Format(price_info.GetData(PriceInfoTypes.COIN_SYMBOL), coin_vs)
-        price = PriceFormatter.Format(price_info.GetData(PriceInfoTypes.CURR_PRICE), coin_vs_sym)
-
-        high_24h = PriceFormatter.Format(price_info.GetData(PriceInfoTypes.HIGH_24H), coin_vs_sym)
-        low_24h = PriceFormatter.Format(price_info.GetData(PriceInfoTypes.LOW_24H), coin_vs_sym)
-        volume = VolumeFormatter.Format(price_info.GetData(PriceInfoTypes.TOTAL_VOLUME), coin_vs_sym)
-        market_cap = MarketCapFormatter.Format(price_info.GetData(PriceInfoTypes.MARKET_CAP), coin_vs_sym)
-        market_cap_rank = price_info.GetData(PriceInfoTypes.MARKET_CAP_RANK)
-
-        change_perc_24h = PriceChangePercFormatter.Format(price_info.GetData(PriceInfoTypes.PRICE_CHANGE_PERC_24H))
-        change_perc_7d = PriceChangePercFormatter.Format(price_info.GetData(PriceInfoTypes.PRICE_CHANGE_PERC_7D))
-        change_perc_14d = PriceChangePercFormatter.Format(price_info.GetData(PriceInfoTypes.PRICE_CHANGE_PERC_14D))
-        change_perc_30d = PriceChangePercFormatter.Format(price_info.GetData(PriceInfoTypes.PRICE_CHANGE_PERC_30D))
+        config = self.config.Snapshot(BotConfigSnapshot)
+        display_market_cap = config.price_display_market_cap
+        display_market_cap_rank = config.price_display_market_cap_rank
 
-        msg = self.translator.GetSentence("PRICE_INFO_TITLE_MSG",
-                                          coin_name=price_info.GetData(PriceInfoTypes.COIN_NAME))
+        key = (price_info.SnapshotId(), self.translator.FileName(), display_market_cap, display_market_cap_rank)
+        msg = price_info_text_cache.Get(key)
+        if msg is None:
+            msg = self.__BuildText(price_info, display_market_cap, display_market_cap_rank)
+            price_info_text_cache.Put(key, msg)
 
-        msg += PriceInfoBuilderConst.MARKDOWN_CODE_DELIM
-        msg += "\n"
+        if price_info.IsStale():
+            msg = "\n".join((msg, self.translator.GetSentence("STALE_DATA_MSG", age_min=price_info.AgeMinutes())))
 
-        msg += self.__PrintAligned(f"💵 {coin_pair}", price)
-        msg += self.__PrintAligned("📈 High 24h", high_24h)
-        msg += self.__PrintAligned("📈 Low 24h", low_24h)
-        msg += self.__PrintAligned("📊 Volume 24h", volume)
+        return msg
 
-        if self.config.GetValue(BotConfigTypes.PRICE_DISPLAY_MARKET_CAP):
-            msg += self.__PrintAligned("💎 Market Cap", market_cap)
-        if self.config.GetValue(BotConfigTypes.PRICE_DISPLAY_MARKET_CAP_RANK):
-            msg += self.__PrintAligned("🏆 Rank", f"{market_cap_rank:d}")
+    def __BuildText(self,
+                    price_info: PriceInfo,
+                    display_market_cap: bool,
+                    display_market_cap_rank: bool) -> str:
+        """
+        Build the text of a price information message.
 
-        msg += "\n⚖ Diff.\n"
-        msg += self.__PrintAligned("     24h", change_perc_24h, 1)
-        msg += self.__PrintAligned("     7d", change_perc_7d, 1)
-        msg += self.__PrintAligned("     14d", change_perc_14d, 1)
-        msg += self.__PrintAligned("     30d", change_perc_30d, 1, False)
+        Args:
+            price_info: Price information to format.
+            display_market_cap: Whether to display the market cap.
+            display_market_cap_rank: Whether to display the market cap rank.
 
-        msg += "\n"
-        msg += PriceInfoBuilderConst.MARKDOWN_CODE_DELIM
+        Returns:
+            Formatted price information message string.
+        """
+        coin_vs = price_info.GetData(PriceInfoTypes.COIN_VS)
+        coin_vs_sym = price_info.GetData(PriceInfoTypes.COIN_VS_SYMBOL)
+        coin_pair = CoinPairFormatter.Format(price_info.GetData(PriceInfoTypes.COIN_SYMBOL), coin_vs)
 
-        return msg
+        msg_parts = [
+            self.translator.GetSentence("PRICE_INFO_TITLE_MSG",
+                                        coin_name=price_info.GetData(PriceInfoTypes.COIN_NAME)),
+            PriceInfoBuilderConst.MARKDOWN_CODE_DELIM,
+            "\n",
+            self.__PrintAligned(f"💵 {coin_pair}",
+                                PriceFormatter.Format(price_info.GetData(PriceInfoTypes.CURR_PRICE), coin_vs_sym)),
+            self.__PrintAligned("📈 High 24h",
+                                PriceFormatter.Format(price_info.GetData(PriceInfoTypes.HIGH_24H), coin_vs_sym)),
+            self.__PrintAligned("📈 Low 24h",
+                                PriceFormatter.Format(price_info.GetData(PriceInfoTypes.LOW_24H), coin_vs_sym)),
+            self.__PrintAligned("📊 Volume 24h",
+                                VolumeFormatter.Format(price_info.GetData(PriceInfoTypes.TOTAL_VOLUME), coin_vs_sym)),
+        ]
+
+        if display_market_cap:
+            msg_parts.append(
+                self.__PrintAligned("💎 Market Cap",
+                                    MarketCapFormatter.Format(price_info.GetData(PriceInfoTypes.MARKET_CAP), coin_vs_sym))
+            )
+        if display_market_cap_rank:
+            msg_parts.append(
+                self.__PrintAligned("🏆 Rank", f"{price_info.GetData(PriceInfoTypes.MARKET_CAP_RANK):d}")
+            )
+
+        msg_parts += [
+            "\n⚖ Diff.\n",
+            self.__PrintAligned("     24h",
+                                PriceChangePercFormatter.Format(price_info.GetData(PriceInfoTypes.PRICE_CHANGE_PERC_24H)),
+                                1),
+            self.__PrintAligned("     7d",
+                                PriceChangePercFormatter.Format(price_info.GetData(PriceInfoTypes.PRICE_CHANGE_PERC_7D)),
+                                1),
+            self.__PrintAligned("     14d",
+                                PriceChangePercFormatter.Format(price_info.GetData(PriceInfoTypes.PRICE_CHANGE_PERC_14D)),
+                                1),
+            self.__PrintAligned("     30d",
+                                PriceChangePercFormatter.Format(price_info.GetData(PriceInfoTypes.PRICE_CHANGE_PERC_30D)),
+                                1,
+                                False),
+            "\n",
+            PriceInfoBuilderConst.MARKDOWN_CODE_DELIM,
+        ]
+
+        return "".join(msg_parts)
 
     @staticmethod
     def __PrintAligned(header: str,
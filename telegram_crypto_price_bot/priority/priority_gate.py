@@ -0,0 +1,96 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import asyncio
+import heapq
+import time
+from typing import Any, List, Tuple
+
+from telegram_crypto_price_bot.priority.priority_lane import PriorityLane
+from telegram_crypto_price_bot.priority.priority_lane_metrics import priority_lane_metrics
+
+
+class PriorityGate:
+    """
+    Gate limiting the number of concurrent users of a resource.
+    When the resource is busy, waiting users are let in by priority lane (and in arrival order within the same lane),
+    so interactive work always precedes scheduled work.
+    """
+
+    name: str
+    max_concurrent: int
+    running_cnt: int
+    seq_num: int
+    waiters: List[Tuple[int, int, asyncio.Future]]
+
+    def __init__(self,
+                 name: str,
+                 max_concurrent: int) -> None:
+        """
+        Initialize the gate.
+
+        Args:
+            name: Resource name, used for metrics.
+            max_concurrent: Maximum number of concurrent users.
+        """
+        self.name = name
+        self.max_concurrent = max_concurrent
+        self.running_cnt = 0
+        self.seq_num = 0
+        self.waiters = []
+
+    async def Acquire(self) -> None:
+        """Wait until the resource can be used, in the priority lane of the current task."""
+        lane = PriorityLane.Current()
+        start_time = time.monotonic()
+
+        if self.running_cnt < self.max_concurrent and len(self.waiters) == 0:
+            self.running_cnt += 1
+        else:
+            fut = asyncio.get_running_loop().create_future()
+            self.seq_num += 1
+            heapq.heappush(self.waiters, (lane.value, self.seq_num, fut))
+            try:
+                await fut
+            except asyncio.CancelledError:
+                # Let the next waiter in if the resource was already handed over
+                if fut.done() and not fut.cancelled():
+                    self.Release()
+                raise
+
+        priority_lane_metrics.Add(self.name, lane, time.monotonic() - start_time)
+
+    def Release(self) -> None:
+        """Release the resource, handing it over to the waiter with the highest priority (if any)."""
+        while len(self.waiters) > 0:
+            _, _, fut = heapq.heappop(self.waiters)
+            if not fut.done():
+                fut.set_result(None)
+                return
+        self.running_cnt -= 1
+
+    async def __aenter__(self) -> None:
+        """Acquire the gate."""
+        await self.Acquire()
+
+    async def __aexit__(self,
+                        *args: Any) -> None:
+        """Release the gate."""
+        self.Release()
@@ -0,0 +1,74 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+from contextvars import ContextVar, Token
+from enum import Enum, auto, unique
+from typing import Any, Optional
+
+
+@unique
+class PriorityLanes(Enum):
+    """Enumeration of priority lanes, from the highest priority to the lowest one."""
+
+    INTERACTIVE = auto()
+    SCHEDULED = auto()
+
+
+# Lane of the current task, work is scheduled by default
+current_priority_lane: "ContextVar[PriorityLanes]" = ContextVar("current_priority_lane", default=PriorityLanes.SCHEDULED)
+
+
+class PriorityLane:
+    """Context manager for executing code in a priority lane."""
+
+    lane: PriorityLanes
+    token: Optional["Token[PriorityLanes]"]
+
+    def __init__(self,
+                 lane: PriorityLanes) -> None:
+        """
+        Initialize the context manager.
+
+        Args:
+            lane: Priority lane.
+        """
+        self.lane = lane
+        self.token = None
+
+    def __enter__(self) -> None:
+        """Enter the priority lane."""
+        self.token = current_priority_lane.set(self.lane)
+
+    def __exit__(self,
+                 *args: Any) -> None:
+        """Exit the priority lane, restoring the previous one."""
+        if self.token is not None:
+            current_priority_lane.reset(self.token)
+            self.token = None
+
+    @staticmethod
+    def Current() -> PriorityLanes:
+        """
+        Get the priority lane of the current task.
+
+        Returns:
+            Priority lane.
+        """
+        return current_priority_lane.get()
@@ -0,0 +1,126 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import copy
+from typing import Dict
+
+from telegram_crypto_price_bot.priority.priority_lane import PriorityLanes
+
+
+class PriorityLaneStats:
+    """Class for latency statistics of a priority lane."""
+
+    count: int
+    total_time: float
+    max_time: float
+
+    def __init__(self) -> None:
+        """Initialize the statistics."""
+        self.count = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+
+    def Add(self,
+            latency: float) -> None:
+        """
+        Add a latency sample.
+
+        Args:
+            latency: Latency in seconds.
+        """
+        self.count += 1
+        self.total_time += latency
+        self.max_time = max(self.max_time, latency)
+
+    def Merge(self,
+              other: "PriorityLaneStats") -> None:
+        """
+        Merge statistics of another lane (e.g. of another process) into these ones.
+
+        Args:
+            other: Other statistics.
+        """
+        self.count += other.count
+        self.total_time += other.total_time
+        self.max_time = max(self.max_time, other.max_time)
+
+    def AverageTime(self) -> float:
+        """
+        Get the average latency.
+
+        Returns:
+            Average latency in seconds.
+        """
+        return self.total_time / self.count if self.count > 0 else 0.0
+
+
+# Statistics for each resource and lane
+PriorityLaneStatsType = Dict[str, Dict[PriorityLanes, PriorityLaneStats]]
+
+
+class PriorityLaneMetrics:
+    """Class for collecting the latency of priority lanes, i.e. the time spent waiting for each resource."""
+
+    stats: PriorityLaneStatsType
+
+    def __init__(self) -> None:
+        """Initialize the metrics."""
+        self.stats = {}
+
+    def Add(self,
+            resource_name: str,
+            lane: PriorityLanes,
+            latency: float) -> None:
+        """
+        Add a latency sample.
+
+        Args:
+            resource_name: Resource name.
+            lane: Priority lane.
+            latency: Latency in seconds.
+        """
+        self.stats.setdefault(resource_name, {}).setdefault(lane, PriorityLaneStats()).Add(latency)
+
+    def GetStats(self) -> PriorityLaneStatsType:
+        """
+        Get a snapshot of the statistics.
+
+        Returns:
+            Statistics for each resource and lane.
+        """
+        return copy.deepcopy(self.stats)
+
+    @staticmethod
+    def MergeStats(stats: PriorityLaneStatsType,
+                   other: PriorityLaneStatsType) -> None:
+        """
+        Merge statistics into other ones.
+
+        Args:
+            stats: Statistics to merge into.
+            other: Statistics to be merged.
+        """
+        for resource_name, lanes_stats in other.items():
+            for lane, lane_stats in lanes_stats.items():
+                stats.setdefault(resource_name, {}).setdefault(lane, PriorityLaneStats()).Merge(lane_stats)
+
+
+# Shared by all resources of the process
+priority_lane_metrics: PriorityLaneMetrics = PriorityLaneMetrics()
@@ -0,0 +1,293 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+import asyncio
+import inspect
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from types import FrameType
+from typing import Deque, List, Optional, Tuple
+
+from telegram_crypto_price_bot.bot.bot_config_types import BotConfigTypes
+from telegram_crypto_price_bot.config.config_object import ConfigObject
+from telegram_crypto_price_bot.logger.logger import Logger
+
+
+class LoopLagMonitorConst:
+    """Constants for loop lag monitor class."""
+
+    # Interval between two lag measurements
+    PROBE_INTERVAL_SEC: float = 0.1
+    # Minimum interval between two checks of the watchdog
+    WATCHDOG_MIN_INTERVAL_SEC: float = 0.01
+    # Number of last lag measurements used for the recent maximum lag (i.e. about 10 seconds)
+    RECENT_LAGS_NUM: int = 100
+    # Number of slowest callbacks kept in statistics
+    SLOW_CALLBACKS_MAX_NUM: int = 5
+    # Number of innermost frames logged for a slow callback
+    STACK_MAX_FRAMES: int = 15
+    # Name of a slow callback when it ended before the watchdog could capture its stack
+    UNKNOWN_CALLBACK: str = "<unknown>"
+
+
+# Slow callback: (name, duration in seconds)
+LoopSlowCallback = Tuple[str, float]
+
+
+class LoopLagStats:
+    """Class for a snapshot of event loop lag statistics."""
+
+    count: int
+    total_lag: float
+    max_lag: float
+    recent_max_lag: float
+    slow_cnt: int
+    slow_callbacks: List[LoopSlowCallback]
+
+    def __init__(self) -> None:
+        """Initialize the statistics."""
+        self.count = 0
+        self.total_lag = 0.0
+        self.max_lag = 0.0
+        self.recent_max_lag = 0.0
+        self.slow_cnt = 0
+        self.slow_callbacks = []
+
+    def Add(self,
+            lag: float) -> None:
+        """
+        Add a lag sample.
+
+        Args:
+            lag: Lag in seconds.
+        """
+        self.count += 1
+        self.total_lag += lag
+        self.max_lag = max(self.max_lag, lag)
+
+    def AddSlowCallback(self,
+                        slow_callback: LoopSlowCallback) -> None:
+        """
+        Add a slow callback, keeping only the slowest ones.
+
+        Args:
+            slow_callback: Slow callback.
+        """
+        self.slow_cnt += 1
+        self.__AddSlowCallbacks([slow_callback])
+
+    def Merge(self,
+              other: "LoopLagStats") -> None:
+        """
+        Merge statistics of another event loop (e.g. of another process) into these ones.
+
+        Args:
+            other: Other statistics.
+        """
+        self.count += other.count
+        self.total_lag += other.total_lag
+        self.max_lag = max(self.max_lag, other.max_lag)
+        self.recent_max_lag = max(self.recent_max_lag, other.recent_max_lag)
+        self.slow_cnt += other.slow_cnt
+        self.__AddSlowCallbacks(other.slow_callbacks)
+
+    def AverageLag(self) -> float:
+        """
+        Get the average lag.
+
+        Returns:
+            Average lag in seconds.
+        """
+        return self.total_lag / self.count if self.count > 0 else 0.0
+
+    def __AddSlowCallbacks(self,
+                           slow_callbacks: List[LoopSlowCallback]) -> None:
+        """
+        Add slow callbacks, keeping only the slowest ones.
+
+        Args:
+            slow_callbacks: Slow callbacks.
+        """
+        self.slow_callbacks = sorted(
+            self.slow_callbacks + slow_callbacks, key=lambda slow_callback: slow_callback[1], reverse=True
+        )[:LoopLagMonitorConst.SLOW_CALLBACKS_MAX_NUM]
+
+
+class LoopLagMonitor:
+    """
+    Monitor of the event loop lag, i.e. the delay of scheduled callbacks, to find blocking work done in the loop.
+    A probe periodically measures how late it is woken up. Meanwhile, a watchdog thread checks if the probe is late
+    for more than the configured threshold: if so, the loop is blocked and the watchdog captures the stack of the loop
+    thread, so that the slow callback can be logged together with the code that is blocking it.
+    """
+
+    config: ConfigObject
+    logger: Logger
+    stats: LoopLagStats
+    recent_lags: Deque[float]
+    loop_thread_id: int
+    lock: threading.Lock
+    wakeup_time: float
+    captured_wakeup_time: float
+    captured_callback: Optional[Tuple[str, str]]
+
+    def __init__(self,
+                 config: ConfigObject,
+                 logger: Logger) -> None:
+        """
+        Initialize the monitor and start it.
+        It shall be created in the event loop thread, with a running event loop.
+
+        Args:
+            config: Configuration object.
+            logger: Logger object.
+        """
+        self.config = config
+        self.logger = logger
+        self.stats = LoopLagStats()
+        self.recent_lags = deque(maxlen=LoopLagMonitorConst.RECENT_LAGS_NUM)
+        self.loop_thread_id = threading.get_ident()
+        self.lock = threading.Lock()
+        self.wakeup_time = 0.0
+        self.captured_wakeup_time = 0.0
+        self.captured_callback = None
+
+        asyncio.ensure_future(self.__Probe())
+        threading.Thread(target=self.__Watchdog, name="LoopLagWatchdog", daemon=True).start()
+
+    def GetStats(self) -> LoopLagStats:
+        """
+        Get a snapshot of the statistics.
+
+        Returns:
+            Loop lag statistics.
+        """
+        stats = LoopLagStats()
+        stats.Merge(self.stats)
+        stats.recent_max_lag = max(self.recent_lags, default=0.0)
+        return stats
+
+    async def __Probe(self) -> None:
+        """Measure the lag of the event loop periodically."""
+        while True:
+            with self.lock:
+                self.wakeup_time = time.monotonic() + LoopLagMonitorConst.PROBE_INTERVAL_SEC
+            await asyncio.sleep(LoopLagMonitorConst.PROBE_INTERVAL_SEC)
+
+            with self.lock:
+                lag = max(time.monotonic() - self.wakeup_time, 0.0)
+                captured_callback = self.captured_callback if self.captured_wakeup_time == self.wakeup_time else None
+                self.captured_callback = None
+            self.stats.Add(lag)
+            self.recent_lags.append(lag)
+
+            threshold = self.__Threshold()
+            if threshold > 0 and lag > threshold:
+                self.__LogSlowCallback(lag, captured_callback)
+
+    def __Watchdog(self) -> None:
+        """Capture the stack of the event loop thread when it is blocked for more than the threshold."""
+        while True:
+            threshold = self.__Threshold()
+            # Check the configuration again sometimes, if disabled
+            time.sleep(max(threshold / 4, LoopLagMonitorConst.WATCHDOG_MIN_INTERVAL_SEC) if threshold > 0 else 1.0)
+            if threshold <= 0:
+                continue
+
+            with self.lock:
+                wakeup_time = self.wakeup_time
+                if self.captured_wakeup_time == wakeup_time or time.monotonic() - wakeup_time <= threshold:
+                    continue
+                self.captured_wakeup_time = wakeup_time
+
+            frame = sys._current_frames().get(self.loop_thread_id)
+            if frame is None:
+                continue
+            captured_callback = self.__CallbackInfo(frame)
+            with self.lock:
+                if self.captured_wakeup_time == wakeup_time:
+                    self.captured_callback = captured_callback
+
+    def __LogSlowCallback(self,
+                          lag: float,
+                          captured_callback: Optional[Tuple[str, str]]) -> None:
+        """
+        Log a slow callback and add it to statistics.
+
+        Args:
+            lag: Lag in seconds.
+            captured_callback: Name and stack of the callback (None if not captured).
+        """
+        if captured_callback is None:
+            self.stats.AddSlowCallback((LoopLagMonitorConst.UNKNOWN_CALLBACK, lag))
+            self.logger.GetLogger().warning(f"Event loop blocked for at least {lag:.3f}s (blocking callback not captured)")
+        else:
+            name, stack = captured_callback
+            self.stats.AddSlowCallback((name, lag))
+            self.logger.GetLogger().warning(f"Event loop blocked for at least {lag:.3f}s by {name}, stack:\n{stack}")
+
+    def __Threshold(self) -> float:
+        """
+        Get the threshold for slow callbacks.
+
+        Returns:
+            Threshold in seconds (0 if disabled).
+        """
+        return self.config.GetValue(BotConfigTypes.APP_LOOP_LAG_THRESHOLD_MS) / 1000
+
+    @staticmethod
+    def __CallbackInfo(frame: FrameType) -> Tuple[str, str]:
+        """
+        Get the name and stack of the callback being executed by the event loop.
+        The name is the one of the innermost coroutine if any (i.e. the one that is blocking), otherwise the one of
+        the function called by the event loop.
+
+        Args:
+            frame: Innermost frame of the event loop thread.
+
+        Returns:
+            Callback name and stack.
+        """
+        frames: List[FrameType] = []
+        curr_frame: Optional[FrameType] = frame
+        while curr_frame is not None:
+            frames.append(curr_frame)
+            curr_frame = curr_frame.f_back
+        frames.reverse()
+
+        coro_frames = [stack_frame for stack_frame in frames if stack_frame.f_code.co_flags & inspect.CO_COROUTINE]
+        if len(coro_frames) > 0:
+            name_frame = coro_frames[-1]
+        else:
+            # Skip the frames of the event loop itself
+            loop_frames_num = max(
+                (i + 1 for i, stack_frame in enumerate(frames) if stack_frame.f_code.co_filename.startswith(asyncio.__path__[0])),
+                default=0
+            )
+            name_frame = frames[loop_frames_num] if loop_frames_num < len(frames) else frame
+        name = f"{name_frame.f_code.co_name} ({os.path.basename(name_frame.f_code.co_filename)}:{name_frame.f_lineno})"
+
+        stack = "".join(traceback.format_stack(frame, LoopLagMonitorConst.STACK_MAX_FRAMES))
+        return name, stack
@@ -0,0 +1,193 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import gc
+import os
+import sys
+import tracemalloc
+from typing import Dict, List, Optional, Tuple, Type
+
+from telegram_crypto_price_bot.chart_info.chart_info import ChartInfo
+from telegram_crypto_price_bot.coin_info.coin_info_job import CoinInfoJob
+from telegram_crypto_price_bot.price_info.price_info import PriceInfo
+
+
+class MemoryProfilerNotStartedError(Exception):
+    """Exception raised when taking a snapshot without starting the memory profiler."""
+
+
+class MemoryProfilerConst:
+    """Constants for memory profiler class."""
+
+    # Only the allocation line is needed for statistics by line
+    TRACE_FRAMES_NUM: int = 1
+    # Allocations of the profiler itself and of module imports are not interesting
+    EXCLUDED_FILES: Tuple[str, ...] = (
+        tracemalloc.__file__,
+        "<frozen importlib._bootstrap>",
+        "<frozen importlib._bootstrap_external>",
+        "<unknown>",
+    )
+
+
+# Allocation site: (file name and line, size difference in bytes, count difference)
+MemoryAllocationSite = Tuple[str, int, int]
+
+
+class MemoryProfileReport:
+    """Report of a memory profile, comparing a snapshot with the baseline."""
+
+    process_id: int
+    traced_size: int
+    traced_peak_size: int
+    size_diff: int
+    top_sites: List[MemoryAllocationSite]
+    object_counts: Dict[str, int]
+
+    def __init__(self) -> None:
+        """Initialize the report."""
+        self.process_id = os.getpid()
+        self.traced_size = 0
+        self.traced_peak_size = 0
+        self.size_diff = 0
+        self.top_sites = []
+        self.object_counts = {}
+
+
+class MemoryProfiler:
+    """
+    Memory profiler based on tracemalloc, to find what is holding memory in a running bot.
+    Tracing is started on demand, taking a baseline snapshot, and can be stopped at any time,
+    so that it has no overhead when not used.
+    """
+
+    baseline: Optional[tracemalloc.Snapshot]
+
+    def __init__(self) -> None:
+        """Initialize the memory profiler."""
+        self.baseline = None
+
+    def IsStarted(self) -> bool:
+        """
+        Get if the memory profiler is started.
+
+        Returns:
+            True if started, False otherwise.
+        """
+        return self.baseline is not None and tracemalloc.is_tracing()
+
+    def Start(self) -> None:
+        """Start tracing memory allocations (if not already started) and take the baseline snapshot."""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(MemoryProfilerConst.TRACE_FRAMES_NUM)
+        # Not available before Python 3.9
+        if hasattr(tracemalloc, "reset_peak"):
+            tracemalloc.reset_peak()
+        self.baseline = self.__TakeSnapshot()
+
+    def Stop(self) -> None:
+        """Stop tracing memory allocations and release the baseline snapshot."""
+        tracemalloc.stop()
+        self.baseline = None
+
+    def Snapshot(self,
+                 top_num: int) -> MemoryProfileReport:
+        """
+        Take a snapshot and compare it with the baseline.
+
+        Args:
+            top_num: Number of top allocation sites to report.
+
+        Returns:
+            Memory profile report.
+
+        Raises:
+            MemoryProfilerNotStartedError: If the memory profiler is not started.
+        """
+        if self.baseline is None or not tracemalloc.is_tracing():
+            raise MemoryProfilerNotStartedError()
+
+        stats = self.__TakeSnapshot().compare_to(self.baseline, "lineno")
+
+        report = MemoryProfileReport()
+        report.traced_size, report.traced_peak_size = tracemalloc.get_traced_memory()
+        report.size_diff = sum(stat.size_diff for stat in stats)
+        report.top_sites = [
+            (f"{self.__ShortFileName(stat.traceback[0].filename)}:{stat.traceback[0].lineno}", stat.size_diff, stat.count_diff)
+            for stat in stats[:top_num]
+        ]
+        report.object_counts = self.__CountObjects()
+        return report
+
+    @staticmethod
+    def __TakeSnapshot() -> tracemalloc.Snapshot:
+        """
+        Take a snapshot, excluding the allocations that are not interesting.
+
+        Returns:
+            Snapshot.
+        """
+        return tracemalloc.take_snapshot().filter_traces(
+            [tracemalloc.Filter(False, file_name) for file_name in MemoryProfilerConst.EXCLUDED_FILES]
+        )
+
+    @staticmethod
+    def __ShortFileName(file_name: str) -> str:
+        """
+        Shorten a file name, making it relative to the import path containing it (e.g. site-packages).
+
+        Args:
+            file_name: File name.
+
+        Returns:
+            Shortened file name.
+        """
+        for path in sorted(sys.path, key=len, reverse=True):
+            if path != "" and file_name.startswith(path + os.sep):
+                return file_name[len(path) + 1:]
+        return file_name
+
+    @staticmethod
+    def __CountObjects() -> Dict[str, int]:
+        """
+        Count the live objects of the types that may accumulate.
+        Matplotlib figures are only counted if matplotlib is used.
+
+        Returns:
+            Number of objects, by type name.
+        """
+        obj_types: List[Type] = [CoinInfoJob, ChartInfo, PriceInfo]
+        figure_module = sys.modules.get("matplotlib.figure")
+        if figure_module is not None:
+            obj_types.append(figure_module.Figure)
+
+        counts = dict.fromkeys((obj_type.__name__ for obj_type in obj_types), 0)
+        obj_types_tuple = tuple(obj_types)
+        for obj in gc.get_objects():
+            # Quick check first, since most objects are of other types
+            if isinstance(obj, obj_types_tuple):
+                for obj_type in obj_types:
+                    if isinstance(obj, obj_type):
+                        counts[obj_type.__name__] += 1
+        return counts
+
+
+# Memory profiler of the process
+memory_profiler: MemoryProfiler = MemoryProfiler()
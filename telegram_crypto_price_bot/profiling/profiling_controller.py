@@ -0,0 +1,91 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+from typing import List
+
+from telegram_crypto_price_bot.logger.logger import Logger
+from telegram_crypto_price_bot.profiling.memory_profiler import MemoryProfileReport, memory_profiler
+from telegram_crypto_price_bot.profiling.sampling_profiler import sampling_profiler
+
+
+class ProfilingController:
+    """
+    Controller of the process-level profilers (memory and CPU), used by profiling commands.
+    Methods are coroutines, so that the sharded controller can also wait for shard processes.
+    """
+
+    logger: Logger
+
+    def __init__(self,
+                 logger: Logger) -> None:
+        """
+        Initialize the profiling controller.
+
+        Args:
+            logger: Logger instance.
+        """
+        self.logger = logger
+
+    async def StartMemoryProfiling(self) -> None:
+        """Start the memory profiler, taking the baseline snapshot."""
+        memory_profiler.Start()
+
+    async def GetMemoryProfiles(self,
+                                top_num: int) -> List[MemoryProfileReport]:
+        """
+        Get the memory profile with respect to the baseline snapshot.
+
+        Args:
+            top_num: Number of top allocation sites to report.
+
+        Returns:
+            Memory profile reports (one, for this process).
+
+        Raises:
+            MemoryProfilerNotStartedError: If the memory profiler is not started.
+        """
+        return [memory_profiler.Snapshot(top_num)]
+
+    async def StopMemoryProfiling(self) -> None:
+        """Stop the memory profiler."""
+        memory_profiler.Stop()
+
+    async def StartCpuProfiling(self,
+                                duration_sec: float) -> None:
+        """
+        Start the sampling profiler for the specified window, writing the output to the logs directory.
+
+        Args:
+            duration_sec: Maximum duration of the window in seconds.
+
+        Raises:
+            SamplingProfilerAlreadyRunningError: If the sampling profiler is already running.
+        """
+        sampling_profiler.Start(duration_sec, self.logger.LogDir())
+
+    async def StopCpuProfiling(self) -> List[str]:
+        """
+        Stop the sampling profiler (if still running).
+
+        Returns:
+            Files written by the last window.
+        """
+        sampling_profiler.Stop()
+        return sampling_profiler.LastFiles()
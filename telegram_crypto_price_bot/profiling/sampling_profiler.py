@@ -0,0 +1,249 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from types import FrameType
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+class SamplingProfilerAlreadyRunningError(Exception):
+    """Exception raised when starting the sampling profiler while it is already running."""
+
+
+class SamplingProfilerConst:
+    """Constants for sampling profiler class."""
+
+    # Interval between two samples
+    SAMPLE_INTERVAL_SEC: float = 0.01
+    # Stage of the samples not belonging to any profiled stage
+    OTHER_STAGE: str = "other"
+    # Output file name, in the folded stacks format used by flamegraph tools
+    FILE_NAME: str = "profile_{date}_{pid}_{stage}.folded"
+    FILE_DATE_FORMAT: str = "%Y%m%d_%H%M%S"
+
+
+class SamplingProfiler:
+    """
+    Sampling profiler, to find hot spots of a running bot under real load.
+    When started, a thread samples the stacks of all the other threads for a bounded window. Each sample is assigned
+    to the outermost profiled stage in its stack (see ProfiledStage) and, at the end of the window, the samples of
+    each stage are written to a file in the folded stacks format, which can be passed to flamegraph tools
+    (e.g. flamegraph.pl or speedscope).
+    Samples are taken from outside the profiled code, so there is no overhead when the profiler is not running.
+    """
+
+    stages: Dict[Any, str]
+    lock: threading.Lock
+    stop_event: threading.Event
+    thread: Optional[threading.Thread]
+    last_files: List[str]
+
+    def __init__(self) -> None:
+        """Initialize the sampling profiler."""
+        self.stages = {}
+        self.lock = threading.Lock()
+        self.stop_event = threading.Event()
+        self.thread = None
+        self.last_files = []
+
+    def RegisterStage(self,
+                      code: Any,
+                      stage_name: str) -> None:
+        """
+        Register the code object of a function as a profiled stage.
+
+        Args:
+            code: Code object.
+            stage_name: Stage name.
+        """
+        self.stages[code] = stage_name
+
+    def IsRunning(self) -> bool:
+        """
+        Get if the sampling profiler is running.
+
+        Returns:
+            True if running, False otherwise.
+        """
+        with self.lock:
+            return self.thread is not None and self.thread.is_alive()
+
+    def LastFiles(self) -> List[str]:
+        """
+        Get the files written by the last profiling window.
+
+        Returns:
+            File names.
+        """
+        with self.lock:
+            return list(self.last_files)
+
+    def Start(self,
+              duration_sec: float,
+              out_dir: str) -> None:
+        """
+        Start sampling for the specified window.
+
+        Args:
+            duration_sec: Maximum duration of the window in seconds.
+            out_dir: Directory where the output files are written at the end of the window.
+
+        Raises:
+            SamplingProfilerAlreadyRunningError: If the sampling profiler is already running.
+        """
+        with self.lock:
+            if self.thread is not None and self.thread.is_alive():
+                raise SamplingProfilerAlreadyRunningError()
+
+            self.stop_event.clear()
+            self.thread = threading.Thread(target=self.__Sample,
+                                           args=(duration_sec, out_dir),
+                                           name="SamplingProfiler",
+                                           daemon=True)
+            self.thread.start()
+
+    def Stop(self) -> None:
+        """Stop sampling before the end of the window (if running), waiting for the output files to be written."""
+        with self.lock:
+            thread = self.thread
+        if thread is not None:
+            self.stop_event.set()
+            thread.join()
+
+    def __Sample(self,
+                 duration_sec: float,
+                 out_dir: str) -> None:
+        """
+        Sample the stacks of the other threads until the end of the window, then write the output files.
+
+        Args:
+            duration_sec: Maximum duration of the window in seconds.
+            out_dir: Directory where the output files are written.
+        """
+        samples: Dict[str, Counter] = {}
+        own_thread_id = threading.get_ident()
+        end_time = time.monotonic() + duration_sec
+
+        while not self.stop_event.is_set() and time.monotonic() < end_time:
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id != own_thread_id:
+                    stage_name, stack = self.__FoldStack(frame)
+                    samples.setdefault(stage_name, Counter())[stack] += 1
+            self.stop_event.wait(SamplingProfilerConst.SAMPLE_INTERVAL_SEC)
+
+        files = self.__WriteFiles(samples, out_dir)
+        with self.lock:
+            self.last_files = files
+
+    def __FoldStack(self,
+                    frame: FrameType) -> Tuple[str, str]:
+        """
+        Fold a stack, starting from the outermost profiled stage (or from the thread entry point if none).
+
+        Args:
+            frame: Innermost frame of the stack.
+
+        Returns:
+            Stage name and folded stack.
+        """
+        frames: List[FrameType] = []
+        curr_frame: Optional[FrameType] = frame
+        while curr_frame is not None:
+            frames.append(curr_frame)
+            curr_frame = curr_frame.f_back
+        frames.reverse()
+
+        stage_name = SamplingProfilerConst.OTHER_STAGE
+        for i, stack_frame in enumerate(frames):
+            if stack_frame.f_code in self.stages:
+                stage_name = self.stages[stack_frame.f_code]
+                frames = frames[i:]
+                break
+
+        return stage_name, ";".join(self.__FrameName(stack_frame) for stack_frame in frames)
+
+    @staticmethod
+    def __FrameName(frame: FrameType) -> str:
+        """
+        Get the name of a frame, identifying its function.
+
+        Args:
+            frame: Frame.
+
+        Returns:
+            Frame name.
+        """
+        code = frame.f_code
+        return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+    @staticmethod
+    def __WriteFiles(samples: Dict[str, Counter],
+                     out_dir: str) -> List[str]:
+        """
+        Write the samples of each stage to a file in the folded stacks format.
+
+        Args:
+            samples: Samples count of each folded stack, by stage.
+            out_dir: Output directory.
+
+        Returns:
+            Written file names.
+        """
+        os.makedirs(out_dir, exist_ok=True)
+
+        date = time.strftime(SamplingProfilerConst.FILE_DATE_FORMAT)
+        files = []
+        for stage_name, stacks in sorted(samples.items()):
+            file_name = os.path.join(
+                out_dir,
+                SamplingProfilerConst.FILE_NAME.format(date=date, pid=os.getpid(), stage=stage_name)
+            )
+            with open(file_name, "w", encoding="utf-8") as fout:
+                for stack, count in stacks.most_common():
+                    fout.write(f"{stack} {count}\n")
+            files.append(file_name)
+        return files
+
+
+# Sampling profiler of the process
+sampling_profiler: SamplingProfiler = SamplingProfiler()
+
+
+def ProfiledStage(stage_name: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Decorator to mark a function as a profiled stage, so that its samples are written to their own file.
+    The function is registered and returned as it is, so it has no overhead.
+
+    Args:
+        stage_name: Stage name
+
+    Returns:
+        Decorator
+    """
+
+    def decorator(fct: Callable[..., Any]) -> Callable[..., Any]:
+        sampling_profiler.RegisterStage(fct.__code__, stage_name)
+        return fct
+
+    return decorator
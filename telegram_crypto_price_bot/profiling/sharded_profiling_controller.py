@@ -0,0 +1,126 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+from typing import Any, List
+
+from typing_extensions import override
+
+from telegram_crypto_price_bot.coin_info.coin_info_shard_pool import CoinInfoShardPool
+from telegram_crypto_price_bot.coin_info.coin_info_shard_worker import CoinInfoShardWorkerConst
+from telegram_crypto_price_bot.logger.logger import Logger
+from telegram_crypto_price_bot.profiling.memory_profiler import MemoryProfileReport
+from telegram_crypto_price_bot.profiling.profiling_controller import ProfilingController
+
+
+class ShardedProfilingController(ProfilingController):
+    """Controller of the process-level profilers of this process and of all shard processes."""
+
+    shard_pool: CoinInfoShardPool
+
+    def __init__(self,
+                 logger: Logger,
+                 shard_pool: CoinInfoShardPool) -> None:
+        """
+        Initialize the sharded profiling controller.
+
+        Args:
+            logger: Logger instance.
+            shard_pool: Pool of shard processes.
+        """
+        super().__init__(logger)
+        self.shard_pool = shard_pool
+
+    @override
+    async def StartMemoryProfiling(self) -> None:
+        """Start the memory profiler of this process and of all shards, taking the baseline snapshots."""
+        await super().StartMemoryProfiling()
+        await self.__RequestShards("StartMemoryProfiling")
+
+    @override
+    async def GetMemoryProfiles(self,
+                                top_num: int) -> List[MemoryProfileReport]:
+        """
+        Get the memory profiles of this process and of all shards with respect to their baseline snapshots.
+
+        Args:
+            top_num: Number of top allocation sites to report.
+
+        Returns:
+            Memory profile reports (one for each process).
+
+        Raises:
+            MemoryProfilerNotStartedError: If the memory profiler is not started.
+        """
+        reports = await super().GetMemoryProfiles(top_num)
+        for shard_reports in await self.__RequestShards("GetMemoryProfiles", top_num):
+            reports.extend(shard_reports)
+
+        return reports
+
+    @override
+    async def StopMemoryProfiling(self) -> None:
+        """Stop the memory profiler of this process and of all shards."""
+        await super().StopMemoryProfiling()
+        await self.__RequestShards("StopMemoryProfiling")
+
+    @override
+    async def StartCpuProfiling(self,
+                                duration_sec: float) -> None:
+        """
+        Start the sampling profiler of this process and of all shards for the specified window,
+        writing the output to the logs directory.
+
+        Args:
+            duration_sec: Maximum duration of the window in seconds.
+
+        Raises:
+            SamplingProfilerAlreadyRunningError: If the sampling profiler is already running.
+        """
+        await super().StartCpuProfiling(duration_sec)
+        await self.__RequestShards("StartCpuProfiling", duration_sec)
+
+    @override
+    async def StopCpuProfiling(self) -> List[str]:
+        """
+        Stop the sampling profiler of this process and of all shards (if still running).
+
+        Returns:
+            Files written by the last window of each process.
+        """
+        files = await super().StopCpuProfiling()
+        for shard_files in await self.__RequestShards("StopCpuProfiling"):
+            files.extend(shard_files)
+
+        return files
+
+    async def __RequestShards(self,
+                              method_name: str,
+                              *args: Any) -> List[Any]:
+        """
+        Send a request to the profiling controllers of all shards and wait for their results.
+
+        Args:
+            method_name: Name of the profiling controller method.
+            *args: Method arguments.
+
+        Returns:
+            Result of the profiling controller method for each shard.
+        """
+        return await self.shard_pool.RequestAll(CoinInfoShardWorkerConst.PROFILING_TARGET, method_name, *args)
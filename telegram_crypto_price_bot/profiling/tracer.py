@@ -0,0 +1,279 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+import asyncio
+import json
+import os
+import random
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from telegram_crypto_price_bot.bot.bot_config_types import BotConfigTypes
+from telegram_crypto_price_bot.config.config_object import ConfigObject
+
+
+class TracerConst:
+    """Constants for tracer class."""
+
+    # Traces are written in the Chrome trace event format (JSON array), which can be opened in Perfetto or
+    # chrome://tracing. The closing bracket can be omitted, so that events are just appended to the file.
+    FILE_HEADER: str = "[\n"
+
+
+# Span: (name, start time in seconds, end time in seconds, arguments)
+TraceSpan = Tuple[str, float, float, Dict[str, Any]]
+
+
+class TraceData:
+    """Data of a trace, collecting the spans of its stages."""
+
+    trace_id: int
+    name: str
+    key: str
+    spans: List[TraceSpan]
+
+    def __init__(self,
+                 trace_id: int,
+                 name: str,
+                 key: str) -> None:
+        """
+        Initialize the trace data.
+
+        Args:
+            trace_id: Trace ID, unique in the process.
+            name: Trace name.
+            key: Correlation key (e.g. job ID).
+        """
+        self.trace_id = trace_id
+        self.name = name
+        self.key = key
+        self.spans = []
+
+
+# Trace of the current task, if sampled (it is copied to tasks created by it, so their spans are collected too)
+current_trace: ContextVar[Optional[TraceData]] = ContextVar("current_trace", default=None)
+
+
+class Tracer:
+    """
+    Lightweight tracer, recording the time spent in each stage of a job run or command.
+    A trace is started for a job run or command, depending on the sampling rate. The stages executed meanwhile
+    (also in tasks created by it) record their span, without any overhead if the trace is not sampled.
+    At the end, the spans are appended to the trace file, together with the correlation key of the trace.
+    Ended traces are buffered and written by an executor thread, so that the event loop never waits for the file.
+    """
+
+    trace_id: int
+    lock: threading.Lock
+    pending_traces: List[Tuple[TraceData, str]]
+    flushing: bool
+
+    def __init__(self) -> None:
+        """Initialize the tracer."""
+        self.trace_id = 0
+        self.lock = threading.Lock()
+        self.pending_traces = []
+        self.flushing = False
+
+    @contextmanager
+    def Trace(self,
+              config: ConfigObject,
+              name: str,
+              key: str,
+              **args: Any) -> Iterator[None]:
+        """
+        Context manager to trace a job run or command, depending on the sampling rate.
+        If already inside a trace, it is recorded as a span of it.
+
+        Args:
+            config: Configuration object.
+            name: Trace name.
+            key: Correlation key (e.g. job ID).
+            **args: Additional arguments of the trace.
+        """
+        if current_trace.get() is not None:
+            with self.Span(name, key=key, **args):
+                yield
+            return
+
+        sample_rate = config.GetValue(BotConfigTypes.APP_TRACE_SAMPLE_RATE)
+        if sample_rate <= 0 or random.random() >= sample_rate:
+            yield
+            return
+
+        self.trace_id += 1
+        trace = TraceData(self.trace_id, name, key)
+        token = current_trace.set(trace)
+        try:
+            with self.Span(name, **args):
+                yield
+        finally:
+            current_trace.reset(token)
+            self.__Export(trace, config.GetValue(BotConfigTypes.APP_TRACE_FILE_NAME))
+
+    @contextmanager
+    def Span(self,
+             name: str,
+             **args: Any) -> Iterator[None]:
+        """
+        Context manager to record the span of a stage in the current trace (if any).
+
+        Args:
+            name: Stage name.
+            **args: Additional arguments of the span.
+        """
+        trace = current_trace.get()
+        if trace is None:
+            yield
+            return
+
+        start_time = time.time()
+        try:
+            yield
+        finally:
+            trace.spans.append((name, start_time, time.time(), args))
+
+    @staticmethod
+    def AddSpan(name: str,
+                start_time: float,
+                end_time: float,
+                **args: Any) -> None:
+        """
+        Add the span of a stage already ended to the current trace (if any), e.g. the time spent waiting in a queue.
+
+        Args:
+            name: Stage name.
+            start_time: Start time in seconds (since epoch).
+            end_time: End time in seconds (since epoch).
+            **args: Additional arguments of the span.
+        """
+        trace = current_trace.get()
+        if trace is not None:
+            trace.spans.append((name, start_time, end_time, args))
+
+    def __Export(self,
+                 trace: TraceData,
+                 file_name: str) -> None:
+        """
+        Buffer an ended trace, starting to flush the buffer in an executor if not already doing it.
+
+        Args:
+            trace: Trace data.
+            file_name: Trace file name.
+        """
+        with self.lock:
+            self.pending_traces.append((trace, file_name))
+            if self.flushing:
+                return
+            self.flushing = True
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop to block
+            self.__Flush()
+        else:
+            loop.run_in_executor(None, self.__Flush)
+
+    def __Flush(self) -> None:
+        """Write the buffered traces, until the buffer is empty (traces may be added meanwhile)."""
+        while True:
+            with self.lock:
+                if len(self.pending_traces) == 0:
+                    self.flushing = False
+                    return
+                traces = self.pending_traces
+                self.pending_traces = []
+
+            traces_by_file: Dict[str, List[TraceData]] = {}
+            for trace, file_name in traces:
+                traces_by_file.setdefault(file_name, []).append(trace)
+            try:
+                for file_name, file_traces in traces_by_file.items():
+                    self.__Write(file_name, file_traces)
+            except Exception:
+                with self.lock:
+                    self.flushing = False
+                raise
+
+    @staticmethod
+    def __Write(file_name: str,
+                traces: List[TraceData]) -> None:
+        """
+        Append the spans of some traces to the trace file, opening it once.
+
+        Args:
+            file_name: Trace file name.
+            traces: Traces data.
+        """
+        dir_name = os.path.dirname(file_name)
+        if dir_name != "":
+            os.makedirs(dir_name, exist_ok=True)
+        with open(file_name, "a", encoding="utf-8") as fout:
+            if fout.tell() == 0:
+                fout.write(TracerConst.FILE_HEADER)
+            for trace in traces:
+                fout.write("".join(json.dumps(event, default=str) + ",\n" for event in Tracer.__Events(trace)))
+
+    @staticmethod
+    def __Events(trace: TraceData) -> List[Dict[str, Any]]:
+        """
+        Get the trace events of a trace.
+        Each trace is shown in its own track, named after the trace and its correlation key.
+
+        Args:
+            trace: Trace data.
+
+        Returns:
+            Trace events.
+        """
+        pid = os.getpid()
+        events: List[Dict[str, Any]] = [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": pid,
+                "tid": trace.trace_id,
+                "args": {"name": f"{trace.name} {trace.key}"},
+            }
+        ]
+        events.extend(
+            {
+                "name": span_name,
+                "cat": trace.name,
+                "ph": "X",
+                "ts": int(start_time * 1e6),
+                "dur": int((end_time - start_time) * 1e6),
+                "pid": pid,
+                "tid": trace.trace_id,
+                "args": {"trace_key": trace.key, **span_args},
+            }
+            # Sorted by start time, so that the outer spans come first
+            for span_name, start_time, end_time, span_args in sorted(trace.spans, key=lambda span: span[1])
+        )
+        return events
+
+
+# Tracer of the process
+tracer: Tracer = Tracer()
@@ -24,6 +24,7 @@ from typing import Any, Dict, Optional
 from defusedxml import ElementTree
 
 from telegram_crypto_price_bot.logger.logger import Logger
+from telegram_crypto_price_bot.translation.translation_template import TranslationTemplate, TranslationTemplateError
 
 
 class TranslationLoaderConst:
@@ -38,7 +39,8 @@ class TranslationLoader:
     """Loader for translation files from XML format."""
 
     logger: Logger
-    sentences: Dict[str, str]
+    file_name: Optional[str]
+    sentences: Dict[str, TranslationTemplate]
 
     def __init__(self,
                  logger: Logger) -> None:
@@ -49,12 +51,16 @@ class TranslationLoader:
             logger: Logger instance.
         """
         self.logger = logger
+        self.file_name = None
         self.sentences = {}
 
     def Load(self,
              file_name: Optional[str] = None) -> None:
         """
         Load translation file, falling back to default if not found.
+        The default language is always loaded first, so that sentences that are missing or not valid in the
+        translation file (e.g. with different placeholders) fall back to the default ones.
+        Sentences are replaced all at once, so the loader can be used while loading again (e.g. on configuration reload).
 
         Args:
             file_name: Path to translation file, or None for default.
@@ -63,18 +69,31 @@ class TranslationLoader:
                                      TranslationLoaderConst.DEF_LANG_FOLDER,
                                      TranslationLoaderConst.DEF_FILE_NAME)
 
+        sentences: Dict[str, TranslationTemplate] = {}
+
+        self.logger.GetLogger().info("Loading default language file...")
+        loaded_file_name = self.__LoadFile(def_file_path, sentences)
+
         if file_name is not None:
             try:
                 self.logger.GetLogger().info(f"Loading language file '{file_name}'...")
-                self.__LoadFile(file_name)
+                loaded_file_name = self.__LoadFile(file_name, sentences)
             except FileNotFoundError:
                 self.logger.GetLogger().error(
-                    f"Language file '{file_name}' not found, loading default language..."
+                    f"Language file '{file_name}' not found, using default language"
                 )
-                self.__LoadFile(def_file_path)
-        else:
-            self.logger.GetLogger().info("Loading default language file...")
-            self.__LoadFile(def_file_path)
+
+        self.sentences = sentences
+        self.file_name = loaded_file_name
+
+    def FileName(self) -> Optional[str]:
+        """
+        Get the name of the loaded translation file, which identifies the language.
+
+        Returns:
+            Translation file name, None if not loaded.
+        """
+        return self.file_name
 
     def GetSentence(self,
                     sentence_id: str,
@@ -88,16 +107,32 @@ class TranslationLoader:
 
         Returns:
             Formatted translated sentence.
+
+        Raises:
+            TranslationTemplateError: If some placeholder values are missing.
         """
-        return self.sentences[sentence_id].format(**kwargs)
+        sentence = self.sentences[sentence_id]
+        # Formatted in place rather than by TranslationTemplate.Format, to avoid packing the arguments again
+        if sentence.static_text is not None:
+            return sentence.static_text
+        try:
+            return sentence.text.format(**kwargs)
+        except (KeyError, TypeError):
+            sentence.CheckPlaceholders(kwargs)
+            raise
 
     def __LoadFile(self,
-                   file_name: str) -> None:
+                   file_name: str,
+                   sentences: Dict[str, TranslationTemplate]) -> str:
         """
         Load and parse translation XML file.
 
         Args:
             file_name: Path to XML translation file.
+            sentences: Sentences to be updated with the loaded ones.
+
+        Returns:
+            Path of the loaded file.
         """
         tree = ElementTree.parse(file_name)
         root = tree.getroot()
@@ -105,12 +140,29 @@ class TranslationLoader:
         for child in root:
             if child.tag == TranslationLoaderConst.SENTENCE_XML_TAG and child.text is not None:
                 sentence_id = child.attrib["id"]
-                self.sentences[sentence_id] = child.text.replace("\\n", "\n")
+                try:
+                    sentence = TranslationTemplate(sentence_id, child.text.replace("\\n", "\n"))
+                except TranslationTemplateError:
+                    self.logger.GetLogger().exception(f"Sentence '{sentence_id}' not valid, skipped")
+                    continue
+
+                # Placeholders shall be the same of the default sentence, since they are the ones passed by the code
+                def_sentence = sentences.get(sentence_id)
+                if def_sentence is not None and def_sentence.Placeholders() != sentence.Placeholders():
+                    self.logger.GetLogger().error(
+                        f"Sentence '{sentence_id}' has placeholders {sorted(sentence.Placeholders())} "
+                        f"instead of {sorted(def_sentence.Placeholders())}, using the default one"
+                    )
+                    continue
+
+                sentences[sentence_id] = sentence
 
                 self.logger.GetLogger().debug(
-                    f"Loaded sentence '{sentence_id}': {self.sentences[sentence_id]}"
+                    f"Loaded sentence '{sentence_id}': {sentence}"
                 )
 
         self.logger.GetLogger().info(
-            f"Language file successfully loaded, number of sentences: {len(self.sentences)}"
+            f"Language file successfully loaded, number of sentences: {len(sentences)}"
         )
+
+        return file_name
@@ -0,0 +1,144 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import re
+from string import Formatter
+from typing import Any, Dict, FrozenSet, Optional, Set
+
+
+class TranslationTemplateError(Exception):
+    """Exception raised when a translation template is not valid or is formatted with missing placeholders."""
+
+
+class TranslationTemplate:
+    """
+    Class for a translation sentence, parsed once when loaded.
+    Placeholders are validated when parsing. Sentences without placeholders are returned as they are, the other ones
+    are formatted with str.format.
+    """
+
+    sentence_id: str
+    text: str
+    static_text: Optional[str]
+    placeholders: FrozenSet[str]
+
+    def __init__(self,
+                 sentence_id: str,
+                 text: str) -> None:
+        """
+        Parse a sentence.
+
+        Args:
+            sentence_id: Sentence identifier.
+            text: Sentence text.
+
+        Raises:
+            TranslationTemplateError: If the sentence is not valid (e.g. unbalanced braces or positional placeholders).
+        """
+        self.sentence_id = sentence_id
+        self.text = text
+
+        try:
+            fields = list(Formatter().parse(text))
+        except ValueError as ex:
+            raise TranslationTemplateError(f"Sentence '{sentence_id}' is not valid: {ex}") from ex
+
+        placeholders: Set[str] = set()
+        for _, field_name, _, _ in fields:
+            if field_name is None:
+                continue
+            # Only the argument name is passed, not its attributes or indexes
+            arg_name = re.split(r"[.\[]", field_name, maxsplit=1)[0]
+            if not arg_name.isidentifier():
+                raise TranslationTemplateError(
+                    f"Sentence '{sentence_id}' has an invalid placeholder '{{{field_name}}}', only named placeholders are allowed"
+                )
+            placeholders.add(arg_name)
+        self.placeholders = frozenset(placeholders)
+
+        if len(placeholders) == 0:
+            # Escaped braces are already resolved
+            self.static_text = "".join(literal_text for literal_text, _, _, _ in fields)
+        else:
+            self.static_text = None
+
+    def Placeholders(self) -> FrozenSet[str]:
+        """
+        Get the placeholders.
+
+        Returns:
+            Placeholder names.
+        """
+        return self.placeholders
+
+    def StaticText(self) -> Optional[str]:
+        """
+        Get the text of a sentence without placeholders.
+
+        Returns:
+            Sentence text, None if the sentence has placeholders.
+        """
+        return self.static_text
+
+    def Format(self,
+               **kwargs: Any) -> str:
+        """
+        Format the sentence.
+
+        Args:
+            **kwargs: Placeholder values.
+
+        Returns:
+            Formatted sentence.
+
+        Raises:
+            TranslationTemplateError: If some placeholder values are missing.
+        """
+        if self.static_text is not None:
+            return self.static_text
+        try:
+            return self.text.format(**kwargs)
+        except (KeyError, TypeError):
+            self.CheckPlaceholders(kwargs)
+            raise
+
+    def CheckPlaceholders(self,
+                          kwargs: Dict[str, Any]) -> None:
+        """
+        Check that all the placeholder values are present.
+
+        Args:
+            kwargs: Placeholder values.
+
+        Raises:
+            TranslationTemplateError: If some placeholder values are missing.
+        """
+        missing = sorted(self.placeholders - kwargs.keys())
+        if len(missing) > 0:
+            raise TranslationTemplateError(f"Sentence '{self.sentence_id}' is missing placeholder values: {missing}")
+
+    def __str__(self) -> str:
+        """
+        Get the sentence text.
+
+        Returns:
+            Sentence text.
+        """
+        return self.text